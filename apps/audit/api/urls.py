@@ -9,6 +9,7 @@ from .views import (
     AuditProducerStatsAPIView,
     AuditSummaryAPIView,
     AuditTimelineAPIView,
+    AuditTimelineExportAPIView,
     AuditTrendStatsAPIView,
 )
 
@@ -29,6 +30,11 @@ urlpatterns = [
         AuditTimelineAPIView.as_view(),
         name="audit-events-timeline",
     ),
+    path(
+        "events/export/",
+        AuditTimelineExportAPIView.as_view(),
+        name="audit-events-export",
+    ),
     path(
         "events/summary/",
         AuditSummaryAPIView.as_view(),
@@ -8,8 +8,9 @@ from uuid import UUID
 
 from bg_audit_events import UnifiedAuditEvent
 from django.conf import settings
-from django.db.models import Count, Max, Q, QuerySet
-from django.db.models.functions import TruncHour
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.http import HttpResponseBase, StreamingHttpResponse
 from django.utils import timezone
 from rest_framework import permissions, status
 from rest_framework.request import Request
@@ -17,6 +18,18 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.audit.models import AuditEvent
+from apps.audit.services.export import EXPORT_FORMATS, stream_export
+from apps.audit.services.ingest_buffer import (
+    IngestBackpressureError,
+    buffered_ingest_enabled,
+    enqueue_or_store,
+)
+from apps.audit.services.rollup import (
+    AuditViewer,
+    aggregate_window,
+    schedule_record_events,
+)
+from apps.audit.services.search import audit_search_filter
 
 from .serializers import (
     AuditEventBulkIngestSerializer,
@@ -26,21 +39,63 @@ from .serializers import (
 )
 
 
+HTTP_STATUS_ACCEPTED = status.HTTP_202_ACCEPTED
 HTTP_STATUS_CREATED = status.HTTP_201_CREATED
 HTTP_STATUS_FORBIDDEN = status.HTTP_403_FORBIDDEN
 HTTP_STATUS_OK = status.HTTP_200_OK
 HTTP_STATUS_BAD_REQUEST = status.HTTP_400_BAD_REQUEST
+HTTP_STATUS_SERVICE_UNAVAILABLE = status.HTTP_503_SERVICE_UNAVAILABLE
+BACKPRESSURE_RETRY_AFTER_S = 5
 
 DEFAULT_TIMELINE_LIMIT = 100
 MAX_TIMELINE_LIMIT = 250
 DEFAULT_SUMMARY_WINDOW_HOURS = 24
 MAX_SUMMARY_WINDOW_HOURS = 168
 
+_TREND_SEVERITY_KEYS = {
+    "debug": "debug",
+    "info": "info",
+    "warning": "warnings",
+    "error": "errors",
+}
+
 
 def _request_is_staff(request: Request) -> bool:
     return bool(getattr(request.user, "is_staff", False))
 
 
+def _audit_viewer(request: Request) -> AuditViewer:
+    return AuditViewer(
+        is_staff=_request_is_staff(request),
+        user_id=str(request.user.pk),
+    )
+
+
+def _per_source_totals(rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Fold (source_system, severity) aggregates into per-source counters."""
+    totals: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        source = row["source_system"]
+        current = totals.setdefault(
+            source,
+            {
+                "source_system": source,
+                "total": 0,
+                "errors": 0,
+                "warnings": 0,
+                "last_seen": None,
+            },
+        )
+        current["total"] += row["total"]
+        if row["severity"] == "error":
+            current["errors"] += row["total"]
+        elif row["severity"] == "warning":
+            current["warnings"] += row["total"]
+        if current["last_seen"] is None or row["last_seen"] > current["last_seen"]:
+            current["last_seen"] = row["last_seen"]
+    return totals
+
+
 def _coerce_count(value: object) -> int:
     if isinstance(value, bool):
         return int(value)
@@ -102,6 +157,22 @@ def _parse_cursor(value: str | None) -> tuple[datetime, UUID] | None:
     return normalized, cursor_id
 
 
+def _enqueue_or_reject(rows: list[AuditEvent]) -> Response | None:
+    """Queue rows for buffered ingest; return a 503 response when full.
+
+    Rows are stored directly when the stream is unavailable.
+    """
+    try:
+        enqueue_or_store(rows)
+    except IngestBackpressureError:
+        return Response(
+            {"detail": "Audit ingest queue is full; retry later."},
+            status=HTTP_STATUS_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(BACKPRESSURE_RETRY_AFTER_S)},
+        )
+    return None
+
+
 def _create_row(*, request: Request, event: UnifiedAuditEvent) -> AuditEvent:
     if request.user.is_authenticated and not event.actor_id:
         event.actor_id = str(request.user.pk)
@@ -152,15 +223,21 @@ class AuditEventIngestAPIView(APIView):
 
         event = UnifiedAuditEvent.from_mapping(data, default_source="unknown")
         row = _create_row(request=request, event=event)
-        row.save()
+        body = {
+            "id_uuid": str(row.id_uuid),
+            "occurred_at": row.occurred_at.isoformat(),
+        }
+        if buffered_ingest_enabled():
+            return _enqueue_or_reject([row]) or Response(
+                body,
+                status=HTTP_STATUS_ACCEPTED,
+            )
 
-        return Response(
-            {
-                "id_uuid": str(row.id_uuid),
-                "occurred_at": row.occurred_at.isoformat(),
-            },
-            status=HTTP_STATUS_CREATED,
-        )
+        with transaction.atomic():
+            # The post_save signal schedules the event's rollup update.
+            row.save()
+
+        return Response(body, status=HTTP_STATUS_CREATED)
 
 
 class AuditEventBulkIngestAPIView(APIView):
@@ -193,7 +270,18 @@ class AuditEventBulkIngestAPIView(APIView):
             )
             rows.append(_create_row(request=request, event=event))
 
-        created_rows = AuditEvent.objects.bulk_create(rows)
+        if buffered_ingest_enabled():
+            return _enqueue_or_reject(rows) or Response(
+                {
+                    "accepted": len(rows),
+                    "ids": [str(row.id_uuid) for row in rows],
+                },
+                status=HTTP_STATUS_ACCEPTED,
+            )
+
+        with transaction.atomic():
+            created_rows = AuditEvent.objects.bulk_create(rows)
+            schedule_record_events(created_rows)
         created_ids = [str(row.id_uuid) for row in created_rows]
 
         return Response(
@@ -205,6 +293,51 @@ class AuditEventBulkIngestAPIView(APIView):
         )
 
 
+def _timeline_queryset(request: Request) -> QuerySet[AuditEvent]:
+    """Apply the timeline filters and visibility rules of `request`."""
+    queryset = AuditEvent.objects.all().order_by("-occurred_at", "-id_uuid")
+
+    source = (request.query_params.get("source") or "").strip()
+    if source:
+        queryset = queryset.filter(source_system=source)
+
+    event_name = (request.query_params.get("event_name") or "").strip()
+    if event_name:
+        queryset = queryset.filter(event_name=event_name)
+
+    actor_id = (request.query_params.get("actor_id") or "").strip()
+    if actor_id:
+        queryset = queryset.filter(actor_id=actor_id)
+
+    club_id = (request.query_params.get("club_id") or "").strip()
+    if club_id:
+        queryset = queryset.filter(club_id=club_id)
+
+    search_term = (request.query_params.get("search") or "").strip()
+    if search_term:
+        queryset = queryset.filter(audit_search_filter(search_term))
+
+    since = _normalize_datetime(request.query_params.get("since"))
+    if since:
+        queryset = queryset.filter(occurred_at__gte=since)
+
+    until = _normalize_datetime(request.query_params.get("until"))
+    if until:
+        queryset = queryset.filter(occurred_at__lte=until)
+
+    if _request_is_staff(request):
+        return queryset
+
+    if request.user.is_authenticated:
+        return queryset.filter(
+            Q(actor_id=str(request.user.pk))
+            | Q(club_id__exact="")
+            | Q(severity__in=["info", "warning", "error"])
+        )
+
+    return queryset.none()
+
+
 class AuditTimelineAPIView(APIView):
     """List audit events as a searchable timeline."""
 
@@ -237,7 +370,8 @@ class AuditTimelineAPIView(APIView):
 
         if cursor is not None:
             cursor_dt, cursor_id = cursor
-            queryset = queryset.filter(
+            # The plain upper bound lets PostgreSQL prune later partitions.
+            queryset = queryset.filter(occurred_at__lte=cursor_dt).filter(
                 Q(occurred_at__lt=cursor_dt)
                 | Q(occurred_at=cursor_dt, id_uuid__lt=cursor_id)
             )
@@ -262,52 +396,50 @@ class AuditTimelineAPIView(APIView):
         )
 
     def _build_queryset(self, request: Request) -> QuerySet[AuditEvent]:
-        queryset = AuditEvent.objects.all().order_by("-occurred_at", "-id_uuid")
-
-        source = (request.query_params.get("source") or "").strip()
-        if source:
-            queryset = queryset.filter(source_system=source)
-
-        event_name = (request.query_params.get("event_name") or "").strip()
-        if event_name:
-            queryset = queryset.filter(event_name=event_name)
-
-        actor_id = (request.query_params.get("actor_id") or "").strip()
-        if actor_id:
-            queryset = queryset.filter(actor_id=actor_id)
-
-        club_id = (request.query_params.get("club_id") or "").strip()
-        if club_id:
-            queryset = queryset.filter(club_id=club_id)
-
-        search_term = (request.query_params.get("search") or "").strip()
-        if search_term:
-            queryset = queryset.filter(
-                Q(event_name__icontains=search_term)
-                | Q(message__icontains=search_term)
-                | Q(actor_id__icontains=search_term)
-                | Q(subject_id__icontains=search_term)
-            )
+        return _timeline_queryset(request)
 
-        since = _normalize_datetime(request.query_params.get("since"))
-        if since:
-            queryset = queryset.filter(occurred_at__gte=since)
 
-        until = _normalize_datetime(request.query_params.get("until"))
-        if until:
-            queryset = queryset.filter(occurred_at__lte=until)
+class AuditTimelineExportAPIView(APIView):
+    """Stream a filtered audit timeline as NDJSON or CSV."""
 
-        if _request_is_staff(request):
-            return queryset
+    permission_classes = (permissions.IsAuthenticated,)
 
-        if request.user.is_authenticated:
-            return queryset.filter(
-                Q(actor_id=str(request.user.pk))
-                | Q(club_id__exact="")
-                | Q(severity__in=["info", "warning", "error"])
+    def get(
+        self,
+        request: Request,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponseBase:
+        """Stream every event matching the timeline filters, newest first.
+
+        Accepts the timeline filters plus `export_format` (`ndjson` or `csv`).
+        The body is gzip-compressed when the client accepts gzip.
+        """
+        export_format = (
+            request.query_params.get("export_format") or "ndjson"
+        ).strip().lower()
+        content_type = EXPORT_FORMATS.get(export_format)
+        if content_type is None:
+            return Response(
+                {"detail": f"export_format must be one of {sorted(EXPORT_FORMATS)}."},
+                status=HTTP_STATUS_BAD_REQUEST,
             )
 
-        return queryset.none()
+        use_gzip = "gzip" in request.headers.get("Accept-Encoding", "").lower()
+        response = StreamingHttpResponse(
+            stream_export(
+                _timeline_queryset(request),
+                export_format=export_format,
+                gzip=use_gzip,
+            ),
+            content_type=f"{content_type}; charset=utf-8",
+        )
+        filename = f"audit-events-{timezone.now():%Y%m%dT%H%M%SZ}.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response["Vary"] = "Accept-Encoding"
+        if use_gzip:
+            response["Content-Encoding"] = "gzip"
+        return response
 
 
 class AuditSummaryAPIView(APIView):
@@ -325,43 +457,41 @@ class AuditSummaryAPIView(APIView):
         window_hours = self._window_hours(request)
         cutoff = timezone.now() - timedelta(hours=window_hours)
 
-        queryset = AuditEvent.objects.filter(occurred_at__gte=cutoff)
-        if not _request_is_staff(request):
-            queryset = queryset.filter(
-                Q(actor_id=str(request.user.pk))
-                | Q(club_id__exact="")
-                | Q(severity__in=["info", "warning", "error"])
-            )
-
-        total = queryset.count()
+        rows = aggregate_window(
+            start=cutoff,
+            group_by=("source_system", "event_name", "severity"),
+            viewer=_audit_viewer(request),
+        )
+        total = sum(row["total"] for row in rows)
+
+        by_severity: dict[str, int] = {}
+        source_counts: dict[str, int] = {}
+        event_counts: dict[str, int] = {}
+        for row in rows:
+            severity = row["severity"]
+            by_severity[severity] = by_severity.get(severity, 0) + row["total"]
+            source = row["source_system"]
+            source_counts[source] = source_counts.get(source, 0) + row["total"]
+            event = row["event_name"]
+            event_counts[event] = event_counts.get(event, 0) + row["total"]
 
-        by_severity = {
-            row["severity"]: row["count"]
-            for row in queryset.values("severity").annotate(count=Count("id_uuid"))
-        }
         by_source = [
-            {
-                "source_system": row["source_system"],
-                "count": row["count"],
-            }
-            for row in queryset
-            .values("source_system")
-            .annotate(count=Count("id_uuid"))
-            .order_by("-count", "source_system")[:20]
+            {"source_system": source, "count": count}
+            for source, count in sorted(
+                source_counts.items(),
+                key=lambda item: (-item[1], item[0]),
+            )[:20]
         ]
         top_events = [
-            {
-                "event_name": row["event_name"],
-                "count": row["count"],
-            }
-            for row in queryset
-            .values("event_name")
-            .annotate(count=Count("id_uuid"))
-            .order_by("-count", "event_name")[:20]
+            {"event_name": event, "count": count}
+            for event, count in sorted(
+                event_counts.items(),
+                key=lambda item: (-item[1], item[0]),
+            )[:20]
         ]
 
-        latest = queryset.order_by("-occurred_at", "-id_uuid").first()
-        oldest = queryset.order_by("occurred_at", "id_uuid").first()
+        latest = max((row["last_seen"] for row in rows), default=None)
+        oldest = min((row["first_seen"] for row in rows), default=None)
 
         return Response(
             {
@@ -371,8 +501,8 @@ class AuditSummaryAPIView(APIView):
                 "by_severity": by_severity,
                 "by_source": by_source,
                 "top_events": top_events,
-                "latest": latest.occurred_at.isoformat() if latest else None,
-                "oldest": oldest.occurred_at.isoformat() if oldest else None,
+                "latest": latest.isoformat() if latest else None,
+                "oldest": oldest.isoformat() if oldest else None,
             },
             status=HTTP_STATUS_OK,
         )
@@ -405,24 +535,15 @@ class AuditProducerStatsAPIView(APIView):
         window_hours = self._window_hours(request)
         cutoff = timezone.now() - timedelta(hours=window_hours)
 
-        queryset = AuditEvent.objects.filter(occurred_at__gte=cutoff)
-        if not _request_is_staff(request):
-            queryset = queryset.filter(
-                Q(actor_id=str(request.user.pk))
-                | Q(club_id__exact="")
-                | Q(severity__in=["info", "warning", "error"])
-            )
-
-        producers = list(
-            queryset
-            .values("source_system")
-            .annotate(
-                total=Count("id_uuid"),
-                errors=Count("id_uuid", filter=Q(severity="error")),
-                warnings=Count("id_uuid", filter=Q(severity="warning")),
-                last_seen=Max("occurred_at"),
-            )
-            .order_by("-total", "source_system")
+        producers = sorted(
+            _per_source_totals(
+                aggregate_window(
+                    start=cutoff,
+                    group_by=("source_system", "severity"),
+                    viewer=_audit_viewer(request),
+                ),
+            ).values(),
+            key=lambda row: (-row["total"], row["source_system"]),
         )
 
         return Response(
@@ -476,36 +597,29 @@ class AuditTrendStatsAPIView(APIView):
         cutoff = now - timedelta(hours=window_hours)
         previous_cutoff = cutoff - timedelta(hours=window_hours)
 
-        current_queryset = AuditEvent.objects.filter(occurred_at__gte=cutoff)
-        previous_queryset = AuditEvent.objects.filter(
-            occurred_at__gte=previous_cutoff,
-            occurred_at__lt=cutoff,
-        )
-
-        if not _request_is_staff(request):
-            visibility_filter = (
-                Q(actor_id=str(request.user.pk))
-                | Q(club_id__exact="")
-                | Q(severity__in=["info", "warning", "error"])
+        viewer = _audit_viewer(request)
+        trend_by_hour: dict[datetime, dict[str, Any]] = {}
+        for row in aggregate_window(
+            start=cutoff,
+            group_by=("hour", "severity"),
+            viewer=viewer,
+        ):
+            bucket = trend_by_hour.setdefault(
+                row["hour"],
+                {"total": 0, "debug": 0, "info": 0, "warnings": 0, "errors": 0},
             )
-            current_queryset = current_queryset.filter(visibility_filter)
-            previous_queryset = previous_queryset.filter(visibility_filter)
-
-        trend_rows = list(
-            current_queryset
-            .annotate(hour=TruncHour("occurred_at"))
-            .values("hour")
-            .annotate(
-                total=Count("id_uuid"),
-                debug=Count("id_uuid", filter=Q(severity="debug")),
-                info=Count("id_uuid", filter=Q(severity="info")),
-                warnings=Count("id_uuid", filter=Q(severity="warning")),
-                errors=Count("id_uuid", filter=Q(severity="error")),
+            bucket["total"] += row["total"]
+            severity_key = _TREND_SEVERITY_KEYS.get(row["severity"])
+            if severity_key is not None:
+                bucket[severity_key] += row["total"]
+        previous_by_severity = {
+            row["severity"]: row["total"]
+            for row in aggregate_window(
+                start=previous_cutoff,
+                end=cutoff,
+                group_by=("severity",),
+                viewer=viewer,
             )
-            .order_by("hour")
-        )
-        trend_by_hour = {
-            row["hour"]: row for row in trend_rows if row["hour"] is not None
         }
 
         start_hour = cutoff.replace(minute=0, second=0, microsecond=0)
@@ -526,10 +640,10 @@ class AuditTrendStatsAPIView(APIView):
             })
             cursor += timedelta(hours=1)
 
-        current_total = current_queryset.count()
-        current_errors = current_queryset.filter(severity="error").count()
-        previous_total = previous_queryset.count()
-        previous_errors = previous_queryset.filter(severity="error").count()
+        current_total = sum(row["total"] for row in trend_by_hour.values())
+        current_errors = sum(row["errors"] for row in trend_by_hour.values())
+        previous_total = sum(previous_by_severity.values())
+        previous_errors = previous_by_severity.get("error", 0)
 
         current_error_rate = (
             (current_errors / current_total) * 100 if current_total else 0.0
@@ -622,42 +736,24 @@ class AuditProducerHealthAPIView(APIView):
         cutoff: datetime,
         previous_cutoff: datetime,
     ) -> tuple[list[dict[str, object]], list[dict[str, object]]]:
-        current_queryset = AuditEvent.objects.filter(occurred_at__gte=cutoff)
-        previous_queryset = AuditEvent.objects.filter(
-            occurred_at__gte=previous_cutoff,
-            occurred_at__lt=cutoff,
-        )
-
-        if not _request_is_staff(request):
-            visibility_filter = (
-                Q(actor_id=str(request.user.pk))
-                | Q(club_id__exact="")
-                | Q(severity__in=["info", "warning", "error"])
-            )
-            current_queryset = current_queryset.filter(visibility_filter)
-            previous_queryset = previous_queryset.filter(visibility_filter)
-
-        current_rows = list(
-            current_queryset
-            .values("source_system")
-            .annotate(
-                total=Count("id_uuid"),
-                errors=Count("id_uuid", filter=Q(severity="error")),
-                warnings=Count("id_uuid", filter=Q(severity="warning")),
-                last_seen=Max("occurred_at"),
-            )
-            .order_by("source_system")
+        viewer = _audit_viewer(request)
+        current = _per_source_totals(
+            aggregate_window(
+                start=cutoff,
+                group_by=("source_system", "severity"),
+                viewer=viewer,
+            ),
         )
-
-        previous_rows = list(
-            previous_queryset
-            .values("source_system")
-            .annotate(
-                total=Count("id_uuid"),
-                errors=Count("id_uuid", filter=Q(severity="error")),
-            )
-            .order_by("source_system")
+        previous = _per_source_totals(
+            aggregate_window(
+                start=previous_cutoff,
+                end=cutoff,
+                group_by=("source_system", "severity"),
+                viewer=viewer,
+            ),
         )
+        current_rows = [current[source] for source in sorted(current)]
+        previous_rows = [previous[source] for source in sorted(previous)]
 
         return current_rows, previous_rows
 
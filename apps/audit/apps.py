@@ -8,3 +8,7 @@ class AuditConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.audit"
+
+    def ready(self) -> None:
+        """Import signals."""
+        import apps.audit.signals
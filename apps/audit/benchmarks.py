@@ -0,0 +1,164 @@
+"""Synthetic audit events and timeline search scenarios for benchmarking.
+
+`generate_audit_events` inserts a deterministic event stream (seeded
+`random.Random`, timestamps spread over the last `days` days) with a mix of
+common and rare message words, so both selective and unselective searches can
+be measured. `build_search_scenarios` returns the timeline search queries in
+the shape the timeline view runs them: search filter, keyset order and a page
+of `limit + 1` rows, for the first and a follow-up cursor page.
+
+Scenarios reuse the kwt_common benchmark runner for timings and query counts;
+`explain_scenarios` adds the PostgreSQL plan so sequential scans stand out.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+import random
+
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from apps.audit.models import AuditEvent
+from apps.audit.services.search import audit_search_filter
+from apps.kwt_common.benchmarks.runner import Scenario
+
+
+PAGE_LIMIT = 100
+RARE_WORD = "quasar"
+RARE_EVERY = 50_000
+_BATCH_SIZE = 5000
+
+_SOURCES = ("extension", "django", "console", "tracker", "worker")
+_ACTIONS = ("started", "finished", "failed", "retried", "updated", "synced")
+_SUBJECTS = ("match", "team", "player", "club", "season")
+_SEVERITIES = ("debug", "info", "info", "info", "warning", "error")
+_WORDS = (
+    "goal",
+    "shot",
+    "attack",
+    "timeout",
+    "substitution",
+    "score",
+    "player",
+    "request",
+    "payload",
+    "cache",
+    "refresh",
+    "upload",
+    "token",
+    "retry",
+    "queue",
+    "latency",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AuditSearchConfig:
+    """Size and shape of the synthetic audit event set."""
+
+    events: int = 2_000_000
+    seed: int = 1
+    days: int = 60
+
+
+def generate_audit_events(config: AuditSearchConfig) -> int:
+    """Insert `config.events` synthetic audit events.
+
+    Rows are written with `bulk_create`, so the hourly rollup is not updated.
+
+    Returns:
+        int: Number of events inserted.
+
+    """
+    rng = random.Random(config.seed)  # noqa: S311
+    now = timezone.now()
+    span_s = config.days * 24 * 60 * 60
+    inserted = 0
+    batch: list[AuditEvent] = []
+    for index in range(config.events):
+        source = rng.choice(_SOURCES)
+        subject = rng.choice(_SUBJECTS)
+        words = rng.sample(_WORDS, k=4)
+        if index % RARE_EVERY == 0:
+            words.append(RARE_WORD)
+        batch.append(
+            AuditEvent(
+                occurred_at=now - timedelta(seconds=rng.randrange(span_s)),
+                source_system=source,
+                event_name=f"{source}.{subject}.{rng.choice(_ACTIONS)}",
+                severity=rng.choice(_SEVERITIES),
+                actor_id=f"user-{rng.randrange(5000)}",
+                subject_type=subject,
+                subject_id=f"{subject}-{rng.randrange(200_000):06d}",
+                club_id=f"club-{rng.randrange(40)}" if rng.random() < 0.7 else "",  # noqa: PLR2004
+                message=" ".join(words),
+            ),
+        )
+        if len(batch) >= _BATCH_SIZE:
+            AuditEvent.objects.bulk_create(batch)
+            inserted += len(batch)
+            batch = []
+    if batch:
+        AuditEvent.objects.bulk_create(batch)
+        inserted += len(batch)
+    return inserted
+
+
+def _timeline_search(term: str) -> QuerySet[AuditEvent]:
+    return AuditEvent.objects.filter(audit_search_filter(term)).order_by(
+        "-occurred_at",
+        "-id_uuid",
+    )
+
+
+def _page(queryset: QuerySet[AuditEvent]) -> list[AuditEvent]:
+    return list(queryset[: PAGE_LIMIT + 1])
+
+
+def _second_page(term: str) -> list[AuditEvent]:
+    first = _page(_timeline_search(term))
+    if len(first) <= PAGE_LIMIT:
+        return []
+    cursor = first[PAGE_LIMIT - 1]
+    return _page(
+        _timeline_search(term)
+        .filter(occurred_at__lte=cursor.occurred_at)
+        .filter(
+            Q(occurred_at__lt=cursor.occurred_at)
+            | Q(occurred_at=cursor.occurred_at, id_uuid__lt=cursor.id_uuid),
+        ),
+    )
+
+
+SEARCH_TERMS: dict[str, str] = {
+    "audit.search.rare_word": RARE_WORD,
+    "audit.search.common_word": "latency",
+    "audit.search.actor_substring": "user-4242",
+    "audit.search.subject_substring": "match-00042",
+    "audit.search.event_name_substring": "tracker.match.failed",
+}
+
+
+def build_search_scenarios() -> list[Scenario]:
+    """Return first-page scenarios per search term plus one cursor page."""
+    scenarios = [
+        Scenario(name, lambda term=term: _page(_timeline_search(term)))
+        for name, term in SEARCH_TERMS.items()
+    ]
+    scenarios.append(
+        Scenario(
+            "audit.search.common_word.second_page",
+            lambda: _second_page(SEARCH_TERMS["audit.search.common_word"]),
+        ),
+    )
+    return scenarios
+
+
+def explain_scenarios() -> dict[str, str]:
+    """Return the query plan of every first-page search query."""
+    return {
+        name: _timeline_search(term)[: PAGE_LIMIT + 1].explain()
+        for name, term in SEARCH_TERMS.items()
+    }
@@ -0,0 +1,130 @@
+"""Benchmark timeline search against a large synthetic audit event set.
+
+Run it against PostgreSQL: the full-text and trigram indexes only exist there.
+By default the generated events are rolled back afterwards.
+
+    python manage.py benchmark_audit_search --events 3000000 --output search.json
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from datetime import UTC, datetime
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.audit.benchmarks import (
+    AuditSearchConfig,
+    build_search_scenarios,
+    explain_scenarios,
+    generate_audit_events,
+)
+from apps.kwt_common.benchmarks.runner import (
+    RESULTS_SCHEMA_VERSION,
+    measure_scenario,
+)
+
+
+class Command(BaseCommand):
+    """Django management command to benchmark audit timeline search."""
+
+    help = (
+        "Generate synthetic audit events and time the timeline search queries "
+        "(first page and cursor page), including their query plans."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Register CLI arguments for this command."""
+        parser.add_argument(
+            "--events",
+            type=int,
+            default=AuditSearchConfig.events,
+            help="Number of synthetic audit events to generate",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=1,
+            help="Seed for the synthetic events (same seed = same data)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=10,
+            help="Calls per scenario (the first call is reported as cold)",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON results to this file instead of stdout",
+        )
+        parser.add_argument(
+            "--keep-data",
+            action="store_true",
+            help="Commit the generated events instead of rolling them back",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Generate events, run the search scenarios and report the results.
+
+        Raises:
+            CommandError: On invalid options.
+
+        """
+        events = options.get("events")
+        repeat = options.get("repeat")
+        if not isinstance(events, int) or events < 1:
+            raise CommandError("--events must be >= 1")
+        if not isinstance(repeat, int) or repeat < 2:  # noqa: PLR2004
+            raise CommandError("--repeat must be >= 2")
+        if connection.vendor != "postgresql":
+            self.stdout.write(
+                self.style.WARNING(
+                    "Search indexes are PostgreSQL-only; numbers will not be "
+                    "representative."
+                ),
+            )
+
+        config = AuditSearchConfig(events=events, seed=int(options.get("seed") or 0))
+        with transaction.atomic():
+            generate_audit_events(config)
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE audit_auditevent")
+            results = {
+                scenario.name: measure_scenario(scenario, repeat=repeat)
+                for scenario in build_search_scenarios()
+            }
+            plans = explain_scenarios()
+            if not options.get("keep_data"):
+                transaction.set_rollback(True)
+
+        document = json.dumps(
+            {
+                "schema": RESULTS_SCHEMA_VERSION,
+                "created_at": datetime.now(UTC).isoformat(),
+                "database": {
+                    "vendor": connection.vendor,
+                    "version": getattr(connection, "pg_version", None),
+                },
+                "events": {"count": config.events, "seed": config.seed},
+                "scenarios": results,
+                "plans": plans,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        output = options.get("output")
+        if output:
+            Path(str(output)).write_text(document + "\n", encoding="utf-8")
+            self.stdout.write(f"Wrote results to {output}")
+        else:
+            self.stdout.write(document)
+
+        for name, numbers in results.items():
+            seq_scan = "Seq Scan" in plans.get(name, "")
+            self.stdout.write(
+                f"{name}: median {numbers['median_ms']} ms"
+                + (" (sequential scan)" if seq_scan else ""),
+            )
@@ -0,0 +1,88 @@
+"""Write buffered audit events from the ingest stream to the database."""
+
+from __future__ import annotations
+
+import os
+import socket
+import time
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import InterfaceError, OperationalError, close_old_connections
+
+from apps.audit.services.ingest_buffer import drain_batch, drain_stream
+
+
+DEFAULT_BLOCK_MS = 5000
+DATABASE_RETRY_DELAY_S = 5
+
+
+class Command(BaseCommand):
+    """Drain the audit ingest stream once, or keep following it."""
+
+    help = (
+        "Write events queued by buffered audit ingest to the database in "
+        "batches. With --follow this runs as a standalone writer process."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--follow",
+            action="store_true",
+            help="Keep running and block on the stream for new events.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Events per batch (default: KORFBAL_AUDIT_INGEST_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--consumer",
+            default=f"{socket.gethostname()}-{os.getpid()}",
+            help="Consumer name within the writer group (default: host-pid).",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Execute drain command.
+
+        Raises:
+            CommandError: If --batch-size is not positive.
+
+        """
+        batch_size = options.get("batch_size")
+        if batch_size is not None and (
+            not isinstance(batch_size, int) or batch_size < 1
+        ):
+            raise CommandError("--batch-size must be >= 1")
+        consumer = str(options.get("consumer"))
+
+        if not options.get("follow"):
+            result = drain_stream(consumer=consumer, batch_size=batch_size)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Wrote {result.written} audit events "
+                    f"({result.dead_lettered} dead-lettered)."
+                )
+            )
+            return
+
+        while True:
+            try:
+                result = drain_batch(
+                    consumer=consumer,
+                    batch_size=batch_size,
+                    block_ms=DEFAULT_BLOCK_MS,
+                )
+            except (InterfaceError, OperationalError) as exc:
+                # The batch stays pending and is read again once the
+                # database is back.
+                self.stderr.write(f"Database unavailable, retrying: {exc}")
+                close_old_connections()
+                time.sleep(DATABASE_RETRY_DELAY_S)
+                continue
+            if result.read:
+                self.stdout.write(
+                    f"Wrote {result.written} audit events "
+                    f"({result.dead_lettered} dead-lettered)."
+                )
@@ -0,0 +1,61 @@
+"""Pre-create upcoming monthly audit event partitions."""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.audit.services.partitions import ensure_partitions, partitioning_enabled
+
+
+DEFAULT_MONTHS_AHEAD = 3
+
+
+class Command(BaseCommand):
+    """Create the partitions for the current and upcoming months."""
+
+    help = (
+        "Create missing monthly audit event partitions so new events never land "
+        "in the default partition. Run daily alongside purge_audit_events."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=None,
+            help=(
+                "Months to prepare after the current one "
+                "(default: KORFBAL_AUDIT_PARTITION_MONTHS_AHEAD or 3)."
+            ),
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Execute partition maintenance.
+
+        Raises:
+            CommandError: If --months-ahead is negative.
+
+        """
+        months_ahead = options.get("months_ahead")
+        if months_ahead is None:
+            months_ahead = getattr(
+                settings,
+                "KORFBAL_AUDIT_PARTITION_MONTHS_AHEAD",
+                DEFAULT_MONTHS_AHEAD,
+            )
+        if not isinstance(months_ahead, int) or months_ahead < 0:
+            raise CommandError("--months-ahead must be >= 0")
+
+        if not partitioning_enabled():
+            self.stdout.write("Audit events are not partitioned; nothing to do.")
+            return
+
+        created = ensure_partitions(months_ahead=months_ahead)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {len(created)} audit partitions"
+                + (f": {', '.join(created)}." if created else ".")
+            )
+        )
@@ -1,14 +1,26 @@
-"""Purge old audit events to keep timeline tables bounded."""
+"""Purge old audit events to keep timeline tables bounded.
+
+When the audit table is partitioned (PostgreSQL), retention drops whole monthly
+partitions instead of deleting rows: a month is removed once all of it is older
+than the cutoff, so rows are kept up to one month past the retention window.
+"""
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandParser
 from django.utils import timezone
 
 from apps.audit.models import AuditEvent
+from apps.audit.services.partitions import (
+    drop_partitions_before,
+    expired_partitions,
+    month_start,
+    partitioning_enabled,
+)
+from apps.audit.services.rollup import purge_rollup
 
 
 DEFAULT_RETENTION_DAYS = 90
@@ -40,6 +52,10 @@ class Command(BaseCommand):
         dry_run = bool(options.get("dry_run"))
 
         cutoff = timezone.now() - timedelta(days=days)
+        if partitioning_enabled():
+            self._drop_partitions(cutoff=cutoff, dry_run=dry_run)
+            return
+
         queryset = AuditEvent._default_manager.filter(occurred_at__lt=cutoff)
         total = queryset.count()
 
@@ -51,10 +67,29 @@ class Command(BaseCommand):
             return
 
         deleted, _details = queryset.delete()
+        purge_rollup(before=cutoff)
         self.stdout.write(
             f"Deleted {deleted} audit events older than {cutoff.isoformat()}."
         )
 
+    def _drop_partitions(self, *, cutoff: datetime, dry_run: bool) -> None:
+        if dry_run:
+            names = [partition.name for partition in expired_partitions(before=cutoff)]
+            self.stdout.write(
+                f"[dry-run] Would drop {len(names)} audit partitions older than "
+                f"{cutoff.isoformat()}: {', '.join(names) or '-'}."
+            )
+            return
+
+        dropped = drop_partitions_before(before=cutoff)
+        # The month containing the cutoff is kept; the hours of it that lost
+        # default-partition rows were recounted by `drop_partitions_before`.
+        purge_rollup(before=month_start(cutoff))
+        self.stdout.write(
+            f"Dropped {len(dropped)} audit partitions older than "
+            f"{cutoff.isoformat()}: {', '.join(dropped) or '-'}."
+        )
+
     def _resolve_days(self, value: object) -> int:
         if isinstance(value, int):
             return max(1, value)
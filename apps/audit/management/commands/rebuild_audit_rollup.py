@@ -0,0 +1,53 @@
+"""Recompute the hourly audit rollup from raw audit events."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+
+from apps.audit.services.rollup import rebuild_rollup
+
+
+DEFAULT_REBUILD_HOURS = 24 * 8
+
+
+class Command(BaseCommand):
+    """Rebuild rollup buckets for a recent window (backfill or repair)."""
+
+    help = (
+        "Recompute hourly audit rollup rows from raw events. Use after deploying "
+        "the rollup, or when events were written outside the ORM."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=DEFAULT_REBUILD_HOURS,
+            help=(
+                "Rebuild this many hours back from now "
+                f"(default: {DEFAULT_REBUILD_HOURS}, covers the dashboard windows)."
+            ),
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Execute rebuild command.
+
+        Raises:
+            CommandError: If --hours is not positive.
+
+        """
+        hours = options.get("hours")
+        if not isinstance(hours, int) or hours < 1:
+            raise CommandError("--hours must be >= 1")
+
+        since = timezone.now() - timedelta(hours=hours)
+        written = rebuild_rollup(since=since)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {written} audit rollup rows since {since.isoformat()}."
+            )
+        )
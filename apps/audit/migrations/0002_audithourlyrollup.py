@@ -0,0 +1,61 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditHourlyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("hour", models.DateTimeField()),
+                ("source_system", models.CharField(max_length=64)),
+                ("event_name", models.CharField(max_length=128)),
+                ("severity", models.CharField(max_length=16)),
+                (
+                    "visibility",
+                    models.CharField(
+                        choices=[("public", "Public"), ("restricted", "Restricted")],
+                        max_length=16,
+                    ),
+                ),
+                ("event_count", models.PositiveBigIntegerField(default=0)),
+                ("first_occurred_at", models.DateTimeField()),
+                ("last_occurred_at", models.DateTimeField()),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["hour", "visibility"],
+                        name="audit_rollup_hour_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "hour",
+                            "source_system",
+                            "event_name",
+                            "severity",
+                            "visibility",
+                        ),
+                        name="audit_rollup_bucket_uniq",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,142 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:00
+"""Partition the audit table by month on occurred_at (PostgreSQL only).
+
+The rows are copied into the new partitioned table in one statement, inside
+the migration transaction. Until it commits, the audit table is locked:
+reads and writes of audit events wait, for roughly as long as a full copy of
+the table plus its indexes takes. Run it in a maintenance window, or enable
+`KORFBAL_AUDIT_BUFFERED_INGEST` beforehand so ingestion keeps accepting
+events and the writer catches up afterwards.
+
+The primary key becomes `(id_uuid, occurred_at)`: PostgreSQL requires the
+partition key in unique constraints. id_uuid stays unique through the
+writers (see `apps.audit.services.partitions`); reversing the migration
+restores the `id_uuid` primary key and fails if duplicates slipped in.
+"""
+
+from datetime import UTC, datetime
+
+from django.db import migrations
+
+
+TABLE = "audit_auditevent"
+MONTHS_AHEAD = 3
+
+
+def _month_starts(first: datetime, last: datetime) -> list[datetime]:
+    current = first.astimezone(UTC).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+    starts = []
+    while current <= last:
+        starts.append(current)
+        index = current.year * 12 + current.month
+        current = current.replace(year=index // 12, month=index % 12 + 1)
+    return starts
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _table_indexes(cursor, table: str) -> tuple[str, list[str]]:
+    cursor.execute(
+        "SELECT conname FROM pg_constraint "
+        "WHERE conrelid = to_regclass(%s) AND contype = 'p'",
+        [table],
+    )
+    pk_name = cursor.fetchone()[0]
+    cursor.execute(
+        "SELECT indexdef FROM pg_indexes "
+        "WHERE schemaname = current_schema() AND tablename = %s "
+        "AND indexname <> %s",
+        [table, pk_name],
+    )
+    # Indexes on a partitioned parent are reported as "ON ONLY <table>".
+    index_sql = [row[0].replace(" ON ONLY ", " ON ") for row in cursor.fetchall()]
+    return pk_name, index_sql
+
+
+def partition_audit_events(apps, schema_editor) -> None:
+    """Rebuild the audit table as monthly range partitions on occurred_at."""
+    del apps
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        pk_name, index_sql = _table_indexes(cursor, TABLE)
+        cursor.execute(f"SELECT min(occurred_at) FROM {qn(TABLE)}")
+        now = datetime.now(tz=UTC)
+        oldest = cursor.fetchone()[0] or now
+        month_starts = _month_starts(min(oldest, now), _add_months(now, MONTHS_AHEAD))
+
+        cursor.execute(f"ALTER TABLE {qn(TABLE)} RENAME TO {qn(TABLE + '_plain')}")
+        cursor.execute(
+            f"CREATE TABLE {qn(TABLE)} "
+            f"(LIKE {qn(TABLE + '_plain')} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (occurred_at)"
+        )
+        cursor.execute(
+            f"CREATE TABLE {qn(TABLE + '_default')} PARTITION OF {qn(TABLE)} DEFAULT"
+        )
+        for start in month_starts:
+            cursor.execute(
+                f"CREATE TABLE {qn(f'{TABLE}_p{start:%Y%m}')} "
+                f"PARTITION OF {qn(TABLE)} FOR VALUES FROM (%s) TO (%s)",
+                [start, _add_months(start, 1)],
+            )
+        cursor.execute(
+            f"INSERT INTO {qn(TABLE)} SELECT * FROM {qn(TABLE + '_plain')}"
+        )
+        cursor.execute(f"DROP TABLE {qn(TABLE + '_plain')}")
+
+        # A primary key on a partitioned table must include the partition key.
+        cursor.execute(
+            f"ALTER TABLE {qn(TABLE)} ADD CONSTRAINT {qn(pk_name)} "
+            "PRIMARY KEY (id_uuid, occurred_at)"
+        )
+        for sql in index_sql:
+            cursor.execute(sql)
+
+
+def unpartition_audit_events(apps, schema_editor) -> None:
+    """Copy the partitioned audit table back into a plain table."""
+    del apps
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        pk_name, index_sql = _table_indexes(cursor, TABLE)
+        cursor.execute(
+            f"ALTER TABLE {qn(TABLE)} RENAME TO {qn(TABLE + '_partitioned')}"
+        )
+        cursor.execute(
+            f"CREATE TABLE {qn(TABLE)} "
+            f"(LIKE {qn(TABLE + '_partitioned')} INCLUDING DEFAULTS)"
+        )
+        cursor.execute(
+            f"INSERT INTO {qn(TABLE)} SELECT * FROM {qn(TABLE + '_partitioned')}"
+        )
+        cursor.execute(f"DROP TABLE {qn(TABLE + '_partitioned')}")
+        cursor.execute(
+            f"ALTER TABLE {qn(TABLE)} ADD CONSTRAINT {qn(pk_name)} "
+            "PRIMARY KEY (id_uuid)"
+        )
+        for sql in index_sql:
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0002_audithourlyrollup"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_audit_events, unpartition_audit_events),
+    ]
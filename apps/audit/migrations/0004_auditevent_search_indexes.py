@@ -0,0 +1,59 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+
+TABLE = "audit_auditevent"
+TRIGRAM_FIELDS = ("event_name", "actor_id", "subject_id")
+
+
+def add_search_indexes(apps, schema_editor) -> None:
+    """Add the full-text column and trigram indexes (PostgreSQL only)."""
+    del apps
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"ALTER TABLE {TABLE} ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, "
+        "coalesce(event_name, '') || ' ' || coalesce(message, ''))) STORED"
+    )
+    schema_editor.execute(
+        f"CREATE INDEX audit_search_vector_idx ON {TABLE} USING gin (search_vector)"
+    )
+    for field in TRIGRAM_FIELDS:
+        schema_editor.execute(
+            f"CREATE INDEX audit_{field}_trgm_idx ON {TABLE} "
+            f"USING gin ({field} gin_trgm_ops)"
+        )
+
+
+def drop_search_indexes(apps, schema_editor) -> None:
+    """Drop the full-text column and trigram indexes (PostgreSQL only)."""
+    del apps
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for field in TRIGRAM_FIELDS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS audit_{field}_trgm_idx")
+    schema_editor.execute("DROP INDEX IF EXISTS audit_search_vector_idx")
+    schema_editor.execute(f"ALTER TABLE {TABLE} DROP COLUMN IF EXISTS search_vector")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0003_partition_auditevent"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="auditevent",
+            index=models.Index(
+                fields=["-occurred_at", "-id_uuid"],
+                name="audit_keyset_idx",
+            ),
+        ),
+        migrations.RunPython(add_search_indexes, drop_search_indexes),
+    ]
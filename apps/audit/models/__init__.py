@@ -1,6 +1,7 @@
 """Audit app models."""
 
 from .event import AuditEvent
+from .rollup import AuditHourlyRollup
 
 
-__all__ = ["AuditEvent"]
+__all__ = ["AuditEvent", "AuditHourlyRollup"]
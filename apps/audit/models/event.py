@@ -117,6 +117,11 @@ class AuditEvent(models.Model):
                 fields=["event_name", "actor_id", "club_id"],
                 name="audit_lookup_idx",
             ),
+            # Keyset pagination order of the timeline (search included).
+            models.Index(
+                fields=["-occurred_at", "-id_uuid"],
+                name="audit_keyset_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -0,0 +1,68 @@
+"""Hourly rollup of audit events for dashboard aggregates."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import ClassVar
+
+from django.db import models
+
+
+VISIBILITY_PUBLIC = "public"
+VISIBILITY_RESTRICTED = "restricted"
+VISIBILITY_CHOICES = [
+    (VISIBILITY_PUBLIC, "Public"),
+    (VISIBILITY_RESTRICTED, "Restricted"),
+]
+
+
+class AuditHourlyRollup(models.Model):
+    """Event counts per (hour, source, event, severity, visibility class).
+
+    `visibility` mirrors the non-staff timeline rule: events without a club or
+    with an info/warning/error severity are `public`; the rest are only visible
+    to staff and the event's actor.
+    """
+
+    hour: models.DateTimeField[datetime, datetime] = models.DateTimeField()
+    source_system: models.CharField[str, str] = models.CharField(max_length=64)
+    event_name: models.CharField[str, str] = models.CharField(max_length=128)
+    severity: models.CharField[str, str] = models.CharField(max_length=16)
+    visibility: models.CharField[str, str] = models.CharField(
+        max_length=16,
+        choices=VISIBILITY_CHOICES,
+    )
+
+    event_count: models.PositiveBigIntegerField[int, int] = (
+        models.PositiveBigIntegerField(default=0)
+    )
+    first_occurred_at: models.DateTimeField[datetime, datetime] = (
+        models.DateTimeField()
+    )
+    last_occurred_at: models.DateTimeField[datetime, datetime] = models.DateTimeField()
+
+    class Meta:
+        """Model metadata: one row per bucket, scanned by hour range."""
+
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(
+                fields=[
+                    "hour",
+                    "source_system",
+                    "event_name",
+                    "severity",
+                    "visibility",
+                ],
+                name="audit_rollup_bucket_uniq",
+            ),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["hour", "visibility"], name="audit_rollup_hour_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Return compact text representation for admin/debug output."""
+        return (
+            f"{self.hour.isoformat()} {self.source_system}:{self.event_name}:"
+            f"{self.severity} x{self.event_count}"
+        )
@@ -0,0 +1,371 @@
+"""Buffered audit ingest through a Valkey stream.
+
+With `KORFBAL_AUDIT_BUFFERED_INGEST` enabled the ingest endpoints validate
+events, append them to a Valkey stream and acknowledge right away. A writer
+drains the stream in large batches: the `flush_audit_ingest_stream` Celery
+task (scheduled by the first enqueue of each flush interval) or a dedicated
+`drain_audit_ingest --follow` process.
+
+- Backpressure: enqueueing fails with `IngestBackpressureError` once
+  `KORFBAL_AUDIT_INGEST_MAX_PENDING` events are waiting; the API answers 503.
+- Delivery: entries are read through a consumer group and only acknowledged
+  after their batch is committed. Entries left pending by a crashed writer
+  are reclaimed, and rows that were already stored are skipped, so a retry
+  never duplicates events or rollup counts.
+- Malformed entries, and rows the database rejects (`IntegrityError`,
+  `DataError`), are moved with their raw entry to a capped dead-letter list,
+  so they can be replayed. That push and the acknowledgement run in one
+  MULTI transaction, so a crashed writer never dead-letters an entry twice.
+  Other database errors (restarts, failovers) leave the batch pending.
+- The Celery flush drains at most a fixed number of batches and schedules
+  itself again while events remain; `drain_audit_ingest` drains until empty.
+- When the stream is unavailable (Valkey down), `enqueue_or_store` writes the
+  events to the database directly instead of failing the request.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+import json
+import logging
+import time
+from typing import Any, Final
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DataError, IntegrityError, transaction
+
+from apps.audit.models import AuditEvent
+from apps.audit.services.rollup import record_events
+from apps.kwt_common.metrics import (
+    record_audit_ingest_flush,
+    record_audit_ingest_rejected,
+)
+
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY: Final[str] = "korfbal:audit:ingest:v1"
+DEAD_LETTER_KEY: Final[str] = "korfbal:audit:ingest:dead:v1"
+CONSUMER_GROUP: Final[str] = "audit-writers"
+FLUSH_SCHEDULED_KEY: Final[str] = "korfbal:audit:ingest:flush-scheduled:v1"
+DEAD_LETTER_MAX: Final[int] = 10_000
+RECLAIM_IDLE_MS: Final[int] = 60_000
+
+_STREAM_FIELDS: Final[tuple[str, ...]] = tuple(
+    field.attname
+    for field in AuditEvent._meta.concrete_fields
+    if field.attname != "created_at"
+)
+
+
+class IngestBackpressureError(Exception):
+    """Raised when the ingest stream holds too many undrained events."""
+
+
+@dataclass(frozen=True, slots=True)
+class DrainResult:
+    """Outcome of one drained batch."""
+
+    read: int
+    written: int
+    dead_lettered: int
+    capped: bool = False
+    """True when `max_batches` ran out before the stream was empty."""
+
+
+def buffered_ingest_enabled() -> bool:
+    """Return whether ingest endpoints should enqueue instead of insert."""
+    return bool(getattr(settings, "KORFBAL_AUDIT_BUFFERED_INGEST", False))
+
+
+@lru_cache(maxsize=1)
+def stream_client() -> Any:
+    """Return the (process-wide) Valkey client for the ingest stream."""
+    import valkey
+
+    return valkey.Valkey.from_url(
+        settings.KORFBAL_AUDIT_INGEST_STREAM_URL,
+        decode_responses=True,
+    )
+
+
+def _encode(row: AuditEvent) -> str:
+    return json.dumps(
+        {name: getattr(row, name) for name in _STREAM_FIELDS},
+        cls=DjangoJSONEncoder,
+    )
+
+
+def _decode(raw: str) -> AuditEvent:
+    data = json.loads(raw)
+    if not isinstance(data, dict):
+        raise TypeError("stream entry is not an object")
+    values = {name: data[name] for name in _STREAM_FIELDS}
+    values["id_uuid"] = UUID(str(values["id_uuid"]))
+    values["occurred_at"] = datetime.fromisoformat(str(values["occurred_at"]))
+    if values["occurred_at"].tzinfo is None:
+        raise ValueError("occurred_at must be timezone-aware")
+    return AuditEvent(**values)
+
+
+def enqueue_events(rows: list[AuditEvent]) -> None:
+    """Append validated, unsaved rows to the ingest stream.
+
+    Raises:
+        IngestBackpressureError: If the stream is full.
+
+    """
+    client = stream_client()
+    max_pending = int(getattr(settings, "KORFBAL_AUDIT_INGEST_MAX_PENDING", 0))
+    depth = int(client.xlen(STREAM_KEY))
+    if max_pending > 0 and depth + len(rows) > max_pending:
+        record_audit_ingest_rejected(queue_depth=depth)
+        raise IngestBackpressureError(
+            f"audit ingest queue holds {depth} events (limit {max_pending})"
+        )
+
+    pipe = client.pipeline(transaction=False)
+    for row in rows:
+        pipe.xadd(STREAM_KEY, {"event": _encode(row)})
+    pipe.execute()
+    _schedule_flush()
+
+
+def enqueue_or_store(rows: list[AuditEvent]) -> None:
+    """Queue rows like `enqueue_events`; store them if the stream is down.
+
+    Rows that were queued before the failure are skipped by the writer,
+    since it never stores an id twice.
+
+    Raises:
+        IngestBackpressureError: If the stream is full.
+
+    """
+    try:
+        enqueue_events(rows)
+    except IngestBackpressureError:
+        raise
+    except Exception:
+        logger.warning(
+            "Audit ingest stream unavailable; writing %s events directly",
+            len(rows),
+            exc_info=True,
+        )
+        write_events(rows)
+
+
+def _schedule_flush() -> None:
+    delay = max(0, int(getattr(settings, "KORFBAL_AUDIT_INGEST_FLUSH_DELAY_S", 2)))
+    # One flush per interval: later enqueues ride along with the pending one.
+    if not cache.add(FLUSH_SCHEDULED_KEY, 1, timeout=max(1, delay)):
+        return
+
+    from apps.audit.tasks import flush_audit_ingest_stream
+
+    try:
+        flush_audit_ingest_stream.apply_async(countdown=delay)
+    except Exception:
+        # The events are queued; the next enqueue schedules the flush.
+        logger.warning("Could not schedule the audit ingest flush", exc_info=True)
+        cache.delete(FLUSH_SCHEDULED_KEY)
+
+
+def _ensure_group(client: Any) -> None:
+    try:
+        client.xgroup_create(STREAM_KEY, CONSUMER_GROUP, id="0", mkstream=True)
+    except Exception as exc:
+        if "BUSYGROUP" not in str(exc):
+            raise
+
+
+def _read_batch(
+    client: Any,
+    *,
+    consumer: str,
+    count: int,
+    block_ms: int | None,
+) -> list[tuple[str, dict[str, str]]]:
+    # Entries a crashed writer read but never acknowledged come first.
+    _next_id, entries, *_rest = client.xautoclaim(
+        STREAM_KEY,
+        CONSUMER_GROUP,
+        consumer,
+        min_idle_time=RECLAIM_IDLE_MS,
+        start_id="0-0",
+        count=count,
+    )
+    if entries:
+        return list(entries)
+
+    response = client.xreadgroup(
+        CONSUMER_GROUP,
+        consumer,
+        {STREAM_KEY: ">"},
+        count=count,
+        block=block_ms,
+    )
+    if not response:
+        return []
+    _stream, stream_entries = response[0]
+    return list(stream_entries)
+
+
+def write_events(rows: list[AuditEvent]) -> int:
+    """Insert unsaved rows that are not stored yet and count them in rollups.
+
+    Returns:
+        int: Number of rows inserted.
+
+    """
+    if not rows:
+        return 0
+    occurred = [row.occurred_at for row in rows]
+    with transaction.atomic():
+        # Redelivered entries may already be stored. The primary key of the
+        # partitioned table also holds occurred_at, so this check is what
+        # keeps id_uuid unique; the occurred_at range keeps the lookup to the
+        # partitions of this batch.
+        existing = set(
+            AuditEvent.objects.filter(
+                id_uuid__in=[row.id_uuid for row in rows],
+                occurred_at__gte=min(occurred),
+                occurred_at__lte=max(occurred),
+            ).values_list("id_uuid", flat=True)
+        )
+        fresh = {
+            row.id_uuid: row for row in rows if row.id_uuid not in existing
+        }
+        created = AuditEvent.objects.bulk_create(list(fresh.values()))
+        record_events(created)
+    return len(created)
+
+
+# Errors caused by the rows themselves. Anything else (a database restart,
+# a failover) propagates and leaves the batch pending for redelivery.
+_REJECTED_ROW_ERRORS: Final = (DataError, IntegrityError)
+
+
+def _dead_letter(entry_id: str, raw: str, exc: Exception) -> str:
+    # The raw entry is kept so the event can be replayed once fixed.
+    return json.dumps({"id": entry_id, "error": str(exc), "event": raw})
+
+
+def _store_individually(
+    decoded: list[tuple[str, str, AuditEvent]],
+    dead: list[str],
+) -> int:
+    written = 0
+    for entry_id, raw, row in decoded:
+        try:
+            written += write_events([row])
+        except _REJECTED_ROW_ERRORS as exc:
+            dead.append(_dead_letter(entry_id, raw, exc))
+    return written
+
+
+def drain_batch(
+    *,
+    consumer: str,
+    batch_size: int | None = None,
+    block_ms: int | None = None,
+) -> DrainResult:
+    """Write up to one batch of queued events to the database.
+
+    Returns:
+        DrainResult: Counts for the processed batch.
+
+    Raises:
+        DatabaseError: If the database is unavailable; the batch stays
+            pending and is redelivered.
+
+    """
+    client = stream_client()
+    count = batch_size or int(
+        getattr(settings, "KORFBAL_AUDIT_INGEST_BATCH_SIZE", 1000),
+    )
+    started = time.perf_counter()
+    _ensure_group(client)
+    entries = _read_batch(client, consumer=consumer, count=count, block_ms=block_ms)
+    if not entries:
+        record_audit_ingest_flush(
+            written=0,
+            dead_lettered=0,
+            elapsed_ms=None,
+            queue_depth=int(client.xlen(STREAM_KEY)),
+        )
+        return DrainResult(read=0, written=0, dead_lettered=0)
+
+    decoded: list[tuple[str, str, AuditEvent]] = []
+    dead: list[str] = []
+    for entry_id, fields in entries:
+        raw = (fields or {}).get("event", "")
+        try:
+            decoded.append((entry_id, raw, _decode(raw)))
+        except (KeyError, TypeError, ValueError) as exc:
+            dead.append(_dead_letter(entry_id, raw, exc))
+
+    try:
+        written = write_events([row for _entry_id, _raw, row in decoded])
+    except _REJECTED_ROW_ERRORS:
+        # One bad row must not block the stream: retry row by row and
+        # dead-letter the rows the database rejects.
+        logger.exception("Audit ingest batch failed; retrying row by row")
+        written = _store_individually(decoded, dead)
+
+    entry_ids = [entry_id for entry_id, _fields in entries]
+    # Dead letters and the acknowledgement land together or not at all: a
+    # redelivered entry was never dead-lettered before.
+    pipe = client.pipeline(transaction=True)
+    if dead:
+        pipe.lpush(DEAD_LETTER_KEY, *dead)
+        pipe.ltrim(DEAD_LETTER_KEY, 0, DEAD_LETTER_MAX - 1)
+    pipe.xack(STREAM_KEY, CONSUMER_GROUP, *entry_ids)
+    # Deleting drained entries keeps XLEN equal to the backlog.
+    pipe.xdel(STREAM_KEY, *entry_ids)
+    pipe.xlen(STREAM_KEY)
+    queue_depth = int(pipe.execute()[-1])
+
+    if dead:
+        logger.warning("Dead-lettered %s rejected audit stream entries", len(dead))
+    record_audit_ingest_flush(
+        written=written,
+        dead_lettered=len(dead),
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+        queue_depth=queue_depth,
+    )
+    return DrainResult(read=len(entries), written=written, dead_lettered=len(dead))
+
+
+def drain_stream(
+    *,
+    consumer: str,
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+) -> DrainResult:
+    """Drain queued events until the stream is empty or `max_batches` ran.
+
+    Returns:
+        DrainResult: Totals across the drained batches; `capped` when
+            `max_batches` ran out first.
+
+    """
+    read = written = dead_lettered = batches = 0
+    while max_batches is None or batches < max(1, max_batches):
+        result = drain_batch(consumer=consumer, batch_size=batch_size)
+        batches += 1
+        read += result.read
+        written += result.written
+        dead_lettered += result.dead_lettered
+        if result.read == 0:
+            return DrainResult(read=read, written=written, dead_lettered=dead_lettered)
+    return DrainResult(
+        read=read,
+        written=written,
+        dead_lettered=dead_lettered,
+        capped=True,
+    )
@@ -0,0 +1,216 @@
+"""Monthly range partitions for `AuditEvent` on PostgreSQL.
+
+Migration `0003_partition_auditevent` turns the audit table into a table
+partitioned by range on `occurred_at`, with one partition per UTC month plus a
+default partition that catches timestamps outside the prepared months.
+
+- `ensure_partitions` pre-creates upcoming months (see the
+  `ensure_audit_partitions` command, run daily from the beat schedule); rows that already landed in the default
+  partition for such a month are moved into the new partition.
+- `drop_partitions_before` implements retention by detaching and dropping
+  whole months, which is constant time regardless of the number of rows.
+- Queries filtering on `occurred_at` only touch the matching partitions.
+
+PostgreSQL requires the partition key in every unique constraint, so the
+primary key is `(id_uuid, occurred_at)` and the database no longer enforces
+a unique `id_uuid` on its own. The writers keep it unique: ids are generated
+server side (UUIDv7) and never taken from producers, and the buffered ingest
+writer skips ids that are already stored before inserting a batch (see
+`apps.audit.services.ingest_buffer`). Code that inserts events with explicit
+ids must do the same.
+
+Other database backends keep the plain table; `partitioning_enabled` reports
+which mode is active so callers can fall back to row deletes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import re
+from typing import Final
+
+from django.db import connection, transaction
+
+from apps.audit.models import AuditEvent
+from apps.audit.services.rollup import rebuild_rollup
+
+
+PARENT_TABLE: Final[str] = AuditEvent._meta.db_table
+DEFAULT_PARTITION: Final[str] = f"{PARENT_TABLE}_default"
+_PARTITION_NAME_RE: Final[re.Pattern[str]] = re.compile(
+    rf"^{PARENT_TABLE}_p(?P<year>\d{{4}})(?P<month>\d{{2}})$",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AuditPartition:
+    """One monthly partition covering `start <= occurred_at < end`."""
+
+    name: str
+    start: datetime
+    end: datetime
+
+
+def month_start(value: datetime) -> datetime:
+    """Return the start of the (UTC) month containing `value`."""
+    return value.astimezone(UTC).replace(
+        day=1,
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Return the month start `months` after the month start `value`."""
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(start: datetime) -> str:
+    """Return the table name of the partition starting at `start`."""
+    return f"{PARENT_TABLE}_p{start:%Y%m}"
+
+
+def partitioning_enabled() -> bool:
+    """Return whether the audit table is a partitioned PostgreSQL table."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(%s)",
+            [PARENT_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions() -> list[AuditPartition]:
+    """Return the monthly partitions (the default partition excluded).
+
+    Returns:
+        list[AuditPartition]: Partitions ordered by start.
+
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(%s)",
+            [PARENT_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions: list[AuditPartition] = []
+    for name in names:
+        match = _PARTITION_NAME_RE.match(name)
+        if match is None:
+            continue
+        start = datetime(int(match["year"]), int(match["month"]), 1, tzinfo=UTC)
+        partitions.append(AuditPartition(name, start, add_months(start, 1)))
+    return sorted(partitions, key=lambda partition: partition.start)
+
+
+def _create_partition(start: datetime) -> str:
+    end = add_months(start, 1)
+    name = partition_name(start)
+    qn = connection.ops.quote_name
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Attaching a range that still has rows in the default partition
+        # fails, so move those rows over first. The lock blocks inserts (but
+        # not reads) until the attach commits, so no new row for this month
+        # can land in the default partition in between.
+        cursor.execute(
+            f"LOCK TABLE {qn(PARENT_TABLE)} IN SHARE ROW EXCLUSIVE MODE",
+        )
+        cursor.execute(
+            f"CREATE TABLE {qn(name)} "
+            f"(LIKE {qn(PARENT_TABLE)} INCLUDING DEFAULTS INCLUDING GENERATED)",
+        )
+        # Only model columns: generated columns cannot be inserted into.
+        columns = ", ".join(
+            qn(field.column) for field in AuditEvent._meta.concrete_fields
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {qn(DEFAULT_PARTITION)} "  # noqa: S608
+            "WHERE occurred_at >= %s AND occurred_at < %s "
+            f"RETURNING {columns}) "
+            f"INSERT INTO {qn(name)} ({columns}) SELECT {columns} FROM moved",
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(PARENT_TABLE)} ATTACH PARTITION {qn(name)} "
+            "FOR VALUES FROM (%s) TO (%s)",
+            [start, end],
+        )
+    return name
+
+
+def ensure_partitions(
+    *,
+    months_ahead: int,
+    now: datetime | None = None,
+) -> list[str]:
+    """Create missing partitions from the current month `months_ahead` on.
+
+    Returns:
+        list[str]: Names of the partitions created.
+
+    """
+    current = month_start(now or datetime.now(tz=UTC))
+    existing = {partition.start for partition in list_partitions()}
+    created: list[str] = []
+    for offset in range(max(0, months_ahead) + 1):
+        start = add_months(current, offset)
+        if start not in existing:
+            created.append(_create_partition(start))
+    return created
+
+
+def expired_partitions(*, before: datetime) -> list[AuditPartition]:
+    """Return the partitions that only hold rows older than `before`."""
+    return [
+        partition for partition in list_partitions() if partition.end <= before
+    ]
+
+
+def drop_partitions_before(*, before: datetime) -> list[str]:
+    """Detach and drop every partition that ends on or before `before`.
+
+    Rows older than `before` in the default partition are deleted as well;
+    that partition only holds timestamps outside the prepared months. Rollup
+    buckets of older months are left to `purge_rollup`; the hours of the
+    month containing `before` that lose rows are recounted here.
+
+    Returns:
+        list[str]: Names of the dropped partitions.
+
+    """
+    qn = connection.ops.quote_name
+    dropped: list[str] = []
+    for partition in expired_partitions(before=before):
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {qn(PARENT_TABLE)} "
+                f"DETACH PARTITION {qn(partition.name)}",
+            )
+            cursor.execute(f"DROP TABLE {qn(partition.name)}")
+        dropped.append(partition.name)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT DISTINCT date_trunc('hour', occurred_at AT TIME ZONE 'UTC') "
+            f"FROM {qn(DEFAULT_PARTITION)} "  # noqa: S608
+            "WHERE occurred_at >= %s AND occurred_at < %s",
+            [month_start(before), before],
+        )
+        hours = [row[0].replace(tzinfo=UTC) for row in cursor.fetchall()]
+        cursor.execute(
+            f"DELETE FROM {qn(DEFAULT_PARTITION)} WHERE occurred_at < %s",  # noqa: S608
+            [before],
+        )
+        for hour in hours:
+            rebuild_rollup(since=hour, until=hour + timedelta(hours=1))
+    return dropped
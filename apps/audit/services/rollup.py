@@ -0,0 +1,422 @@
+"""Maintain and query the hourly audit rollup.
+
+Dashboards (summary, producer stats, trends, health) aggregate over windows of
+up to a week. Scanning raw `AuditEvent` rows for that is proportional to the
+event volume, so complete hours are read from `AuditHourlyRollup` instead:
+
+- new events are added to their bucket once stored. Ingest requests only
+  schedule that (`schedule_record_events`; `post_save` for single rows):
+  after commit the `add_to_audit_rollup` task applies one increment per
+  bucket, so requests never wait on the hot bucket of the current hour. The
+  buffered ingest writer counts whole batches itself (`record_events`).
+  Increments are queued without retries; the hourly `recount_audit_rollup`
+  task recounts recent hours so a lost one does not leave a bucket short;
+- `rebuild_rollup` recomputes a time range from raw events (backfill/repair,
+  see the `rebuild_audit_rollup` command);
+- reads take complete hours from the rollup and only the partial hours at the
+  window edges (including the current hour) from raw events, so results are
+  identical to aggregating raw rows once pending increments are applied (the
+  last complete hour may trail by the task latency);
+- `purge_rollup` drops the hours before a retention cutoff and recomputes
+  the hour containing it from the events that remain.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import partial
+import logging
+from typing import Any, Final
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, Max, Min, Q, QuerySet, Sum, Value, When
+from django.db.models.functions import Greatest, Least, TruncHour
+from django.utils import timezone
+
+from apps.audit.models import AuditEvent, AuditHourlyRollup
+from apps.audit.models.rollup import VISIBILITY_PUBLIC, VISIBILITY_RESTRICTED
+
+
+PUBLIC_SEVERITIES: Final[tuple[str, ...]] = ("info", "warning", "error")
+ROLLUP_DIMENSIONS: Final[tuple[str, ...]] = (
+    "hour",
+    "source_system",
+    "event_name",
+    "severity",
+)
+_ONE_HOUR: Final[timedelta] = timedelta(hours=1)
+_REBUILD_BATCH_SIZE: Final[int] = 1000
+
+_PUBLIC_FILTER: Final[Q] = Q(club_id__exact="") | Q(severity__in=PUBLIC_SEVERITIES)
+
+logger = logging.getLogger(__name__)
+
+# Bucket key: hour, source_system, event_name, severity, visibility.
+_BucketKey = tuple[datetime, str, str, str, str]
+# JSON form of one bucket increment, as sent to the rollup task.
+RollupDelta = list[Any]
+
+
+@dataclass(frozen=True, slots=True)
+class AuditViewer:
+    """Who is reading aggregates: staff see everything, others a subset."""
+
+    is_staff: bool
+    user_id: str = ""
+
+    def event_filter(self) -> Q | None:
+        """Return the raw-event visibility filter (None for staff)."""
+        if self.is_staff:
+            return None
+        return Q(actor_id=self.user_id) | _PUBLIC_FILTER
+
+
+def floor_hour(value: datetime) -> datetime:
+    """Return the start of the (UTC) hour containing `value`."""
+    return value.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_hour(value: datetime) -> datetime:
+    floored = floor_hour(value)
+    return floored if floored == value else floored + _ONE_HOUR
+
+
+def visibility_class(*, club_id: str, severity: str) -> str:
+    """Return the rollup visibility class of an event."""
+    if not club_id or severity in PUBLIC_SEVERITIES:
+        return VISIBILITY_PUBLIC
+    return VISIBILITY_RESTRICTED
+
+
+@dataclass(slots=True)
+class _Bucket:
+    count: int
+    first: datetime
+    last: datetime
+
+
+def _count_buckets(events: Iterable[AuditEvent]) -> dict[_BucketKey, _Bucket]:
+    buckets: dict[_BucketKey, _Bucket] = {}
+    for event in events:
+        key = (
+            floor_hour(event.occurred_at),
+            event.source_system,
+            event.event_name,
+            event.severity,
+            visibility_class(club_id=event.club_id, severity=event.severity),
+        )
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = _Bucket(1, event.occurred_at, event.occurred_at)
+        else:
+            bucket.count += 1
+            bucket.first = min(bucket.first, event.occurred_at)
+            bucket.last = max(bucket.last, event.occurred_at)
+    return buckets
+
+
+def _apply_buckets(buckets: dict[_BucketKey, _Bucket]) -> None:
+    # A fixed order keeps concurrent writers from deadlocking on buckets.
+    for (hour, source_system, event_name, severity, visibility), bucket in sorted(
+        buckets.items(),
+        key=lambda item: item[0],
+    ):
+        _increment_bucket(
+            {
+                "hour": hour,
+                "source_system": source_system,
+                "event_name": event_name,
+                "severity": severity,
+                "visibility": visibility,
+            },
+            bucket,
+        )
+
+
+def record_events(events: Iterable[AuditEvent]) -> None:
+    """Add freshly stored events to their hourly rollup buckets right away."""
+    _apply_buckets(_count_buckets(events))
+
+
+def schedule_record_events(events: Iterable[AuditEvent]) -> None:
+    """Add freshly stored events to their buckets after the commit.
+
+    The counts go to the `add_to_audit_rollup` task; when it cannot be
+    queued they are applied on the spot.
+    """
+    deltas = [
+        [
+            key[0].isoformat(),
+            *key[1:],
+            bucket.count,
+            bucket.first.isoformat(),
+            bucket.last.isoformat(),
+        ]
+        for key, bucket in _count_buckets(events).items()
+    ]
+    if deltas:
+        transaction.on_commit(partial(_send_deltas, deltas))
+
+
+def _send_deltas(deltas: list[RollupDelta]) -> None:
+    from apps.audit.tasks import add_to_audit_rollup
+
+    try:
+        add_to_audit_rollup.apply_async(args=(deltas,), retry=False)
+    except Exception:
+        logger.warning(
+            "Could not queue the audit rollup update; applying it inline",
+            exc_info=True,
+        )
+        apply_rollup_deltas(deltas)
+
+
+@transaction.atomic
+def apply_rollup_deltas(deltas: Iterable[RollupDelta]) -> int:
+    """Apply bucket increments built by `schedule_record_events`.
+
+    They are applied in one transaction, so a retried task never counts
+    events twice.
+
+    Returns:
+        int: Number of events counted.
+
+    """
+    buckets: dict[_BucketKey, _Bucket] = {}
+    for delta in deltas:
+        hour, source_system, event_name, severity, visibility = delta[:5]
+        key = (
+            datetime.fromisoformat(hour),
+            source_system,
+            event_name,
+            severity,
+            visibility,
+        )
+        bucket = _Bucket(
+            int(delta[5]),
+            datetime.fromisoformat(delta[6]),
+            datetime.fromisoformat(delta[7]),
+        )
+        current = buckets.get(key)
+        if current is None:
+            buckets[key] = bucket
+        else:
+            current.count += bucket.count
+            current.first = min(current.first, bucket.first)
+            current.last = max(current.last, bucket.last)
+    _apply_buckets(buckets)
+    return sum(bucket.count for bucket in buckets.values())
+
+
+def _increment_bucket(key: dict[str, Any], bucket: _Bucket) -> None:
+    def update() -> int:
+        return AuditHourlyRollup.objects.filter(**key).update(
+            event_count=F("event_count") + bucket.count,
+            first_occurred_at=Least(F("first_occurred_at"), Value(bucket.first)),
+            last_occurred_at=Greatest(F("last_occurred_at"), Value(bucket.last)),
+        )
+
+    if update():
+        return
+    try:
+        with transaction.atomic():
+            AuditHourlyRollup.objects.create(
+                **key,
+                event_count=bucket.count,
+                first_occurred_at=bucket.first,
+                last_occurred_at=bucket.last,
+            )
+    except IntegrityError:
+        # Another writer created the bucket concurrently.
+        update()
+
+
+def _visibility_expression() -> Case:
+    return Case(
+        When(_PUBLIC_FILTER, then=Value(VISIBILITY_PUBLIC)),
+        default=Value(VISIBILITY_RESTRICTED),
+    )
+
+
+@transaction.atomic
+def rebuild_rollup(*, since: datetime, until: datetime | None = None) -> int:
+    """Recompute all rollup buckets for the hours between `since` and `until`.
+
+    Returns:
+        int: Number of rollup rows written.
+
+    """
+    start = floor_hour(since)
+    rollup_rows = AuditHourlyRollup.objects.filter(hour__gte=start)
+    events = AuditEvent.objects.filter(occurred_at__gte=start)
+    if until is not None:
+        end = _ceil_hour(until)
+        rollup_rows = rollup_rows.filter(hour__lt=end)
+        events = events.filter(occurred_at__lt=end)
+    rollup_rows.delete()
+
+    aggregated = (
+        events
+        .annotate(
+            hour=TruncHour("occurred_at", tzinfo=UTC),
+            visibility=_visibility_expression(),
+        )
+        .values("hour", "source_system", "event_name", "severity", "visibility")
+        .annotate(
+            event_count=Count("id_uuid"),
+            first_occurred_at=Min("occurred_at"),
+            last_occurred_at=Max("occurred_at"),
+        )
+        .order_by()
+    )
+    created = AuditHourlyRollup.objects.bulk_create(
+        (AuditHourlyRollup(**row) for row in aggregated.iterator()),
+        batch_size=_REBUILD_BATCH_SIZE,
+    )
+    return len(created)
+
+
+@transaction.atomic
+def purge_rollup(*, before: datetime) -> int:
+    """Drop the buckets of events older than `before`, once they are purged.
+
+    Hours ending on or before `before` are deleted. The hour containing
+    `before` keeps its newer events, so its buckets are recomputed from the
+    raw events left after the purge.
+
+    Returns:
+        int: Number of rollup rows deleted.
+
+    """
+    deleted, _details = AuditHourlyRollup.objects.filter(
+        hour__lt=floor_hour(before),
+    ).delete()
+    if floor_hour(before) != before:
+        rebuild_rollup(since=before, until=before)
+    return deleted
+
+
+def _grouped(
+    queryset: QuerySet[Any],
+    *,
+    group_by: Sequence[str],
+    count: Count | Sum,
+    first: str,
+    last: str,
+) -> Iterable[dict[str, Any]]:
+    return (
+        queryset
+        .values(*group_by)
+        .annotate(total=count, first_seen=Min(first), last_seen=Max(last))
+        .order_by()
+    )
+
+
+def _raw_rows(
+    events: QuerySet[AuditEvent],
+    *,
+    group_by: Sequence[str],
+) -> Iterable[dict[str, Any]]:
+    if "hour" in group_by:
+        events = events.annotate(hour=TruncHour("occurred_at", tzinfo=UTC))
+    return _grouped(
+        events,
+        group_by=group_by,
+        count=Count("id_uuid"),
+        first="occurred_at",
+        last="occurred_at",
+    )
+
+
+def aggregate_window(
+    *,
+    start: datetime,
+    end: datetime | None = None,
+    group_by: Sequence[str],
+    viewer: AuditViewer,
+) -> list[dict[str, Any]]:
+    """Aggregate visible events with `start <= occurred_at < end`.
+
+    `end=None` leaves the window open (events dated in the future included),
+    matching an `occurred_at >= start` filter on raw events.
+
+    Args:
+        start: Inclusive window start.
+        end: Exclusive window end, or None for an open window.
+        group_by: Subset of `ROLLUP_DIMENSIONS` to group on.
+        viewer: Whose visibility rules apply.
+
+    Returns:
+        list[dict[str, Any]]: One dict per group with the `group_by` fields,
+        `total`, `first_seen` and `last_seen`.
+
+    Raises:
+        ValueError: If `group_by` contains an unknown dimension.
+
+    """
+    unknown = set(group_by) - set(ROLLUP_DIMENSIONS)
+    if unknown:
+        raise ValueError(f"Unknown rollup dimensions: {sorted(unknown)}")
+
+    # Complete hours come from the rollup; the partial hours at both edges
+    # (the open end always includes the current hour) from raw events.
+    rollup_start = _ceil_hour(start)
+    rollup_end = floor_hour(end if end is not None else timezone.now())
+
+    events = AuditEvent.objects.filter(occurred_at__gte=start)
+    if end is not None:
+        events = events.filter(occurred_at__lt=end)
+    visibility_filter = viewer.event_filter()
+    if visibility_filter is not None:
+        events = events.filter(visibility_filter)
+
+    sources: list[Iterable[dict[str, Any]]] = []
+    if rollup_start < rollup_end:
+        rollup = AuditHourlyRollup.objects.filter(
+            hour__gte=rollup_start,
+            hour__lt=rollup_end,
+        )
+        if not viewer.is_staff:
+            rollup = rollup.filter(visibility=VISIBILITY_PUBLIC)
+            # Restricted buckets are not per-actor; add the viewer's own.
+            sources.append(
+                _raw_rows(
+                    AuditEvent.objects
+                    .filter(
+                        occurred_at__gte=rollup_start,
+                        occurred_at__lt=rollup_end,
+                        actor_id=viewer.user_id,
+                    )
+                    .exclude(_PUBLIC_FILTER),
+                    group_by=group_by,
+                ),
+            )
+        sources.append(
+            _grouped(
+                rollup,
+                group_by=group_by,
+                count=Sum("event_count"),
+                first="first_occurred_at",
+                last="last_occurred_at",
+            ),
+        )
+        events = events.filter(
+            Q(occurred_at__lt=rollup_start) | Q(occurred_at__gte=rollup_end),
+        )
+    sources.append(_raw_rows(events, group_by=group_by))
+
+    merged: dict[tuple[Any, ...], dict[str, Any]] = {}
+    for rows in sources:
+        for row in rows:
+            key = tuple(row[name] for name in group_by)
+            current = merged.get(key)
+            if current is None:
+                # PostgreSQL sums bigint columns as numeric; keep totals ints.
+                merged[key] = {**row, "total": int(row["total"])}
+                continue
+            current["total"] += int(row["total"])
+            current["first_seen"] = min(current["first_seen"], row["first_seen"])
+            current["last_seen"] = max(current["last_seen"], row["last_seen"])
+    return list(merged.values())
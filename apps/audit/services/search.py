@@ -0,0 +1,92 @@
+"""Timeline search over audit events.
+
+On PostgreSQL, migration `0004_auditevent_search_indexes` adds a generated
+`search_vector` column (event name and message, `simple` configuration) with a
+GIN index, plus trigram GIN indexes on the identifier-like columns. A search
+then matches:
+
+- words of the message/event name via `websearch_to_tsquery` (quoted phrases,
+  `or` and `-word` work as in web search boxes);
+- for plain input (no operators), words of the message/event name that start
+  with the searched words (`overti` finds "overtime"), via a prefix tsquery on
+  the same index;
+- substrings of `event_name`, `actor_id` and `subject_id` via `ILIKE`, which
+  the trigram indexes serve for terms of three or more characters.
+
+Text inside a message word (`time` in "overtime") is not matched; `icontains`
+used to, but it cannot use an index on the message. The column is not a model
+field (Django never writes it), so the match is a raw SQL expression. Other
+backends keep the plain `icontains` filters.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Final
+
+from django.db import connection
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+
+from apps.audit.models import AuditEvent
+
+
+SEARCH_CONFIG: Final[str] = "simple"
+TRIGRAM_FIELDS: Final[tuple[str, ...]] = ("event_name", "actor_id", "subject_id")
+
+_WORD_RE: Final[re.Pattern[str]] = re.compile(r"[^\W_]+")
+# Web search syntax: phrases, alternatives and excluded words.
+_OPERATOR_RE: Final[re.Pattern[str]] = re.compile(
+    r"\"|(?:^|\s)-|(?:^|\s)or(?:\s|$)",
+    re.IGNORECASE,
+)
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _prefix_tsquery(term: str) -> str | None:
+    """Return a `to_tsquery` input matching words starting with each word."""
+    if _OPERATOR_RE.search(term):
+        return None
+    words = _WORD_RE.findall(term.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def _column(name: str) -> str:
+    qn = connection.ops.quote_name
+    return f"{qn(AuditEvent._meta.db_table)}.{qn(name)}"
+
+
+def audit_search_filter(term: str) -> Q:
+    """Return the filter matching audit events for a timeline search term."""
+    if connection.vendor != "postgresql":
+        return (
+            Q(event_name__icontains=term)
+            | Q(message__icontains=term)
+            | Q(actor_id__icontains=term)
+            | Q(subject_id__icontains=term)
+        )
+
+    vector = _column("search_vector")
+    text_sql = f"{vector} @@ websearch_to_tsquery('{SEARCH_CONFIG}', %s)"
+    text_params = [term]
+    prefix = _prefix_tsquery(term)
+    if prefix is not None:
+        text_sql += f" OR {vector} @@ to_tsquery('{SEARCH_CONFIG}', %s)"
+        text_params.append(prefix)
+
+    pattern = _like_pattern(term)
+    return Q(
+        RawSQL(text_sql, text_params, output_field=BooleanField()),
+    ) | Q(
+        RawSQL(
+            " OR ".join(f"{_column(field)} ILIKE %s" for field in TRIGRAM_FIELDS),
+            [pattern] * len(TRIGRAM_FIELDS),
+            output_field=BooleanField(),
+        ),
+    )
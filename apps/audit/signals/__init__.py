@@ -0,0 +1,6 @@
+"""Module contains signals for the audit app."""
+
+from .rollup_signals import add_event_to_rollup
+
+
+__all__ = ["add_event_to_rollup"]
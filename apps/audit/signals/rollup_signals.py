@@ -0,0 +1,26 @@
+"""Keep the hourly audit rollup in step with stored events."""
+
+from __future__ import annotations
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.audit.models import AuditEvent
+from apps.audit.services.rollup import schedule_record_events
+
+
+@receiver(post_save, sender=AuditEvent)
+def add_event_to_rollup(
+    sender: type[AuditEvent],
+    instance: AuditEvent,
+    created: bool,
+    raw: bool = False,
+    **kwargs: object,
+) -> None:
+    """Count a newly stored event in its hourly bucket after the commit.
+
+    `bulk_create` does not send `post_save`; bulk ingest schedules its
+    events itself.
+    """
+    if created and not raw:
+        schedule_record_events([instance])
@@ -0,0 +1,81 @@
+"""Celery tasks for the audit app."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from celery import shared_task
+from django.conf import settings
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.audit.services.ingest_buffer import drain_stream
+from apps.audit.services.rollup import (
+    RollupDelta,
+    apply_rollup_deltas,
+    floor_hour,
+    rebuild_rollup,
+)
+
+
+FLUSH_CONSUMER = "celery-flush"
+FLUSH_MAX_BATCHES = 100
+DEFAULT_RECOUNT_HOURS = 24
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def flush_audit_ingest_stream(self: Any) -> dict[str, int]:
+    """Write queued audit events from the ingest stream to the database."""
+    result = drain_stream(consumer=FLUSH_CONSUMER, max_batches=FLUSH_MAX_BATCHES)
+    if result.capped:
+        # Leave the worker to other tasks and continue in a fresh run.
+        flush_audit_ingest_stream.apply_async(countdown=0)
+    return {
+        "read": result.read,
+        "written": result.written,
+        "dead_lettered": result.dead_lettered,
+    }
+
+
+@shared_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def add_to_audit_rollup(deltas: list[RollupDelta]) -> int:
+    """Add the events counted by an ingest request to their rollup buckets."""
+    return apply_rollup_deltas(deltas)
+
+
+@shared_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def recount_audit_rollup() -> int:
+    """Recount the recent complete hours of the rollup from raw events.
+
+    Rollup increments are queued without retries, so a lost or failed
+    `add_to_audit_rollup` run leaves its buckets short. Running this
+    periodically (see the beat schedule) bounds that drift to the hours
+    since the last run; an increment that lands after a recount already
+    counted its events is corrected by the next run. The current hour is
+    always read from raw events.
+    """
+    hours = max(
+        1,
+        int(
+            getattr(
+                settings,
+                "KORFBAL_AUDIT_ROLLUP_RECOUNT_HOURS",
+                DEFAULT_RECOUNT_HOURS,
+            ),
+        ),
+    )
+    until = floor_hour(timezone.now())
+    return rebuild_rollup(since=until - timedelta(hours=hours), until=until)
+
+
+@shared_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def ensure_audit_partitions() -> None:
+    """Create the upcoming monthly audit partitions (daily beat entry)."""
+    call_command("ensure_audit_partitions")
+
+
+@shared_task(autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def purge_audit_events() -> None:
+    """Apply the audit retention window (daily beat entry)."""
+    call_command("purge_audit_events")
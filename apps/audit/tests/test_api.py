@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import timedelta
 from http import HTTPStatus
+from typing import Any
 
 from django.contrib.auth import get_user_model
 from django.test import override_settings
@@ -235,27 +237,31 @@ def test_timeline_invalid_cursor_returns_400(client: Client) -> None:
 
 @pytest.mark.django_db
 @override_settings(SECURE_SSL_REDIRECT=False)
-def test_summary_returns_aggregates_for_staff(client: Client) -> None:
+def test_summary_returns_aggregates_for_staff(
+    client: Client,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
     """Summary endpoint should return grouped counts for staff users."""
     now = timezone.now()
-    AuditEvent.objects.create(
-        event_name="sync.started",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=1),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="sync.started",
-        source_system="extension",
-        occurred_at=now - timedelta(minutes=10),
-        severity="warning",
-    )
-    AuditEvent.objects.create(
-        event_name="trade.failed",
-        source_system="rolltrader_console",
-        occurred_at=now - timedelta(minutes=5),
-        severity="error",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        AuditEvent.objects.create(
+            event_name="sync.started",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=1),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="sync.started",
+            source_system="extension",
+            occurred_at=now - timedelta(minutes=10),
+            severity="warning",
+        )
+        AuditEvent.objects.create(
+            event_name="trade.failed",
+            source_system="rolltrader_console",
+            occurred_at=now - timedelta(minutes=5),
+            severity="error",
+        )
 
     user = get_user_model().objects.create_user(
         username="summary_staff_user",
@@ -285,7 +291,10 @@ def test_summary_returns_aggregates_for_staff(client: Client) -> None:
 
 @pytest.mark.django_db
 @override_settings(SECURE_SSL_REDIRECT=False)
-def test_summary_filters_for_non_staff_user(client: Client) -> None:
+def test_summary_filters_for_non_staff_user(
+    client: Client,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
     """Non-staff users should only see rows matching timeline visibility rules."""
     now = timezone.now()
 
@@ -300,28 +309,29 @@ def test_summary_filters_for_non_staff_user(client: Client) -> None:
         is_staff=False,
     )
 
-    AuditEvent.objects.create(
-        event_name="visible.by.actor",
-        source_system="django",
-        occurred_at=now - timedelta(minutes=30),
-        actor_id=str(visible_user.pk),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="visible.by.club",
-        source_system="django",
-        occurred_at=now - timedelta(minutes=20),
-        club_id="",
-        severity="warning",
-    )
-    AuditEvent.objects.create(
-        event_name="hidden.row",
-        source_system="django",
-        occurred_at=now - timedelta(minutes=10),
-        actor_id=str(hidden_user.pk),
-        club_id="club-abc",
-        severity="critical",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        AuditEvent.objects.create(
+            event_name="visible.by.actor",
+            source_system="django",
+            occurred_at=now - timedelta(minutes=30),
+            actor_id=str(visible_user.pk),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="visible.by.club",
+            source_system="django",
+            occurred_at=now - timedelta(minutes=20),
+            club_id="",
+            severity="warning",
+        )
+        AuditEvent.objects.create(
+            event_name="hidden.row",
+            source_system="django",
+            occurred_at=now - timedelta(minutes=10),
+            actor_id=str(hidden_user.pk),
+            club_id="club-abc",
+            severity="critical",
+        )
 
     client.force_login(visible_user)
     response = client.get("/api/audit/events/summary/", {"window_hours": 24})
@@ -337,27 +347,31 @@ def test_summary_filters_for_non_staff_user(client: Client) -> None:
 
 @pytest.mark.django_db
 @override_settings(SECURE_SSL_REDIRECT=False)
-def test_producer_stats_returns_grouped_health_metrics(client: Client) -> None:
+def test_producer_stats_returns_grouped_health_metrics(
+    client: Client,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
     """Producer stats endpoint should expose per-source totals/error counters."""
     now = timezone.now()
-    AuditEvent.objects.create(
-        event_name="a",
-        source_system="extension",
-        occurred_at=now - timedelta(minutes=20),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="b",
-        source_system="extension",
-        occurred_at=now - timedelta(minutes=5),
-        severity="error",
-    )
-    AuditEvent.objects.create(
-        event_name="c",
-        source_system="rolltrader_console",
-        occurred_at=now - timedelta(minutes=2),
-        severity="warning",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        AuditEvent.objects.create(
+            event_name="a",
+            source_system="extension",
+            occurred_at=now - timedelta(minutes=20),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="b",
+            source_system="extension",
+            occurred_at=now - timedelta(minutes=5),
+            severity="error",
+        )
+        AuditEvent.objects.create(
+            event_name="c",
+            source_system="rolltrader_console",
+            occurred_at=now - timedelta(minutes=2),
+            severity="warning",
+        )
 
     user = get_user_model().objects.create_user(
         username="producer_stats_staff",
@@ -382,7 +396,10 @@ def test_producer_stats_returns_grouped_health_metrics(client: Client) -> None:
 
 @pytest.mark.django_db
 @override_settings(SECURE_SSL_REDIRECT=False)
-def test_producer_stats_applies_non_staff_visibility_filters(client: Client) -> None:
+def test_producer_stats_applies_non_staff_visibility_filters(
+    client: Client,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
     """Non-staff producer stats should hide events outside timeline visibility scope."""
     now = timezone.now()
     visible_user = get_user_model().objects.create_user(
@@ -396,21 +413,22 @@ def test_producer_stats_applies_non_staff_visibility_filters(client: Client) ->
         is_staff=False,
     )
 
-    AuditEvent.objects.create(
-        event_name="visible",
-        source_system="extension",
-        occurred_at=now - timedelta(minutes=3),
-        actor_id=str(visible_user.pk),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="hidden",
-        source_system="secret_source",
-        occurred_at=now - timedelta(minutes=2),
-        actor_id=str(hidden_user.pk),
-        club_id="club-private",
-        severity="debug",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        AuditEvent.objects.create(
+            event_name="visible",
+            source_system="extension",
+            occurred_at=now - timedelta(minutes=3),
+            actor_id=str(visible_user.pk),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="hidden",
+            source_system="secret_source",
+            occurred_at=now - timedelta(minutes=2),
+            actor_id=str(hidden_user.pk),
+            club_id="club-private",
+            severity="debug",
+        )
 
     client.force_login(visible_user)
     response = client.get("/api/audit/events/producers/", {"window_hours": 24})
@@ -424,49 +442,53 @@ def test_producer_stats_applies_non_staff_visibility_filters(client: Client) ->
 
 @pytest.mark.django_db
 @override_settings(SECURE_SSL_REDIRECT=False)
-def test_trends_returns_hourly_points_and_error_rate_delta(client: Client) -> None:
+def test_trends_returns_hourly_points_and_error_rate_delta(
+    client: Client,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
     """Trends endpoint should provide hourly buckets and error-rate delta."""
     now = timezone.now()
 
     # Current window: 4 events, 1 error => 25%
-    AuditEvent.objects.create(
-        event_name="current.info.1",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=1, minutes=5),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="current.info.2",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=2, minutes=15),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="current.warning",
-        source_system="rolltrader_console",
-        occurred_at=now - timedelta(hours=3, minutes=25),
-        severity="warning",
-    )
-    AuditEvent.objects.create(
-        event_name="current.error",
-        source_system="rolltrader_console",
-        occurred_at=now - timedelta(hours=4, minutes=10),
-        severity="error",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        AuditEvent.objects.create(
+            event_name="current.info.1",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=1, minutes=5),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="current.info.2",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=2, minutes=15),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="current.warning",
+            source_system="rolltrader_console",
+            occurred_at=now - timedelta(hours=3, minutes=25),
+            severity="warning",
+        )
+        AuditEvent.objects.create(
+            event_name="current.error",
+            source_system="rolltrader_console",
+            occurred_at=now - timedelta(hours=4, minutes=10),
+            severity="error",
+        )
 
-    # Previous window: 2 events, 1 error => 50%
-    AuditEvent.objects.create(
-        event_name="previous.error",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=7),
-        severity="error",
-    )
-    AuditEvent.objects.create(
-        event_name="previous.info",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=8),
-        severity="info",
-    )
+        # Previous window: 2 events, 1 error => 50%
+        AuditEvent.objects.create(
+            event_name="previous.error",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=7),
+            severity="error",
+        )
+        AuditEvent.objects.create(
+            event_name="previous.info",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=8),
+            severity="info",
+        )
 
     user = get_user_model().objects.create_user(
         username="trends_staff_user",
@@ -493,7 +515,10 @@ def test_trends_returns_hourly_points_and_error_rate_delta(client: Client) -> No
 
 @pytest.mark.django_db
 @override_settings(SECURE_SSL_REDIRECT=False)
-def test_trends_non_staff_applies_visibility_filter(client: Client) -> None:
+def test_trends_non_staff_applies_visibility_filter(
+    client: Client,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
     """Non-staff trends should exclude hidden debug-only producer events."""
     now = timezone.now()
 
@@ -508,21 +533,22 @@ def test_trends_non_staff_applies_visibility_filter(client: Client) -> None:
         is_staff=False,
     )
 
-    AuditEvent.objects.create(
-        event_name="visible.info",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=1),
-        actor_id=str(visible_user.pk),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="hidden.debug",
-        source_system="secret_source",
-        occurred_at=now - timedelta(hours=1, minutes=20),
-        actor_id=str(hidden_user.pk),
-        club_id="club-private",
-        severity="debug",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        AuditEvent.objects.create(
+            event_name="visible.info",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=1),
+            actor_id=str(visible_user.pk),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="hidden.debug",
+            source_system="secret_source",
+            occurred_at=now - timedelta(hours=1, minutes=20),
+            actor_id=str(hidden_user.pk),
+            club_id="club-private",
+            severity="debug",
+        )
 
     client.force_login(visible_user)
     response = client.get(
@@ -538,81 +564,85 @@ def test_trends_non_staff_applies_visibility_filter(client: Client) -> None:
 
 @pytest.mark.django_db
 @override_settings(SECURE_SSL_REDIRECT=False)
-def test_health_scores_rank_worst_producer_first(client: Client) -> None:
+def test_health_scores_rank_worst_producer_first(
+    client: Client,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
     """Health endpoint should rank producers by descending risk score."""
     now = timezone.now()
 
     # extension gets worse: higher current error-rate than previous window
-    AuditEvent.objects.create(
-        event_name="ext.current.error.1",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=1),
-        severity="error",
-    )
-    AuditEvent.objects.create(
-        event_name="ext.current.error.2",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=2),
-        severity="error",
-    )
-    AuditEvent.objects.create(
-        event_name="ext.current.info.1",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=2, minutes=10),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="ext.current.warning.1",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=3),
-        severity="warning",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        AuditEvent.objects.create(
+            event_name="ext.current.error.1",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=1),
+            severity="error",
+        )
+        AuditEvent.objects.create(
+            event_name="ext.current.error.2",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=2),
+            severity="error",
+        )
+        AuditEvent.objects.create(
+            event_name="ext.current.info.1",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=2, minutes=10),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="ext.current.warning.1",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=3),
+            severity="warning",
+        )
 
-    AuditEvent.objects.create(
-        event_name="ext.previous.info.1",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=7),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="ext.previous.info.2",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=8),
-        severity="info",
-    )
+        AuditEvent.objects.create(
+            event_name="ext.previous.info.1",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=7),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="ext.previous.info.2",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=8),
+            severity="info",
+        )
 
-    # rolltrader stable: no current errors
-    AuditEvent.objects.create(
-        event_name="rt.current.info.1",
-        source_system="rolltrader_console",
-        occurred_at=now - timedelta(hours=1, minutes=5),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="rt.current.info.2",
-        source_system="rolltrader_console",
-        occurred_at=now - timedelta(hours=2, minutes=5),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="rt.current.info.3",
-        source_system="rolltrader_console",
-        occurred_at=now - timedelta(hours=3, minutes=5),
-        severity="info",
-    )
+        # rolltrader stable: no current errors
+        AuditEvent.objects.create(
+            event_name="rt.current.info.1",
+            source_system="rolltrader_console",
+            occurred_at=now - timedelta(hours=1, minutes=5),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="rt.current.info.2",
+            source_system="rolltrader_console",
+            occurred_at=now - timedelta(hours=2, minutes=5),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="rt.current.info.3",
+            source_system="rolltrader_console",
+            occurred_at=now - timedelta(hours=3, minutes=5),
+            severity="info",
+        )
 
-    AuditEvent.objects.create(
-        event_name="rt.previous.error.1",
-        source_system="rolltrader_console",
-        occurred_at=now - timedelta(hours=7, minutes=10),
-        severity="error",
-    )
-    AuditEvent.objects.create(
-        event_name="rt.previous.info.1",
-        source_system="rolltrader_console",
-        occurred_at=now - timedelta(hours=8, minutes=10),
-        severity="info",
-    )
+        AuditEvent.objects.create(
+            event_name="rt.previous.error.1",
+            source_system="rolltrader_console",
+            occurred_at=now - timedelta(hours=7, minutes=10),
+            severity="error",
+        )
+        AuditEvent.objects.create(
+            event_name="rt.previous.info.1",
+            source_system="rolltrader_console",
+            occurred_at=now - timedelta(hours=8, minutes=10),
+            severity="info",
+        )
 
     user = get_user_model().objects.create_user(
         username="health_staff_user",
@@ -636,7 +666,10 @@ def test_health_scores_rank_worst_producer_first(client: Client) -> None:
 
 @pytest.mark.django_db
 @override_settings(SECURE_SSL_REDIRECT=False)
-def test_health_scores_non_staff_hides_private_debug_source(client: Client) -> None:
+def test_health_scores_non_staff_hides_private_debug_source(
+    client: Client,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
     """Non-staff health endpoint should not expose private debug-only sources."""
     now = timezone.now()
     visible_user = get_user_model().objects.create_user(
@@ -650,21 +683,22 @@ def test_health_scores_non_staff_hides_private_debug_source(client: Client) -> N
         is_staff=False,
     )
 
-    AuditEvent.objects.create(
-        event_name="visible.health.info",
-        source_system="extension",
-        occurred_at=now - timedelta(hours=1),
-        actor_id=str(visible_user.pk),
-        severity="info",
-    )
-    AuditEvent.objects.create(
-        event_name="hidden.health.debug",
-        source_system="secret_source",
-        occurred_at=now - timedelta(hours=1, minutes=30),
-        actor_id=str(hidden_user.pk),
-        club_id="club-private",
-        severity="debug",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        AuditEvent.objects.create(
+            event_name="visible.health.info",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=1),
+            actor_id=str(visible_user.pk),
+            severity="info",
+        )
+        AuditEvent.objects.create(
+            event_name="hidden.health.debug",
+            source_system="secret_source",
+            occurred_at=now - timedelta(hours=1, minutes=30),
+            actor_id=str(hidden_user.pk),
+            club_id="club-private",
+            severity="debug",
+        )
 
     client.force_login(visible_user)
     response = client.get(
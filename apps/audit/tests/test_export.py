@@ -0,0 +1,112 @@
+"""Tests for the streaming audit timeline export."""
+
+from __future__ import annotations
+
+import csv
+from datetime import timedelta
+import gzip
+from http import HTTPStatus
+import io
+import json
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.test.client import Client
+from django.utils import timezone
+import pytest
+
+from apps.audit.models import AuditEvent
+
+
+TEST_PASSWORD = "pass1234"  # nosec
+EXPORT_URL = "/api/audit/events/export/"
+
+
+def _create_events() -> None:
+    now = timezone.now()
+    AuditEvent.objects.create(
+        event_name="sync.started",
+        source_system="extension",
+        occurred_at=now - timedelta(minutes=10),
+        severity="info",
+        message="sync begin",
+        metadata={"step": 1},
+    )
+    AuditEvent.objects.create(
+        event_name="sync.completed",
+        source_system="extension",
+        occurred_at=now,
+        severity="info",
+        message='sync "end", done',
+    )
+    AuditEvent.objects.create(
+        event_name="debug.trace",
+        source_system="extension",
+        occurred_at=now - timedelta(minutes=5),
+        severity="debug",
+        club_id="club-1",
+    )
+
+
+def _login(client: Client, *, is_staff: bool) -> None:
+    user = get_user_model().objects.create_user(
+        username="export_user",
+        password=TEST_PASSWORD,
+        is_staff=is_staff,
+    )
+    client.force_login(user)
+
+
+def _body(response: Any) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+@override_settings(SECURE_SSL_REDIRECT=False)
+def test_export_streams_ndjson_with_visibility_filters(client: Client) -> None:
+    """Non-staff exports apply the timeline visibility rules."""
+    _create_events()
+    _login(client, is_staff=False)
+
+    response = client.get(EXPORT_URL, {"source": "extension"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.streaming
+    assert response["Content-Type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in _body(response).decode().splitlines()]
+    assert [row["event_name"] for row in rows] == ["sync.completed", "sync.started"]
+    assert rows[1]["metadata"] == {"step": 1}
+
+
+@pytest.mark.django_db
+@override_settings(SECURE_SSL_REDIRECT=False)
+def test_export_streams_gzipped_csv(client: Client) -> None:
+    """CSV exports are gzip-compressed when the client accepts it."""
+    _create_events()
+    _login(client, is_staff=True)
+
+    response = client.get(
+        EXPORT_URL,
+        {"export_format": "csv", "search": "sync"},
+        HTTP_ACCEPT_ENCODING="gzip, br",
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response["Content-Encoding"] == "gzip"
+    text = gzip.decompress(_body(response)).decode()
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert [row["event_name"] for row in rows] == ["sync.completed", "sync.started"]
+    assert rows[0]["message"] == 'sync "end", done'
+    assert json.loads(rows[1]["metadata"]) == {"step": 1}
+
+
+@pytest.mark.django_db
+@override_settings(SECURE_SSL_REDIRECT=False)
+def test_export_rejects_unknown_format(client: Client) -> None:
+    """Unsupported export formats are rejected before streaming."""
+    _login(client, is_staff=True)
+
+    response = client.get(EXPORT_URL, {"export_format": "xml"})
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,328 @@
+"""Tests for buffered audit ingest through the Valkey stream."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from http import HTTPStatus
+import json
+from typing import Any
+from uuid import UUID
+
+from django.core.cache import cache
+from django.db import DataError, OperationalError
+from django.test import override_settings
+from django.test.client import Client
+import pytest
+
+from apps.audit import tasks
+from apps.audit.models import AuditEvent, AuditHourlyRollup
+from apps.audit.services import ingest_buffer
+
+
+EXPECTED_QUEUED_EVENTS = 2
+
+
+class _FakeStream:
+    """In-memory stand-in for the stream commands used by the ingest buffer."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, dict[str, str]] = {}
+        self.pending: set[str] = set()
+        self.delivered: set[str] = set()
+        self.dead: list[str] = []
+        self.pipelines: list[bool] = []
+        self._next_id = 0
+
+    def pipeline(self, *, transaction: bool = True) -> _FakePipeline:
+        self.pipelines.append(transaction)
+        return _FakePipeline(self)
+
+    def xlen(self, _key: str) -> int:
+        return len(self.entries)
+
+    def xadd(self, _key: str, fields: dict[str, str]) -> str:
+        self._next_id += 1
+        entry_id = f"{self._next_id}-0"
+        self.entries[entry_id] = dict(fields)
+        return entry_id
+
+    def xgroup_create(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def xautoclaim(self, *args: Any, **kwargs: Any) -> list[Any]:
+        return ["0-0", [], []]
+
+    def xreadgroup(
+        self,
+        _group: str,
+        _consumer: str,
+        _streams: dict[str, str],
+        *,
+        count: int,
+        block: int | None,
+    ) -> list[Any]:
+        fresh = [
+            (entry_id, fields)
+            for entry_id, fields in self.entries.items()
+            if entry_id not in self.delivered
+        ][:count]
+        if not fresh:
+            return []
+        for entry_id, _fields in fresh:
+            self.delivered.add(entry_id)
+            self.pending.add(entry_id)
+        return [["stream", fresh]]
+
+    def xack(self, _key: str, _group: str, *entry_ids: str) -> int:
+        self.pending.difference_update(entry_ids)
+        return len(entry_ids)
+
+    def xdel(self, _key: str, *entry_ids: str) -> int:
+        for entry_id in entry_ids:
+            self.entries.pop(entry_id, None)
+        return len(entry_ids)
+
+    def lpush(self, _key: str, *values: str) -> int:
+        self.dead[:0] = reversed(values)
+        return len(self.dead)
+
+    def ltrim(self, _key: str, start: int, end: int) -> None:
+        self.dead = self.dead[start : end + 1]
+
+
+class _FakePipeline:
+    def __init__(self, stream: _FakeStream) -> None:
+        self._stream = stream
+        self._calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any) -> None:
+            self._calls.append((name, args))
+
+        return queue
+
+    def execute(self) -> list[Any]:
+        return [getattr(self._stream, name)(*args) for name, args in self._calls]
+
+
+@pytest.fixture
+def scheduled() -> list[int]:
+    """Countdowns of the flush tasks scheduled during the test."""
+    return []
+
+
+@pytest.fixture
+def stream(
+    monkeypatch: pytest.MonkeyPatch,
+    scheduled: list[int],
+) -> Iterator[_FakeStream]:
+    """Route the ingest buffer to an in-memory stream."""
+    fake = _FakeStream()
+    monkeypatch.setattr(ingest_buffer, "stream_client", lambda: fake)
+    monkeypatch.setattr(
+        tasks.flush_audit_ingest_stream,
+        "apply_async",
+        lambda *, countdown: scheduled.append(countdown),
+    )
+    cache.delete(ingest_buffer.FLUSH_SCHEDULED_KEY)
+    yield fake
+    cache.delete(ingest_buffer.FLUSH_SCHEDULED_KEY)
+
+
+@pytest.mark.django_db
+@override_settings(SECURE_SSL_REDIRECT=False, KORFBAL_AUDIT_BUFFERED_INGEST=True)
+def test_buffered_ingest_queues_until_drained(
+    client: Client,
+    stream: _FakeStream,
+) -> None:
+    """Events are acknowledged at once and written by the next flush."""
+    response = client.post(
+        "/api/audit/events/ingest/bulk/",
+        data={
+            "events": [
+                {"event_name": "sync.started", "source_system": "extension"},
+                {"event_name": "sync.failed", "source_system": "extension"},
+            ],
+        },
+        content_type="application/json",
+    )
+
+    assert response.status_code == HTTPStatus.ACCEPTED
+    assert response.json()["accepted"] == EXPECTED_QUEUED_EVENTS
+    assert AuditEvent.objects.count() == 0
+    assert stream.xlen("") == EXPECTED_QUEUED_EVENTS
+
+    result = tasks.flush_audit_ingest_stream.run()
+
+    assert result["written"] == EXPECTED_QUEUED_EVENTS
+    assert set(AuditEvent.objects.values_list("id_uuid", flat=True)) == {
+        UUID(value) for value in response.json()["ids"]
+    }
+    assert AuditHourlyRollup.objects.count() == EXPECTED_QUEUED_EVENTS
+    assert stream.xlen("") == 0
+    assert not stream.pending
+
+
+@pytest.mark.django_db
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    KORFBAL_AUDIT_BUFFERED_INGEST=True,
+    KORFBAL_AUDIT_INGEST_MAX_PENDING=1,
+)
+def test_buffered_ingest_applies_backpressure(
+    client: Client,
+    stream: _FakeStream,
+) -> None:
+    """A full stream rejects new events with 503 and Retry-After."""
+    stream.xadd("", {"event": "{}"})
+
+    response = client.post(
+        "/api/audit/events/ingest/",
+        data={"event_name": "sync.started", "source_system": "extension"},
+        content_type="application/json",
+    )
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response["Retry-After"]
+    assert stream.xlen("") == 1
+
+
+@pytest.mark.django_db
+def test_drain_dead_letters_malformed_and_skips_stored_entries(
+    stream: _FakeStream,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
+    """Malformed entries are dead-lettered; redelivered rows are not duplicated."""
+    with django_capture_on_commit_callbacks(execute=True):
+        stored = AuditEvent.objects.create(
+            event_name="sync.started",
+            source_system="extension",
+            occurred_at=datetime(2026, 10, 1, 10, tzinfo=UTC),
+        )
+    stream.xadd("", {"event": ingest_buffer._encode(stored)})
+    stream.xadd("", {"event": '{"event_name": "missing fields"}'})
+
+    result = ingest_buffer.drain_stream(consumer="test")
+
+    assert (result.read, result.written, result.dead_lettered) == (2, 0, 1)
+    assert AuditEvent.objects.count() == 1
+    assert AuditHourlyRollup.objects.get().event_count == 1
+    assert len(stream.dead) == 1
+    assert stream.xlen("") == 0
+    # The dead letters are pushed in the same MULTI as the acknowledgement.
+    assert stream.pipelines[-1] is True
+
+
+def _queue(stream: _FakeStream, *event_names: str) -> None:
+    for name in event_names:
+        row = AuditEvent(
+            event_name=name,
+            source_system="extension",
+            occurred_at=datetime(2026, 10, 1, 10, tzinfo=UTC),
+        )
+        stream.xadd("", {"event": ingest_buffer._encode(row)})
+
+
+@pytest.mark.django_db
+def test_drain_dead_letters_rejected_rows_with_their_entry(
+    monkeypatch: pytest.MonkeyPatch,
+    stream: _FakeStream,
+) -> None:
+    """Rows the database rejects are dead-lettered with the raw entry."""
+    write_events = ingest_buffer.write_events
+
+    def _reject_bad(rows: list[AuditEvent]) -> int:
+        if any(row.event_name == "bad" for row in rows):
+            msg = "value too long"
+            raise DataError(msg)
+        return write_events(rows)
+
+    monkeypatch.setattr(ingest_buffer, "write_events", _reject_bad)
+    _queue(stream, "good", "bad")
+    raw_bad = stream.entries["2-0"]["event"]
+
+    result = ingest_buffer.drain_stream(consumer="test")
+
+    assert (result.read, result.written, result.dead_lettered) == (2, 1, 1)
+    assert AuditEvent.objects.get().event_name == "good"
+    assert json.loads(stream.dead[0]) == {
+        "id": "2-0",
+        "error": "value too long",
+        "event": raw_bad,
+    }
+    assert stream.xlen("") == 0
+
+
+@pytest.mark.django_db
+def test_drain_leaves_the_batch_pending_when_the_database_is_down(
+    monkeypatch: pytest.MonkeyPatch,
+    stream: _FakeStream,
+) -> None:
+    """Operational errors propagate; nothing is acknowledged or dead-lettered."""
+
+    def _unavailable(rows: list[AuditEvent]) -> int:
+        msg = "server closed the connection"
+        raise OperationalError(msg)
+
+    monkeypatch.setattr(ingest_buffer, "write_events", _unavailable)
+    _queue(stream, "first", "second")
+
+    with pytest.raises(OperationalError):
+        ingest_buffer.drain_batch(consumer="test")
+
+    assert stream.pending == {"1-0", "2-0"}
+    assert stream.xlen("") == EXPECTED_QUEUED_EVENTS
+    assert not stream.dead
+
+
+@pytest.mark.django_db
+@override_settings(KORFBAL_AUDIT_INGEST_BATCH_SIZE=1)
+def test_flush_task_reschedules_itself_when_capped(
+    monkeypatch: pytest.MonkeyPatch,
+    stream: _FakeStream,
+    scheduled: list[int],
+) -> None:
+    """A flush that hits its batch cap continues in a new task run."""
+    monkeypatch.setattr(tasks, "FLUSH_MAX_BATCHES", 1)
+    for name in ("sync.started", "sync.finished"):
+        ingest_buffer.enqueue_events([
+            AuditEvent(
+                event_name=name,
+                source_system="extension",
+                occurred_at=datetime(2026, 10, 1, 10, tzinfo=UTC),
+            ),
+        ])
+    scheduled.clear()
+
+    result = tasks.flush_audit_ingest_stream.run()
+
+    assert result["written"] == 1
+    assert scheduled == [0]
+    assert ingest_buffer.drain_stream(consumer="test").capped is False
+    assert AuditEvent.objects.count() == EXPECTED_QUEUED_EVENTS
+
+
+@pytest.mark.django_db
+@override_settings(SECURE_SSL_REDIRECT=False, KORFBAL_AUDIT_BUFFERED_INGEST=True)
+def test_buffered_ingest_writes_directly_when_the_stream_is_down(
+    client: Client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Events are stored synchronously instead of failing without Valkey."""
+
+    def _unavailable() -> None:
+        msg = "connection refused"
+        raise ConnectionError(msg)
+
+    monkeypatch.setattr(ingest_buffer, "stream_client", _unavailable)
+
+    response = client.post(
+        "/api/audit/events/ingest/",
+        data={"event_name": "sync.started", "source_system": "extension"},
+        content_type="application/json",
+    )
+
+    assert response.status_code == HTTPStatus.ACCEPTED
+    assert AuditEvent.objects.get().event_name == "sync.started"
+    assert AuditHourlyRollup.objects.get().event_count == 1
@@ -0,0 +1,235 @@
+"""Tests for audit event partition maintenance."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.utils import timezone
+import pytest
+
+from apps.audit import tasks
+from apps.audit.management.commands import purge_audit_events
+from apps.audit.models import AuditEvent, AuditHourlyRollup
+from apps.audit.services import partitions
+from apps.audit.services.partitions import AuditPartition
+from apps.audit.services.rollup import floor_hour, record_events
+
+
+# Set DJANGO_TEST_USE_POSTGRES=1 to run these against PostgreSQL.
+postgres_only = pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="audit partitioning needs PostgreSQL",
+)
+
+
+def _partition(year: int, month: int) -> AuditPartition:
+    start = datetime(year, month, 1, tzinfo=UTC)
+    return AuditPartition(
+        partitions.partition_name(start),
+        start,
+        partitions.add_months(start, 1),
+    )
+
+
+def test_month_helpers_wrap_years() -> None:
+    """Month arithmetic and partition names follow UTC calendar months."""
+    start = partitions.month_start(
+        datetime(2026, 12, 31, 23, 30, tzinfo=UTC) + timedelta(hours=1),
+    )
+
+    assert start == datetime(2027, 1, 1, tzinfo=UTC)
+    assert partitions.add_months(start, -1) == datetime(2026, 12, 1, tzinfo=UTC)
+    assert partitions.add_months(start, 13) == datetime(2028, 2, 1, tzinfo=UTC)
+    assert partitions.partition_name(start) == "audit_auditevent_p202701"
+
+
+def test_expired_partitions_only_include_whole_months(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A partition expires once its end lies before the cutoff."""
+    monkeypatch.setattr(
+        partitions,
+        "list_partitions",
+        lambda: [_partition(2026, 6), _partition(2026, 7), _partition(2026, 8)],
+    )
+
+    expired = partitions.expired_partitions(
+        before=datetime(2026, 8, 15, tzinfo=UTC),
+    )
+
+    assert [partition.name for partition in expired] == [
+        "audit_auditevent_p202606",
+        "audit_auditevent_p202607",
+    ]
+
+
+@pytest.mark.django_db
+def test_purge_drops_partitions_when_partitioned(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Partitioned storage is purged by dropping partitions, not rows."""
+    dropped_before: list[datetime] = []
+    monkeypatch.setattr(purge_audit_events, "partitioning_enabled", lambda: True)
+    monkeypatch.setattr(
+        purge_audit_events,
+        "drop_partitions_before",
+        lambda *, before: dropped_before.append(before) or ["p1", "p2"],
+    )
+
+    out = StringIO()
+    call_command("purge_audit_events", days=90, stdout=out)
+
+    assert len(dropped_before) == 1
+    assert "Dropped 2 audit partitions" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_ensure_partitions_is_noop_without_partitioning() -> None:
+    """The command reports and exits on unpartitioned databases."""
+    out = StringIO()
+    call_command("ensure_audit_partitions", stdout=out)
+
+    assert "not partitioned" in out.getvalue()
+
+
+def _event(occurred_at: datetime) -> AuditEvent:
+    return AuditEvent.objects.create(
+        occurred_at=occurred_at,
+        source_system="test",
+        event_name="partition.test",
+    )
+
+
+def _table_of(event: AuditEvent) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT tableoid::regclass::text FROM {partitions.PARENT_TABLE} "  # noqa: S608
+            "WHERE id_uuid = %s",
+            [event.id_uuid],
+        )
+        return cursor.fetchone()[0]
+
+
+@postgres_only
+@pytest.mark.django_db
+def test_ensure_partitions_moves_rows_out_of_the_default_partition() -> None:
+    """Rows that landed in the default partition move into the new month."""
+    start = partitions.add_months(partitions.month_start(timezone.now()), 24)
+    event = _event(start + timedelta(days=3))
+    assert _table_of(event) == partitions.DEFAULT_PARTITION
+
+    created = partitions.ensure_partitions(months_ahead=0, now=start)
+
+    assert created == [partitions.partition_name(start)]
+    assert _table_of(event) == partitions.partition_name(start)
+    assert partitions.ensure_partitions(months_ahead=0, now=start) == []
+
+
+@postgres_only
+@pytest.mark.django_db
+def test_drop_partitions_before_drops_whole_months_only() -> None:
+    """Expired months are dropped; newer rows and partitions are kept."""
+    start = partitions.add_months(partitions.month_start(timezone.now()), -36)
+    partitions.ensure_partitions(months_ahead=1, now=start)
+    expired = _event(start + timedelta(days=1))
+    kept = _event(partitions.add_months(start, 1) + timedelta(days=1))
+    stray = _event(start - timedelta(days=400))
+
+    dropped = partitions.drop_partitions_before(
+        before=partitions.add_months(start, 1) + timedelta(days=10),
+    )
+
+    assert partitions.partition_name(start) in dropped
+    assert partitions.partition_name(partitions.add_months(start, 1)) not in dropped
+    remaining = set(AuditEvent.objects.values_list("id_uuid", flat=True))
+    assert expired.id_uuid not in remaining
+    assert stray.id_uuid not in remaining
+    assert kept.id_uuid in remaining
+
+
+@postgres_only
+@pytest.mark.django_db
+def test_drop_partitions_before_recounts_kept_hours_of_default_rows() -> None:
+    """Default-partition rows of the kept month leave the rollup with them."""
+    start = partitions.add_months(partitions.month_start(timezone.now()), -36)
+    expired = start + timedelta(days=1, minutes=10)
+    kept = start + timedelta(days=20, minutes=10)
+    record_events(
+        AuditEvent.objects.bulk_create([
+            AuditEvent(
+                occurred_at=occurred_at,
+                source_system="test",
+                event_name="partition.test",
+            )
+            for occurred_at in (expired, kept)
+        ]),
+    )
+
+    partitions.drop_partitions_before(before=start + timedelta(days=10))
+
+    assert list(
+        AuditHourlyRollup.objects
+        .order_by("hour")
+        .values_list("hour", "event_count"),
+    ) == [(floor_hour(kept), 1)]
+
+
+@postgres_only
+@pytest.mark.django_db(transaction=True)
+def test_partition_migration_keeps_rows_and_reverses() -> None:
+    """Migrating to and from the partitioned table preserves every row."""
+    latest = MigrationExecutor(connection).loader.graph.leaf_nodes("audit")
+    old = _event(timezone.now() - timedelta(days=100))
+    new = _event(timezone.now())
+
+    try:
+        MigrationExecutor(connection).migrate([
+            ("audit", "0002_audithourlyrollup"),
+        ])
+        assert not partitions.partitioning_enabled()
+
+        MigrationExecutor(connection).migrate([
+            ("audit", "0003_partition_auditevent"),
+        ])
+        assert partitions.partitioning_enabled()
+        assert _table_of(old) == partitions.partition_name(
+            partitions.month_start(old.occurred_at),
+        )
+        assert _table_of(new) == partitions.partition_name(
+            partitions.month_start(new.occurred_at),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT array_agg(a.attname ORDER BY a.attname) "
+                "FROM pg_index i JOIN pg_attribute a "
+                "ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey) "
+                "WHERE i.indrelid = to_regclass(%s) AND i.indisprimary",
+                [partitions.PARENT_TABLE],
+            )
+            assert cursor.fetchone()[0] == ["id_uuid", "occurred_at"]
+    finally:
+        MigrationExecutor(connection).migrate(latest)
+
+    assert set(AuditEvent.objects.values_list("id_uuid", flat=True)) == {
+        old.id_uuid,
+        new.id_uuid,
+    }
+
+
+@pytest.mark.django_db
+def test_retention_tasks_run_the_maintenance_commands() -> None:
+    """The beat tasks create partitions and purge expired events."""
+    AuditEvent.objects.create(
+        occurred_at=timezone.now() - timedelta(days=400),
+        source_system="test",
+        event_name="partition.test",
+    )
+
+    tasks.ensure_audit_partitions.apply().get()
+    tasks.purge_audit_events.apply().get()
+
+    assert not AuditEvent.objects.exists()
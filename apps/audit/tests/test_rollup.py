@@ -0,0 +1,265 @@
+"""Tests for the hourly audit rollup."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from io import StringIO
+from typing import Any
+
+from django.core.management import call_command
+from django.utils import timezone
+import pytest
+
+from apps.audit import tasks
+from apps.audit.models import AuditEvent, AuditHourlyRollup
+from apps.audit.services.rollup import (
+    AuditViewer,
+    aggregate_window,
+    floor_hour,
+    purge_rollup,
+    rebuild_rollup,
+    record_events,
+)
+
+
+ROLLED_UP_COUNT = 10
+
+
+def _create_events() -> None:
+    now = timezone.now()
+    for minutes, source, severity, club_id, actor_id in (
+        (5, "extension", "info", "", ""),
+        (50, "extension", "error", "club-1", ""),
+        (70, "extension", "error", "club-1", ""),
+        (130, "console", "debug", "club-1", "7"),
+        (135, "console", "debug", "club-1", "8"),
+        (190, "console", "warning", "", ""),
+        (60 * 30, "extension", "info", "", ""),
+    ):
+        AuditEvent.objects.create(
+            event_name=f"{source}.{severity}",
+            source_system=source,
+            occurred_at=now - timedelta(minutes=minutes),
+            severity=severity,
+            club_id=club_id,
+            actor_id=actor_id,
+        )
+
+
+def _rollup_snapshot() -> set[tuple[object, ...]]:
+    return set(
+        AuditHourlyRollup.objects.values_list(
+            "hour",
+            "source_system",
+            "event_name",
+            "severity",
+            "visibility",
+            "event_count",
+            "first_occurred_at",
+            "last_occurred_at",
+        ),
+    )
+
+
+@pytest.mark.django_db
+def test_incremental_rollup_matches_rebuild(
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
+    """Buckets maintained on save equal buckets recomputed from raw events."""
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        _create_events()
+    # One rollup task per saved event, applied after commit.
+    assert len(callbacks) == 7  # noqa: PLR2004
+    bulk = [
+        AuditEvent(
+            event_name="extension.info",
+            source_system="extension",
+            occurred_at=timezone.now() - timedelta(minutes=5),
+            severity="info",
+        ),
+    ]
+    record_events(AuditEvent.objects.bulk_create(bulk))
+    incremental = _rollup_snapshot()
+
+    rebuild_rollup(since=timezone.now() - timedelta(days=2))
+
+    assert _rollup_snapshot() == incremental
+    # The two club debug events share a bucket unless an hour boundary falls
+    # between them.
+    restricted_hours = {
+        floor_hour(occurred_at)
+        for occurred_at in AuditEvent.objects.filter(severity="debug").values_list(
+            "occurred_at",
+            flat=True,
+        )
+    }
+    assert AuditHourlyRollup.objects.filter(visibility="restricted").count() == len(
+        restricted_hours,
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "viewer",
+    [AuditViewer(is_staff=True), AuditViewer(is_staff=False, user_id="7")],
+)
+def test_aggregate_window_matches_raw_events(
+    viewer: AuditViewer,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
+    """Rollup hours plus raw edge hours give the same totals as raw rows."""
+    with django_capture_on_commit_callbacks(execute=True):
+        _create_events()
+    start = timezone.now() - timedelta(hours=3, minutes=20)
+
+    rows = aggregate_window(
+        start=start,
+        group_by=("source_system", "severity"),
+        viewer=viewer,
+    )
+
+    events = AuditEvent.objects.filter(occurred_at__gte=start)
+    visibility_filter = viewer.event_filter()
+    if visibility_filter is not None:
+        events = events.filter(visibility_filter)
+    expected = Counter(events.values_list("source_system", "severity"))
+    assert {
+        (row["source_system"], row["severity"]): row["total"] for row in rows
+    } == dict(expected)
+    assert ("console", "debug") in expected or not viewer.is_staff
+
+
+@pytest.mark.django_db
+def test_aggregate_window_reads_complete_hours_from_rollup(
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
+    """Complete hours come from the rollup rather than raw events."""
+    occurred_at = timezone.now() - timedelta(hours=5)
+    with django_capture_on_commit_callbacks(execute=True):
+        AuditEvent.objects.create(
+            event_name="sync.started",
+            source_system="extension",
+            occurred_at=occurred_at,
+            severity="info",
+        )
+    AuditHourlyRollup.objects.filter(hour=floor_hour(occurred_at)).update(
+        event_count=ROLLED_UP_COUNT,
+    )
+
+    rows = aggregate_window(
+        start=timezone.now() - timedelta(hours=24),
+        group_by=("event_name",),
+        viewer=AuditViewer(is_staff=True),
+    )
+
+    assert rows == [
+        {
+            "event_name": "sync.started",
+            "total": ROLLED_UP_COUNT,
+            "first_seen": occurred_at,
+            "last_seen": occurred_at,
+        },
+    ]
+
+
+@pytest.mark.django_db
+def test_rollup_commands_rebuild_and_purge() -> None:
+    """The rebuild command restores buckets; purging drops old ones."""
+    now = timezone.now()
+    AuditEvent.objects.create(
+        event_name="old",
+        source_system="test",
+        occurred_at=now - timedelta(days=100),
+        severity="info",
+    )
+    AuditEvent.objects.create(
+        event_name="new",
+        source_system="test",
+        occurred_at=now - timedelta(hours=2),
+        severity="info",
+    )
+    AuditHourlyRollup.objects.filter(event_name="new").delete()
+
+    out = StringIO()
+    call_command("rebuild_audit_rollup", hours=24, stdout=out)
+    assert "Rebuilt 1 audit rollup rows" in out.getvalue()
+    assert AuditHourlyRollup.objects.filter(event_name="new").exists()
+
+    call_command("purge_audit_events", days=90, stdout=StringIO())
+    assert list(AuditHourlyRollup.objects.values_list("event_name", flat=True)) == [
+        "new",
+    ]
+
+
+@pytest.mark.django_db
+def test_purge_rollup_recounts_the_cutoff_hour() -> None:
+    """Buckets of the hour containing the cutoff only count remaining events."""
+    cutoff = datetime(2026, 7, 1, 10, 30, tzinfo=UTC)
+    events = AuditEvent.objects.bulk_create([
+        AuditEvent(
+            event_name="sync.started",
+            source_system="extension",
+            occurred_at=cutoff + timedelta(minutes=minutes),
+            severity="info",
+        )
+        for minutes in (-90, -20, 10)
+    ])
+    record_events(events)
+    AuditEvent.objects.filter(occurred_at__lt=cutoff).delete()
+
+    assert purge_rollup(before=cutoff) == 1
+    assert list(AuditHourlyRollup.objects.values_list("hour", "event_count")) == [
+        (floor_hour(cutoff), 1),
+    ]
+
+
+@pytest.mark.django_db
+def test_rollup_is_applied_inline_when_the_task_cannot_be_queued(
+    monkeypatch: pytest.MonkeyPatch,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
+    """A broker outage does not lose rollup counts."""
+
+    def _unavailable(*args: Any, **kwargs: Any) -> None:
+        msg = "broker down"
+        raise ConnectionError(msg)
+
+    monkeypatch.setattr(tasks.add_to_audit_rollup, "apply_async", _unavailable)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        AuditEvent.objects.create(
+            event_name="sync.started",
+            source_system="extension",
+            occurred_at=timezone.now() - timedelta(hours=2),
+            severity="info",
+        )
+
+    assert AuditHourlyRollup.objects.get().event_count == 1
+
+
+@pytest.mark.django_db
+def test_recount_task_repairs_lost_increments() -> None:
+    """Buckets whose queued increment was lost are recounted periodically."""
+    now = timezone.now()
+    AuditEvent.objects.bulk_create([
+        AuditEvent(
+            event_name="sync.started",
+            source_system="extension",
+            occurred_at=now - timedelta(hours=hours),
+            severity="info",
+        )
+        for hours in (2, 2, 30)
+    ])
+    record_events(AuditEvent.objects.filter(occurred_at__lt=now - timedelta(days=1)))
+
+    assert tasks.recount_audit_rollup.apply().get() == 1
+    assert list(
+        AuditHourlyRollup.objects
+        .order_by("hour")
+        .values_list("hour", "event_count"),
+    ) == [
+        (floor_hour(now - timedelta(hours=30)), 1),
+        (floor_hour(now - timedelta(hours=2)), 2),
+    ]
@@ -0,0 +1,118 @@
+"""Tests for audit timeline search."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+import json
+from pathlib import Path
+
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+import pytest
+
+from apps.audit.models import AuditEvent
+from apps.audit.services.search import (
+    _like_pattern,
+    _prefix_tsquery,
+    audit_search_filter,
+)
+
+
+def test_like_pattern_escapes_wildcards() -> None:
+    """User input never acts as a LIKE wildcard."""
+    assert _like_pattern("50%_off\\") == "%50\\%\\_off\\\\%"
+
+
+def test_prefix_tsquery_only_covers_plain_input() -> None:
+    """Plain words become prefix matches; web search syntax is left alone."""
+    assert _prefix_tsquery("Goal over-ti") == "goal:* & over:* & ti:*"
+    assert _prefix_tsquery("user_42!") == "user:* & 42:*"
+    assert _prefix_tsquery("'&|") is None
+    assert _prefix_tsquery('"goal scored"') is None
+    assert _prefix_tsquery("goal -penalty") is None
+    assert _prefix_tsquery("goal OR penalty") is None
+
+
+@pytest.mark.django_db
+def test_search_filter_matches_message_and_identifiers() -> None:
+    """Search matches the message and identifier-like fields."""
+    now = timezone.now()
+    for index, (message, actor_id) in enumerate(
+        (("Goal scored in overtime", ""), ("", "user-4242"), ("Nothing", "")),
+    ):
+        AuditEvent.objects.create(
+            event_name=f"tracker.event{index}",
+            source_system="tracker",
+            occurred_at=now - timedelta(minutes=index),
+            message=message,
+            actor_id=actor_id,
+        )
+
+    def matches(term: str) -> set[str]:
+        return set(
+            AuditEvent.objects
+            .filter(audit_search_filter(term))
+            .values_list("event_name", flat=True)
+        )
+
+    assert matches("overtime") == {"tracker.event0"}
+    assert matches("4242") == {"tracker.event1"}
+    assert matches("event2") == {"tracker.event2"}
+
+
+@pytest.mark.django_db
+def test_benchmark_audit_search_reports_scenarios(tmp_path: Path) -> None:
+    """The search benchmark runs on a small data set and rolls it back."""
+    output = tmp_path / "search.json"
+    call_command(
+        "benchmark_audit_search",
+        events=200,
+        repeat=2,
+        output=str(output),
+        stdout=StringIO(),
+    )
+
+    document = json.loads(output.read_text(encoding="utf-8"))
+    assert "audit.search.rare_word" in document["scenarios"]
+    assert "audit.search.common_word.second_page" in document["scenarios"]
+    assert AuditEvent.objects.count() == 0
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="full-text search needs PostgreSQL",
+)
+@pytest.mark.django_db
+def test_postgres_search_keeps_partial_matches() -> None:
+    """Word prefixes and identifier substrings match; operators still work."""
+    now = timezone.now()
+    for index, (message, subject_id) in enumerate(
+        (
+            ("Goal scored in overtime", ""),
+            ("Penalty goal", "match-0042"),
+            ("Nothing", ""),
+        ),
+    ):
+        AuditEvent.objects.create(
+            event_name=f"tracker.event{index}",
+            source_system="tracker",
+            occurred_at=now - timedelta(minutes=index),
+            message=message,
+            subject_id=subject_id,
+        )
+
+    def matches(term: str) -> set[str]:
+        return set(
+            AuditEvent.objects
+            .filter(audit_search_filter(term))
+            .values_list("event_name", flat=True)
+        )
+
+    assert matches("overti") == {"tracker.event0"}
+    assert matches("goal") == {"tracker.event0", "tracker.event1"}
+    assert matches("goal -penalty") == {"tracker.event0"}
+    assert matches('"penalty goal"') == {"tracker.event1"}
+    assert matches("tch-00") == {"tracker.event1"}
+    assert matches("event2") == {"tracker.event2"}
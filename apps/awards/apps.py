@@ -8,3 +8,7 @@ class AwardsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.awards"
+
+    def ready(self) -> None:
+        """Import signals."""
+        import apps.awards.signals
@@ -10,13 +10,15 @@ from __future__ import annotations
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any
+from functools import partial
+from typing import Any, cast
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.db.models import Count, Max
 from django.utils import timezone
 
 from apps.awards.models.mvp import MatchMvp, MatchMvpVote
+from apps.awards.services import mvp_cache
 from apps.game_tracker.models import (
     MatchData,
     MatchPart,
@@ -24,6 +26,11 @@ from apps.game_tracker.models import (
     PlayerChange,
     Shot,
 )
+from apps.kwt_common.image_derivatives import (
+    LIST_THUMBNAIL_SIZE,
+    image_name_for_size,
+)
+from apps.kwt_common.media_urls import cached_storage_url
 from apps.player.models.player import Player
 from apps.schedule.models.match import Match
 
@@ -116,8 +123,125 @@ def get_or_create_match_mvp(match: Match, match_data: MatchData) -> MatchMvp:
     return obj
 
 
+@dataclass(frozen=True)
+class MvpCandidateSnapshot:
+    """Cacheable MVP candidate.
+
+    Pictures are kept as storage names: presigned URLs expire, so they are
+    resolved when a payload is built.
+    """
+
+    id_uuid: str
+    username: str
+    display_name: str
+    team_side: str | None
+    thumbnail_name: str
+    picture_name: str
+    placeholder_url: str
+
+    @classmethod
+    def from_player(
+        cls,
+        player: Player,
+        *,
+        team_side: str | None,
+    ) -> MvpCandidateSnapshot:
+        """Snapshot a player (with `user` loaded) as a candidate."""
+        username = player.user.username
+        picture = player.profile_picture
+        return cls(
+            id_uuid=str(player.id_uuid),
+            username=username,
+            display_name=player.user.get_full_name() or username,
+            team_side=team_side,
+            thumbnail_name=(
+                image_name_for_size(
+                    picture,
+                    player.profile_picture_derivatives,
+                    LIST_THUMBNAIL_SIZE,
+                )
+                if picture
+                else ""
+            ),
+            picture_name=str(picture.name) if picture else "",
+            placeholder_url=(
+                "" if picture else player.get_placeholder_profile_picture_url()
+            ),
+        )
+
+    def picture_url(self, *, thumbnail: bool) -> str:
+        """Return the (list thumbnail or full-size) profile picture URL."""
+        name = self.thumbnail_name if thumbnail else self.picture_name
+        if not name:
+            return self.placeholder_url
+        storage = Player._meta.get_field("profile_picture").storage
+        return cached_storage_url(storage, name)
+
+    def to_candidate(self) -> MvpCandidate:
+        """Return the candidate list entry."""
+        return MvpCandidate(
+            id_uuid=self.id_uuid,
+            username=self.username,
+            display_name=self.display_name,
+            profile_picture_url=self.picture_url(thumbnail=True),
+            team_side=self.team_side,
+        )
+
+    def payload(self, *, team_side: str | None = None) -> dict[str, str | None]:
+        """Return the same shape as `_candidate_payload`."""
+        return {
+            "id_uuid": self.id_uuid,
+            "username": self.username,
+            "display_name": self.display_name,
+            "profile_picture_url": self.picture_url(thumbnail=False),
+            "team_side": team_side,
+        }
+
+
+def cached_match_mvp(match: Match, match_data: MatchData) -> MatchMvp:
+    """Return the MatchMvp record of a finished match, cached between saves."""
+    mvp = mvp_cache.get_match_mvp(match.id_uuid)
+    if isinstance(mvp, MatchMvp):
+        return mvp
+    mvp = get_or_create_match_mvp(match, match_data)
+    mvp_cache.set_match_mvp(match.id_uuid, mvp)
+    return mvp
+
+
 def build_mvp_candidates(match: Match, match_data: MatchData) -> list[MvpCandidate]:
     """Return a stable list of players that can be voted MVP for this match."""
+    return [
+        snapshot.to_candidate()
+        for snapshot in mvp_candidate_snapshots(match, match_data)
+    ]
+
+
+def mvp_candidate_snapshots(
+    match: Match,
+    match_data: MatchData,
+) -> list[MvpCandidateSnapshot]:
+    """Return the MVP candidates; cached once the match is finished.
+
+    Roster changes drop the cached list (see `apps.awards.signals`).
+    """
+    finished = match_data.status == "finished"
+    if finished:
+        cached = mvp_cache.get_candidates(match_data.id_uuid)
+        if cached is not None and all(
+            isinstance(item, MvpCandidateSnapshot) for item in cached
+        ):
+            return cast(list[MvpCandidateSnapshot], cached)
+
+    snapshots = _load_candidate_snapshots(match, match_data)
+    if finished:
+        mvp_cache.set_candidates(match_data.id_uuid, list(snapshots))
+    return snapshots
+
+
+def _load_candidate_snapshots(
+    match: Match,
+    match_data: MatchData,
+) -> list[MvpCandidateSnapshot]:
     home_id = str(match.home_team.id_uuid)
     away_id = str(match.away_team.id_uuid)
 
@@ -128,19 +252,8 @@ def build_mvp_candidates(match: Match, match_data: MatchData) -> list[MvpCandida
             return "away"
         return None
 
-    def candidate_from_player(player: Player, *, team_id: str | None) -> MvpCandidate:
-        username = player.user.username
-        display_name = player.user.get_full_name() or username
-        return MvpCandidate(
-            id_uuid=str(player.id_uuid),
-            username=username,
-            display_name=display_name,
-            profile_picture_url=player.get_profile_picture(),
-            team_side=side_from_team_id(team_id),
-        )
-
     def add_candidate(
-        acc: dict[str, MvpCandidate],
+        acc: dict[str, MvpCandidateSnapshot],
         *,
         player: Player | None,
         team_id: str | None,
@@ -150,9 +263,12 @@ def build_mvp_candidates(match: Match, match_data: MatchData) -> list[MvpCandida
         pid = str(player.id_uuid)
         if pid in acc:
             return
-        acc[pid] = candidate_from_player(player, team_id=team_id)
+        acc[pid] = MvpCandidateSnapshot.from_player(
+            player,
+            team_side=side_from_team_id(team_id),
+        )
 
-    candidates: dict[str, MvpCandidate] = {}
+    candidates: dict[str, MvpCandidateSnapshot] = {}
 
     match_players = MatchPlayer.objects.select_related("player__user", "team").filter(
         match_data=match_data,
@@ -173,7 +289,7 @@ def build_mvp_candidates(match: Match, match_data: MatchData) -> list[MvpCandida
 
 def _add_candidates_from_events(
     match_data: MatchData,
-    acc: dict[str, MvpCandidate],
+    acc: dict[str, MvpCandidateSnapshot],
 ) -> None:
     """Fallback candidate extraction from events."""
 
@@ -183,15 +299,7 @@ def _add_candidates_from_events(
         pid = str(player.id_uuid)
         if pid in acc:
             return
-        username = player.user.username
-        display_name = player.user.get_full_name() or username
-        acc[pid] = MvpCandidate(
-            id_uuid=pid,
-            username=username,
-            display_name=display_name,
-            profile_picture_url=player.get_profile_picture(),
-            team_side=None,
-        )
+        acc[pid] = MvpCandidateSnapshot.from_player(player, team_side=None)
 
     for shot in Shot.objects.select_related("player__user", "team").filter(
         match_data=match_data,
@@ -207,10 +315,12 @@ def _add_candidates_from_events(
         safe_add(change.player_out)
 
 
-def _sort_candidates(candidates: Iterable[MvpCandidate]) -> list[MvpCandidate]:
+def _sort_candidates(
+    candidates: Iterable[MvpCandidateSnapshot],
+) -> list[MvpCandidateSnapshot]:
     """Stable ordering: home first then away then username."""
 
-    def sort_key(c: MvpCandidate) -> tuple[int, str]:
+    def sort_key(c: MvpCandidateSnapshot) -> tuple[int, str]:
         bucket = 2
         if c.team_side == "home":
             bucket = 0
@@ -224,7 +334,7 @@ def _sort_candidates(candidates: Iterable[MvpCandidate]) -> list[MvpCandidate]:
 def _candidate_is_valid(
     *,
     candidate: Player,
-    candidates: Iterable[MvpCandidate],
+    candidates: Iterable[MvpCandidateSnapshot],
 ) -> bool:
     cid = str(candidate.id_uuid)
     return any(c.id_uuid == cid for c in candidates)
@@ -236,56 +346,78 @@ def _validate_vote_or_raise(
     match_data: MatchData,
     candidate: Player,
 ) -> None:
-    mvp = get_or_create_match_mvp(match, match_data)
+    mvp = cached_match_mvp(match, match_data)
     now = timezone.now()
 
     if now >= mvp.closes_at:
         raise ValueError("Voting is closed.")
 
-    candidates = build_mvp_candidates(match, match_data)
+    candidates = mvp_candidate_snapshots(match, match_data)
     if not _candidate_is_valid(candidate=candidate, candidates=candidates):
         raise ValueError("Invalid MVP candidate.")
 
 
-@transaction.atomic
+def _count_votes(match: Match) -> dict[str, int]:
+    rows = match.mvp_votes.values("candidate").annotate(votes=Count("id_uuid"))
+    return {
+        str(row["candidate"]): int(row["votes"])
+        for row in rows.order_by()
+        if row.get("candidate") is not None
+    }
+
+
+def vote_tallies(match: Match, candidate_ids: Iterable[str]) -> dict[str, int]:
+    """Return the vote count per candidate id.
+
+    Counts come from the cached tallies while they are trusted, otherwise they
+    are recounted from the database and cached again.
+    """
+    tallies = mvp_cache.get_tallies(match.id_uuid)
+    if tallies is None:
+        # Zero counters for every candidate, so first votes are plain INCRs.
+        tallies = {**dict.fromkeys(candidate_ids, 0), **_count_votes(match)}
+        mvp_cache.set_tallies(match.id_uuid, tallies)
+    return tallies
+
+
 def ensure_mvp_published(match: Match, match_data: MatchData) -> MatchMvp:
     """If voting is closed and not published yet, compute and persist the winner."""
-    mvp = get_or_create_match_mvp(match, match_data)
+    mvp = cached_match_mvp(match, match_data)
 
     # Already published.
     if mvp.mvp_player_id and mvp.published_at:
         return mvp
 
-    now = timezone.now()
-    if now < mvp.closes_at:
+    if timezone.now() < mvp.closes_at:
         return mvp
 
-    # Select winner by vote count. Tie-breaker: lowest UUID string (stable).
-    winner_row = (
-        MatchMvpVote.objects
-        .filter(match=match)
-        .values("candidate")
-        .annotate(votes=Count("id_uuid"))
-        .order_by("-votes", "candidate")
-        .first()
-    )
+    return _publish_mvp(match, mvp)
 
-    if not winner_row:
-        # No votes cast; mark closed but unpublished winner.
-        mvp.published_at = now
-        mvp.save(update_fields=["published_at", "updated_at"])
-        return mvp
 
-    winner_id = winner_row.get("candidate")
+@transaction.atomic
+def _publish_mvp(match: Match, mvp: MatchMvp) -> MatchMvp:
+    now = timezone.now()
+    # Reconcile the cached tallies with the votes the winner is chosen from.
+    counts = _count_votes(match)
+    transaction.on_commit(partial(mvp_cache.set_tallies, match.id_uuid, counts))
+
+    # Select winner by vote count. Tie-breaker: lowest UUID string (stable).
+    ranked = sorted((-votes, cid) for cid, votes in counts.items() if votes > 0)
+    winner_id = ranked[0][1] if ranked else None
     winner = Player.objects.filter(id_uuid=winner_id).first() if winner_id else None
+
     if not winner:
-        mvp.published_at = now
-        mvp.save(update_fields=["published_at", "updated_at"])
+        # No votes cast; mark closed but unpublished winner.
+        if mvp.published_at is None:
+            mvp.published_at = now
+            mvp.save(update_fields=["published_at", "updated_at"])
+            transaction.on_commit(partial(mvp_cache.set_match_mvp, match.id_uuid, mvp))
         return mvp
 
     mvp.mvp_player = winner
     mvp.published_at = now
     mvp.save(update_fields=["mvp_player", "published_at", "updated_at"])
+    transaction.on_commit(partial(mvp_cache.set_match_mvp, match.id_uuid, mvp))
     return mvp
 
 
@@ -295,19 +427,27 @@ def _vote_payload_for_voter(
     voter: Player | None,
     anon_voter_token: str | None,
 ) -> dict[str, str] | None:
-    if voter is not None:
-        vote = match.mvp_votes.filter(voter=voter).first()
-        if not vote:
-            return None
-        return {"candidate_id_uuid": str(vote.candidate_id)}
-
-    if not anon_voter_token:
+    key = mvp_cache.voter_key(
+        voter_id=voter.id_uuid if voter is not None else None,
+        voter_token=anon_voter_token,
+    )
+    if key is None:
         return None
 
-    vote = match.mvp_votes.filter(voter_token=anon_voter_token).first()
-    if not vote:
+    hit, candidate_id = mvp_cache.get_voter_choice(match.id_uuid, key)
+    if not hit:
+        votes = (
+            match.mvp_votes.filter(voter=voter)
+            if voter is not None
+            else match.mvp_votes.filter(voter_token=anon_voter_token)
+        )
+        vote_candidate = votes.values_list("candidate_id", flat=True).first()
+        candidate_id = str(vote_candidate) if vote_candidate else None
+        mvp_cache.set_voter_choice(match.id_uuid, key, candidate_id)
+
+    if candidate_id is None:
         return None
-    return {"candidate_id_uuid": str(vote.candidate_id)}
+    return {"candidate_id_uuid": candidate_id}
 
 
 def _candidate_payload(
@@ -333,66 +473,76 @@ def build_match_mvp_status_payload(
     voter: Player | None = None,
     anon_voter_token: str | None = None,
 ) -> dict[str, Any]:
-    """Build the stable API payload for match MVP status."""
+    """Build the stable API payload for match MVP status.
+
+    Served from the MVP caches (see `apps.awards.services.mvp_cache`); only
+    players that are not (or no longer) candidates are loaded from the database.
+    """
     mvp = ensure_mvp_published(match, match_data)
-    candidates = build_mvp_candidates(match, match_data)
+    candidates = mvp_candidate_snapshots(match, match_data)
+    candidates_by_id = {c.id_uuid: c for c in candidates}
     user_vote = _vote_payload_for_voter(
         match=match,
         voter=voter,
         anon_voter_token=anon_voter_token,
     )
 
-    mvp_player = mvp.mvp_player
-    mvp_payload = (
-        None
-        if mvp_player is None
-        else {
-            key: value
-            for key, value in _candidate_payload(mvp_player).items()
-            if key != "team_side"
+    tallies = vote_tallies(match, candidates_by_id)
+    vote_rows = sorted(
+        ((cid, votes) for cid, votes in tallies.items() if votes > 0),
+        key=lambda row: (-row[1], row[0]),
+    )
+
+    winner_id = str(mvp.mvp_player_id) if mvp.mvp_player_id else None
+    missing_ids = {
+        cid for cid, _votes in vote_rows if cid not in candidates_by_id
+    } | ({winner_id} if winner_id and winner_id not in candidates_by_id else set())
+    other_players = (
+        {
+            str(p.id_uuid): p
+            for p in Player.objects.select_related("user").filter(
+                id_uuid__in=missing_ids,
+            )
         }
+        if missing_ids
+        else {}
     )
 
-    now = timezone.now()
-    open_for_votes = bool(now < mvp.closes_at)
+    def player_payload(
+        player_id: str,
+        *,
+        team_side: str | None,
+    ) -> dict[str, str | None] | None:
+        snapshot = candidates_by_id.get(player_id)
+        if snapshot is not None:
+            return snapshot.payload(team_side=team_side)
+        player = other_players.get(player_id)
+        if player is None:
+            return None
+        return _candidate_payload(player, team_side=team_side)
 
-    vote_rows = list(
-        match.mvp_votes
-        .values("candidate")
-        .annotate(votes=Count("id_uuid"))
-        .order_by("-votes", "candidate")
+    winner_payload = (
+        player_payload(winner_id, team_side=None) if winner_id else None
     )
-
-    side_by_id = {c.id_uuid: c.team_side for c in candidates}
-    voted_candidate_ids = [
-        str(row.get("candidate"))
-        for row in vote_rows
-        if row.get("candidate") is not None
-    ]
-    voted_players = Player.objects.select_related("user").filter(
-        id_uuid__in=voted_candidate_ids,
+    mvp_payload = (
+        None
+        if winner_payload is None
+        else {key: value for key, value in winner_payload.items() if key != "team_side"}
     )
-    voted_players_by_id = {str(p.id_uuid): p for p in voted_players}
+
+    now = timezone.now()
+    open_for_votes = bool(now < mvp.closes_at)
 
     vote_breakdown: list[dict[str, Any]] = []
-    for row in vote_rows:
-        candidate_id = row.get("candidate")
-        if candidate_id is None:
-            continue
-        candidate_id_str = str(candidate_id)
-        player = voted_players_by_id.get(candidate_id_str)
-        if player is None:
-            continue
-        votes = row.get("votes")
-        vote_breakdown.append(
-            {
-                "candidate": _candidate_payload(
-                    player,
-                    team_side=side_by_id.get(candidate_id_str),
-                ),
-                "votes": int(votes) if isinstance(votes, int) else 0,
-            },
+    for candidate_id, votes in vote_rows:
+        snapshot = candidates_by_id.get(candidate_id)
+        payload = player_payload(
+            candidate_id,
+            team_side=snapshot.team_side if snapshot is not None else None,
         )
+        if payload is None:
+            continue
+        vote_breakdown.append({"candidate": payload, "votes": votes})
 
     return {
         "available": True,
@@ -405,7 +555,7 @@ def build_match_mvp_status_payload(
                 "id_uuid": c.id_uuid,
                 "username": c.username,
                 "display_name": c.display_name,
-                "profile_picture_url": c.profile_picture_url,
+                "profile_picture_url": c.picture_url(thumbnail=True),
                 "team_side": c.team_side,
             }
             for c in candidates
@@ -417,6 +567,60 @@ def build_match_mvp_status_payload(
     }
 
 
+def _save_vote(
+    *,
+    match: Match,
+    candidate: Player,
+    voter_lookup: dict[str, Any],
+) -> tuple[MatchMvpVote, str | None]:
+    """Create or update a vote; return it with the previous candidate id."""
+    vote = (
+        MatchMvpVote.objects
+        .select_for_update()
+        .filter(match=match, **voter_lookup)
+        .first()
+    )
+    if vote is None:
+        try:
+            with transaction.atomic():
+                created = MatchMvpVote.objects.create(
+                    match=match,
+                    candidate=candidate,
+                    **voter_lookup,
+                )
+        except IntegrityError:
+            # A concurrent first vote of the same voter won the race.
+            vote = MatchMvpVote.objects.select_for_update().get(
+                match=match,
+                **voter_lookup,
+            )
+        else:
+            return created, None
+
+    previous = str(vote.candidate_id)
+    if previous != str(candidate.id_uuid):
+        vote.candidate = candidate
+        vote.save(update_fields=["candidate", "updated_at"])
+    return vote, previous
+
+
+def _record_vote(
+    *,
+    match: Match,
+    voter: str | None,
+    previous: str | None,
+    current: str,
+) -> None:
+    # After commit: a rolled back vote must not move the counters. Callers
+    # run in their own transaction, so the voter's next read already agrees.
+    def _apply() -> None:
+        mvp_cache.apply_vote_change(match.id_uuid, previous=previous, current=current)
+        if voter is not None:
+            mvp_cache.set_voter_choice(match.id_uuid, voter, current)
+
+    transaction.on_commit(_apply)
+
+
 @transaction.atomic
 def cast_vote(
     *,
@@ -428,10 +632,16 @@ def cast_vote(
     """Create or update a voter's MVP vote."""
     _validate_vote_or_raise(match=match, match_data=match_data, candidate=candidate)
 
-    obj, _created = MatchMvpVote.objects.update_or_create(
+    obj, previous = _save_vote(
         match=match,
-        voter=voter,
-        defaults={"candidate": candidate},
+        candidate=candidate,
+        voter_lookup={"voter": voter},
+    )
+    _record_vote(
+        match=match,
+        voter=mvp_cache.voter_key(voter_id=voter.id_uuid, voter_token=None),
+        previous=previous,
+        current=str(candidate.id_uuid),
     )
     return obj
 
@@ -447,9 +657,15 @@ def cast_vote_anon(
     """Create or update an anonymous MVP vote tied to a cookie token."""
     _validate_vote_or_raise(match=match, match_data=match_data, candidate=candidate)
 
-    obj, _created = MatchMvpVote.objects.update_or_create(
+    obj, previous = _save_vote(
+        match=match,
+        candidate=candidate,
+        voter_lookup={"voter_token": voter_token},
+    )
+    _record_vote(
         match=match,
-        voter_token=voter_token,
-        defaults={"candidate": candidate},
+        voter=mvp_cache.voter_key(voter_id=None, voter_token=voter_token),
+        previous=previous,
+        current=str(candidate.id_uuid),
     )
     return obj
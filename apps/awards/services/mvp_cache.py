@@ -0,0 +1,185 @@
+"""Cache entries behind the match MVP status and vote endpoints.
+
+Everything is keyed per match (candidates per `MatchData`) and stored in the
+shared cache (Valkey):
+
+- candidate snapshots of a finished match; they hold storage names instead of
+  URLs, so presigned picture URLs are resolved (and re-signed) per request;
+- the `MatchMvp` voting window;
+- each voter's current choice;
+- one vote counter per candidate, bumped atomically by every vote. The counters
+  are trusted while the tally marker exists; the marker expires every
+  `KORFBAL_MVP_TALLY_RECONCILE_S`, after which the next read recounts from the
+  database. Publishing recounts as well.
+
+Writes that follow database changes run after commit, so a rolled back
+change never reaches the cache and other workers never re-cache rows that
+are about to change. Cache failures are never fatal: reads fall back to the
+database.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from typing import TYPE_CHECKING, Final
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+if TYPE_CHECKING:
+    from apps.awards.models.mvp import MatchMvp
+
+
+_CACHE_KEY_PREFIX: Final[str] = "korfbal:mvp:v1"
+_NO_VOTE: Final[str] = ""
+
+
+def _key(scope: object, *parts: object) -> str:
+    return ":".join([_CACHE_KEY_PREFIX, str(scope), *map(str, parts)])
+
+
+def _ttl() -> int:
+    return max(1, int(getattr(settings, "KORFBAL_MVP_CACHE_TTL_S", 60 * 60 * 6)))
+
+
+def _reconcile_interval() -> int:
+    return max(1, int(getattr(settings, "KORFBAL_MVP_TALLY_RECONCILE_S", 60)))
+
+
+def voter_key(*, voter_id: object | None, voter_token: str | None) -> str | None:
+    """Return the cache identity of a player or anonymous voter."""
+    if voter_id is not None:
+        return f"player-{voter_id}"
+    if voter_token:
+        return f"token-{voter_token}"
+    return None
+
+
+def get_candidates(match_data_id: object) -> list[object] | None:
+    """Return the cached candidate snapshots, or None on a miss."""
+    with contextlib.suppress(Exception):
+        cached = cache.get(_key(match_data_id, "candidates"))
+        if isinstance(cached, list):
+            return cached
+    return None
+
+
+def set_candidates(match_data_id: object, snapshots: list[object]) -> None:
+    """Cache the candidate snapshots of a finished match."""
+    with contextlib.suppress(Exception):
+        cache.set(_key(match_data_id, "candidates"), snapshots, timeout=_ttl())
+
+
+def delete_candidates(*match_data_ids: object) -> None:
+    """Drop the cached candidate snapshots (roster or player changed)."""
+    if not match_data_ids:
+        return
+    with contextlib.suppress(Exception):
+        cache.delete_many([_key(mid, "candidates") for mid in match_data_ids])
+
+
+def get_match_mvp(match_id: object) -> MatchMvp | None:
+    """Return the cached voting window, or None on a miss."""
+    with contextlib.suppress(Exception):
+        return cache.get(_key(match_id, "window"))
+    return None
+
+
+def set_match_mvp(match_id: object, mvp: MatchMvp) -> None:
+    """Cache the voting window of a match."""
+    with contextlib.suppress(Exception):
+        cache.set(_key(match_id, "window"), mvp, timeout=_ttl())
+
+
+def delete_match_mvp(match_id: object) -> None:
+    """Drop the cached voting window (it was saved or deleted)."""
+    with contextlib.suppress(Exception):
+        cache.delete(_key(match_id, "window"))
+
+
+def get_voter_choice(match_id: object, voter: str) -> tuple[bool, str | None]:
+    """Return `(hit, candidate_id)`; a hit without candidate means no vote."""
+    with contextlib.suppress(Exception):
+        cached = cache.get(_key(match_id, "voter", voter))
+        if isinstance(cached, str):
+            return True, cached or None
+    return False, None
+
+
+def set_voter_choice(match_id: object, voter: str, candidate_id: str | None) -> None:
+    """Cache a voter's current choice (None: the voter has not voted)."""
+    with contextlib.suppress(Exception):
+        cache.set(
+            _key(match_id, "voter", voter),
+            candidate_id or _NO_VOTE,
+            timeout=_ttl(),
+        )
+
+
+def delete_voter_choice(match_id: object, voter: str) -> None:
+    """Drop a voter's cached choice."""
+    with contextlib.suppress(Exception):
+        cache.delete(_key(match_id, "voter", voter))
+
+
+def get_tallies(match_id: object) -> dict[str, int] | None:
+    """Return the cached vote count per candidate id, or None when stale."""
+    with contextlib.suppress(Exception):
+        candidate_ids = cache.get(_key(match_id, "tally"))
+        if not isinstance(candidate_ids, list):
+            return None
+        keys = {_key(match_id, "tally", cid): cid for cid in candidate_ids}
+        counts = cache.get_many(list(keys))
+        if len(counts) != len(keys):
+            return None
+        return {keys[key]: int(value) for key, value in counts.items()}
+    return None
+
+
+def set_tallies(match_id: object, counts: dict[str, int]) -> None:
+    """Replace the cached tallies with counts recounted from the database."""
+    with contextlib.suppress(Exception):
+        cache.set_many(
+            {_key(match_id, "tally", cid): int(n) for cid, n in counts.items()},
+            timeout=_ttl(),
+        )
+        # Written last: counters are only trusted while the marker exists.
+        cache.set(
+            _key(match_id, "tally"),
+            sorted(counts),
+            timeout=_reconcile_interval(),
+        )
+
+
+def invalidate_tallies(match_id: object) -> None:
+    """Force the next read to recount the tallies from the database."""
+    with contextlib.suppress(Exception):
+        cache.delete(_key(match_id, "tally"))
+
+
+def apply_vote_change(
+    match_id: object,
+    *,
+    previous: str | None,
+    current: str | None,
+) -> None:
+    """Move one vote from `previous` to `current` in the cached tallies."""
+    if previous == current:
+        return
+    try:
+        candidate_ids = cache.get(_key(match_id, "tally"))
+        if not isinstance(candidate_ids, list):
+            # Nothing trusted to update; the next read recounts anyway.
+            return
+        if current is not None and current not in candidate_ids:
+            # First vote for this candidate: recount instead of guessing.
+            invalidate_tallies(match_id)
+            return
+        if current is not None:
+            cache.incr(_key(match_id, "tally", current))
+        if previous is not None:
+            cache.decr(_key(match_id, "tally", previous))
+    except Exception:
+        # A counter went missing (eviction) or the cache is down: recount.
+        invalidate_tallies(match_id)
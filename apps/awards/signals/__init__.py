@@ -0,0 +1,18 @@
+"""Module contains signals for the awards app."""
+
+from .mvp_signals import (
+    invalidate_mvp_candidates,
+    invalidate_mvp_candidates_of_player,
+    invalidate_mvp_candidates_of_user,
+    invalidate_mvp_vote,
+    invalidate_mvp_window,
+)
+
+
+__all__ = [
+    "invalidate_mvp_candidates",
+    "invalidate_mvp_candidates_of_player",
+    "invalidate_mvp_candidates_of_user",
+    "invalidate_mvp_vote",
+    "invalidate_mvp_window",
+]
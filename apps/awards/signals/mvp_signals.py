@@ -0,0 +1,139 @@
+"""Keep the MVP caches in line with roster, window, vote and player changes.
+
+Cache entries are dropped after commit (see `apps.awards.services.mvp_cache`).
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Final
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.awards.models.mvp import MatchMvp, MatchMvpVote
+from apps.awards.services import mvp_cache
+from apps.game_tracker.models import MatchPlayer, PlayerChange, Shot
+from apps.player.models import Player
+
+
+# Fields copied into the cached candidate snapshots.
+_CANDIDATE_USER_FIELDS: Final = frozenset({"username", "first_name", "last_name"})
+_CANDIDATE_PLAYER_FIELDS: Final = frozenset({
+    "profile_picture",
+    "profile_picture_derivatives",
+})
+
+
+@receiver(post_save, sender=MatchMvp)
+@receiver(post_delete, sender=MatchMvp)
+def invalidate_mvp_window(
+    sender: type[MatchMvp],
+    instance: MatchMvp,
+    **kwargs: object,
+) -> None:
+    """Drop the cached voting window when it is saved or deleted."""
+    transaction.on_commit(partial(mvp_cache.delete_match_mvp, instance.match_id))
+
+
+@receiver(post_save, sender=MatchMvpVote)
+@receiver(post_delete, sender=MatchMvpVote)
+def invalidate_mvp_vote(
+    sender: type[MatchMvpVote],
+    instance: MatchMvpVote,
+    **kwargs: object,
+) -> None:
+    """Drop the voter's cached choice; deletes also force a tally recount.
+
+    Votes cast through `cast_vote`/`cast_vote_anon` update the tallies and
+    the voter's choice themselves, after this on the same commit.
+    """
+    voter = mvp_cache.voter_key(
+        voter_id=instance.voter_id,
+        voter_token=str(instance.voter_token) if instance.voter_token else None,
+    )
+    if voter is not None:
+        transaction.on_commit(
+            partial(mvp_cache.delete_voter_choice, instance.match_id, voter),
+        )
+    if kwargs.get("signal") is post_delete:
+        transaction.on_commit(
+            partial(mvp_cache.invalidate_tallies, instance.match_id),
+        )
+
+
+@receiver(post_save, sender=MatchPlayer)
+@receiver(post_delete, sender=MatchPlayer)
+def invalidate_mvp_candidates(
+    sender: type[MatchPlayer],
+    instance: MatchPlayer,
+    **kwargs: object,
+) -> None:
+    """Drop the cached MVP candidates when the match roster changes."""
+    transaction.on_commit(
+        partial(mvp_cache.delete_candidates, instance.match_data_id),
+    )
+
+
+def _drop_candidates_of_player(player_id: object) -> None:
+    # Candidates come from the roster, or from events without a roster.
+    match_data_ids = (
+        set(
+            MatchPlayer.objects
+            .filter(player_id=player_id)
+            .values_list("match_data_id", flat=True)
+        )
+        | set(
+            Shot.objects
+            .filter(player_id=player_id)
+            .values_list("match_data_id", flat=True)
+            .distinct()
+        )
+        | set(
+            PlayerChange.objects
+            .filter(Q(player_in_id=player_id) | Q(player_out_id=player_id))
+            .values_list("match_data_id", flat=True)
+            .distinct()
+        )
+    )
+    mvp_cache.delete_candidates(*match_data_ids)
+
+
+@receiver(post_save, sender=Player)
+def invalidate_mvp_candidates_of_player(
+    sender: type[Player],
+    instance: Player,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,
+) -> None:
+    """Drop the cached candidates showing the player's old profile picture."""
+    if created or (
+        update_fields is not None and not update_fields & _CANDIDATE_PLAYER_FIELDS
+    ):
+        return
+    transaction.on_commit(partial(_drop_candidates_of_player, instance.id_uuid))
+
+
+@receiver(post_save, sender=User)
+def invalidate_mvp_candidates_of_user(
+    sender: type[User],
+    instance: User,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,
+) -> None:
+    """Drop the cached candidates showing the user's old name."""
+    # New users are not on any roster yet; logins only touch `last_login`.
+    if created or (
+        update_fields is not None and not update_fields & _CANDIDATE_USER_FIELDS
+    ):
+        return
+    player_id = (
+        Player.objects.filter(user=instance).values_list("id_uuid", flat=True).first()
+    )
+    if player_id is not None:
+        transaction.on_commit(partial(_drop_candidates_of_player, player_id))
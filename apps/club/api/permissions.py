@@ -8,13 +8,11 @@ from rest_framework.views import APIView
 
 from apps.club.models.club import Club
 from apps.player.models.player import Player
+from apps.player.services.viewer_identity import viewer_player_for
 
 
 def _viewer_player(request: Request) -> Player | None:
-    user = getattr(request, "user", None)
-    if user is None or not getattr(user, "is_authenticated", False):
-        return None
-    return Player.objects.filter(user=user).first()
+    return viewer_player_for(request)
 
 
 class IsClubAdmin(BasePermission):
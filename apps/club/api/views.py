@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
 
 from django.db.models import Q, QuerySet
 from django.utils import timezone
@@ -23,8 +23,19 @@ from apps.club.services.eligibility_dashboard import build_club_eligibility_dash
 from apps.game_tracker.models import MatchData
 from apps.kwt_common.api.pagination import StandardResultsSetPagination
 from apps.kwt_common.api.permissions import IsStaffOrReadOnly
-from apps.kwt_common.utils.match_summary import build_match_summaries
+from apps.kwt_common.overview_sections import (
+    OverviewSection,
+    compose_sections,
+    is_complete_overview,
+)
+from apps.kwt_common.public_cache import (
+    cached_public_payload,
+    club_tag,
+    public_cache_key,
+)
+from apps.kwt_common.utils.match_summary import load_match_summaries
 from apps.player.models.player import Player
+from apps.player.services.viewer_identity import viewer_player_for
 from apps.schedule.models import Season
 from apps.team.api.serializers import TeamSerializer
 from apps.team.models.team import Team
@@ -49,6 +60,23 @@ class ClubViewSet(viewsets.ModelViewSet):
     filter_backends = (filters.SearchFilter,)
     search_fields = ("name",)
 
+    # Max SQL queries per action (incl. session/auth lookups); see
+    # `apps.kwt_common.query_budget`.
+    query_budgets: ClassVar[dict[str, int]] = {
+        "list": 5,
+        "retrieve": 4,
+        "create": 6,
+        "update": 7,
+        "partial_update": 7,
+        "destroy": 10,
+        "overview": 13,
+        "admin_settings": 9,
+        "user_search": 8,
+        "eligibility_dashboard": 13,
+        "add_membership": 14,
+        "remove_membership": 9,
+    }
+
     @action(detail=True, methods=("GET",), url_path="overview")
     def overview(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Return teams and match summaries for a club detail page.
@@ -58,58 +86,95 @@ class ClubViewSet(viewsets.ModelViewSet):
 
         """
         club = self.get_object()
+        if request.user.is_authenticated:
+            return Response(self._overview_payload(request, club))
+        payload = cached_public_payload(
+            public_cache_key(
+                "club-overview",
+                request.query_params,
+                fields=("season",),
+                subject=club.id_uuid,
+            ),
+            tags=(club_tag(club.id_uuid),),
+            compute=lambda: self._overview_payload(request, club),
+            cacheable=is_complete_overview,
+        )
+        return Response(payload)
+
+    def _overview_payload(self, request: Request, club: Club) -> dict[str, Any]:
         seasons_qs = list(self._club_seasons_queryset(club))
         season = self._resolve_season(request, seasons_qs)
-
-        teams_qs = self._club_teams_queryset(club, season)
-        teams_payload = TeamSerializer(
-            teams_qs,
-            many=True,
-            context=self.get_serializer_context(),
-        ).data
-
         match_data_qs = self._club_match_queryset(club, season)
 
-        upcoming_matches = build_match_summaries(
-            match_data_qs.filter(status__in=["upcoming", "active"]).order_by(
-                "match_link__start_time"
-            )[:10]
-        )
-        recent_matches = build_match_summaries(
-            match_data_qs.filter(status="finished").order_by("-match_link__start_time")[
-                :10
-            ]
+        results = compose_sections(
+            "club",
+            (
+                OverviewSection(
+                    name="teams",
+                    compute=lambda: TeamSerializer(
+                        self._club_teams_queryset(club, season),
+                        many=True,
+                        context=self.get_serializer_context(),
+                    ).data,
+                    fallback=[],
+                ),
+                OverviewSection(
+                    name="upcoming",
+                    compute=lambda: load_match_summaries(
+                        match_data_qs
+                        .filter(status__in=["upcoming", "active"])
+                        .order_by("match_link__start_time")[:10]
+                    ),
+                    fallback=[],
+                ),
+                OverviewSection(
+                    name="recent",
+                    compute=lambda: load_match_summaries(
+                        match_data_qs
+                        .filter(status="finished")
+                        .order_by("-match_link__start_time")[:10]
+                    ),
+                    fallback=[],
+                ),
+                OverviewSection(
+                    name="seasons",
+                    compute=lambda: self._seasons_payload(seasons_qs),
+                    fallback=[],
+                ),
+            ),
         )
+        teams_payload = results.get("teams")
 
-        current_season = self._current_season()
-        seasons_payload = [
-            {
-                "id_uuid": str(option.id_uuid),
-                "name": option.name,
-                "start_date": option.start_date.isoformat(),
-                "end_date": option.end_date.isoformat(),
-                "is_current": current_season is not None
-                and option.id_uuid == current_season.id_uuid,
-            }
-            for option in seasons_qs
-        ]
-
-        payload = {
+        return {
             "club": self.get_serializer(club).data,
             "teams": teams_payload,
             "matches": {
-                "upcoming": upcoming_matches,
-                "recent": recent_matches,
+                "upcoming": results.get("upcoming"),
+                "recent": results.get("recent"),
             },
-            "seasons": seasons_payload,
+            "seasons": results.get("seasons"),
             "meta": {
                 "team_count": len(teams_payload),
                 "season_id": str(season.id_uuid) if season else None,
                 "season_name": season.name if season else None,
                 "viewer_is_admin": self._viewer_is_admin(request, club),
+                "partial_sections": list(results.partial),
             },
         }
-        return Response(payload)
+
+    def _seasons_payload(self, seasons: list[Season]) -> list[dict[str, Any]]:
+        current_season = self._current_season()
+        return [
+            {
+                "id_uuid": str(option.id_uuid),
+                "name": option.name,
+                "start_date": option.start_date.isoformat(),
+                "end_date": option.end_date.isoformat(),
+                "is_current": current_season is not None
+                and option.id_uuid == current_season.id_uuid,
+            }
+            for option in seasons
+        ]
 
     @action(
         detail=True,
@@ -234,10 +299,7 @@ class ClubViewSet(viewsets.ModelViewSet):
         return club.admin.filter(id_uuid=viewer.id_uuid).exists()
 
     def _viewer_player(self, request: Request) -> Player | None:
-        user = getattr(request, "user", None)
-        if user is None or not getattr(user, "is_authenticated", False):
-            return None
-        return Player.objects.filter(user=user).first()
+        return viewer_player_for(request)
 
     def _club_teams_queryset(self, club: Club, season: Season | None) -> QuerySet[Team]:
         queryset = club.teams.select_related("club").order_by("name")
@@ -252,14 +314,7 @@ class ClubViewSet(viewsets.ModelViewSet):
     def _club_match_queryset(
         self, club: Club, season: Season | None
     ) -> QuerySet[MatchData]:
-        queryset = MatchData.objects.select_related(
-            "match_link",
-            "match_link__home_team",
-            "match_link__home_team__club",
-            "match_link__away_team",
-            "match_link__away_team__club",
-            "match_link__season",
-        ).filter(
+        queryset = MatchData.objects.filter(
             Q(match_link__home_team__club=club) | Q(match_link__away_team__club=club),
         )
         if season:
@@ -8,3 +8,7 @@ class ClubConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.club"
+
+    def ready(self) -> None:
+        """Import signals."""
+        import apps.club.signals
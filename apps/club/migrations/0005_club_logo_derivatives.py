@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("club", "0004_alter_club_logo"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="club",
+            name="logo_derivatives",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -9,6 +9,8 @@ from django.conf import settings
 from django.db import models
 from django.templatetags.static import static
 
+from apps.kwt_common.image_derivatives import image_url_for_size
+
 
 if TYPE_CHECKING:
     from apps.team.models.team import Team
@@ -32,6 +34,11 @@ class Club(models.Model):
         blank=True,
         null=True,
     )
+    # Generated thumbnails, see `apps.kwt_common.image_derivatives`.
+    logo_derivatives: models.JSONField[dict[str, Any]] = models.JSONField(
+        default=dict,
+        blank=True,
+    )
 
     if TYPE_CHECKING:
         teams: models.QuerySet[Team]
@@ -56,15 +63,20 @@ class Club(models.Model):
         # project migrated to a React SPA. Club links should point into the SPA.
         return f"{settings.WEB_APP_ORIGIN}/clubs/{self.id_uuid}"
 
-    def get_club_logo(self) -> str:
+    def get_club_logo(self, size: int | None = None) -> str:
         """Get the URL of the club logo.
 
+        Args:
+            size: Optional display size in pixels. When set, the smallest
+                generated thumbnail covering it is returned instead of the
+                original upload.
+
         Returns:
             str: The URL of the club logo or a default image if not set.
 
         """
         if self.logo:
-            return self.logo.url
+            return image_url_for_size(self.logo, self.logo_derivatives, size)
 
         # Optional: if the KWT club doesn't have an uploaded logo in the DB,
         # serve a known static brand asset.
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 import math
@@ -14,8 +15,11 @@ from django.db.models import Q, QuerySet
 from django.utils import timezone
 
 from apps.club.models import Club
-from apps.game_tracker.models import MatchData, MatchPlayer, PlayerMatchMinutes
-from apps.game_tracker.models.player_match_minutes import LATEST_MATCH_MINUTES_VERSION
+from apps.club.services.eligibility_state import (
+    EligibilityState,
+    as_player_payload,
+    load_eligibility_state,
+)
 from apps.player.models import Player
 from apps.schedule.models import Season
 from apps.team.models import Team, TeamData
@@ -55,7 +59,7 @@ class PlayedEntry:
 class PlayerState:
     """Computed eligibility state per player for one dashboard render."""
 
-    player: Player
+    player: dict[str, str]
     counted_entries: list[PlayedEntry]
     total_counted: int
     restrictions_active: bool
@@ -95,18 +99,6 @@ def _infer_family(*, team_name: str, wedstrijd_sport: bool) -> str:
     return "SENIOR_B"
 
 
-def _expected_match_minutes(match_data: MatchData) -> float:
-    parts = float(getattr(match_data, "parts", 0) or 0)
-    part_length = float(getattr(match_data, "part_length", 0) or 0)
-    expected = (parts * part_length) / 60.0
-    return max(1.0, expected)
-
-
-def _is_played_match(*, minutes_played: float, match_data: MatchData) -> bool:
-    required = _expected_match_minutes(match_data) * 0.75
-    return minutes_played >= required
-
-
 def _pick_counted_match_for_week(entries: list[PlayedEntry]) -> PlayedEntry:
     a_entries = [entry for entry in entries if entry.wedstrijd_sport]
     candidates = a_entries or entries
@@ -239,14 +231,6 @@ def _can_lowest_a_play_b(
     )
 
 
-def _as_player_payload(player: Player) -> dict[str, str]:
-    return {
-        "id_uuid": str(player.id_uuid),
-        "username": player.user.username,
-        "profile_url": player.get_absolute_url(),
-    }
-
-
 def _build_teams_payload(
     team_context_by_id: dict[str, TeamContext],
 ) -> list[dict[str, Any]]:
@@ -284,133 +268,61 @@ def _build_team_context_by_id(
     return team_context_by_id
 
 
-def _fetch_match_data_by_id(
-    *,
-    club_team_ids: list[str],
-    season: Season | None,
-) -> dict[str, MatchData]:
-    finished_matches_qs = (
-        MatchData.objects
-        .select_related("match_link", "match_link__season")
-        .filter(status="finished", match_link__isnull=False)
-        .filter(
-            Q(match_link__home_team_id__in=club_team_ids)
-            | Q(match_link__away_team_id__in=club_team_ids)
-        )
-    )
-    if season is not None:
-        finished_matches_qs = finished_matches_qs.filter(match_link__season=season)
-    return {str(md.id_uuid): md for md in finished_matches_qs}
-
-
-def _resolve_team_id_for_entry(
-    *,
-    match_data: MatchData,
-    player_id: str,
-    designated_team_by_match_and_player: dict[tuple[str, str], str],
-    team_context_by_id: dict[str, TeamContext],
-) -> str | None:
-    team_id = designated_team_by_match_and_player.get((
-        str(match_data.id_uuid),
-        player_id,
-    ))
-    if team_id:
-        return team_id
-    if match_data.match_link is None:
-        return None
-
-    home_team_id = str(match_data.match_link.home_team_id)
-    away_team_id = str(match_data.match_link.away_team_id)
-    home_is_club = home_team_id in team_context_by_id
-    away_is_club = away_team_id in team_context_by_id
-    if home_is_club and not away_is_club:
-        return home_team_id
-    if away_is_club and not home_is_club:
-        return away_team_id
-    return home_team_id
-
-
-def _collect_entries_and_players(
+def _entries_from_state(
     *,
-    match_data_by_id: dict[str, MatchData],
-    club_team_ids: list[str],
+    state: EligibilityState,
     team_context_by_id: dict[str, TeamContext],
-) -> tuple[dict[str, list[PlayedEntry]], dict[str, Player]]:
-    match_minutes_qs = PlayerMatchMinutes.objects.select_related(
-        "player",
-        "player__user",
-        "match_data",
-        "match_data__match_link",
-    ).filter(
-        algorithm_version=LATEST_MATCH_MINUTES_VERSION,
-        match_data_id__in=match_data_by_id.keys(),
-    )
-
-    designated_team_by_match_and_player = {
-        (str(row.match_data_id), str(row.player_id)): str(row.team_id)
-        for row in MatchPlayer.objects.filter(
-            match_data_id__in=match_data_by_id.keys(),
-            team_id__in=club_team_ids,
-        ).only("match_data_id", "player_id", "team_id")
-    }
-
+) -> dict[str, list[PlayedEntry]]:
     entries_by_player: dict[str, list[PlayedEntry]] = defaultdict(list)
-    players_by_id: dict[str, Player] = {}
-
-    for row in match_minutes_qs:
-        match_data = row.match_data
-        if match_data is None or match_data.match_link is None:
-            continue
-
-        player = row.player
-        player_id = str(player.id_uuid)
-        team_id = _resolve_team_id_for_entry(
-            match_data=match_data,
-            player_id=player_id,
-            designated_team_by_match_and_player=designated_team_by_match_and_player,
-            team_context_by_id=team_context_by_id,
-        )
-        if team_id is None or team_id not in team_context_by_id:
-            continue
-        if not _is_played_match(
-            minutes_played=float(row.minutes_played),
-            match_data=match_data,
-        ):
-            continue
 
-        team_ctx = team_context_by_id[team_id]
-        players_by_id[player_id] = player
-        entries_by_player[player_id].append(
-            PlayedEntry(
-                played_at=match_data.match_link.start_time,
-                week_start=_week_start_for(match_data.match_link.start_time),
-                team_id=team_id,
-                team_rank=team_ctx.team_rank,
-                family=team_ctx.family,
-                wedstrijd_sport=team_ctx.wedstrijd_sport,
+    for appearances in state.matches.values():
+        week_start = _week_start_for(appearances.played_at)
+        for player_id, team_id in appearances.team_by_player.items():
+            team_ctx = team_context_by_id.get(team_id)
+            if team_ctx is None:
+                continue
+            entries_by_player[player_id].append(
+                PlayedEntry(
+                    played_at=appearances.played_at,
+                    week_start=week_start,
+                    team_id=team_id,
+                    team_rank=team_ctx.team_rank,
+                    family=team_ctx.family,
+                    wedstrijd_sport=team_ctx.wedstrijd_sport,
+                )
             )
-        )
 
-    return entries_by_player, players_by_id
+    return entries_by_player
 
 
-def _add_roster_players(
-    players_by_id: dict[str, Player],
+def _load_player_payloads(
+    played_ids: Iterable[str],
     team_data_qs: QuerySet[TeamData],
-) -> None:
-    roster_players = (
+) -> dict[str, dict[str, str]]:
+    # Players who played first, then the remaining roster players.
+    played_ids = list(played_ids)
+    players = (
         Player.objects
-        .filter(team_data_as_player__in=team_data_qs)
+        .filter(Q(id_uuid__in=played_ids) | Q(team_data_as_player__in=team_data_qs))
         .select_related("user")
         .distinct()
     )
-    for player in roster_players:
-        players_by_id.setdefault(str(player.id_uuid), player)
+    payload_by_id = {
+        str(player.id_uuid): as_player_payload(player) for player in players
+    }
+    players_by_id = {
+        player_id: payload_by_id[player_id]
+        for player_id in played_ids
+        if player_id in payload_by_id
+    }
+    for player_id, payload in payload_by_id.items():
+        players_by_id.setdefault(player_id, payload)
+    return players_by_id
 
 
 def _build_player_states(
     *,
-    players_by_id: dict[str, Player],
+    players_by_id: dict[str, dict[str, str]],
     entries_by_player: dict[str, list[PlayedEntry]],
     team_context_by_id: dict[str, TeamContext],
 ) -> dict[str, PlayerState]:
@@ -516,7 +428,7 @@ def _build_player_payloads(
     players_payload: list[dict[str, Any]] = []
     for player_id, state in sorted(
         player_states.items(),
-        key=lambda item: item[1].player.user.username.lower(),
+        key=lambda item: item[1].player["username"].lower(),
     ):
         own_team = (
             team_context_by_id.get(state.own_team_id)
@@ -624,7 +536,7 @@ def _build_player_payloads(
             })
 
         players_payload.append({
-            "player": _as_player_payload(state.player),
+            "player": state.player,
             "played_matches_count": state.total_counted,
             "restrictions_active": state.restrictions_active,
             "active_family": state.active_family,
@@ -641,7 +553,11 @@ def build_club_eligibility_dashboard(
     club: Club,
     season: Season | None,
 ) -> dict[str, Any]:
-    """Build club-level eligibility and vastspelen dashboard payload."""
+    """Build club-level eligibility and vastspelen dashboard payload.
+
+    `generated_at` is the time the cached played-match state was last built or
+    updated (see `apps.club.services.eligibility_state`).
+    """
     team_data_qs = TeamData.objects.select_related("team", "team__club").filter(
         team__club=club
     )
@@ -659,26 +575,28 @@ def build_club_eligibility_dashboard(
             "players": [],
         }
 
-    club_team_ids = list(team_context_by_id.keys())
-    match_data_by_id = _fetch_match_data_by_id(
-        club_team_ids=club_team_ids,
+    # Played-match state is cached per (club, season); ranks, families and
+    # rosters below are always current.
+    state = load_eligibility_state(
+        club_id=club.id_uuid,
         season=season,
+        team_ids=frozenset(team_context_by_id),
     )
-    if not match_data_by_id:
+    if not state.matches:
         return {
             "season_id": str(season.id_uuid) if season else None,
             "season_name": season.name if season else None,
-            "generated_at": timezone.now().isoformat(),
+            "generated_at": state.updated_at.isoformat(),
             "teams": teams_payload,
             "players": [],
         }
 
-    entries_by_player, players_by_id = _collect_entries_and_players(
-        match_data_by_id=match_data_by_id,
-        club_team_ids=club_team_ids,
+    entries_by_player = _entries_from_state(
+        state=state,
         team_context_by_id=team_context_by_id,
     )
-    _add_roster_players(players_by_id, team_data_qs)
+    # Payloads are read fresh (the cached state only holds player ids).
+    players_by_id = _load_player_payloads(entries_by_player, team_data_qs)
 
     player_states = _build_player_states(
         players_by_id=players_by_id,
@@ -702,7 +620,7 @@ def build_club_eligibility_dashboard(
     return {
         "season_id": str(season.id_uuid) if season else None,
         "season_name": season.name if season else None,
-        "generated_at": timezone.now().isoformat(),
+        "generated_at": state.updated_at.isoformat(),
         "teams": teams_payload,
         "players": players_payload,
     }
@@ -0,0 +1,376 @@
+"""Cached played-match state behind the club eligibility dashboard.
+
+Collecting who played which finished match for which club team is the
+expensive part of the dashboard: every finished match of every club team, with
+its `PlayerMatchMinutes` and `MatchPlayer` rows. That state is kept in the
+shared cache (Valkey) per (club, season) as an `EligibilityState`:
+
+- `matches` holds, per finished match, the played time and the club team each
+  player counted for (only appearances that reached the played-minutes bar).
+  Player payloads (names, profile links) are not cached, so renames show up
+  right away.
+
+When a match finishes or is reopened, its minutes are recomputed or its roster
+changes, only that match is recomputed in the cached states of both clubs (see
+`apps.club.signals.eligibility_signals`; roster syncs that bypass signals
+call `schedule_eligibility_refresh` themselves). A state is rebuilt from scratch when
+the club's set of teams for the season changes or the entry expires
+(`KORFBAL_ELIGIBILITY_STATE_TTL_S`). Team ranks, families and rosters are
+not cached; the dashboard reads them on every request.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass
+from datetime import datetime
+from importlib import import_module
+import logging
+from typing import Any, Final
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.game_tracker.models import MatchData, MatchPlayer, PlayerMatchMinutes
+from apps.game_tracker.models.player_match_minutes import LATEST_MATCH_MINUTES_VERSION
+from apps.player.models import Player
+from apps.schedule.models import Season
+from apps.team.models import Team
+
+
+logger = logging.getLogger(__name__)
+
+_CACHE_KEY_PREFIX: Final[str] = "korfbal:eligibility:v3"
+_ALL_SEASONS: Final[str] = "all"
+_LOCK_TIMEOUT_S: Final[int] = 30
+
+
+@dataclass(frozen=True, slots=True)
+class MatchAppearances:
+    """Counted appearances of club players in one finished match."""
+
+    played_at: datetime
+    team_by_player: dict[str, str]
+
+
+@dataclass(slots=True)
+class EligibilityState:
+    """Played-match state of one club for one season (or all seasons)."""
+
+    team_ids: frozenset[str]
+    matches: dict[str, MatchAppearances]
+    updated_at: datetime
+
+
+def _state_key(club_id: object, season_id: object | None) -> str:
+    season_part = _ALL_SEASONS if season_id is None else str(season_id)
+    return f"{_CACHE_KEY_PREFIX}:{club_id}:{season_part}"
+
+
+def _state_ttl() -> int:
+    return max(
+        1,
+        int(getattr(settings, "KORFBAL_ELIGIBILITY_STATE_TTL_S", 60 * 60 * 6)),
+    )
+
+
+def as_player_payload(player: Player) -> dict[str, str]:
+    """Return the dashboard payload of a player (with `user` loaded)."""
+    return {
+        "id_uuid": str(player.id_uuid),
+        "username": player.user.username,
+        "profile_url": player.get_absolute_url(),
+    }
+
+
+def _expected_match_minutes(match_data: MatchData) -> float:
+    parts = float(getattr(match_data, "parts", 0) or 0)
+    part_length = float(getattr(match_data, "part_length", 0) or 0)
+    expected = (parts * part_length) / 60.0
+    return max(1.0, expected)
+
+
+def _is_played_match(*, minutes_played: float, match_data: MatchData) -> bool:
+    required = _expected_match_minutes(match_data) * 0.75
+    return minutes_played >= required
+
+
+def _fetch_match_data_by_id(
+    *,
+    club_team_ids: list[str],
+    season: Season | None,
+) -> dict[str, MatchData]:
+    finished_matches_qs = (
+        MatchData.objects
+        .select_related("match_link", "match_link__season")
+        .filter(status="finished", match_link__isnull=False)
+        .filter(
+            Q(match_link__home_team_id__in=club_team_ids)
+            | Q(match_link__away_team_id__in=club_team_ids)
+        )
+    )
+    if season is not None:
+        finished_matches_qs = finished_matches_qs.filter(match_link__season=season)
+    return {str(md.id_uuid): md for md in finished_matches_qs}
+
+
+def _resolve_team_id_for_entry(
+    *,
+    match_data: MatchData,
+    player_id: str,
+    designated_team_by_match_and_player: dict[tuple[str, str], str],
+    club_team_ids: frozenset[str],
+) -> str | None:
+    team_id = designated_team_by_match_and_player.get((
+        str(match_data.id_uuid),
+        player_id,
+    ))
+    if team_id:
+        return team_id
+    if match_data.match_link is None:
+        return None
+
+    home_team_id = str(match_data.match_link.home_team_id)
+    away_team_id = str(match_data.match_link.away_team_id)
+    home_is_club = home_team_id in club_team_ids
+    away_is_club = away_team_id in club_team_ids
+    if home_is_club and not away_is_club:
+        return home_team_id
+    if away_is_club and not home_is_club:
+        return away_team_id
+    return home_team_id
+
+
+def _load_rows(
+    match_data_ids: list[str],
+) -> tuple[list[PlayerMatchMinutes], list[tuple[str, str, str]]]:
+    minutes_rows = list(
+        PlayerMatchMinutes.objects.filter(
+            algorithm_version=LATEST_MATCH_MINUTES_VERSION,
+            match_data_id__in=match_data_ids,
+        )
+    )
+    roster_rows = [
+        (str(match_data_id), str(player_id), str(team_id))
+        for match_data_id, player_id, team_id in MatchPlayer.objects.filter(
+            match_data_id__in=match_data_ids,
+        ).values_list("match_data_id", "player_id", "team_id")
+    ]
+    return minutes_rows, roster_rows
+
+
+def _collect_appearances(
+    *,
+    match_data_by_id: dict[str, MatchData],
+    minutes_rows: list[PlayerMatchMinutes],
+    roster_rows: list[tuple[str, str, str]],
+    club_team_ids: frozenset[str],
+) -> dict[str, MatchAppearances]:
+    designated_team_by_match_and_player = {
+        (match_data_id, player_id): team_id
+        for match_data_id, player_id, team_id in roster_rows
+        if team_id in club_team_ids
+    }
+
+    # Finished matches without counted appearances are kept (empty) too.
+    team_by_player_by_match: dict[str, dict[str, str]] = {
+        match_data_id: {} for match_data_id in match_data_by_id
+    }
+
+    for row in minutes_rows:
+        match_data = match_data_by_id.get(str(row.match_data_id))
+        if match_data is None or match_data.match_link is None:
+            continue
+
+        player_id = str(row.player_id)
+        team_id = _resolve_team_id_for_entry(
+            match_data=match_data,
+            player_id=player_id,
+            designated_team_by_match_and_player=designated_team_by_match_and_player,
+            club_team_ids=club_team_ids,
+        )
+        if team_id is None or team_id not in club_team_ids:
+            continue
+        if not _is_played_match(
+            minutes_played=float(row.minutes_played),
+            match_data=match_data,
+        ):
+            continue
+
+        team_by_player_by_match[str(match_data.id_uuid)][player_id] = team_id
+
+    matches = {
+        match_data_id: MatchAppearances(
+            played_at=match_data_by_id[match_data_id].match_link.start_time,
+            team_by_player=team_by_player,
+        )
+        for match_data_id, team_by_player in team_by_player_by_match.items()
+    }
+    return matches
+
+
+def build_eligibility_state(
+    *,
+    team_ids: frozenset[str],
+    season: Season | None,
+) -> EligibilityState:
+    """Collect the played-match state of a club's teams from the database."""
+    match_data_by_id = _fetch_match_data_by_id(
+        club_team_ids=sorted(team_ids),
+        season=season,
+    )
+    matches: dict[str, MatchAppearances] = {}
+    if match_data_by_id:
+        minutes_rows, roster_rows = _load_rows(list(match_data_by_id))
+        matches = _collect_appearances(
+            match_data_by_id=match_data_by_id,
+            minutes_rows=minutes_rows,
+            roster_rows=roster_rows,
+            club_team_ids=team_ids,
+        )
+    return EligibilityState(
+        team_ids=team_ids,
+        matches=matches,
+        updated_at=timezone.now(),
+    )
+
+
+def load_eligibility_state(
+    *,
+    club_id: object,
+    season: Season | None,
+    team_ids: frozenset[str],
+) -> EligibilityState:
+    """Return the cached state, rebuilding it when missing or out of date.
+
+    A state built for a different set of club teams is rebuilt, since team
+    resolution depends on which teams belong to the club.
+    """
+    key = _state_key(club_id, season.id_uuid if season else None)
+    cached = None
+    with contextlib.suppress(Exception):
+        cached = cache.get(key)
+    if isinstance(cached, EligibilityState) and cached.team_ids == team_ids:
+        return cached
+
+    state = build_eligibility_state(team_ids=team_ids, season=season)
+    with contextlib.suppress(Exception):
+        cache.set(key, state, timeout=_state_ttl())
+    return state
+
+
+def _apply_match(
+    key: str,
+    *,
+    match_data: MatchData,
+    minutes_rows: list[PlayerMatchMinutes],
+    roster_rows: list[tuple[str, str, str]],
+) -> bool:
+    lock_key = f"{key}:lock"
+    if not cache.add(lock_key, 1, timeout=_LOCK_TIMEOUT_S):
+        # Another worker is updating this state: drop it instead of racing.
+        cache.delete(key)
+        return False
+    try:
+        state = cache.get(key)
+        if not isinstance(state, EligibilityState):
+            return False
+
+        match_data_id = str(match_data.id_uuid)
+        state.matches.pop(match_data_id, None)
+        if match_data.status == "finished":
+            state.matches.update(
+                _collect_appearances(
+                    match_data_by_id={match_data_id: match_data},
+                    minutes_rows=minutes_rows,
+                    roster_rows=roster_rows,
+                    club_team_ids=state.team_ids,
+                ),
+            )
+        state.updated_at = timezone.now()
+        cache.set(key, state, timeout=_state_ttl())
+        return True
+    finally:
+        cache.delete(lock_key)
+
+
+def refresh_match_in_eligibility_states(match_data_id: str) -> int:
+    """Recompute one match in the cached states of the clubs that played it.
+
+    Returns:
+        int: Number of cached states updated.
+
+    """
+    match_data = (
+        MatchData.objects
+        .select_related("match_link")
+        .filter(id_uuid=match_data_id)
+        .first()
+    )
+    if match_data is None or match_data.match_link is None:
+        return 0
+
+    match = match_data.match_link
+    club_ids = set(
+        Team.objects
+        .filter(id_uuid__in=[match.home_team_id, match.away_team_id])
+        .values_list("club_id", flat=True)
+    )
+    keys = [
+        _state_key(club_id, season_id)
+        for club_id in club_ids
+        for season_id in (match.season_id, None)
+    ]
+    with contextlib.suppress(Exception):
+        keys = list(cache.get_many(keys))
+    if not keys:
+        return 0
+
+    minutes_rows, roster_rows = (
+        _load_rows([str(match_data.id_uuid)])
+        if match_data.status == "finished"
+        else ([], [])
+    )
+    updated = 0
+    for key in keys:
+        with contextlib.suppress(Exception):
+            updated += _apply_match(
+                key,
+                match_data=match_data,
+                minutes_rows=minutes_rows,
+                roster_rows=roster_rows,
+            )
+    return updated
+
+
+def schedule_eligibility_refresh(*, match_data_id: str) -> None:
+    """Best-effort enqueue of a state refresh for one match, after commit.
+
+    Changes within `KORFBAL_ELIGIBILITY_REFRESH_DELAY_S` share one task.
+    """
+    delay = max(1, int(getattr(settings, "KORFBAL_ELIGIBILITY_REFRESH_DELAY_S", 5)))
+
+    def _enqueue() -> None:
+        try:
+            if not cache.add(refresh_scheduled_key(match_data_id), 1, timeout=delay):
+                return
+            tasks: Any = import_module("apps.club.tasks")
+            tasks.refresh_club_eligibility_for_match.apply_async(
+                args=(match_data_id,),
+                countdown=delay,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to enqueue refresh_club_eligibility_for_match(%s).",
+                match_data_id,
+            )
+
+    transaction.on_commit(_enqueue)
+
+
+def refresh_scheduled_key(match_data_id: str) -> str:
+    """Return the cache key marking a scheduled refresh for a match."""
+    return f"{_CACHE_KEY_PREFIX}:refresh-scheduled:{match_data_id}"
@@ -0,0 +1,16 @@
+"""Module contains signals for the club app."""
+
+from .club_signals import schedule_club_logo_derivatives
+from .eligibility_signals import (
+    refresh_eligibility_on_match_status,
+    refresh_eligibility_on_minutes_change,
+    refresh_eligibility_on_roster_change,
+)
+
+
+__all__ = [
+    "refresh_eligibility_on_match_status",
+    "refresh_eligibility_on_minutes_change",
+    "refresh_eligibility_on_roster_change",
+    "schedule_club_logo_derivatives",
+]
@@ -0,0 +1,32 @@
+"""File contains signals for the Club model."""
+
+from __future__ import annotations
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.club.models.club import Club
+from apps.kwt_common.image_derivatives import (
+    image_field_needs_derivatives,
+    schedule_image_derivatives,
+)
+
+
+@receiver(post_save, sender=Club)
+def schedule_club_logo_derivatives(
+    sender: type[Club],
+    instance: Club,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,
+) -> None:
+    """Generate club logo thumbnails after a new upload is committed."""
+    if image_field_needs_derivatives(
+        instance,
+        image_field="logo",
+        derivatives_field="logo_derivatives",
+        update_fields=update_fields,
+    ):
+        schedule_image_derivatives(
+            task_path="apps.club.tasks.generate_club_logo_derivatives",
+            object_id=str(instance.id_uuid),
+        )
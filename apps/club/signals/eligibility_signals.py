@@ -0,0 +1,49 @@
+"""Signals keeping the cached club eligibility state in sync with matches."""
+
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.club.services.eligibility_state import schedule_eligibility_refresh
+from apps.game_tracker.models import MatchData, MatchPlayer, PlayerMatchMinutes
+from apps.game_tracker.signals.match_status_signals import previous_match_status
+
+
+@receiver(post_save, sender=MatchData)
+def refresh_eligibility_on_match_status(
+    sender: type[MatchData],
+    instance: MatchData,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,
+) -> None:
+    """Refresh the eligibility state when a match finishes or is reopened."""
+    if update_fields is not None and "status" not in update_fields:
+        return
+    previous_status = previous_match_status(instance)
+    if previous_status == instance.status:
+        return
+    if "finished" in {previous_status, instance.status}:
+        schedule_eligibility_refresh(match_data_id=str(instance.id_uuid))
+
+
+@receiver(post_save, sender=PlayerMatchMinutes)
+@receiver(post_delete, sender=PlayerMatchMinutes)
+def refresh_eligibility_on_minutes_change(
+    sender: type[PlayerMatchMinutes],
+    instance: PlayerMatchMinutes,
+    **kwargs: object,
+) -> None:
+    """Refresh the eligibility state after a match's minutes are recomputed."""
+    schedule_eligibility_refresh(match_data_id=str(instance.match_data_id))
+
+
+@receiver(post_save, sender=MatchPlayer)
+@receiver(post_delete, sender=MatchPlayer)
+def refresh_eligibility_on_roster_change(
+    sender: type[MatchPlayer],
+    instance: MatchPlayer,
+    **kwargs: object,
+) -> None:
+    """Refresh the eligibility state when a match roster changes."""
+    schedule_eligibility_refresh(match_data_id=str(instance.match_data_id))
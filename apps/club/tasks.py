@@ -0,0 +1,53 @@
+"""Celery tasks for the club app."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from celery import shared_task
+from django.core.cache import cache
+
+from apps.club.models.club import Club
+from apps.club.services.eligibility_state import (
+    refresh_match_in_eligibility_states,
+    refresh_scheduled_key,
+)
+from apps.kwt_common.image_derivatives import refresh_image_derivatives
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def generate_club_logo_derivatives(
+    self: Any,
+    club_id: str,
+    *,
+    force: bool = False,
+) -> dict[str, str]:
+    """Generate fixed-size thumbnails for a club logo."""
+    club = (
+        Club.objects
+        .filter(id_uuid=club_id)
+        .only("id_uuid", "logo", "logo_derivatives")
+        .first()
+    )
+    if club is None:
+        return {"club_id": club_id, "status": "not_found"}
+
+    refreshed = refresh_image_derivatives(
+        club,
+        image_field="logo",
+        derivatives_field="logo_derivatives",
+        force=force,
+    )
+    return {"club_id": club_id, "status": "ok" if refreshed else "current"}
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def refresh_club_eligibility_for_match(
+    self: Any,
+    match_data_id: str,
+) -> dict[str, str | int]:
+    """Recompute one match in the cached club eligibility states."""
+    # Cleared first so changes made while this runs schedule another refresh.
+    cache.delete(refresh_scheduled_key(match_data_id))
+    updated = refresh_match_in_eligibility_states(match_data_id)
+    return {"match_data_id": match_data_id, "states_updated": updated}
@@ -17,6 +17,7 @@ from apps.game_tracker.models.player_match_minutes import (
     LATEST_MATCH_MINUTES_VERSION,
     PlayerMatchMinutes,
 )
+from apps.kwt_common.query_budget import assert_within_query_budget
 from apps.player.models import PlayerClubMembership
 from apps.schedule.models import Match, Season
 from apps.team.models import Team, TeamData
@@ -64,7 +65,9 @@ def test_club_overview_returns_team_and_match_payload(client: Client) -> None:
     past_match_data.away_score = 14
     past_match_data.save(update_fields=["status", "home_score", "away_score"])
 
-    response = client.get(f"/api/club/clubs/{club.id_uuid}/overview/")
+    response = assert_within_query_budget(
+        lambda: client.get(f"/api/club/clubs/{club.id_uuid}/overview/"),
+    )
 
     assert response.status_code == HTTPStatus.OK
     payload = response.json()
@@ -562,9 +565,11 @@ def test_club_eligibility_dashboard_returns_own_team_and_distances(
         )
 
     client.force_login(admin_user)
-    response = client.get(
-        f"/api/club/clubs/{club.id_uuid}/eligibility-dashboard/",
-        {"season": str(season.id_uuid)},
+    response = assert_within_query_budget(
+        lambda: client.get(
+            f"/api/club/clubs/{club.id_uuid}/eligibility-dashboard/",
+            {"season": str(season.id_uuid)},
+        ),
     )
     assert response.status_code == HTTPStatus.OK
     payload = response.json()
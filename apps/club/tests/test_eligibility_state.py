@@ -0,0 +1,215 @@
+"""Tests for the cached club eligibility state."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+import pytest
+
+from apps.club.models import Club
+from apps.club.services.eligibility_dashboard import build_club_eligibility_dashboard
+from apps.club.services.eligibility_state import (
+    load_eligibility_state,
+    refresh_match_in_eligibility_states,
+)
+from apps.club.signals import eligibility_signals
+from apps.game_tracker.models import GroupType, MatchData, PlayerGroup
+from apps.game_tracker.models.player_match_minutes import (
+    LATEST_MATCH_MINUTES_VERSION,
+    PlayerMatchMinutes,
+)
+from apps.game_tracker.services import player_designation
+from apps.player.models import Player
+from apps.schedule.models import Match, Season
+from apps.team.models import Team, TeamData
+
+
+MAX_WARM_QUERIES = 3
+
+
+def _club_with_finished_match() -> tuple[Club, Season, Team, MatchData, Player]:
+    today = timezone.now().date()
+    season = Season.objects.create(
+        name="2026/2027",
+        start_date=today - timedelta(days=30),
+        end_date=today + timedelta(days=300),
+    )
+    club = Club.objects.create(name="State Club")
+    team = Team.objects.create(name="1", club=club)
+    opponent = Team.objects.create(
+        name="Opp",
+        club=Club.objects.create(name="Opp Club"),
+    )
+    TeamData.objects.create(
+        team=team,
+        season=season,
+        competition="Hoofdklasse",
+        wedstrijd_sport=True,
+        team_rank=1,
+    )
+    match = Match.objects.create(
+        home_team=team,
+        away_team=opponent,
+        season=season,
+        start_time=timezone.now() - timedelta(days=7),
+    )
+    match_data = MatchData.objects.get(match_link=match)
+    match_data.status = "finished"
+    match_data.save(update_fields=["status"])
+
+    player = (
+        get_user_model()
+        .objects.create_user(
+            username="state_player",
+            password="pass1234",  # nosec
+        )
+        .player
+    )
+    PlayerMatchMinutes.objects.create(
+        match_data=match_data,
+        player=player,
+        algorithm_version=LATEST_MATCH_MINUTES_VERSION,
+        minutes_played=Decimal("120.0"),
+    )
+    return club, season, team, match_data, player
+
+
+@pytest.mark.django_db
+def test_warm_dashboard_reads_played_matches_from_cache() -> None:
+    """A second dashboard build only reads teams and rosters."""
+    club, season, _team, _match_data, _player = _club_with_finished_match()
+    cold = build_club_eligibility_dashboard(club=club, season=season)
+
+    with CaptureQueriesContext(connection) as queries:
+        warm = build_club_eligibility_dashboard(club=club, season=season)
+
+    assert len(queries) <= MAX_WARM_QUERIES
+    assert warm == cold
+    assert [row["player"]["username"] for row in warm["players"]] == [
+        "state_player",
+    ]
+
+
+@pytest.mark.django_db
+def test_refresh_applies_one_match_to_the_cached_state() -> None:
+    """Minutes recorded after the state was built show up after a refresh."""
+    club, season, team, match_data, _player = _club_with_finished_match()
+    team_ids = frozenset({str(team.id_uuid)})
+    load_eligibility_state(club_id=club.id_uuid, season=season, team_ids=team_ids)
+
+    newcomer = (
+        get_user_model()
+        .objects.create_user(
+            username="state_newcomer",
+            password="pass1234",  # nosec
+        )
+        .player
+    )
+    PlayerMatchMinutes.objects.create(
+        match_data=match_data,
+        player=newcomer,
+        algorithm_version=LATEST_MATCH_MINUTES_VERSION,
+        minutes_played=Decimal("120.0"),
+    )
+    # Signals only schedule the refresh after commit; run it directly. Only
+    # the cached season state is updated (no all-seasons state was built).
+    assert refresh_match_in_eligibility_states(str(match_data.id_uuid)) == 1
+
+    state = load_eligibility_state(
+        club_id=club.id_uuid,
+        season=season,
+        team_ids=team_ids,
+    )
+    appearances = state.matches[str(match_data.id_uuid)]
+    assert appearances.team_by_player[str(newcomer.id_uuid)] == str(team.id_uuid)
+
+
+@pytest.mark.django_db
+def test_state_is_rebuilt_when_the_club_teams_change() -> None:
+    """A state built for another set of club teams is not reused."""
+    club, season, team, match_data, _player = _club_with_finished_match()
+    load_eligibility_state(
+        club_id=club.id_uuid,
+        season=season,
+        team_ids=frozenset({str(team.id_uuid)}),
+    )
+
+    second = Team.objects.create(name="2", club=club)
+    state = load_eligibility_state(
+        club_id=club.id_uuid,
+        season=season,
+        team_ids=frozenset({str(team.id_uuid), str(second.id_uuid)}),
+    )
+
+    assert state.team_ids == frozenset({str(team.id_uuid), str(second.id_uuid)})
+    assert str(match_data.id_uuid) in state.matches
+
+
+@pytest.mark.django_db
+def test_dashboard_shows_renamed_players_from_a_warm_state() -> None:
+    """The cached state holds player ids; names are read on every build."""
+    club, season, _team, _match_data, player = _club_with_finished_match()
+    build_club_eligibility_dashboard(club=club, season=season)
+
+    player.user.username = "state_renamed"
+    player.user.save(update_fields=["username"])
+    warm = build_club_eligibility_dashboard(club=club, season=season)
+
+    assert [row["player"]["username"] for row in warm["players"]] == [
+        "state_renamed",
+    ]
+
+
+@pytest.mark.django_db
+def test_status_changes_in_both_directions_schedule_a_refresh(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Finishing and reopening a match refresh it, also through full saves."""
+    _club, _season, team, match_data, player = _club_with_finished_match()
+    refreshed: list[str] = []
+
+    def _record(*, match_data_id: str) -> None:
+        refreshed.append(match_data_id)
+
+    monkeypatch.setattr(eligibility_signals, "schedule_eligibility_refresh", _record)
+    monkeypatch.setattr(player_designation, "schedule_eligibility_refresh", _record)
+
+    match_data.status = "active"
+    match_data.save()
+    match_data.save()
+    match_data.status = "finished"
+    match_data.save(update_fields=["status"])
+    match_data.save(update_fields=["status"])
+    assert refreshed == [str(match_data.id_uuid)] * 2
+
+    # Roster syncs use `bulk_create`, which sends no signals.
+    reserve = GroupType.objects.create(name="Reserve", order=3)
+    PlayerGroup.objects.create(
+        match_data=match_data,
+        team=team,
+        starting_type=reserve,
+        current_type=reserve,
+    ).players.add(player)
+    player_designation.sync_match_players_for_team(match_data=match_data, team=team)
+    assert refreshed == [str(match_data.id_uuid)] * 3
+
+
+@pytest.mark.django_db
+def test_status_save_looks_the_previous_status_up_once() -> None:
+    """The status-driven receivers share one previous-status lookup."""
+    _club, _season, _team, match_data, _player = _club_with_finished_match()
+    status_lookup = f'SELECT "{MatchData._meta.db_table}"."status"'
+
+    match_data.status = "active"
+    with CaptureQueriesContext(connection) as queries:
+        match_data.save(update_fields=["status"])
+    assert sum(query["sql"].startswith(status_lookup) for query in queries) == 1
+
+    with CaptureQueriesContext(connection) as queries:
+        match_data.save(update_fields=["part_length"])
+    assert not any(query["sql"].startswith(status_lookup) for query in queries)
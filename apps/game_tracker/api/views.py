@@ -12,7 +12,7 @@ import json
 from typing import Any
 
 from django.db import transaction
-from django.db.models import Prefetch, Q, QuerySet
+from django.db.models import Prefetch, QuerySet
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework.decorators import api_view, permission_classes
@@ -31,9 +31,11 @@ from apps.game_tracker.services.player_designation import (
     sync_match_players,
     validate_target_group_capacity,
 )
-from apps.game_tracker.services.player_search import player_name_match_score
+from apps.game_tracker.services.player_search_index import get_player_search_index
+from apps.kwt_common.image_derivatives import LIST_THUMBNAIL_SIZE
 from apps.player.models import Player
 from apps.player.privacy import can_view_by_visibility
+from apps.player.services.viewer_identity import viewer_player_for
 from apps.schedule.models import Match
 from apps.team.models import Team, TeamData
 
@@ -42,10 +44,7 @@ PLAYER_GROUP_EDIT_PERMISSION_ERROR = "You do not have permission to edit player
 
 
 def _viewer_player(request: Request) -> Player | None:
-    user = getattr(request, "user", None)
-    if user is None or not getattr(user, "is_authenticated", False):
-        return None
-    return Player.objects.filter(user=user).first()
+    return viewer_player_for(request)
 
 
 def _profile_picture_for(viewer: Player | None, target: Player) -> str:
@@ -54,7 +53,7 @@ def _profile_picture_for(viewer: Player | None, target: Player) -> str:
         viewer=viewer,
         target=target,
     ):
-        return target.get_profile_picture()
+        return target.get_profile_picture(size=LIST_THUMBNAIL_SIZE)
     return target.get_placeholder_profile_picture_url()
 
 
@@ -186,12 +185,27 @@ def players_team(request: Request, match_id: str, team_id: str) -> Response:
 
 MIN_PLAYER_NAME_LENGTH = 3
 MAX_PLAYER_NAME_LENGTH = 50
+DEFAULT_PLAYER_SEARCH_LIMIT = 25
+MAX_PLAYER_SEARCH_LIMIT = 100
+
+
+def _player_search_limit(request: Request) -> int:
+    limit_param = request.query_params.get("limit")
+    try:
+        limit = int(limit_param) if limit_param else DEFAULT_PLAYER_SEARCH_LIMIT
+    except ValueError:
+        limit = DEFAULT_PLAYER_SEARCH_LIMIT
+    return min(max(limit, 1), MAX_PLAYER_SEARCH_LIMIT)
 
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def player_search(request: Request, match_id: str, team_id: str) -> Response:
-    """Search for players by username, excluding already-grouped players."""
+    """Search for players by name, excluding already-grouped players.
+
+    Results are ranked (exact, partial, then close typos) and capped by the
+    optional `limit` query parameter.
+    """
     search_query = (request.query_params.get("search") or "").strip()
     if not search_query:
         return Response({"error": "No player selected"}, status=400)
@@ -234,56 +248,29 @@ def player_search(request: Request, match_id: str, team_id: str) -> Response:
         .distinct()
     )
 
-    match_date = timezone.localdate(match_model.start_time)
-
-    # Only show players who belong to this club context.
-    # - TeamData is season-scoped (legacy) and historically incomplete.
-    #   We therefore consider *any* team of the club in the match season.
-    # - club membership is date-scoped (new) and preferred when available.
-    club_roster_filter = Q(
-        team_data_as_player__team__club=team_model.club,
-        team_data_as_player__season=match_model.season,
-    ) | Q(
-        team_data_as_coach__team__club=team_model.club,
-        team_data_as_coach__season=match_model.season,
+    # Only players of this club context are eligible: any team of the club in
+    # the match season (TeamData) or a club membership covering the match date.
+    # Eligibility and name matching are served from the per-club search index.
+    index = get_player_search_index(
+        club_id=team_model.club_id,
+        season_id=match_model.season_id,
     )
-
-    membership_filter = Q(
-        club_membership_links__club=team_model.club,
-        club_membership_links__start_date__lte=match_date,
-    ) & (
-        Q(club_membership_links__end_date__isnull=True)
-        | Q(club_membership_links__end_date__gte=match_date)
+    matches = index.search(
+        search_query,
+        match_date=timezone.localdate(match_model.start_time),
+        exclude_ids={str(player_id) for player_id in excluded_ids},
+        limit=_player_search_limit(request),
     )
-
-    allowed_filter = club_roster_filter | membership_filter
-
-    roster_players = (
-        Player.objects
-        .filter(allowed_filter)
-        .exclude(id_uuid__in=excluded_ids)
-        .distinct()
-        .select_related("user")
-    )
-    ranked_players = [
-        (score, player)
-        for player in roster_players
-        if (
-            score := player_name_match_score(
-                search_query,
-                username=player.user.username,
-                first_name=player.user.first_name,
-                last_name=player.user.last_name,
-            )
+    players_by_id = {
+        str(player.id_uuid): player
+        for player in Player.objects.select_related("user").filter(
+            id_uuid__in=[entry.player_id for entry in matches],
         )
-        is not None
-    ]
+    }
     players = [
         player
-        for _, player in sorted(
-            ranked_players,
-            key=lambda item: (item[0], item[1].user.username.casefold()),
-        )
+        for entry in matches
+        if (player := players_by_id.get(entry.player_id)) is not None
     ]
 
     viewer = _viewer_player(request)
@@ -0,0 +1,67 @@
+"""Build the materialized events/shots timeline for existing matches.
+
+Matches get their timeline rows on the next live change anyway; until then the
+public timeline endpoints fall back to building payloads per request. Run this
+once after deploying to move historical matches onto the stored rows.
+
+Example:
+    uv run python apps/django_projects/korfbal/manage.py rebuild_match_timelines
+
+Notes:
+    CLI options:
+        - --dry-run: don't write changes, just report.
+
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db.models import F, Q
+
+from apps.game_tracker.models import MatchData
+from apps.game_tracker.services.match_timeline_projection import (
+    rebuild_match_timeline,
+)
+
+
+class Command(BaseCommand):
+    """Build stored timeline rows for matches that have none (or stale ones)."""
+
+    help = "Build the stored events/shots timeline for started matches."
+
+    def add_arguments(self, parser: Any) -> None:
+        """Register CLI arguments for this command."""
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Do not write rows; only report how many matches need them.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the rebuild."""
+        ids = list(
+            MatchData.objects
+            .exclude(status="upcoming")
+            .filter(
+                Q(timeline_revision__isnull=True)
+                | ~Q(timeline_revision=F("live_revision")),
+            )
+            .values_list("id_uuid", flat=True)
+        )
+        total = len(ids)
+        if total == 0 or options.get("dry_run"):
+            self.stdout.write(f"{total} matches need a timeline rebuild.")
+            return
+
+        rebuilt = 0
+        for index, match_data_id in enumerate(ids, start=1):
+            if rebuild_match_timeline(MatchData(pk=match_data_id)):
+                rebuilt += 1
+            if index % 100 == 0:
+                self.stdout.write(f"Processed {index}/{total}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Done. Rebuilt {rebuilt} of {total} matches."),
+        )
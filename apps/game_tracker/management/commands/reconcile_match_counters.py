@@ -0,0 +1,74 @@
+"""Verify the per-team match counters against the event tables.
+
+`MatchTeamCounters` rows are kept up to date by signals; writes that bypass
+them (`bulk_create`, queryset `update()`/raw SQL) leave the counters off until
+they are reconciled. Matches created before the table existed have no rows;
+`--fix` creates them.
+
+Example:
+    uv run python apps/django_projects/korfbal/manage.py reconcile_match_counters
+
+Notes:
+    CLI options:
+        - --fix: rewrite mismatching or missing counters.
+        - --status: only check matches with this status (repeatable).
+
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from apps.game_tracker.models import MatchData
+from apps.game_tracker.services.match_counters import reconcile_match_counters
+
+
+class Command(BaseCommand):
+    """Report (and optionally repair) drifted per-team match counters."""
+
+    help = "Compare per-team match counters with shots, substitutions and timeouts."
+
+    def add_arguments(self, parser: Any) -> None:
+        """Register CLI arguments for this command."""
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rewrite counters that differ from the event tables.",
+        )
+        parser.add_argument(
+            "--status",
+            action="append",
+            default=[],
+            help="Only check matches with this status (repeatable).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the reconciliation."""
+        fix = bool(options.get("fix"))
+        queryset = MatchData.objects.order_by("id_uuid")
+        if options.get("status"):
+            queryset = queryset.filter(status__in=options["status"])
+        total = queryset.count()
+
+        drifted = 0
+        for index, match_data in enumerate(
+            queryset.only("id_uuid", "match_link").iterator(),
+            start=1,
+        ):
+            mismatches = reconcile_match_counters(match_data, fix=fix)
+            if mismatches:
+                drifted += 1
+                for team_id, (stored, counted) in mismatches.items():
+                    self.stdout.write(
+                        f"{match_data.id_uuid} team {team_id}: stored={stored} "
+                        f"counted={counted}",
+                    )
+            if index % 100 == 0:
+                self.stdout.write(f"Processed {index}/{total}")
+
+        action = "Fixed" if fix else "Found"
+        self.stdout.write(
+            self.style.SUCCESS(f"Done. {action} {drifted} of {total} matches."),
+        )
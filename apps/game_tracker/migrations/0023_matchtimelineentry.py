@@ -0,0 +1,74 @@
+import bg_uuidv7.bg_uuidv7
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game_tracker", "0022_matchlivechange"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="matchdata",
+            name="timeline_revision",
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="matchdata",
+            name="timeline_base_revision",
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="MatchTimelineEntry",
+            fields=[
+                (
+                    "id_uuid",
+                    models.UUIDField(
+                        default=bg_uuidv7.bg_uuidv7.uuidv7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "stream",
+                    models.CharField(
+                        choices=[("events", "Events"), ("shots", "Shots")],
+                        max_length=8,
+                    ),
+                ),
+                ("event_id", models.CharField(max_length=64)),
+                ("position", models.PositiveIntegerField(default=0)),
+                ("revision", models.PositiveBigIntegerField()),
+                ("deleted", models.BooleanField(default=False)),
+                ("payload", models.JSONField(default=dict)),
+                (
+                    "match_data",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="timeline_entries",
+                        to="game_tracker.matchdata",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["match_data", "stream", "revision"],
+                        name="game_tracker_timeline_rev_idx",
+                    ),
+                    models.Index(
+                        fields=["match_data", "stream", "position"],
+                        name="game_tracker_timeline_pos_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("match_data", "stream", "event_id"),
+                        name="game_tracker_unique_timeline_entry",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+import bg_uuidv7.bg_uuidv7
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game_tracker", "0023_matchtimelineentry"),
+        ("team", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MatchTeamCounters",
+            fields=[
+                (
+                    "id_uuid",
+                    models.UUIDField(
+                        default=bg_uuidv7.bg_uuidv7.uuidv7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("goals", models.IntegerField(default=0)),
+                ("shots", models.IntegerField(default=0)),
+                ("substitutions", models.IntegerField(default=0)),
+                ("timeouts", models.IntegerField(default=0)),
+                (
+                    "match_data",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="team_counters",
+                        to="game_tracker.matchdata",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="team.team",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("match_data", "team"),
+                        name="game_tracker_unique_match_team_counters",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+"""Index attacks by match and time for the tracker's last-event lookup."""
+
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game_tracker", "0024_matchteamcounters"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attack",
+            index=models.Index(
+                fields=["match_data", "time"],
+                name="attack_match_time_idx",
+            ),
+        ),
+    ]
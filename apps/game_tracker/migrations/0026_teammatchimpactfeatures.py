@@ -0,0 +1,69 @@
+import bg_uuidv7.bg_uuidv7
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game_tracker", "0025_attack_match_time_idx"),
+        ("team", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TeamMatchImpactFeatures",
+            fields=[
+                (
+                    "id_uuid",
+                    models.UUIDField(
+                        default=bg_uuidv7.bg_uuidv7.uuidv7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("algorithm_version", models.CharField(max_length=32)),
+                ("feature_version", models.PositiveSmallIntegerField()),
+                ("goals_scored_points", models.FloatField(default=0.0)),
+                ("shooter_misses_weighted", models.FloatField(default=0.0)),
+                ("defended_shots", models.IntegerField(default=0)),
+                ("defended_goals", models.IntegerField(default=0)),
+                ("defended_misses", models.IntegerField(default=0)),
+                (
+                    "doorloop_concede_points_times_defenders",
+                    models.FloatField(default=0.0),
+                ),
+                ("computed_at", models.DateTimeField(auto_now=True)),
+                (
+                    "match_data",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="team_impact_features",
+                        to="game_tracker.matchdata",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="match_impact_features",
+                        to="team.team",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["algorithm_version", "feature_version"],
+                        name="impact_features_version_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("match_data", "team"),
+                        name="uniq_team_match_impact_features",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -7,6 +7,8 @@ from .match_data import MatchData
 from .match_live_change import MatchLiveChange
 from .match_part import MatchPart
 from .match_player import MatchPlayer
+from .match_team_counters import MatchTeamCounters
+from .match_timeline_entry import MatchTimelineEntry
 from .pause import Pause
 from .player_change import PlayerChange
 from .player_group import PlayerGroup
@@ -14,6 +16,7 @@ from .player_match_impact import PlayerMatchImpact
 from .player_match_impact_breakdown import PlayerMatchImpactBreakdown
 from .player_match_minutes import PlayerMatchMinutes
 from .shot import Shot
+from .team_match_impact_features import TeamMatchImpactFeatures
 from .timeout import Timeout
 
 
@@ -25,6 +28,8 @@ __all__ = [
     "MatchLiveChange",
     "MatchPart",
     "MatchPlayer",
+    "MatchTeamCounters",
+    "MatchTimelineEntry",
     "Pause",
     "PlayerChange",
     "PlayerGroup",
@@ -32,5 +37,6 @@ __all__ = [
     "PlayerMatchImpactBreakdown",
     "PlayerMatchMinutes",
     "Shot",
+    "TeamMatchImpactFeatures",
     "Timeout",
 ]
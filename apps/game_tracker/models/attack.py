@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from bg_uuidv7 import uuidv7
 from django.db import models
@@ -42,6 +42,16 @@ class Attack(models.Model):
         null=True,
     )
 
+    class Meta:
+        """Meta options for Attack."""
+
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(
+                fields=["match_data", "time"],
+                name="attack_match_time_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         """Return the string representation of the attack.
 
@@ -43,6 +43,14 @@ class MatchData(models.Model):
         models.PositiveBigIntegerField(default=0)
     )
     live_changed_at: models.DateTimeField = models.DateTimeField(default=timezone.now)
+    # Live revision the materialized timeline (MatchTimelineEntry) reflects, and
+    # the revision it was (re)built at; deltas are only exact from there on.
+    timeline_revision: models.PositiveBigIntegerField[int | None, int | None] = (
+        models.PositiveBigIntegerField(null=True, blank=True)
+    )
+    timeline_base_revision: models.PositiveBigIntegerField[
+        int | None, int | None
+    ] = models.PositiveBigIntegerField(null=True, blank=True)
 
     class Meta:
         """Meta class for MatchData model."""
@@ -0,0 +1,58 @@
+"""Per-team live counters of a match (goals, shots, substitutions, timeouts)."""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+from bg_uuidv7 import uuidv7
+from django.db import models
+
+from .constants import team_model_string
+
+
+class MatchTeamCounters(models.Model):
+    """Denormalized event counts of one team in a match.
+
+    Rows are created with their `MatchData` and adjusted by signals in the
+    transaction that inserts or deletes the counted row. The source tables stay
+    authoritative; `reconcile_match_counters` verifies and repairs the rows.
+    """
+
+    id_uuid: models.UUIDField[str, str] = models.UUIDField(
+        primary_key=True,
+        default=uuidv7,
+        editable=False,
+    )
+    match_data: models.ForeignKey[Any, Any] = models.ForeignKey(
+        "MatchData",
+        on_delete=models.CASCADE,
+        related_name="team_counters",
+    )
+    team: models.ForeignKey[Any, Any] = models.ForeignKey(
+        team_model_string,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    team_id: str
+    goals: models.IntegerField[int, int] = models.IntegerField(default=0)
+    shots: models.IntegerField[int, int] = models.IntegerField(default=0)
+    substitutions: models.IntegerField[int, int] = models.IntegerField(default=0)
+    timeouts: models.IntegerField[int, int] = models.IntegerField(default=0)
+
+    class Meta:
+        """Database constraints."""
+
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(
+                fields=["match_data", "team"],
+                name="game_tracker_unique_match_team_counters",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Return a concise counters summary."""
+        return (
+            f"{self.match_data_id}:{self.team_id} goals={self.goals} "
+            f"shots={self.shots} subs={self.substitutions} "
+            f"timeouts={self.timeouts}"
+        )
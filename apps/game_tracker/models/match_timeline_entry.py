@@ -0,0 +1,73 @@
+"""Materialized timeline rows served by the public events and shots endpoints."""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+from bg_uuidv7 import uuidv7
+from django.db import models
+
+
+class MatchTimelineEntry(models.Model):
+    """One serialized event of a match timeline (events or shots stream).
+
+    Rows are rewritten whenever the live revision of their match advances and
+    their payload or position changed. Deleted events keep a tombstone row so
+    delta reads can report them.
+    """
+
+    class Stream(models.TextChoices):
+        """Timeline endpoints the row belongs to."""
+
+        EVENTS = "events", "Events"
+        SHOTS = "shots", "Shots"
+
+    id_uuid: models.UUIDField[str, str] = models.UUIDField(
+        primary_key=True,
+        default=uuidv7,
+        editable=False,
+    )
+    match_data: models.ForeignKey[Any, Any] = models.ForeignKey(
+        "MatchData",
+        on_delete=models.CASCADE,
+        related_name="timeline_entries",
+    )
+    stream: models.CharField[str, str] = models.CharField(
+        max_length=8,
+        choices=Stream.choices,
+    )
+    event_id: models.CharField[str, str] = models.CharField(max_length=64)
+    position: models.PositiveIntegerField[int, int] = models.PositiveIntegerField(
+        default=0,
+    )
+    revision: models.PositiveBigIntegerField[int, int] = (
+        models.PositiveBigIntegerField()
+    )
+    deleted: models.BooleanField[bool, bool] = models.BooleanField(default=False)
+    payload: models.JSONField[dict[str, Any], dict[str, Any]] = models.JSONField(
+        default=dict,
+    )
+
+    class Meta:
+        """Database constraints and lookup indexes."""
+
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(
+                fields=["match_data", "stream", "event_id"],
+                name="game_tracker_unique_timeline_entry",
+            ),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(
+                fields=["match_data", "stream", "revision"],
+                name="game_tracker_timeline_rev_idx",
+            ),
+            models.Index(
+                fields=["match_data", "stream", "position"],
+                name="game_tracker_timeline_pos_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Return a concise entry identifier."""
+        return f"{self.match_data_id}:{self.stream}:{self.event_id}@{self.revision}"
@@ -0,0 +1,81 @@
+"""Persisted per-team impact features per match.
+
+`compute_match_team_impact_features` rebuilds a match's events, shots, groups
+and role timelines before it can produce the handful of numbers that weight
+tuning needs. Storing them per team lets `fit_match_impact_v6` load the whole
+archive in one query instead of replaying every finished match.
+"""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+from bg_uuidv7 import uuidv7
+from django.db import models
+
+from .constants import team_model_string
+
+
+class TeamMatchImpactFeatures(models.Model):
+    """Impact feature vector of one team in a match.
+
+    Rows are only valid for their `algorithm_version` and `feature_version`;
+    readers ignore rows stored with other versions.
+    """
+
+    id_uuid: models.UUIDField[str, str] = models.UUIDField(
+        primary_key=True,
+        default=uuidv7,
+        editable=False,
+    )
+    match_data: models.ForeignKey[Any, Any] = models.ForeignKey(
+        "MatchData",
+        on_delete=models.CASCADE,
+        related_name="team_impact_features",
+    )
+    match_data_id: str
+    team: models.ForeignKey[Any, Any] = models.ForeignKey(
+        team_model_string,
+        on_delete=models.CASCADE,
+        related_name="match_impact_features",
+    )
+    team_id: str
+
+    algorithm_version: models.CharField = models.CharField(max_length=32)
+    feature_version: models.PositiveSmallIntegerField = (
+        models.PositiveSmallIntegerField()
+    )
+
+    goals_scored_points: models.FloatField = models.FloatField(default=0.0)
+    shooter_misses_weighted: models.FloatField = models.FloatField(default=0.0)
+    defended_shots: models.IntegerField = models.IntegerField(default=0)
+    defended_goals: models.IntegerField = models.IntegerField(default=0)
+    defended_misses: models.IntegerField = models.IntegerField(default=0)
+    doorloop_concede_points_times_defenders: models.FloatField = models.FloatField(
+        default=0.0,
+    )
+
+    computed_at: models.DateTimeField = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Model metadata."""
+
+        constraints: ClassVar[tuple[models.BaseConstraint, ...]] = (
+            models.UniqueConstraint(
+                fields=["match_data", "team"],
+                name="uniq_team_match_impact_features",
+            ),
+        )
+        indexes: ClassVar[tuple[models.Index, ...]] = (
+            models.Index(
+                fields=["algorithm_version", "feature_version"],
+                name="impact_features_version_idx",
+            ),
+        )
+
+    def __str__(self) -> str:
+        """Return a human-friendly representation."""
+        return (
+            f"Impact features {self.team_id} @ {self.match_data_id} "
+            f"({self.algorithm_version}/{self.feature_version})"
+        )
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import partial
 
@@ -12,6 +13,14 @@ from django.utils import timezone
 from apps.game_tracker.models import MatchData, MatchLiveChange
 from apps.game_tracker.realtime.contracts import ALL_LIVE_RESOURCES, LiveResource
 from apps.game_tracker.realtime.publisher import publish_match_changed
+from apps.game_tracker.services.match_timeline_projection import (
+    TIMELINE_RESOURCES,
+    sync_match_timeline,
+    timeline_is_current,
+)
+from apps.game_tracker.services.public_responses import (
+    invalidate_match_public_responses,
+)
 
 
 _LIVE_CHANGE_RETENTION = 512
@@ -26,18 +35,44 @@ def _record_match_change_in_transaction(
     locked = MatchData.objects.select_for_update().filter(pk=match_data.pk).first()
     if locked is None:
         return match_data.live_revision
+    timeline_current = timeline_is_current(locked)
     locked.live_revision += 1
     locked.live_changed_at = timezone.now()
-    locked.save(update_fields=["live_revision", "live_changed_at"])
+
+    ids = {
+        resource: {str(value) for value in values}
+        for resource, values in changed_ids.items()
+        if resource in resources
+    }
+    if not timeline_current:
+        # First build (or a missed write): deltas restart from here.
+        sync_match_timeline(locked, revision=locked.live_revision)
+        locked.timeline_base_revision = locked.live_revision
+    elif resources & TIMELINE_RESOURCES:
+        # The projection diff is the complete set of changed timeline ids.
+        for resource, synced_ids in sync_match_timeline(
+            locked,
+            revision=locked.live_revision,
+        ).items():
+            if synced_ids or resource in resources:
+                resources |= {resource}
+                ids[resource] = ids.get(resource, set()) | synced_ids
+    locked.timeline_revision = locked.live_revision
+    locked.save(
+        update_fields=[
+            "live_revision",
+            "live_changed_at",
+            "timeline_revision",
+            "timeline_base_revision",
+        ],
+    )
 
     MatchLiveChange.objects.create(
         match_data=locked,
         revision=locked.live_revision,
         resources=sorted(resource.value for resource in resources),
         changed_ids={
-            resource.value: sorted({str(value) for value in values})
-            for resource, values in changed_ids.items()
-            if resource in resources
+            resource.value: sorted(values) for resource, values in ids.items()
         },
     )
 
@@ -50,7 +85,10 @@ def _record_match_change_in_transaction(
 
     match_data.live_revision = locked.live_revision
     match_data.live_changed_at = locked.live_changed_at
+    match_data.timeline_revision = locked.timeline_revision
+    match_data.timeline_base_revision = locked.timeline_base_revision
 
+    invalidate_match_public_responses(match_id=locked.match_link_id)
     transaction.on_commit(
         partial(
             publish_match_changed,
@@ -89,6 +127,28 @@ def record_match_change(
         )
 
 
+@contextmanager
+def revision_snapshot() -> Iterator[None]:
+    """Run reads against one database snapshot without taking row locks.
+
+    On PostgreSQL the block is a READ ONLY, REPEATABLE READ transaction: the
+    `live_revision` read first matches every event row read after it, while
+    tracker writes (which lock `MatchData`) are neither blocked nor waited on.
+    SQLite serializes transactions anyway. Inside an outer transaction the
+    isolation level can no longer change, so the outer one is used as is.
+    """
+    if connection.in_atomic_block:
+        yield
+        return
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY",
+                )
+        yield
+
+
 @dataclass(frozen=True, slots=True)
 class MatchChangeSummary:
     """Resources and complete entity-id deltas for a revision range."""
@@ -0,0 +1,233 @@
+"""Per-team goal, shot, substitution and timeout counters of a match.
+
+Tracker commands enforce substitution/timeout limits and every tracker state
+shows the counts, so they used to be recounted from `Shot`, `PlayerChange` and
+`Timeout` on each command and state build. `MatchTeamCounters` keeps them per
+team instead:
+
+- rows are created (zeroed) together with the `MatchData`;
+- signals adjust them with `F()` increments in the transaction that inserts or
+  deletes a counted row, and recount the match when such a row is edited
+  (e.g. through the event editor);
+- `reconcile_match_counters` compares them with the source tables and repairs
+  them (`manage.py reconcile_match_counters`).
+
+Matches without rows (created before the table existed) fall back to counting.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Final
+
+from django.db import models, transaction
+
+from apps.game_tracker.models import (
+    MatchData,
+    MatchTeamCounters,
+    PlayerChange,
+    Shot,
+    Timeout,
+)
+from apps.schedule.models import Match
+
+
+COUNTER_FIELDS: Final[tuple[str, ...]] = (
+    "goals",
+    "shots",
+    "substitutions",
+    "timeouts",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TeamCounters:
+    """Event counts of one team in a match."""
+
+    goals: int = 0
+    shots: int = 0
+    substitutions: int = 0
+    timeouts: int = 0
+
+
+def _match_team_ids(match_data: MatchData) -> tuple[Any, Any] | None:
+    return (
+        Match.objects
+        .filter(id_uuid=match_data.match_link_id)
+        .values_list("home_team_id", "away_team_id")
+        .first()
+    )
+
+
+def count_match_counters(match_data: MatchData) -> dict[str, TeamCounters]:
+    """Count the events of both teams from the source tables.
+
+    Returns:
+        dict[str, TeamCounters]: Counters by team id (string).
+
+    """
+    team_ids = _match_team_ids(match_data)
+    if team_ids is None:
+        return {}
+    counts: dict[str, dict[str, int]] = {
+        str(team_id): dict.fromkeys(COUNTER_FIELDS, 0) for team_id in team_ids
+    }
+
+    for row in (
+        Shot.objects
+        .filter(match_data=match_data, team_id__in=team_ids)
+        .values("team_id")
+        .annotate(
+            shots=models.Count("id_uuid"),
+            goals=models.Count("id_uuid", filter=models.Q(scored=True)),
+        )
+    ):
+        counts[str(row["team_id"])].update(shots=row["shots"], goals=row["goals"])
+    for row in (
+        PlayerChange.objects
+        .filter(match_data=match_data, player_group__team_id__in=team_ids)
+        .values("player_group__team_id")
+        .annotate(count=models.Count("id_uuid"))
+    ):
+        counts[str(row["player_group__team_id"])]["substitutions"] = row["count"]
+    for row in (
+        Timeout.objects
+        .filter(match_data=match_data, team_id__in=team_ids)
+        .values("team_id")
+        .annotate(count=models.Count("id_uuid"))
+    ):
+        counts[str(row["team_id"])]["timeouts"] = row["count"]
+
+    return {
+        team_id: TeamCounters(**team_counts) for team_id, team_counts in counts.items()
+    }
+
+
+def _stored_counters(match_data: MatchData) -> dict[str, TeamCounters]:
+    return {
+        str(row["team_id"]): TeamCounters(
+            **{name: row[name] for name in COUNTER_FIELDS},
+        )
+        for row in MatchTeamCounters.objects
+        .filter(match_data=match_data)
+        .values("team_id", *COUNTER_FIELDS)
+    }
+
+
+def ensure_match_counters(match_data: MatchData) -> None:
+    """Create zeroed counter rows for both teams of a new match."""
+    team_ids = _match_team_ids(match_data)
+    if team_ids is None:
+        return
+    MatchTeamCounters.objects.bulk_create(
+        [
+            MatchTeamCounters(match_data=match_data, team_id=team_id)
+            for team_id in team_ids
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def match_counters(
+    match_data: MatchData,
+    *,
+    team_ids: tuple[Any, Any] | None = None,
+) -> dict[str, TeamCounters] | None:
+    """Return the stored counters of both teams, or None if rows are missing.
+
+    Args:
+        match_data: Match to read.
+        team_ids: Home and away team ids, if the caller already has them.
+
+    Returns:
+        dict[str, TeamCounters] | None: Counters by team id (string).
+
+    """
+    rows = _stored_counters(match_data)
+    if team_ids is None:
+        team_ids = _match_team_ids(match_data)
+    if team_ids is None or any(str(team_id) not in rows for team_id in team_ids):
+        return None
+    return rows
+
+
+def team_counters(match_data: MatchData, team_id: object) -> TeamCounters:
+    """Return the counters of one team, counting them if no row is stored.
+
+    Returns:
+        TeamCounters: The team's goals, shots, substitutions and timeouts.
+
+    """
+    row = (
+        MatchTeamCounters.objects
+        .filter(match_data=match_data, team_id=team_id)
+        .values(*COUNTER_FIELDS)
+        .first()
+    )
+    if row is not None:
+        return TeamCounters(**row)
+    return count_match_counters(match_data).get(str(team_id), TeamCounters())
+
+
+def adjust_match_counters(
+    match_data_id: object,
+    team_id: object,
+    **deltas: int,
+) -> None:
+    """Add `deltas` (counter name -> change) to one team's stored counters.
+
+    A missing row is left alone; reads fall back to counting until
+    `refresh_match_counters` creates it.
+    """
+    changes = {
+        name: models.F(name) + delta for name, delta in deltas.items() if delta
+    }
+    if not changes or match_data_id is None or team_id is None:
+        return
+    MatchTeamCounters.objects.filter(
+        match_data_id=match_data_id,
+        team_id=team_id,
+    ).update(**changes)
+
+
+def refresh_match_counters(match_data: MatchData) -> None:
+    """Recount both teams and store the result."""
+    with transaction.atomic():
+        for team_id, counters in count_match_counters(match_data).items():
+            MatchTeamCounters.objects.update_or_create(
+                match_data=match_data,
+                team_id=team_id,
+                defaults={name: getattr(counters, name) for name in COUNTER_FIELDS},
+            )
+
+
+def reconcile_match_counters(
+    match_data: MatchData,
+    *,
+    fix: bool = False,
+) -> dict[str, tuple[TeamCounters | None, TeamCounters]]:
+    """Compare the stored counters with the source tables.
+
+    Args:
+        match_data: Match to verify.
+        fix: Overwrite mismatching or missing rows with the counted values.
+
+    Returns:
+        dict[str, tuple[TeamCounters | None, TeamCounters]]: Per mismatching
+        team id, the stored counters (None if missing) and the counted ones.
+
+    """
+    with transaction.atomic():
+        if fix:
+            # Serialize with tracker commands, which lock the match first.
+            MatchData.objects.select_for_update().filter(pk=match_data.pk).first()
+        counted = count_match_counters(match_data)
+        stored = _stored_counters(match_data)
+        mismatches = {
+            team_id: (stored.get(team_id), counters)
+            for team_id, counters in counted.items()
+            if stored.get(team_id) != counters
+        }
+        if fix and mismatches:
+            refresh_match_counters(match_data)
+    return mismatches
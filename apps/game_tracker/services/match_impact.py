@@ -1,9 +1,12 @@
 """Public facade for match impact scoring helpers."""
 
 from .match_impact_persistence import (
+    MATCH_IMPACT_FEATURES_VERSION,
     compute_match_impact_breakdown_cached,
+    load_match_team_impact_features,
     persist_match_impact_rows,
     persist_match_impact_rows_with_breakdowns,
+    persist_match_team_impact_features,
 )
 from .match_impact_scorer import (
     LATEST_MATCH_IMPACT_ALGORITHM_VERSION,
@@ -29,6 +32,7 @@ from .match_impact_timeline import (
 
 __all__ = [
     "LATEST_MATCH_IMPACT_ALGORITHM_VERSION",
+    "MATCH_IMPACT_FEATURES_VERSION",
     "Interval",
     "MatchImpactRow",
     "MatchTeamImpactFeatures",
@@ -43,8 +47,10 @@ __all__ = [
     "compute_match_impact_rows",
     "compute_match_team_impact_features",
     "doorloop_concede_factor_for_version",
+    "load_match_team_impact_features",
     "persist_match_impact_rows",
     "persist_match_impact_rows_with_breakdowns",
+    "persist_match_team_impact_features",
     "round_js_1dp",
     "shot_impact_weights_for_version",
 ]
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 import contextlib
+import dataclasses
+from typing import Final
 
 from django.core.cache import cache
 from django.db import transaction
@@ -11,6 +14,7 @@ from apps.game_tracker.models import (
     MatchData,
     PlayerMatchImpact,
     PlayerMatchImpactBreakdown,
+    TeamMatchImpactFeatures,
 )
 from apps.player.models.player import Player
 from apps.team.models.team import Team
@@ -18,9 +22,22 @@ from apps.team.models.team import Team
 from .match_impact_scorer import (
     LATEST_MATCH_IMPACT_ALGORITHM_VERSION,
     MATCH_IMPACT_BREAKDOWN_CACHE_VERSION,
+    MatchTeamImpactFeatures,
     PlayerImpactBreakdown,
     compute_match_impact_breakdown,
     compute_match_impact_rows,
+    compute_match_team_impact_features,
+)
+
+
+# Bump when `MatchTeamImpactFeatures` gains fields or their derivation changes,
+# so stored feature rows are recomputed instead of read.
+MATCH_IMPACT_FEATURES_VERSION: Final[int] = 1
+
+_FEATURE_FIELDS: Final[tuple[str, ...]] = tuple(
+    field.name
+    for field in dataclasses.fields(MatchTeamImpactFeatures)
+    if field.name != "team_id"
 )
 
 
@@ -161,3 +178,67 @@ def persist_match_impact_rows_with_breakdowns(
             upserted += 1
 
     return upserted
+
+
+def persist_match_team_impact_features(
+    *,
+    match_data: MatchData,
+    algorithm_version: str = LATEST_MATCH_IMPACT_ALGORITHM_VERSION,
+) -> dict[str, MatchTeamImpactFeatures]:
+    """Compute + upsert the per-team impact features of a match.
+
+    Returns:
+        dict[str, MatchTeamImpactFeatures]: The stored features by team id.
+
+    """
+    features_by_team = compute_match_team_impact_features(
+        match_data=match_data,
+        algorithm_version=algorithm_version,
+    )
+    with transaction.atomic():
+        for team_id, features in features_by_team.items():
+            TeamMatchImpactFeatures.objects.update_or_create(
+                match_data=match_data,
+                team_id=team_id,
+                defaults={
+                    "algorithm_version": algorithm_version,
+                    "feature_version": MATCH_IMPACT_FEATURES_VERSION,
+                    **{name: getattr(features, name) for name in _FEATURE_FIELDS},
+                },
+            )
+    return features_by_team
+
+
+def load_match_team_impact_features(
+    *,
+    match_data_ids: Iterable[str] | None = None,
+    algorithm_version: str = LATEST_MATCH_IMPACT_ALGORITHM_VERSION,
+) -> dict[str, dict[str, MatchTeamImpactFeatures]]:
+    """Return stored per-team features of the current versions in one query.
+
+    Args:
+        match_data_ids: Matches to load; all stored matches when omitted.
+        algorithm_version: Impact algorithm the features were computed for.
+
+    Returns:
+        dict[str, dict[str, MatchTeamImpactFeatures]]: Features by match data
+        id, then team id. Matches without current rows are absent.
+
+    """
+    rows = TeamMatchImpactFeatures.objects.filter(
+        algorithm_version=algorithm_version,
+        feature_version=MATCH_IMPACT_FEATURES_VERSION,
+    )
+    if match_data_ids is not None:
+        rows = rows.filter(match_data_id__in=list(match_data_ids))
+
+    features: dict[str, dict[str, MatchTeamImpactFeatures]] = {}
+    for row in rows.values("match_data_id", "team_id", *_FEATURE_FIELDS):
+        team_id = str(row["team_id"])
+        features.setdefault(str(row["match_data_id"]), {})[team_id] = (
+            MatchTeamImpactFeatures(
+                team_id=team_id,
+                **{name: row[name] for name in _FEATURE_FIELDS},
+            )
+        )
+    return features
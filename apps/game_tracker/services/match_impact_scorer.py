@@ -76,7 +76,7 @@ def compute_match_team_impact_features(  # noqa: C901, PLR0912, PLR0915
 
     groups = list(
         PlayerGroup.objects
-        .select_related("starting_type", "team")
+        .select_related("team")
         .prefetch_related("players")
         .filter(match_data=match_data)
     )
@@ -959,7 +959,7 @@ def compute_match_impact_rows(
 
     groups = list(
         PlayerGroup.objects
-        .select_related("starting_type", "team")
+        .select_related("team")
         .prefetch_related("players")
         .filter(match_data=match_data)
     )
@@ -1057,7 +1057,7 @@ def compute_match_impact_breakdown(
 
     groups = list(
         PlayerGroup.objects
-        .select_related("starting_type", "team")
+        .select_related("team")
         .prefetch_related("players")
         .filter(match_data=match_data)
     )
@@ -7,6 +7,7 @@ from operator import itemgetter
 from typing import Any, Literal
 
 from apps.game_tracker.models import PlayerGroup
+from apps.game_tracker.services.reference_data import reference_data
 
 
 EPS = 0.001
@@ -218,9 +219,12 @@ def _subs_grouped_by_minute(
 
 
 def _group_role_by_id(groups: list[PlayerGroup]) -> dict[str, GroupRole]:
+    references = reference_data()
     role_by_id: dict[str, GroupRole] = {}
     for g in groups:
-        role_by_id[str(g.id_uuid)] = _normalise_group_role(g.starting_type.name)
+        group_type = references.group_type(g.starting_type_id)
+        name = group_type.name if group_type is not None else g.starting_type.name
+        role_by_id[str(g.id_uuid)] = _normalise_group_role(name)
     return role_by_id
 
 
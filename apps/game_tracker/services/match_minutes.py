@@ -172,7 +172,7 @@ def compute_minutes_by_player_id(*, match_data: MatchData) -> dict[str, float]:
 
     groups = list(
         PlayerGroup.objects
-        .select_related("starting_type", "team")
+        .select_related("team")
         .prefetch_related("players")
         .filter(match_data=match_data)
     )
@@ -19,6 +19,9 @@ from uuid import UUID
 from django.db.models import Count, F, Q
 
 from apps.game_tracker.models import MatchData, Shot
+from apps.game_tracker.services.public_responses import (
+    invalidate_match_public_responses,
+)
 
 
 def compute_scores_for_matchdata_ids(
@@ -78,4 +81,5 @@ def persist_matchdata_scores(match_data: MatchData) -> tuple[int, int]:
 
     match_data.home_score, match_data.away_score = computed
     match_data.save(update_fields=["home_score", "away_score"])
+    invalidate_match_public_responses(match_id=match_data.match_link_id)
     return computed
@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, TypedDict
 
 from django.db.models import Count, Q
 
-from apps.game_tracker.models import GoalType, MatchData, MatchPlayer, PlayerGroup, Shot
+from apps.game_tracker.models import MatchData, MatchPlayer, PlayerGroup, Shot
+from apps.game_tracker.services.reference_data import GoalTypeRef, reference_data
+from apps.kwt_common.image_derivatives import LIST_THUMBNAIL_SIZE
 from apps.player.models.player import Player
 from apps.schedule.models import Match
 from apps.team.models.team import Team
 from apps.team.models.team_data import TeamData
 
 
-def _goal_types_json(goal_types: list[GoalType]) -> list[dict[str, str]]:
+def _goal_types_json(goal_types: Sequence[GoalTypeRef]) -> list[dict[str, str]]:
     return [
         {"id": str(goal_type.id_uuid), "name": goal_type.name}
         for goal_type in goal_types
@@ -34,25 +37,30 @@ def _build_team_goal_stats(
     match_data: MatchData,
     home_team: Team,
     away_team: Team,
-    goal_types: list[GoalType],
+    goal_types: Sequence[GoalTypeRef],
 ) -> dict[str, dict[str, int]]:
-    team_goal_stats: dict[str, dict[str, int]] = {}
-    for goal_type in goal_types:
-        goals_home = Shot.objects.filter(
-            match_data=match_data,
-            team=home_team,
-            shot_type=goal_type,
-            scored=True,
-        ).count()
-        goals_away = Shot.objects.filter(
+    goals = {
+        (row["team"], row["shot_type"]): row["count"]
+        for row in Shot.objects
+        .filter(
             match_data=match_data,
-            team=away_team,
-            shot_type=goal_type,
+            team__in=[home_team, away_team],
             scored=True,
-        ).count()
+            shot_type__isnull=False,
+        )
+        .values("team", "shot_type")
+        .annotate(count=Count("id_uuid"))
+        .order_by()
+    }
+    team_goal_stats: dict[str, dict[str, int]] = {}
+    for goal_type in goal_types:
         team_goal_stats[goal_type.name] = {
-            "goals_by_player": int(goals_home),
-            "goals_against_player": int(goals_away),
+            "goals_by_player": int(
+                goals.get((home_team.id_uuid, goal_type.id_uuid), 0),
+            ),
+            "goals_against_player": int(
+                goals.get((away_team.id_uuid, goal_type.id_uuid), 0),
+            ),
         }
 
     return team_goal_stats
@@ -144,7 +152,7 @@ def _build_player_lines(
             "id_uuid": str(player.id_uuid),
             "display_name": player.user.get_full_name() or player.user.username,
             "username": player.user.username,
-            "profile_picture_url": player.get_profile_picture(),
+            "profile_picture_url": player.get_profile_picture(size=LIST_THUMBNAIL_SIZE),
             "profile_url": player.get_absolute_url(),
             "shots_for": int(getattr(player, "shots_for", 0)),
             "shots_against": int(getattr(player, "shots_against", 0)),
@@ -321,7 +329,7 @@ def _build_match_stats_payload(
         away_team=away_team,
     )
 
-    goal_types = list(GoalType.objects.all())
+    goal_types = reference_data().goal_types
     goal_types_json = _goal_types_json(goal_types)
 
     team_goal_stats = _build_team_goal_stats(
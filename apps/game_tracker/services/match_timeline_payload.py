@@ -9,6 +9,7 @@ improves testability.
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -80,26 +81,50 @@ def _event_time_key(event: object) -> datetime:
     return datetime.min.replace(tzinfo=UTC)
 
 
+def _pause_time_before(
+    pauses: Sequence[Pause],
+    *,
+    match_part_start: datetime,
+    event_time: datetime,
+) -> timedelta:
+    """Sum finished pauses like `_time_in_minutes` does, from loaded rows."""
+    total = timedelta(0)
+    for pause in pauses:
+        if pause.active or pause.start_time is None:
+            continue
+        if match_part_start <= pause.start_time < event_time:
+            total += (pause.end_time or pause.start_time) - pause.start_time
+    return total
+
+
 def _time_in_minutes(
     *,
     match_data: MatchData,
     match_part_start: datetime,
     match_part_number: int,
     event_time: datetime,
+    pauses: Sequence[Pause] | None = None,
 ) -> str:
-    pause_time = Pause.objects.filter(
-        match_data=match_data,
-        active=False,
-        start_time__lt=event_time,
-        start_time__gte=match_part_start,
-    ).filter(start_time__isnull=False).aggregate(
-        total_pause=Sum(
-            ExpressionWrapper(
-                Coalesce(F("end_time"), F("start_time")) - F("start_time"),
-                output_field=DurationField(),
-            )
+    if pauses is not None:
+        pause_time = _pause_time_before(
+            pauses,
+            match_part_start=match_part_start,
+            event_time=event_time,
         )
-    ).get("total_pause") or timedelta(0)
+    else:
+        pause_time = Pause.objects.filter(
+            match_data=match_data,
+            active=False,
+            start_time__lt=event_time,
+            start_time__gte=match_part_start,
+        ).filter(start_time__isnull=False).aggregate(
+            total_pause=Sum(
+                ExpressionWrapper(
+                    Coalesce(F("end_time"), F("start_time")) - F("start_time"),
+                    output_field=DurationField(),
+                )
+            )
+        ).get("total_pause") or timedelta(0)
     pause_time_seconds = pause_time.total_seconds()
 
     time_in_minutes_value = round(
@@ -194,13 +219,29 @@ def _build_match_events(match_data: MatchData) -> list[dict[str, Any]]:
         .order_by("start_time")
     )
 
+    # Whole-timeline builds share one pause and timeout load instead of
+    # querying both per event.
+    timeouts: dict[str, Timeout] = {}
+    for timeout in (
+        Timeout.objects
+        .select_related("team")
+        .filter(pause__in=[pause.pk for pause in pauses])
+        .order_by("pk")
+    ):
+        timeouts.setdefault(str(timeout.pause_id), timeout)
+
     events: list[object] = [*goals, *player_changes, *pauses]
     events.sort(key=_event_time_key)
 
     payload: list[dict[str, Any]] = []
 
     for event in events:
-        serialized = _serialize_match_event(match_data, event)
+        serialized = _serialize_match_event(
+            match_data,
+            event,
+            pauses=pauses,
+            timeouts=timeouts,
+        )
         if serialized is not None:
             payload.append(serialized)
 
@@ -220,6 +261,12 @@ def _build_match_shots(match_data: MatchData) -> list[dict[str, Any]]:
         for p in g.players.all():
             player_team_id[str(p.id_uuid)] = tid
 
+    pauses = list(
+        Pause.objects
+        .only("id_uuid", "start_time", "end_time", "active")
+        .filter(match_data=match_data)
+    )
+
     shots = list(
         Shot.objects
         .select_related(
@@ -253,6 +300,7 @@ def _build_match_shots(match_data: MatchData) -> list[dict[str, Any]]:
             match_data,
             shot,
             player_team_id=player_team_id,
+            pauses=pauses,
         )
         if serialized is not None:
             payload.append(serialized)
@@ -279,17 +327,30 @@ def build_match_shots(match_data: MatchData) -> list[dict[str, Any]]:
 def _serialize_match_event(
     match_data: MatchData,
     event: object,
+    *,
+    pauses: Sequence[Pause],
+    timeouts: Mapping[str, Timeout],
 ) -> dict[str, Any] | None:
     if isinstance(event, Shot):
-        return _serialize_goal_event(match_data, event)
+        return _serialize_goal_event(match_data, event, pauses=pauses)
     if isinstance(event, PlayerChange):
-        return _serialize_substitute_event(match_data, event)
+        return _serialize_substitute_event(match_data, event, pauses=pauses)
     if isinstance(event, Pause):
-        return _serialize_pause_event(match_data, event)
+        return _serialize_pause_event(
+            match_data,
+            event,
+            pauses=pauses,
+            timeouts=timeouts,
+        )
     return None
 
 
-def _serialize_goal_event(match_data: MatchData, event: Shot) -> dict[str, Any] | None:
+def _serialize_goal_event(
+    match_data: MatchData,
+    event: Shot,
+    *,
+    pauses: Sequence[Pause] | None = None,
+) -> dict[str, Any] | None:
     if not event.match_part or not event.time or not event.shot_type:
         return None
 
@@ -324,6 +385,7 @@ def _serialize_goal_event(match_data: MatchData, event: Shot) -> dict[str, Any]
             match_part_start=event.match_part.start_time,
             match_part_number=event.match_part.part_number,
             event_time=event.time,
+            pauses=pauses,
         ),
         "player_id": str(event.player.id_uuid),
         "player": event.player.user.username,
@@ -347,6 +409,7 @@ def _serialize_shot_timeline_event(
     event: Shot,
     *,
     player_team_id: dict[str, str] | None = None,
+    pauses: Sequence[Pause] | None = None,
 ) -> dict[str, Any] | None:
     if not event.player:
         return None
@@ -384,6 +447,7 @@ def _serialize_shot_timeline_event(
             match_part_start=event.match_part.start_time,
             match_part_number=event.match_part.part_number,
             event_time=event.time,
+            pauses=pauses,
         )
 
     return payload
@@ -392,6 +456,8 @@ def _serialize_shot_timeline_event(
 def _serialize_substitute_event(
     match_data: MatchData,
     event: PlayerChange,
+    *,
+    pauses: Sequence[Pause] | None = None,
 ) -> dict[str, Any] | None:
     if not event.time:
         return None
@@ -420,6 +486,7 @@ def _serialize_substitute_event(
             match_part_start=event.match_part.start_time,
             match_part_number=event.match_part.part_number,
             event_time=event.time,
+            pauses=pauses,
         )
     else:
         payload["time"] = _intermission_label_for_time(match_data, event.time)
@@ -438,11 +505,18 @@ def serialize_substitute_event(
 def _serialize_pause_event(
     match_data: MatchData,
     event: Pause,
+    *,
+    pauses: Sequence[Pause] | None = None,
+    timeouts: Mapping[str, Timeout] | None = None,
 ) -> dict[str, Any] | None:
     if not event.match_part or not event.start_time:
         return None
 
-    timeout = Timeout.objects.select_related("team").filter(pause=event).first()
+    timeout = (
+        timeouts.get(str(event.id_uuid))
+        if timeouts is not None
+        else Timeout.objects.select_related("team").filter(pause=event).first()
+    )
 
     return {
         "event_kind": "timeout" if timeout else "pause",
@@ -457,6 +531,7 @@ def _serialize_pause_event(
             match_part_start=event.match_part.start_time,
             match_part_number=event.match_part.part_number,
             event_time=event.start_time,
+            pauses=pauses,
         ),
         "length": event.length().total_seconds(),
         "start_time": (event.start_time.isoformat() if event.start_time else None),
@@ -0,0 +1,246 @@
+"""Materialized events/shots timelines for cheap full and delta reads.
+
+Every live revision that can change a timeline re-derives both payload lists
+once (on the write path, inside the revision transaction) and stores them as
+`MatchTimelineEntry` rows: one per event with its serialized payload, its
+position in the timeline and the revision it last changed at. Removed events
+keep a tombstone. Public reads then never run the payload builders:
+
+- full reads are one ordered scan of the live rows;
+- delta reads are `revision > since` index reads plus the id order.
+
+The projection is only used while `MatchData.timeline_revision` equals the
+live revision; deltas are exact from `timeline_base_revision` (the revision
+it was last built from scratch) on. Callers fall back to the builders
+otherwise, e.g. for matches that have not changed since this was introduced.
+
+Payloads embed usernames and goal type names, which change without advancing
+a match's live revision. Those changes call `refresh_match_timelines`: it
+marks the projections stale in the saving transaction (reads use the
+builders) and rebuilds them in a Celery task after commit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Final
+
+from django.db import transaction
+
+from apps.game_tracker.models import MatchData, MatchTimelineEntry
+from apps.game_tracker.realtime.contracts import LiveResource
+from apps.game_tracker.services.match_timeline_payload import (
+    build_match_events,
+    build_match_shots,
+)
+
+
+_STREAMS: Final[dict[LiveResource, str]] = {
+    LiveResource.EVENTS: MatchTimelineEntry.Stream.EVENTS,
+    LiveResource.SHOTS: MatchTimelineEntry.Stream.SHOTS,
+}
+
+# Changes to these resources can alter timeline payloads (shot team ids fall
+# back to player group membership).
+TIMELINE_RESOURCES: Final[frozenset[LiveResource]] = frozenset({
+    LiveResource.EVENTS,
+    LiveResource.SHOTS,
+    LiveResource.PLAYER_GROUPS,
+})
+
+
+@dataclass(frozen=True, slots=True)
+class TimelineDelta:
+    """Changes of one timeline stream after a client's revision."""
+
+    upsert: list[dict[str, Any]]
+    deleted_ids: list[str]
+    order: list[str]
+
+
+def timeline_is_current(match_data: MatchData) -> bool:
+    """Return whether the stored timeline reflects the match's live revision."""
+    return (
+        match_data.timeline_revision is not None
+        and match_data.timeline_revision == match_data.live_revision
+    )
+
+
+def sync_match_timeline(
+    match_data: MatchData,
+    *,
+    revision: int,
+) -> dict[LiveResource, set[str]]:
+    """Store the current events and shots payloads of a match at `revision`.
+
+    Must run in the transaction that advances `match_data` to `revision`.
+    Only rows whose payload or position differ are written.
+
+    Returns:
+        dict[LiveResource, set[str]]: Ids upserted or deleted, per stream.
+
+    """
+    built = {
+        LiveResource.EVENTS: build_match_events(match_data),
+        LiveResource.SHOTS: build_match_shots(match_data),
+    }
+    existing = {
+        (entry.stream, entry.event_id): entry
+        for entry in MatchTimelineEntry.objects.filter(match_data=match_data)
+    }
+    created: list[MatchTimelineEntry] = []
+    updated: list[MatchTimelineEntry] = []
+    changed: dict[LiveResource, set[str]] = {resource: set() for resource in built}
+
+    for resource, payloads in built.items():
+        stream = _STREAMS[resource]
+        for position, payload in enumerate(payloads):
+            event_id = str(payload["event_id"])
+            entry = existing.pop((stream, event_id), None)
+            if entry is None:
+                created.append(
+                    MatchTimelineEntry(
+                        match_data=match_data,
+                        stream=stream,
+                        event_id=event_id,
+                        position=position,
+                        revision=revision,
+                        payload=payload,
+                    ),
+                )
+                changed[resource].add(event_id)
+            elif entry.deleted or entry.payload != payload:
+                entry.payload = payload
+                entry.deleted = False
+                entry.position = position
+                entry.revision = revision
+                updated.append(entry)
+                changed[resource].add(event_id)
+            elif entry.position != position:
+                # Reordering alone is carried by the delta `order` list.
+                entry.position = position
+                updated.append(entry)
+
+    resources = {stream: resource for resource, stream in _STREAMS.items()}
+    for entry in existing.values():
+        if entry.deleted:
+            continue
+        entry.deleted = True
+        entry.revision = revision
+        updated.append(entry)
+        changed[resources[entry.stream]].add(entry.event_id)
+
+    if created:
+        MatchTimelineEntry.objects.bulk_create(created)
+    if updated:
+        MatchTimelineEntry.objects.bulk_update(
+            updated,
+            ["payload", "deleted", "position", "revision"],
+        )
+    return changed
+
+
+def rebuild_match_timeline(match_data: MatchData) -> bool:
+    """Build the projection of a match at its current revision (backfill).
+
+    The live revision is not advanced, so nothing is published; deltas for the
+    match are exact from this revision on.
+
+    Returns:
+        bool: False if the projection was already current.
+
+    """
+    with transaction.atomic():
+        locked = MatchData.objects.select_for_update().filter(pk=match_data.pk).first()
+        if locked is None or timeline_is_current(locked):
+            return False
+        sync_match_timeline(locked, revision=locked.live_revision)
+        locked.timeline_revision = locked.live_revision
+        locked.timeline_base_revision = locked.live_revision
+        locked.save(update_fields=["timeline_revision", "timeline_base_revision"])
+    return True
+
+
+def refresh_match_timelines(match_data_ids: Iterable[object]) -> list[str]:
+    """Mark stored timelines stale and rebuild them after commit.
+
+    Returns:
+        list[str]: Ids of the matches whose projection was marked stale.
+
+    """
+    stale = [
+        str(match_data_id)
+        for match_data_id in MatchData.objects
+        .filter(pk__in=set(match_data_ids), timeline_revision__isnull=False)
+        .values_list("id_uuid", flat=True)
+    ]
+    if not stale:
+        return stale
+    MatchData.objects.filter(pk__in=stale).update(timeline_revision=None)
+    transaction.on_commit(partial(_schedule_rebuild, stale))
+    return stale
+
+
+def _schedule_rebuild(match_data_ids: list[str]) -> None:
+    from apps.game_tracker.tasks import rebuild_match_timelines
+
+    rebuild_match_timelines.delay(match_data_ids)
+
+
+def read_timeline(
+    match_data: MatchData,
+    resource: LiveResource,
+) -> list[dict[str, Any]] | None:
+    """Return the stored payload list, or None if the projection is stale."""
+    if not timeline_is_current(match_data):
+        return None
+    return list(
+        MatchTimelineEntry.objects
+        .filter(match_data=match_data, stream=_STREAMS[resource], deleted=False)
+        .order_by("position")
+        .values_list("payload", flat=True)
+    )
+
+
+def read_timeline_delta(
+    match_data: MatchData,
+    resource: LiveResource,
+    *,
+    since_revision: int,
+) -> TimelineDelta | None:
+    """Return the changes after `since_revision`, or None if they are unknown."""
+    base_revision = match_data.timeline_base_revision
+    if not timeline_is_current(match_data) or base_revision is None:
+        return None
+    if not base_revision <= since_revision <= match_data.live_revision:
+        return None
+
+    entries = MatchTimelineEntry.objects.filter(
+        match_data=match_data,
+        stream=_STREAMS[resource],
+    )
+    upsert: list[dict[str, Any]] = []
+    deleted_ids: list[str] = []
+    if since_revision < match_data.live_revision:
+        for event_id, deleted, payload in (
+            entries
+            .filter(revision__gt=since_revision)
+            .order_by("position")
+            .values_list("event_id", "deleted", "payload")
+        ):
+            if deleted:
+                deleted_ids.append(event_id)
+            else:
+                upsert.append(payload)
+    return TimelineDelta(
+        upsert=upsert,
+        deleted_ids=sorted(deleted_ids),
+        order=list(
+            entries
+            .filter(deleted=False)
+            .order_by("position")
+            .values_list("event_id", flat=True)
+        ),
+    )
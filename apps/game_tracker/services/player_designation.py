@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
+from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 
+from apps.awards.services import mvp_cache
+from apps.club.services.eligibility_state import schedule_eligibility_refresh
 from apps.game_tracker.models import MatchData, MatchPlayer, PlayerGroup
 from apps.game_tracker.services.player_groups import (
     PlayerGroupAssignmentError,
@@ -51,6 +55,12 @@ def sync_match_players_for_team(*, match_data: MatchData, team: Team) -> None:
             ],
             ignore_conflicts=True,
         )
+        # `bulk_create` sends no `post_save`, so the MVP and eligibility
+        # signals miss it.
+        transaction.on_commit(
+            partial(mvp_cache.delete_candidates, match_data.id_uuid),
+        )
+        schedule_eligibility_refresh(match_data_id=str(match_data.id_uuid))
 
     if to_delete:
         MatchPlayer.objects.filter(
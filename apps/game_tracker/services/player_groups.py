@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from apps.game_tracker.models import GroupType, MatchData, PlayerGroup
+from apps.game_tracker.services.reference_data import reference_data
 from apps.player.models import Player
 from apps.team.models import Team
 
@@ -67,7 +68,7 @@ def get_reserve_group(*, match_data: MatchData, team: Team) -> PlayerGroup:
     return PlayerGroup.objects.get(
         team=team,
         match_data=match_data,
-        starting_type__name=RESERVE_GROUP_NAME,
+        starting_type_id=reference_data().group_type_id(RESERVE_GROUP_NAME),
     )
 
 
@@ -0,0 +1,364 @@
+"""Per-(club, season) name index for the match-player picker.
+
+`player_search` is called on every keystroke. Instead of loading all eligible
+players with a multi-join `DISTINCT` query and normalizing/fuzzy-matching every
+name each time, the eligible players of a club for a season are indexed once:
+
+- names are normalized up-front and split into unique terms;
+- a bigram → term posting list narrows the substring stage;
+- terms are bucketed by length so the fuzzy stage only compares terms that can
+  pass the length window (and `quick_ratio` before the full `ratio`);
+- club memberships keep their date range so eligibility for a given match date
+  is decided in memory.
+
+Indexes live in the shared cache (Valkey) plus a small per-process LRU. Roster,
+membership and user-name changes bump a generation token (see
+`apps.game_tracker.signals.player_search_signals`), so every worker rebuilds on
+its next lookup. Ranking is identical to `player_name_match_score`.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable
+import contextlib
+from dataclasses import dataclass, field
+from datetime import date
+from difflib import SequenceMatcher
+import threading
+from typing import Final
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from apps.game_tracker.services.player_search import (
+    FUZZY_MATCH_THRESHOLD,
+    MIN_FUZZY_TERM_LENGTH,
+    normalize_player_name,
+)
+from apps.player.models import Player
+from apps.player.models.player_club_membership import PlayerClubMembership
+
+
+_CACHE_KEY_PREFIX: Final[str] = "korfbal:player-search:v1"
+_GLOBAL_GENERATION: Final[str] = "all"
+_LOCAL_MAX_ENTRIES: Final[int] = 64
+
+_local_lock = threading.Lock()
+_local_indexes: OrderedDict[tuple[str, str], PlayerSearchIndex] = OrderedDict()
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerSearchEntry:
+    """One eligible player with pre-normalized name data."""
+
+    player_id: str
+    username: str
+    fields: tuple[str, ...]
+    term_ids: frozenset[int]
+    on_roster: bool
+    memberships: tuple[tuple[date, date | None], ...]
+
+    def eligible_on(self, match_date: date) -> bool:
+        """Return whether the player belongs to the club on `match_date`."""
+        return self.on_roster or any(
+            start <= match_date and (end is None or end >= match_date)
+            for start, end in self.memberships
+        )
+
+
+@dataclass(slots=True)
+class PlayerSearchIndex:
+    """Searchable name index of every player eligible for one club and season."""
+
+    generation: tuple[object, object]
+    entries: tuple[PlayerSearchEntry, ...]
+    terms: tuple[str, ...]
+    _bigrams: dict[str, frozenset[int]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _terms_by_length: dict[int, tuple[int, ...]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        """Build the in-memory lookup structures (not stored in the cache)."""
+        bigrams: dict[str, set[int]] = {}
+        by_length: dict[int, list[int]] = {}
+        for term_id, term in enumerate(self.terms):
+            by_length.setdefault(len(term), []).append(term_id)
+            for gram in _bigrams_of(term):
+                bigrams.setdefault(gram, set()).add(term_id)
+        self._bigrams = {gram: frozenset(ids) for gram, ids in bigrams.items()}
+        self._terms_by_length = {
+            length: tuple(ids) for length, ids in by_length.items()
+        }
+
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle only the source data; lookup structures are rebuilt on load."""
+        return {
+            "generation": self.generation,
+            "entries": self.entries,
+            "terms": self.terms,
+        }
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore from `__getstate__` output and rebuild lookup structures."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self.__post_init__()
+
+    def search(
+        self,
+        query: str,
+        *,
+        match_date: date,
+        exclude_ids: Iterable[str] = (),
+        limit: int | None = None,
+    ) -> list[PlayerSearchEntry]:
+        """Return eligible players matching `query`, best match first.
+
+        Scores follow `player_name_match_score` (0 = whole query in a name,
+        1 = every term is part of a name term, 2 = every term is a close
+        typo of a name term); ties are ordered by case-folded username.
+        """
+        normalized_query = normalize_player_name(query)
+        if not normalized_query:
+            return []
+
+        excluded = set(exclude_ids)
+        candidates = [
+            entry
+            for entry in self.entries
+            if entry.player_id not in excluded and entry.eligible_on(match_date)
+        ]
+        query_terms = tuple(dict.fromkeys(normalized_query.split()))
+        containing = {term: self._terms_containing(term) for term in query_terms}
+        close: dict[str, frozenset[int]] | None = None
+
+        ranked: list[tuple[int, str, PlayerSearchEntry]] = []
+        for entry in candidates:
+            if any(normalized_query in value for value in entry.fields):
+                score = 0
+            elif all(entry.term_ids & containing[term] for term in query_terms):
+                score = 1
+            else:
+                if close is None:
+                    close = {term: self._terms_close_to(term) for term in query_terms}
+                if not all(entry.term_ids & close[term] for term in query_terms):
+                    continue
+                score = 2
+            ranked.append((score, entry.username.casefold(), entry))
+
+        ranked.sort(key=lambda item: (item[0], item[1]))
+        matches = [entry for _, _, entry in ranked]
+        return matches[:limit] if limit is not None else matches
+
+    def _terms_containing(self, query_term: str) -> frozenset[int]:
+        grams = _bigrams_of(query_term)
+        if not grams:
+            return frozenset(
+                term_id
+                for term_id, term in enumerate(self.terms)
+                if query_term in term
+            )
+        postings = sorted(
+            (self._bigrams.get(gram, frozenset()) for gram in grams),
+            key=len,
+        )
+        shortlist = frozenset.intersection(*postings)
+        return frozenset(
+            term_id for term_id in shortlist if query_term in self.terms[term_id]
+        )
+
+    def _terms_close_to(self, query_term: str) -> frozenset[int]:
+        if len(query_term) < MIN_FUZZY_TERM_LENGTH:
+            return frozenset()
+        window = max(1, len(query_term) // 4)
+        matcher = SequenceMatcher(None, query_term)
+        close: set[int] = set()
+        for length in range(len(query_term) - window, len(query_term) + window + 1):
+            if length < MIN_FUZZY_TERM_LENGTH:
+                continue
+            for term_id in self._terms_by_length.get(length, ()):
+                matcher.set_seq2(self.terms[term_id])
+                if (
+                    matcher.quick_ratio() >= FUZZY_MATCH_THRESHOLD
+                    and matcher.ratio() >= FUZZY_MATCH_THRESHOLD
+                ):
+                    close.add(term_id)
+        return frozenset(close)
+
+
+def _bigrams_of(term: str) -> set[str]:
+    return {term[index : index + 2] for index in range(len(term) - 1)}
+
+
+def _index_ttl() -> int:
+    return max(0, int(getattr(settings, "KORFBAL_PLAYER_SEARCH_INDEX_TTL_S", 600)))
+
+
+def _generation_key(scope: object) -> str:
+    return f"{_CACHE_KEY_PREFIX}:gen:{scope}"
+
+
+def _index_key(club_id: str, season_id: str, generation: tuple[object, object]) -> str:
+    club_generation, global_generation = generation
+    return (
+        f"{_CACHE_KEY_PREFIX}:index:{club_id}:{season_id}:"
+        f"{club_generation}:{global_generation}"
+    )
+
+
+def build_player_search_index(
+    *,
+    club_id: str,
+    season_id: str,
+    generation: tuple[object, object] = (None, None),
+) -> PlayerSearchIndex:
+    """Load every player eligible for `club_id` in `season_id` into an index.
+
+    Eligible are players/coaches on any of the club's teams in the season, and
+    players with a club membership (whose dates are checked at search time).
+    """
+    roster_filter = Q(
+        team_data_as_player__team__club_id=club_id,
+        team_data_as_player__season_id=season_id,
+    ) | Q(
+        team_data_as_coach__team__club_id=club_id,
+        team_data_as_coach__season_id=season_id,
+    )
+    roster_ids = {
+        str(player_id)
+        for player_id in Player.objects
+        .filter(roster_filter)
+        .values_list("id_uuid", flat=True)
+        .distinct()
+    }
+    memberships: dict[str, list[tuple[date, date | None]]] = {}
+    for player_id, start_date, end_date in PlayerClubMembership.objects.filter(
+        club_id=club_id,
+    ).values_list("player_id", "start_date", "end_date"):
+        memberships.setdefault(str(player_id), []).append((start_date, end_date))
+
+    rows = (
+        Player.objects
+        .filter(id_uuid__in=roster_ids | set(memberships))
+        .values_list("id_uuid", "user__username", "user__first_name", "user__last_name")
+        .order_by()
+    )
+
+    term_ids: dict[str, int] = {}
+    entries: list[PlayerSearchEntry] = []
+    for player_id, username, first_name, last_name in rows:
+        fields = tuple(
+            filter(
+                None,
+                (
+                    normalize_player_name(username),
+                    normalize_player_name(first_name),
+                    normalize_player_name(last_name),
+                    normalize_player_name(f"{first_name} {last_name}"),
+                ),
+            ),
+        )
+        ids = frozenset(
+            term_ids.setdefault(term, len(term_ids))
+            for term in " ".join(fields).split()
+        )
+        entries.append(
+            PlayerSearchEntry(
+                player_id=str(player_id),
+                username=username,
+                fields=fields,
+                term_ids=ids,
+                on_roster=str(player_id) in roster_ids,
+                memberships=tuple(memberships.get(str(player_id), ())),
+            ),
+        )
+
+    return PlayerSearchIndex(
+        generation=generation,
+        entries=tuple(entries),
+        terms=tuple(term_ids),
+    )
+
+
+def get_player_search_index(*, club_id: object, season_id: object) -> PlayerSearchIndex:
+    """Return the (cached) search index for a club and season.
+
+    A warm lookup costs one cache round trip to read the generation tokens;
+    the index itself comes from the per-process LRU or the shared cache.
+    """
+    club_key, season_key = str(club_id), str(season_id)
+    try:
+        tokens = cache.get_many(
+            [_generation_key(club_key), _generation_key(_GLOBAL_GENERATION)],
+        )
+    except Exception:  # noqa: BLE001
+        tokens = {}
+    generation = (
+        tokens.get(_generation_key(club_key)),
+        tokens.get(_generation_key(_GLOBAL_GENERATION)),
+    )
+
+    local_key = (club_key, season_key)
+    with _local_lock:
+        index = _local_indexes.get(local_key)
+        if index is not None and index.generation == generation:
+            _local_indexes.move_to_end(local_key)
+            return index
+
+    ttl = _index_ttl()
+    index_key = _index_key(club_key, season_key, generation)
+    index = None
+    if ttl:
+        with contextlib.suppress(Exception):
+            index = cache.get(index_key)
+    if not isinstance(index, PlayerSearchIndex):
+        index = build_player_search_index(
+            club_id=club_key,
+            season_id=season_key,
+            generation=generation,
+        )
+        if ttl:
+            with contextlib.suppress(Exception):
+                cache.set(index_key, index, timeout=ttl)
+
+    with _local_lock:
+        _local_indexes[local_key] = index
+        _local_indexes.move_to_end(local_key)
+        while len(_local_indexes) > _LOCAL_MAX_ENTRIES:
+            _local_indexes.popitem(last=False)
+    return index
+
+
+def invalidate_player_search_index(club_ids: Iterable[object] | None = None) -> None:
+    """Force a rebuild of the indexes of `club_ids` (all clubs when None)."""
+    scopes = (
+        [_GLOBAL_GENERATION]
+        if club_ids is None
+        else sorted({str(club_id) for club_id in club_ids if club_id})
+    )
+    if not scopes:
+        return
+    token = uuid.uuid4().hex
+    with contextlib.suppress(Exception):
+        cache.set_many(
+            {_generation_key(scope): token for scope in scopes},
+            timeout=None,
+        )
+
+
+def clear_local_player_search_indexes() -> None:
+    """Drop the per-process index cache (tests)."""
+    with _local_lock:
+        _local_indexes.clear()
@@ -0,0 +1,38 @@
+"""Invalidate cached public responses when a match changes.
+
+Schedule lists and the club/team overviews of both sides embed match states
+and scores; see `apps.kwt_common.public_cache` for how the tags are used.
+"""
+
+from __future__ import annotations
+
+import contextlib
+
+from django.db import transaction
+from django.db.models import Q
+
+from apps.kwt_common.public_cache import (
+    SCHEDULE_TAG,
+    club_tag,
+    invalidate_public_tags,
+    team_tag,
+)
+from apps.team.models import Team
+
+
+def _invalidate_for_match(match_id: str) -> None:
+    tags = [SCHEDULE_TAG]
+    with contextlib.suppress(Exception):
+        for team_id, club_id in Team.objects.filter(
+            Q(home_matches__id_uuid=match_id) | Q(away_matches__id_uuid=match_id),
+        ).values_list("id_uuid", "club_id"):
+            tags.extend((team_tag(team_id), club_tag(club_id)))
+    invalidate_public_tags(tags)
+
+
+def invalidate_match_public_responses(*, match_id: object | None) -> None:
+    """Invalidate the public responses showing a match, after commit."""
+    if match_id is None:
+        return
+    match_key = str(match_id)
+    transaction.on_commit(lambda: _invalidate_for_match(match_key))
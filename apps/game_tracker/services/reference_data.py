@@ -0,0 +1,150 @@
+"""Process-wide registry of goal and group types.
+
+`GoalType` and `GroupType` are static reference rows (a handful, edited in the
+admin), yet tracker, stats and impact code used to query them, or join on
+their names, on every request. `reference_data()` serves them from a snapshot
+loaded once per process and reused until the generation token in the shared
+cache (Valkey) changes. Saves and deletes bump the token (see
+`apps.game_tracker.signals.reference_data_signals`), so every worker reloads
+on its next lookup. A warm lookup costs one cache round trip.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass, field
+import threading
+from typing import Final
+import uuid
+
+from django.core.cache import cache
+
+from apps.game_tracker.models import GoalType, GroupType
+
+
+ATTACK_GROUP_NAME: Final[str] = "Aanval"
+DEFENSE_GROUP_NAME: Final[str] = "Verdediging"
+
+_GENERATION_KEY: Final[str] = "korfbal:reference-data:v1:gen"
+
+_local_lock = threading.Lock()
+_local: dict[str, ReferenceData] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class GoalTypeRef:
+    """Cached `GoalType` row."""
+
+    id_uuid: object
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class GroupTypeRef:
+    """Cached `GroupType` row."""
+
+    id_uuid: object
+    name: str
+    order: int
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceData:
+    """Goal types (by name) and group types (by order, name) of one generation."""
+
+    generation: object
+    goal_types: tuple[GoalTypeRef, ...]
+    group_types: tuple[GroupTypeRef, ...]
+    _goal_types_by_id: dict[str, GoalTypeRef] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _group_types_by_id: dict[str, GroupTypeRef] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _group_type_ids_by_name: dict[str, object] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        """Index the rows by id and name."""
+        object.__setattr__(
+            self,
+            "_goal_types_by_id",
+            {str(row.id_uuid): row for row in self.goal_types},
+        )
+        object.__setattr__(
+            self,
+            "_group_types_by_id",
+            {str(row.id_uuid): row for row in self.group_types},
+        )
+        object.__setattr__(
+            self,
+            "_group_type_ids_by_name",
+            {row.name: row.id_uuid for row in self.group_types},
+        )
+
+    def goal_type(self, goal_type_id: object) -> GoalTypeRef | None:
+        """Return the goal type with `goal_type_id`, if it exists."""
+        return self._goal_types_by_id.get(str(goal_type_id))
+
+    def group_type(self, group_type_id: object) -> GroupTypeRef | None:
+        """Return the group type with `group_type_id`, if it exists."""
+        return self._group_types_by_id.get(str(group_type_id))
+
+    def group_type_id(self, name: str) -> object | None:
+        """Return the id of the group type called `name`, if it exists."""
+        return self._group_type_ids_by_name.get(name)
+
+
+def _load(generation: object) -> ReferenceData:
+    return ReferenceData(
+        generation=generation,
+        goal_types=tuple(
+            GoalTypeRef(id_uuid=id_uuid, name=name)
+            for id_uuid, name in GoalType.objects
+            .order_by("name")
+            .values_list("id_uuid", "name")
+        ),
+        group_types=tuple(
+            GroupTypeRef(id_uuid=id_uuid, name=name, order=order)
+            for id_uuid, name, order in GroupType.objects
+            .order_by("order", "name")
+            .values_list("id_uuid", "name", "order")
+        ),
+    )
+
+
+def reference_data() -> ReferenceData:
+    """Return the current goal and group types of this process."""
+    try:
+        generation = cache.get(_GENERATION_KEY)
+    except Exception:  # noqa: BLE001
+        generation = None
+    with _local_lock:
+        current = _local.get("current")
+    if current is not None and current.generation == generation:
+        return current
+
+    loaded = _load(generation)
+    with _local_lock:
+        _local["current"] = loaded
+    return loaded
+
+
+def invalidate_reference_data() -> None:
+    """Make every process reload goal and group types on its next lookup."""
+    clear_local_reference_data()
+    with contextlib.suppress(Exception):
+        cache.set(_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def clear_local_reference_data() -> None:
+    """Drop this process's snapshot (tests)."""
+    with _local_lock:
+        _local.clear()
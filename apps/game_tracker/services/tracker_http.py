@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+import contextlib
 from dataclasses import dataclass
 from datetime import UTC, datetime
 import logging
 from typing import Any, Protocol, cast
 from uuid import UUID
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
+from django.db import connection, models, transaction
 from django.utils import timezone
 from django.utils.module_loading import import_string
 
@@ -34,15 +37,21 @@ from apps.game_tracker.services.live_updates import (
     record_match_change,
     summarize_match_changes,
 )
-from apps.game_tracker.services.match_scores import compute_scores_for_matchdata_ids
-from apps.game_tracker.services.match_timeline_payload import (
-    build_match_events,
-    build_match_shots,
+from apps.game_tracker.services.match_counters import (
+    count_match_counters,
+    match_counters,
+    team_counters,
 )
+from apps.game_tracker.services.match_scores import compute_scores_for_matchdata_ids
 from apps.game_tracker.services.player_groups import (
     RESERVE_GROUP_NAME,
     get_reserve_group,
 )
+from apps.game_tracker.services.reference_data import (
+    ATTACK_GROUP_NAME,
+    DEFENSE_GROUP_NAME,
+    reference_data,
+)
 from apps.player.models import Player
 from apps.player.services.goal_song_manifest import build_goal_song_manifest
 from apps.schedule.models import Match
@@ -212,343 +221,163 @@ def _is_paused(match_data: MatchData, current_part: MatchPart | None) -> bool:
     ).exists()
 
 
-def _timer_data(
-    match_data: MatchData,
-    current_part: MatchPart | None,
-) -> dict[str, Any]:
-    if not current_part:
-        return {
-            "type": "deactivated",
-            "match_data_id": str(match_data.id_uuid),
-        }
-
-    active_pause = Pause.objects.filter(
-        match_data=match_data,
-        active=True,
-        match_part=current_part,
-    ).first()
-
-    pauses = Pause.objects.filter(
-        match_data=match_data,
-        active=False,
-        match_part=current_part,
-    )
-    pause_time = sum(pause.length().total_seconds() for pause in pauses)
-
-    base: dict[str, Any] = {
-        "match_data_id": str(match_data.id_uuid),
-        "time": current_part.start_time.isoformat(),
-        "length": match_data.part_length,
-        "pause_length": pause_time,
-        "server_time": datetime.now(UTC).isoformat(),
-    }
-
-    if active_pause and active_pause.start_time:
-        return {
-            **base,
-            "type": "pause",
-            "calc_to": active_pause.start_time.isoformat(),
-        }
-
-    return {
-        **base,
-        "type": "active",
-    }
-
-
-def _score(match_data: MatchData, *, team: Team, opponent: Team) -> tuple[int, int]:
-    totals = (
-        Shot.objects
-        .filter(match_data=match_data, scored=True, team__in=[team, opponent])
-        .values("team")
-        .annotate(count=models.Count("id_uuid"))
-    )
-    goals_by_team = {row["team"]: row["count"] for row in totals}
-    return goals_by_team.get(team.id_uuid, 0), goals_by_team.get(opponent.id_uuid, 0)
-
-
 def _swap_player_group_types(match_data: MatchData, team: Team) -> None:
-    group_type_attack = GroupType.objects.get(name="Aanval")
-    group_type_defense = GroupType.objects.get(name="Verdediging")
+    references = reference_data()
+    attack_id = references.group_type_id(ATTACK_GROUP_NAME)
+    defense_id = references.group_type_id(DEFENSE_GROUP_NAME)
+    if attack_id is None or defense_id is None:
+        raise GroupType.DoesNotExist("Attack and defense group types are required.")
 
     pg_attack = PlayerGroup.objects.get(
         match_data=match_data,
         team=team,
-        current_type=group_type_attack,
+        current_type_id=attack_id,
     )
     pg_defense = PlayerGroup.objects.get(
         match_data=match_data,
         team=team,
-        current_type=group_type_defense,
+        current_type_id=defense_id,
     )
 
-    pg_attack.current_type = group_type_defense
-    pg_defense.current_type = group_type_attack
+    pg_attack.current_type_id = defense_id
+    pg_defense.current_type_id = attack_id
     pg_attack.save(update_fields=["current_type"])
     pg_defense.save(update_fields=["current_type"])
 
 
-def _player_stats_by_team(
-    match_data: MatchData,
-    *,
-    team: Team,
-    opponent: Team,
-) -> dict[str, dict[str, int]]:
-    player_stats: dict[str, dict[str, int]] = {}
-    shot_totals = (
-        Shot.objects
-        .filter(match_data=match_data, team__in=[team, opponent])
-        .values("player_id", "team_id")
-        .annotate(
-            shots=models.Count("id_uuid"),
-            goals=models.Count("id_uuid", filter=models.Q(scored=True)),
-        )
+def _last_shot_queryset() -> models.QuerySet[Shot]:
+    return Shot.objects.select_related(
+        "player",
+        "player__user",
+        "shot_type",
+        "match_part",
+        "team",
+    ).only(
+        "id_uuid",
+        "match_data_id",
+        "time",
+        "scored",
+        "for_team",
+        "player__id_uuid",
+        "player__user__username",
+        "shot_type__id_uuid",
+        "shot_type__name",
+        "match_part__id_uuid",
+        "match_part__start_time",
+        "match_part__part_number",
+        "team__id_uuid",
     )
 
-    for row in shot_totals:
-        player_id = str(row["player_id"])
-        team_id = row["team_id"]
-        stats = player_stats.setdefault(
-            player_id,
-            {
-                "shots_for": 0,
-                "shots_against": 0,
-                "goals_for": 0,
-                "goals_against": 0,
-            },
-        )
-        if team_id == team.id_uuid:
-            stats["shots_for"] = row["shots"]
-            stats["goals_for"] = row["goals"]
-            continue
-
-        stats["shots_against"] = row["shots"]
-        stats["goals_against"] = row["goals"]
 
-    return player_stats
-
-
-def _player_groups_payload(
-    match_data: MatchData,
-    *,
-    team: Team,
-    opponent: Team,
-) -> list[dict[str, Any]]:
-    player_stats = _player_stats_by_team(match_data, team=team, opponent=opponent)
-    player_groups = (
-        PlayerGroup.objects
-        .select_related("starting_type", "current_type")
-        .prefetch_related("players__user")
-        .filter(match_data=match_data, team=team)
-        .exclude(starting_type__name=RESERVE_GROUP_NAME)
-        .order_by(
-            # Put the currently attacking group first.
-            # (Same idea as the WS consumer ordering.)
-            "current_type__name",
-            "starting_type__name",
-        )
+def _last_change_queryset() -> models.QuerySet[PlayerChange]:
+    return PlayerChange.objects.select_related(
+        "player_in",
+        "player_in__user",
+        "player_out",
+        "player_out__user",
+        "player_group",
+        "match_part",
+    ).only(
+        "id_uuid",
+        "match_data_id",
+        "time",
+        "player_in__id_uuid",
+        "player_in__user__username",
+        "player_out__id_uuid",
+        "player_out__user__username",
+        "player_group__id_uuid",
+        "match_part__id_uuid",
+        "match_part__start_time",
+        "match_part__part_number",
     )
 
-    # We want Aanval first, then Verdediging. Ordering by name isn't stable in
-    # all locales, so we reorder in Python.
-    ordered: list[PlayerGroup] = []
-    aanval = [pg for pg in player_groups if pg.current_type.name == "Aanval"]
-    verdediging = [pg for pg in player_groups if pg.current_type.name == "Verdediging"]
-    ordered.extend(aanval)
-    ordered.extend(verdediging)
-
-    result: list[dict[str, Any]] = []
-    for pg in ordered:
-        players_payload: list[dict[str, Any]] = []
-        for p in pg.players.all():
-            stats = player_stats.get(
-                str(p.id_uuid),
-                {
-                    "shots_for": 0,
-                    "shots_against": 0,
-                    "goals_for": 0,
-                    "goals_against": 0,
-                },
-            )
-
-            players_payload.append({
-                "id": str(p.id_uuid),
-                "name": p.user.username,
-                **stats,
-            })
 
-        result.append({
-            "id": str(pg.id_uuid),
-            "starting_type": pg.starting_type.name,
-            "current_type": pg.current_type.name,
-            "players": players_payload,
-        })
-    return result
+def _last_pause_queryset() -> models.QuerySet[Pause]:
+    return Pause.objects.select_related("match_part").only(
+        "id_uuid",
+        "match_data_id",
+        "start_time",
+        "end_time",
+        "active",
+        "match_part__id_uuid",
+        "match_part__start_time",
+        "match_part__part_number",
+    )
 
 
-def _reserve_players_payload(
-    match_data: MatchData,
-    *,
-    team: Team,
-) -> list[dict[str, Any]]:
-    reserve_group = (
-        PlayerGroup.objects
-        .prefetch_related("players__user")
-        .filter(
-            match_data=match_data,
-            team=team,
-            starting_type__name=RESERVE_GROUP_NAME,
-        )
-        .first()
+def _last_attack_queryset() -> models.QuerySet[Attack]:
+    return Attack.objects.select_related("team").only(
+        "id_uuid",
+        "match_data_id",
+        "time",
+        "team__id_uuid",
+        "team__name",
     )
-    if not reserve_group:
-        return []
-    return [
-        {"id": str(p.id_uuid), "name": p.user.username}
-        for p in reserve_group.players.all()
-    ]
 
 
-def _last_event_key(event: object) -> datetime:
-    value = getattr(event, "time", None)
-    if isinstance(value, datetime):
-        return value
-    value = getattr(event, "start_time", None)
-    if isinstance(value, datetime):
-        return value
-    return datetime.min.replace(tzinfo=UTC)
+_LastEventSource = tuple[
+    type[models.Model],
+    str,
+    Callable[[], models.QuerySet[Any]],
+]
+
+# (model, time field, serializer queryset) per event source. On equal times a
+# later source wins.
+_LAST_EVENT_SOURCES: tuple[_LastEventSource, ...] = (
+    (Shot, "time", _last_shot_queryset),
+    (PlayerChange, "time", _last_change_queryset),
+    (Pause, "start_time", _last_pause_queryset),
+    (Attack, "time", _last_attack_queryset),
+)
 
 
 def _get_last_event_model(match_data: MatchData) -> object | None:
-    candidates: list[object] = []
+    """Return the most recent shot, substitution, pause or attack.
 
-    shot = (
-        Shot.objects
-        .select_related("player", "player__user", "shot_type", "match_part", "team")
-        .only(
-            "id_uuid",
-            "match_data_id",
-            "time",
-            "scored",
-            "for_team",
-            "player__id_uuid",
-            "player__user__username",
-            "shot_type__id_uuid",
-            "shot_type__name",
-            "match_part__id_uuid",
-            "match_part__start_time",
-            "match_part__part_number",
-            "team__id_uuid",
-        )
-        .filter(match_data=match_data)
-        .order_by("-time")
-        .first()
-    )
-    if shot and shot.time:
-        candidates.append(shot)
-
-    change = (
-        PlayerChange.objects
-        .select_related(
-            "player_in",
-            "player_in__user",
-            "player_out",
-            "player_out__user",
-            "player_group",
-            "match_part",
-        )
-        .only(
-            "id_uuid",
-            "match_data_id",
-            "time",
-            "player_in__id_uuid",
-            "player_in__user__username",
-            "player_out__id_uuid",
-            "player_out__user__username",
-            "player_group__id_uuid",
-            "match_part__id_uuid",
-            "match_part__start_time",
-            "match_part__part_number",
-        )
-        .filter(match_data=match_data)
-        .order_by("-time")
-        .first()
-    )
-    if change and change.time:
-        candidates.append(change)
-
-    pause = (
-        Pause.objects
-        .select_related("match_part")
-        .only(
-            "id_uuid",
-            "match_data_id",
-            "start_time",
-            "end_time",
-            "active",
-            "match_part__id_uuid",
-            "match_part__start_time",
-            "match_part__part_number",
+    One `UNION ALL` picks the (source, id) of the latest event; the winner is
+    then loaded with the relations its serializer needs. Where the database
+    allows it, every branch is limited to its own latest row, so each is a
+    single `(match_data, time)` index probe.
+    """
+    per_branch_limit = connection.features.supports_slicing_ordering_in_compound
+    branches: list[models.QuerySet[Any]] = []
+    for source, (model, time_field, _queryset) in enumerate(_LAST_EVENT_SOURCES):
+        branch = (
+            cast(Any, model)
+            .objects.filter(
+                match_data=match_data,
+                **{f"{time_field}__isnull": False},
+            )
+            .annotate(
+                event_time=models.F(time_field),
+                source=models.Value(source, output_field=models.IntegerField()),
+            )
+            .values_list("id_uuid", "event_time", "source")
         )
-        .filter(match_data=match_data)
-        .order_by("-start_time")
+        if per_branch_limit:
+            branch = branch.order_by("-event_time", "-id_uuid")[:1]
+        branches.append(branch)
+
+    first, *rest = branches
+    latest = (
+        first
+        .union(*rest, all=True)
+        .order_by("-event_time", "-source", "-id_uuid")
         .first()
     )
-    if pause and pause.start_time:
-        candidates.append(pause)
-
-    attack = (
-        Attack.objects
-        .select_related("team")
-        .only("id_uuid", "match_data_id", "time", "team__id_uuid", "team__name")
-        .filter(match_data=match_data)
-        .order_by("-time")
-        .first()
-    )
-    if attack and attack.time:
-        candidates.append(attack)
-
-    if not candidates:
+    if latest is None:
         return None
-    candidates.sort(key=_last_event_key)
-    return candidates[-1]
+    event_id, _event_time, source = latest
+    _model, _time_field, queryset = _LAST_EVENT_SOURCES[source]
+    return queryset().filter(id_uuid=event_id).first()
 
 
-def _last_event_payload(
-    match_data: MatchData,
-    *,
-    team: Team,
-    opponent: Team,
-) -> dict[str, Any]:
-    event = _get_last_event_model(match_data)
-    if not event:
-        return {"type": "no_event"}
+def _serialize_last_event_shot(event: Shot) -> dict[str, Any]:
+    """Serialize a shot without a team perspective.
 
-    goals_for, goals_against = _score(match_data, team=team, opponent=opponent)
-
-    if isinstance(event, Shot):
-        return _serialize_last_event_shot(
-            event,
-            team=team,
-            goals_for=goals_for,
-            goals_against=goals_against,
-        )
-    if isinstance(event, PlayerChange):
-        return _serialize_last_event_player_change(event)
-    if isinstance(event, Pause):
-        return _serialize_last_event_pause(event)
-    if isinstance(event, Attack):
-        return _serialize_last_event_attack(event)
-    return {"type": "no_event"}
-
-
-def _serialize_last_event_shot(
-    event: Shot,
-    *,
-    team: Team,
-    goals_for: int,
-    goals_against: int,
-) -> dict[str, Any]:
+    `for_team` and the goal counters are filled in per team by
+    `_last_event_for_team`.
+    """
     if not event.time:
         return {"type": "no_event"}
 
@@ -557,7 +386,7 @@ def _serialize_last_event_shot(
         "id": str(event.id_uuid),
         "player": event.player.user.username,
         "player_id": str(event.player.id_uuid),
-        "for_team": bool(team_id == team.id_uuid),
+        "for_team": False,
         "team_id": str(team_id) if team_id else None,
         "time_iso": event.time.isoformat(),
         "time": event.time.isoformat(),
@@ -570,8 +399,8 @@ def _serialize_last_event_shot(
             "name": "Gescoord",
             "shot_type": event.shot_type.name,
             "shot_type_id": str(event.shot_type.id_uuid),
-            "goals_for": goals_for,
-            "goals_against": goals_against,
+            "goals_for": 0,
+            "goals_against": 0,
         }
 
     return {
@@ -649,9 +478,307 @@ def _last_changed_at(match_data: MatchData) -> datetime:
     return match_data.live_changed_at
 
 
+_TRACKER_FACTS_KEY_PREFIX = "korfbal:tracker-facts:v1"
+_EMPTY_PLAYER_STATS = {
+    "shots_for": 0,
+    "shots_against": 0,
+    "goals_for": 0,
+    "goals_against": 0,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TrackerFacts:
+    """Match-wide tracker data shared by every team perspective.
+
+    Ids are strings and times ISO strings, so one snapshot per live revision
+    can be cached and projected for both teams and spectators.
+    """
+
+    part_start: str | None
+    pause_active: bool
+    pause_start: str | None
+    pause_seconds: float
+    goals: dict[str, int]
+    substitutions: dict[str, int]
+    timeouts: dict[str, int]
+    # (player_id, team_id, shots, goals) for every player who took a shot.
+    player_shots: tuple[tuple[str, str, int, int], ...]
+    # Both teams' groups: id, team_id, starting/current type ids and players.
+    player_groups: tuple[dict[str, Any], ...]
+    last_event: dict[str, Any] | None
+
+
+def _tracker_facts_ttl() -> int:
+    return max(0, int(getattr(settings, "KORFBAL_TRACKER_FACTS_TTL_S", 60)))
+
+
+def _tracker_facts_key(match_data: MatchData) -> str:
+    # The change timestamp guards against reusing a revision number that was
+    # handed out by a rolled-back transaction.
+    changed_at = match_data.live_changed_at
+    return (
+        f"{_TRACKER_FACTS_KEY_PREFIX}:{match_data.pk}:{match_data.live_revision}:"
+        f"{changed_at.timestamp() if changed_at else ''}"
+    )
+
+
+def _serialize_last_event(event: object | None) -> dict[str, Any] | None:
+    if isinstance(event, Shot):
+        return _serialize_last_event_shot(event)
+    if isinstance(event, PlayerChange):
+        return _serialize_last_event_player_change(event)
+    if isinstance(event, Pause):
+        return _serialize_last_event_pause(event)
+    if isinstance(event, Attack):
+        return _serialize_last_event_attack(event)
+    return None
+
+
+def _load_tracker_facts(match: Match, match_data: MatchData) -> TrackerFacts:
+    team_ids = (cast(Any, match).home_team_id, cast(Any, match).away_team_id)
+
+    current_part = _current_part(match_data)
+    pause_active = False
+    pause_start: str | None = None
+    pause_seconds = 0.0
+    if current_part is not None:
+        for pause in Pause.objects.filter(
+            match_data=match_data,
+            match_part=current_part,
+        ).order_by("start_time"):
+            if not pause.active:
+                pause_seconds += pause.length().total_seconds()
+            elif not pause_active:
+                pause_active = True
+                pause_start = (
+                    pause.start_time.isoformat() if pause.start_time else None
+                )
+
+    goals: dict[str, int] = {}
+    player_shots: list[tuple[str, str, int, int]] = []
+    for row in (
+        Shot.objects
+        .filter(match_data=match_data, team_id__in=team_ids)
+        .values("player_id", "team_id")
+        .annotate(
+            shots=models.Count("id_uuid"),
+            goals=models.Count("id_uuid", filter=models.Q(scored=True)),
+        )
+    ):
+        team_id = str(row["team_id"])
+        goals[team_id] = goals.get(team_id, 0) + row["goals"]
+        player_shots.append((
+            str(row["player_id"]),
+            team_id,
+            row["shots"],
+            row["goals"],
+        ))
+
+    counters = match_counters(match_data, team_ids=team_ids)
+    if counters is None:
+        counters = count_match_counters(match_data)
+    substitutions = {
+        team_id: counts.substitutions for team_id, counts in counters.items()
+    }
+    timeouts = {team_id: counts.timeouts for team_id, counts in counters.items()}
+
+    player_groups = tuple(
+        {
+            "id": str(pg.id_uuid),
+            "team_id": str(pg.team_id),
+            "starting_type_id": str(pg.starting_type_id),
+            "current_type_id": str(pg.current_type_id),
+            "players": [
+                {"id": str(p.id_uuid), "name": p.user.username}
+                for p in pg.players.all()
+            ],
+        }
+        for pg in (
+            PlayerGroup.objects
+            .filter(match_data=match_data, team_id__in=team_ids)
+            .prefetch_related(
+                models.Prefetch(
+                    "players",
+                    queryset=Player.objects.select_related("user"),
+                ),
+            )
+        )
+    )
+
+    return TrackerFacts(
+        part_start=current_part.start_time.isoformat() if current_part else None,
+        pause_active=pause_active,
+        pause_start=pause_start,
+        pause_seconds=pause_seconds,
+        goals=goals,
+        substitutions=substitutions,
+        timeouts=timeouts,
+        player_shots=tuple(player_shots),
+        player_groups=player_groups,
+        last_event=_serialize_last_event(_get_last_event_model(match_data)),
+    )
+
+
+def load_tracker_facts(match: Match, match_data: MatchData) -> TrackerFacts:
+    """Return the match-wide tracker data at the match's live revision.
+
+    The data is loaded in a fixed number of queries, independent of the number
+    of players and events, and shared through the cache (Valkey) per live
+    revision. Writes outside tracker commands that do not advance the revision
+    (e.g. admin edits) show up once the entry expires.
+
+    Returns:
+        TrackerFacts: Data for `get_tracker_state` to project per team.
+
+    """
+    ttl = _tracker_facts_ttl()
+    key = _tracker_facts_key(match_data)
+    if ttl:
+        facts = None
+        with contextlib.suppress(Exception):
+            facts = cache.get(key)
+        if isinstance(facts, TrackerFacts):
+            return facts
+
+    facts = _load_tracker_facts(match, match_data)
+    if ttl:
+        with contextlib.suppress(Exception):
+            cache.set(key, facts, timeout=ttl)
+    return facts
+
+
+def _timer_data(match_data: MatchData, facts: TrackerFacts) -> dict[str, Any]:
+    if facts.part_start is None:
+        return {
+            "type": "deactivated",
+            "match_data_id": str(match_data.id_uuid),
+        }
+
+    base: dict[str, Any] = {
+        "match_data_id": str(match_data.id_uuid),
+        "time": facts.part_start,
+        "length": match_data.part_length,
+        "pause_length": facts.pause_seconds,
+        "server_time": datetime.now(UTC).isoformat(),
+    }
+
+    if facts.pause_start:
+        return {
+            **base,
+            "type": "pause",
+            "calc_to": facts.pause_start,
+        }
+
+    return {
+        **base,
+        "type": "active",
+    }
+
+
+def _player_groups_payload(
+    facts: TrackerFacts,
+    *,
+    team_id: str,
+) -> list[dict[str, Any]]:
+    player_stats: dict[str, dict[str, int]] = {}
+    for player_id, shot_team_id, shots, goals in facts.player_shots:
+        stats = player_stats.setdefault(player_id, dict(_EMPTY_PLAYER_STATS))
+        if shot_team_id == team_id:
+            stats["shots_for"] = shots
+            stats["goals_for"] = goals
+        else:
+            stats["shots_against"] = shots
+            stats["goals_against"] = goals
+
+    references = reference_data()
+    reserve_type_id = str(references.group_type_id(RESERVE_GROUP_NAME))
+    player_groups = [
+        pg
+        for pg in facts.player_groups
+        if pg["team_id"] == team_id and pg["starting_type_id"] != reserve_type_id
+    ]
+
+    def type_name(group_type_id: str) -> str:
+        group_type = references.group_type(group_type_id)
+        return group_type.name if group_type is not None else ""
+
+    # We want Aanval first, then Verdediging. Ordering by name isn't stable in
+    # all locales, so we reorder in Python.
+    ordered: list[dict[str, Any]] = []
+    for current_type in (ATTACK_GROUP_NAME, DEFENSE_GROUP_NAME):
+        ordered.extend(
+            sorted(
+                (
+                    pg
+                    for pg in player_groups
+                    if type_name(pg["current_type_id"]) == current_type
+                ),
+                key=lambda pg: type_name(pg["starting_type_id"]),
+            ),
+        )
+
+    return [
+        {
+            "id": pg["id"],
+            "starting_type": type_name(pg["starting_type_id"]),
+            "current_type": type_name(pg["current_type_id"]),
+            "players": [
+                {
+                    **player,
+                    **player_stats.get(player["id"], _EMPTY_PLAYER_STATS),
+                }
+                for player in pg["players"]
+            ],
+        }
+        for pg in ordered
+    ]
+
+
+def _reserve_players_payload(
+    facts: TrackerFacts,
+    *,
+    team_id: str,
+) -> list[dict[str, Any]]:
+    reserve_type_id = reference_data().group_type_id(RESERVE_GROUP_NAME)
+    if reserve_type_id is None:
+        return []
+    for pg in facts.player_groups:
+        if pg["team_id"] == team_id and pg["starting_type_id"] == str(
+            reserve_type_id,
+        ):
+            return [dict(player) for player in pg["players"]]
+    return []
+
+
+def _last_event_for_team(
+    facts: TrackerFacts,
+    *,
+    team_id: str,
+    goals_for: int,
+    goals_against: int,
+) -> dict[str, Any]:
+    event = facts.last_event
+    if not event:
+        return {"type": "no_event"}
+    if event["type"] == "goal":
+        return {
+            **event,
+            "for_team": event["team_id"] == team_id,
+            "goals_for": goals_for,
+            "goals_against": goals_against,
+        }
+    if event["type"] == "shot":
+        return {**event, "for_team": event["team_id"] == team_id}
+    return dict(event)
+
+
 def get_tracker_state(match: Match, *, team: Team) -> dict[str, Any]:
     """Return a snapshot of the current tracker state.
 
+    Match-wide data comes from `load_tracker_facts`; only the team projection
+    and the goal song manifest are built per call.
+
     Raises:
         TrackerCommandError: If the tracker data for the match does not exist.
 
@@ -661,48 +788,35 @@ def get_tracker_state(match: Match, *, team: Team) -> dict[str, Any]:
     if not match_data:
         raise TrackerCommandError(MATCH_TRACKER_DATA_NOT_FOUND, code="not_found")
 
-    current_part = _current_part(match_data)
+    facts = load_tracker_facts(match, match_data)
+    team_id = str(team.id_uuid)
+    opponent_id = str(opponent.id_uuid)
 
-    goals_for, goals_against = _score(match_data, team=team, opponent=opponent)
-    paused = _is_paused(match_data, current_part)
+    goals_for = facts.goals.get(team_id, 0)
+    goals_against = facts.goals.get(opponent_id, 0)
+    paused = (
+        match_data.status != "active"
+        or facts.part_start is None
+        or facts.pause_active
+    )
 
     start_stop_label = "Start"
     if match_data.status == "active" and not paused:
         start_stop_label = "Pauze"
 
-    goal_types = list(GoalType.objects.order_by("name"))
+    goal_types = reference_data().goal_types
 
     substitutions_max = 8
-    substitutions_counts = (
-        PlayerChange.objects
-        .filter(match_data=match_data, player_group__team__in=[team, opponent])
-        .values("player_group__team")
-        .annotate(count=models.Count("id_uuid"))
-    )
-    substitutions_by_team = {
-        row["player_group__team"]: row["count"] for row in substitutions_counts
-    }
-    substitutions_for = substitutions_by_team.get(team.id_uuid, 0)
-    substitutions_against = substitutions_by_team.get(opponent.id_uuid, 0)
+    substitutions_for = facts.substitutions.get(team_id, 0)
+    substitutions_against = facts.substitutions.get(opponent_id, 0)
     substitutions_total = substitutions_for + substitutions_against
 
     timeouts_max = 2
-    timeouts_counts = (
-        Timeout.objects
-        .filter(match_data=match_data, team__in=[team, opponent])
-        .values("team")
-        .annotate(count=models.Count("id_uuid"))
-    )
-    timeouts_by_team = {row["team"]: row["count"] for row in timeouts_counts}
-    timeouts_for = timeouts_by_team.get(team.id_uuid, 0)
-    timeouts_against = timeouts_by_team.get(opponent.id_uuid, 0)
+    timeouts_for = facts.timeouts.get(team_id, 0)
+    timeouts_against = facts.timeouts.get(opponent_id, 0)
 
-    player_groups = _player_groups_payload(
-        match_data,
-        team=team,
-        opponent=opponent,
-    )
-    reserve_players = _reserve_players_payload(match_data, team=team)
+    player_groups = _player_groups_payload(facts, team_id=team_id)
+    reserve_players = _reserve_players_payload(facts, team_id=team_id)
     player_ids = [
         player["id"] for group in player_groups for player in group["players"]
     ]
@@ -742,7 +856,7 @@ def get_tracker_state(match: Match, *, team: Team) -> dict[str, Any]:
         "substitutions_total": substitutions_total,
         "paused": paused,
         "start_stop_label": start_stop_label,
-        "timer": _timer_data(match_data, current_part),
+        "timer": _timer_data(match_data, facts),
         "player_groups": player_groups,
         "reserve_players": reserve_players,
         "goal_audio": build_goal_song_manifest(
@@ -751,7 +865,12 @@ def get_tracker_state(match: Match, *, team: Team) -> dict[str, Any]:
             season=match.season,
         ),
         "goal_types": [{"id": str(gt.id_uuid), "name": gt.name} for gt in goal_types],
-        "last_event": _last_event_payload(match_data, team=team, opponent=opponent),
+        "last_event": _last_event_for_team(
+            facts,
+            team_id=team_id,
+            goals_for=goals_for,
+            goals_against=goals_against,
+        ),
         "last_changed_at": _last_changed_at(match_data).isoformat(),
         "live_revision": match_data.live_revision,
     }
@@ -854,16 +973,6 @@ def apply_tracker_command(
             else _command_time_from_payload(payload)
         )
         affected_resources = _COMMAND_RESOURCES.get(command, frozenset())
-        before_events = (
-            {event["event_id"]: event for event in build_match_events(match_data)}
-            if LiveResource.EVENTS in affected_resources
-            else {}
-        )
-        before_shots = (
-            {shot["event_id"]: shot for shot in build_match_shots(match_data)}
-            if LiveResource.SHOTS in affected_resources
-            else {}
-        )
 
         with suppress_live_update_signals():
             parsed_command.apply(
@@ -875,30 +984,8 @@ def apply_tracker_command(
                 ),
             )
         if command in _MUTATING_COMMANDS:
-            changed_ids: dict[LiveResource, set[str]] = {}
-            if LiveResource.EVENTS in affected_resources:
-                after_events = {
-                    event["event_id"]: event for event in build_match_events(match_data)
-                }
-                changed_ids[LiveResource.EVENTS] = {
-                    event_id
-                    for event_id in before_events.keys() | after_events.keys()
-                    if before_events.get(event_id) != after_events.get(event_id)
-                }
-            if LiveResource.SHOTS in affected_resources:
-                after_shots = {
-                    shot["event_id"]: shot for shot in build_match_shots(match_data)
-                }
-                changed_ids[LiveResource.SHOTS] = {
-                    event_id
-                    for event_id in before_shots.keys() | after_shots.keys()
-                    if before_shots.get(event_id) != after_shots.get(event_id)
-                }
-            record_match_change(
-                match_data,
-                resources=affected_resources,
-                changed_ids=changed_ids,
-            )
+            # Changed event/shot ids come from the timeline projection diff.
+            record_match_change(match_data, resources=affected_resources)
 
     return get_tracker_state(match, team=team)
 
@@ -1144,10 +1231,7 @@ def _cmd_timeout(
 ) -> None:
     current_part, _ = _require_not_paused(match_data, team, match)
 
-    if (
-        Timeout.objects.filter(match_data=match_data, team=team).count()
-        >= _MAX_TIMEOUTS_PER_TEAM
-    ):
+    if team_counters(match_data, team.id_uuid).timeouts >= _MAX_TIMEOUTS_PER_TEAM:
         raise TrackerCommandError(
             "Maximum number of timeouts reached.",
             code="max_timeouts",
@@ -1345,10 +1429,7 @@ def _cmd_substitute_reg(
         part_for_event = None
 
     substitutions_max = 8
-    substitutions_for = PlayerChange.objects.filter(
-        match_data=match_data,
-        player_group__team=team,
-    ).count()
+    substitutions_for = team_counters(match_data, team.id_uuid).substitutions
     if substitutions_for >= substitutions_max:
         raise TrackerCommandError(
             "Max wissels bereikt.",
@@ -1360,7 +1441,7 @@ def _cmd_substitute_reg(
 
     reserve_group = get_reserve_group(match_data=match_data, team=team)
     active_group = PlayerGroup.objects.exclude(
-        starting_type__name=RESERVE_GROUP_NAME,
+        starting_type_id=reserve_group.starting_type_id,
     ).get(
         team=team,
         match_data=match_data,
@@ -1420,10 +1501,7 @@ def _cmd_substitute_against_reg(
         part_for_event = None
 
     substitutions_max = 8
-    substitutions_against = PlayerChange.objects.filter(
-        match_data=match_data,
-        player_group__team=opponent,
-    ).count()
+    substitutions_against = team_counters(match_data, opponent.id_uuid).substitutions
     if substitutions_against >= substitutions_max:
         raise TrackerCommandError(
             "Max wissels bereikt.",
@@ -7,20 +7,36 @@ from .impact_recompute_signals import (
     _player_group_players_changed,
     _shot_changed,
 )
+from .match_counter_signals import (
+    _match_data_counters_created,
+    _shot_counters_deleted,
+    _shot_counters_saved,
+    _substitution_counters_deleted,
+    _substitution_counters_saved,
+    _timeout_counters_deleted,
+    _timeout_counters_saved,
+)
 from .match_data_signals import (
     create_player_groups_for_new_group_type,
     create_player_groups_for_new_match_data,
 )
 from .match_signals import create_match_data_for_new_match
+from .match_status_signals import _remember_previous_match_status
 from .minutes_recompute_signals import (
     _match_data_post_save as _minutes_match_data_post_save,
-    _match_data_pre_save as _minutes_match_data_pre_save,
     _pause_changed as _minutes_pause_changed,
     _player_change_changed as _minutes_player_change_changed,
     _player_group_changed as _minutes_player_group_changed,
     _player_group_players_changed as _minutes_player_group_players_changed,
     _shot_changed as _minutes_shot_changed,
 )
+from .player_search_signals import (
+    _club_membership_changed,
+    _player_deleted,
+    _team_data_changed,
+    _team_data_members_changed,
+    _user_renamed,
+)
 from .realtime_update_signals import (
     _attack_realtime_changed,
     _match_data_realtime_changed,
@@ -29,6 +45,12 @@ from .realtime_update_signals import (
     _shot_realtime_changed,
     _substitution_realtime_changed,
 )
+from .reference_data_signals import _reference_data_changed
+from .timeline_name_signals import (
+    _goal_type_renamed_in_timelines,
+    _remember_username_for_timelines,
+    _user_renamed_in_timelines,
+)
 
 
 __all__ = [
@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
-
-from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 from apps.game_tracker.models import MatchData, Pause, PlayerChange, PlayerGroup, Shot
 from apps.game_tracker.services.match_impact_recompute import (
     schedule_match_impact_recompute,
 )
+from apps.game_tracker.signals.match_status_signals import previous_match_status
 
 
 FINISHED_MATCH_IMPACT_RECOMPUTE_DELAY_SECONDS = 30
@@ -45,25 +44,6 @@ def _match_data_id_from_instance(
     return None
 
 
-@receiver(pre_save, sender=MatchData)
-def _match_data_pre_save(
-    sender: type[MatchData], instance: MatchData, **kwargs: object
-) -> None:
-    """Track status transitions so post_save can react to "finished"."""
-    if not instance.pk:
-        # New row.
-        cast(Any, instance)._previous_status_for_impact_recompute = None
-        return
-
-    previous_status = (
-        MatchData.objects
-        .filter(pk=instance.pk)
-        .values_list("status", flat=True)
-        .first()
-    )
-    cast(Any, instance)._previous_status_for_impact_recompute = previous_status
-
-
 @receiver(post_save, sender=MatchData)
 def _match_data_post_save(
     sender: type[MatchData],
@@ -75,7 +55,7 @@ def _match_data_post_save(
     if instance.status != "finished":
         return
 
-    previous_status = getattr(instance, "_previous_status_for_impact_recompute", None)
+    previous_status = previous_match_status(instance)
     if created or previous_status != "finished":
         schedule_match_impact_recompute(
             match_data_id=str(instance.id_uuid),
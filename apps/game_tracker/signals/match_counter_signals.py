@@ -0,0 +1,142 @@
+"""Keep `MatchTeamCounters` in step with shots, substitutions and timeouts.
+
+See `apps.game_tracker.services.match_counters`. These run inside tracker
+commands too: unlike live revisions, counter updates are never coalesced.
+"""
+
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.game_tracker.models import (
+    MatchData,
+    PlayerChange,
+    PlayerGroup,
+    Shot,
+    Timeout,
+)
+from apps.game_tracker.services.match_counters import (
+    adjust_match_counters,
+    ensure_match_counters,
+    refresh_match_counters,
+)
+
+
+@receiver(post_save, sender=MatchData)
+def _match_data_counters_created(
+    sender: type[MatchData],
+    instance: MatchData,
+    created: bool,
+    **kwargs: object,
+) -> None:
+    del sender, kwargs
+    if created:
+        ensure_match_counters(instance)
+
+
+def _refresh(match_data_id: object) -> None:
+    match_data = MatchData.objects.filter(id_uuid=match_data_id).first()
+    if match_data is not None:
+        refresh_match_counters(match_data)
+
+
+@receiver(post_save, sender=Shot)
+def _shot_counters_saved(
+    sender: type[Shot],
+    instance: Shot,
+    created: bool,
+    **kwargs: object,
+) -> None:
+    del sender, kwargs
+    if not created:
+        # Edits may move the shot to another team or toggle `scored`.
+        _refresh(instance.match_data_id)
+        return
+    adjust_match_counters(
+        instance.match_data_id,
+        instance.team_id,
+        shots=1,
+        goals=int(instance.scored),
+    )
+
+
+@receiver(post_delete, sender=Shot)
+def _shot_counters_deleted(
+    sender: type[Shot],
+    instance: Shot,
+    **kwargs: object,
+) -> None:
+    del sender, kwargs
+    adjust_match_counters(
+        instance.match_data_id,
+        instance.team_id,
+        shots=-1,
+        goals=-int(instance.scored),
+    )
+
+
+def _substitution_team_id(instance: PlayerChange) -> object | None:
+    return (
+        PlayerGroup.objects
+        .filter(id_uuid=instance.player_group_id)
+        .values_list("team_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=PlayerChange)
+def _substitution_counters_saved(
+    sender: type[PlayerChange],
+    instance: PlayerChange,
+    created: bool,
+    **kwargs: object,
+) -> None:
+    del sender, kwargs
+    if not created:
+        _refresh(instance.match_data_id)
+        return
+    adjust_match_counters(
+        instance.match_data_id,
+        _substitution_team_id(instance),
+        substitutions=1,
+    )
+
+
+@receiver(post_delete, sender=PlayerChange)
+def _substitution_counters_deleted(
+    sender: type[PlayerChange],
+    instance: PlayerChange,
+    **kwargs: object,
+) -> None:
+    del sender, kwargs
+    # Cascading deletes remove substitutions before their player group.
+    adjust_match_counters(
+        instance.match_data_id,
+        _substitution_team_id(instance),
+        substitutions=-1,
+    )
+
+
+@receiver(post_save, sender=Timeout)
+def _timeout_counters_saved(
+    sender: type[Timeout],
+    instance: Timeout,
+    created: bool,
+    **kwargs: object,
+) -> None:
+    del sender, kwargs
+    if not created:
+        _refresh(instance.match_data_id)
+        return
+    adjust_match_counters(instance.match_data_id, instance.team_id, timeouts=1)
+
+
+@receiver(post_delete, sender=Timeout)
+def _timeout_counters_deleted(
+    sender: type[Timeout],
+    instance: Timeout,
+    **kwargs: object,
+) -> None:
+    del sender, kwargs
+    adjust_match_counters(instance.match_data_id, instance.team_id, timeouts=-1)
@@ -0,0 +1,44 @@
+"""Signal that records a match's stored status before it is saved.
+
+Several post_save receivers react to status transitions (a match finishing or
+being reopened). They read the previous status through
+`previous_match_status`, so a save costs one lookup instead of one per
+receiver.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from apps.game_tracker.models import MatchData
+
+
+@receiver(pre_save, sender=MatchData)
+def _remember_previous_match_status(
+    sender: type[MatchData],
+    instance: MatchData,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,
+) -> None:
+    """Record the stored status so post_save can spot status transitions."""
+    previous_status = None
+    if instance.pk:
+        if update_fields is not None and "status" not in update_fields:
+            # The save leaves the stored status alone.
+            previous_status = instance.status
+        else:
+            previous_status = (
+                MatchData.objects
+                .filter(pk=instance.pk)
+                .values_list("status", flat=True)
+                .first()
+            )
+    cast(Any, instance)._previous_match_status = previous_status
+
+
+def previous_match_status(instance: MatchData) -> str | None:
+    """Return the status stored before the save being handled (None if new)."""
+    return getattr(instance, "_previous_match_status", None)
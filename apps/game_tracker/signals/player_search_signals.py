@@ -0,0 +1,139 @@
+"""Signals that invalidate the match-player search index.
+
+The index (see `apps.game_tracker.services.player_search_index`) is scoped per
+club and season; roster and membership changes and user renames rebuild the
+affected clubs, player deletions rebuild every club. Generations are bumped
+after commit, so no request can index the old rows under the new generation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import partial
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.game_tracker.services.player_search_index import (
+    invalidate_player_search_index,
+)
+from apps.player.models import Player
+from apps.player.models.player_club_membership import PlayerClubMembership
+from apps.team.models import TeamData
+
+
+_SEARCHABLE_USER_FIELDS = frozenset({"username", "first_name", "last_name"})
+
+
+def _invalidate_after_commit(club_ids: Iterable[object] | None = None) -> None:
+    transaction.on_commit(
+        partial(
+            invalidate_player_search_index,
+            None if club_ids is None else list(club_ids),
+        ),
+    )
+
+
+def _club_ids_of_user(user: User) -> set[object]:
+    player_id = (
+        Player.objects.filter(user=user).values_list("id_uuid", flat=True).first()
+    )
+    if player_id is None:
+        return set()
+    return set(
+        TeamData.objects
+        .filter(Q(players=player_id) | Q(coach=player_id))
+        .values_list("team__club_id", flat=True)
+        .distinct()
+    ) | set(
+        PlayerClubMembership.objects
+        .filter(player_id=player_id)
+        .values_list("club_id", flat=True)
+        .distinct()
+    )
+
+
+@receiver(post_save, sender=TeamData)
+@receiver(post_delete, sender=TeamData)
+def _team_data_changed(
+    sender: type[TeamData],
+    instance: TeamData,
+    **kwargs: object,
+) -> None:
+    _invalidate_after_commit([instance.team.club_id])
+
+
+@receiver(m2m_changed, sender=TeamData.players.through)
+@receiver(m2m_changed, sender=TeamData.coach.through)
+def _team_data_members_changed(
+    sender: type[Any],
+    instance: TeamData | Player,
+    action: str,
+    reverse: bool,
+    pk_set: set[Any] | None,
+    **kwargs: object,
+) -> None:
+    if not reverse:
+        if action in {"post_add", "post_remove", "post_clear"}:
+            _invalidate_after_commit([instance.team.club_id])
+        return
+
+    # Reverse side: `instance` is a Player and `pk_set` holds TeamData ids. A
+    # reverse clear has no pk_set, so collect the teams before they are removed.
+    if action == "pre_clear":
+        team_data = (
+            instance.team_data_as_player
+            if sender is TeamData.players.through
+            else instance.team_data_as_coach
+        )
+        pk_set = set(team_data.values_list("pk", flat=True))
+    elif action not in {"post_add", "post_remove"}:
+        return
+    if pk_set:
+        _invalidate_after_commit(
+            TeamData.objects
+            .filter(pk__in=pk_set)
+            .values_list("team__club_id", flat=True)
+            .distinct(),
+        )
+
+
+@receiver(post_save, sender=PlayerClubMembership)
+@receiver(post_delete, sender=PlayerClubMembership)
+def _club_membership_changed(
+    sender: type[PlayerClubMembership],
+    instance: PlayerClubMembership,
+    **kwargs: object,
+) -> None:
+    _invalidate_after_commit([instance.club_id])
+
+
+@receiver(post_save, sender=User)
+def _user_renamed(
+    sender: type[User],
+    instance: User,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,
+) -> None:
+    # New users are not on any roster yet; logins only touch `last_login`.
+    if created or (
+        update_fields is not None and not update_fields & _SEARCHABLE_USER_FIELDS
+    ):
+        return
+    club_ids = _club_ids_of_user(instance)
+    if club_ids:
+        _invalidate_after_commit(club_ids)
+
+
+@receiver(post_delete, sender=Player)
+def _player_deleted(
+    sender: type[Player],
+    instance: Player,
+    **kwargs: object,
+) -> None:
+    _invalidate_after_commit()
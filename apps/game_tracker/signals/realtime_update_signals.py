@@ -42,6 +42,13 @@ SUBSTITUTE_RESOURCES = {
     LiveResource.IMPACTS,
 }
 PAUSE_RESOURCES = {LiveResource.LIVE, LiveResource.TRACKER, LiveResource.EVENTS}
+# MatchData fields written by `record_match_change` itself.
+_REVISION_BOOKKEEPING_FIELDS = {
+    "live_revision",
+    "live_changed_at",
+    "timeline_revision",
+    "timeline_base_revision",
+}
 
 
 def _record(
@@ -149,8 +156,6 @@ def _match_data_realtime_changed(
     **kwargs: object,
 ) -> None:
     del sender, kwargs
-    if created or (
-        update_fields and update_fields <= {"live_revision", "live_changed_at"}
-    ):
+    if created or (update_fields and update_fields <= _REVISION_BOOKKEEPING_FIELDS):
         return
     _record(instance, set(ALL_LIVE_RESOURCES))
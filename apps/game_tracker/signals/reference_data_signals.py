@@ -0,0 +1,32 @@
+"""Signals that invalidate the goal/group type registry.
+
+See `apps.game_tracker.services.reference_data`. This process drops its
+snapshot right away (its connection sees the change), but the shared
+generation is bumped after commit: bumping it earlier would let other
+workers reload the old rows and keep them until the next change.
+"""
+
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.game_tracker.models import GoalType, GroupType
+from apps.game_tracker.services.reference_data import (
+    clear_local_reference_data,
+    invalidate_reference_data,
+)
+
+
+@receiver(post_save, sender=GoalType)
+@receiver(post_delete, sender=GoalType)
+@receiver(post_save, sender=GroupType)
+@receiver(post_delete, sender=GroupType)
+def _reference_data_changed(
+    sender: type[GoalType | GroupType],
+    instance: GoalType | GroupType,
+    **kwargs: object,
+) -> None:
+    clear_local_reference_data()
+    transaction.on_commit(invalidate_reference_data)
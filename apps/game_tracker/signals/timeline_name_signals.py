@@ -0,0 +1,92 @@
+"""Signals that refresh stored match timelines after name changes.
+
+Timeline payloads (see `apps.game_tracker.services.match_timeline_projection`)
+embed player usernames and goal type names. Renames do not advance a match's
+live revision, so the affected projections are refreshed here.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from django.contrib.auth.models import User
+from django.db.models import Q
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from apps.game_tracker.models import GoalType, PlayerChange, Shot
+from apps.game_tracker.services.match_timeline_projection import (
+    refresh_match_timelines,
+)
+from apps.player.models import Player
+
+
+def _saves_field(update_fields: frozenset[str] | None, name: str) -> bool:
+    return update_fields is None or name in update_fields
+
+
+@receiver(pre_save, sender=User)
+def _remember_username_for_timelines(
+    sender: type[User],
+    instance: User,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,
+) -> None:
+    previous = None
+    if instance.pk and _saves_field(update_fields, "username"):
+        previous = (
+            User.objects
+            .filter(pk=instance.pk)
+            .values_list("username", flat=True)
+            .first()
+        )
+    cast(Any, instance)._previous_username_for_timelines = previous
+
+
+@receiver(post_save, sender=User)
+def _user_renamed_in_timelines(
+    sender: type[User],
+    instance: User,
+    created: bool,
+    **kwargs: object,
+) -> None:
+    previous = getattr(instance, "_previous_username_for_timelines", None)
+    if created or previous is None or previous == instance.username:
+        return
+    player_id = (
+        Player.objects.filter(user=instance).values_list("id_uuid", flat=True).first()
+    )
+    if player_id is None:
+        return
+    refresh_match_timelines(
+        set(
+            Shot.objects
+            .filter(player_id=player_id)
+            .values_list("match_data_id", flat=True)
+            .distinct()
+        )
+        | set(
+            PlayerChange.objects
+            .filter(Q(player_in_id=player_id) | Q(player_out_id=player_id))
+            .values_list("match_data_id", flat=True)
+            .distinct()
+        ),
+    )
+
+
+@receiver(post_save, sender=GoalType)
+def _goal_type_renamed_in_timelines(
+    sender: type[GoalType],
+    instance: GoalType,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,
+) -> None:
+    if created or not _saves_field(update_fields, "name"):
+        return
+    refresh_match_timelines(
+        Shot.objects
+        .filter(shot_type=instance)
+        .values_list("match_data_id", flat=True)
+        .distinct(),
+    )
@@ -9,8 +9,12 @@ from celery import shared_task
 from apps.game_tracker.models import MatchData
 from apps.game_tracker.services.match_impact import (
     persist_match_impact_rows_with_breakdowns,
+    persist_match_team_impact_features,
 )
 from apps.game_tracker.services.match_minutes import persist_match_minutes
+from apps.game_tracker.services.match_timeline_projection import (
+    rebuild_match_timeline,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -29,6 +33,9 @@ def recompute_match_impacts(self, match_data_id: str) -> dict[str, int | str]:
         return {"match_data_id": match_data_id, "rows": 0, "status": "not_found"}
 
     rows = persist_match_impact_rows_with_breakdowns(match_data=match_data)
+    if match_data.status == "finished":
+        # Weight fitting reads these instead of replaying finished matches.
+        persist_match_team_impact_features(match_data=match_data)
     logger.info("Recomputed match impacts for %s (%s rows)", match_data_id, rows)
     return {"match_data_id": match_data_id, "rows": rows, "status": "ok"}
 
@@ -48,3 +55,14 @@ def recompute_match_minutes(self, match_data_id: str) -> dict[str, int | str]:
     rows = persist_match_minutes(match_data=match_data)
     logger.info("Recomputed match minutes for %s (%s rows)", match_data_id, rows)
     return {"match_data_id": match_data_id, "rows": rows, "status": "ok"}
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def rebuild_match_timelines(self, match_data_ids: list[str]) -> dict[str, int]:
+    """Rebuild stored timelines that a user or goal type rename made stale."""
+    rebuilt = sum(
+        rebuild_match_timeline(MatchData(pk=match_data_id))
+        for match_data_id in match_data_ids
+    )
+    logger.info("Rebuilt %s of %s match timelines", rebuilt, len(match_data_ids))
+    return {"matches": len(match_data_ids), "rebuilt": rebuilt}
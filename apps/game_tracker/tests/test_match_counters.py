@@ -0,0 +1,112 @@
+"""Tests for the per-team match counters."""
+
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+import pytest
+
+from apps.game_tracker.models import MatchTeamCounters, PlayerChange, Shot, Timeout
+from apps.game_tracker.services.match_counters import (
+    TeamCounters,
+    count_match_counters,
+    match_counters,
+    reconcile_match_counters,
+)
+from apps.game_tracker.tests.tracker_test_helpers import (
+    create_group_types,
+    create_match_part,
+    create_player_group,
+    create_tracker_match,
+    create_tracker_player,
+)
+
+
+@pytest.mark.django_db
+def test_counters_follow_inserts_edits_and_deletes() -> None:
+    """Signals keep the stored counters equal to the event tables."""
+    tracker = create_tracker_match(prefix="Counters")
+    match_data = tracker.match_data
+    home_id, away_id = str(tracker.home_team.id_uuid), str(tracker.away_team.id_uuid)
+    part = create_match_part(match_data=match_data)
+    player = create_tracker_player(username="counters-player")
+    group = create_player_group(
+        match_data=match_data,
+        team=tracker.away_team,
+        group_type=create_group_types("Counters group")["Counters group"],
+    )
+
+    assert match_counters(match_data) == {
+        home_id: TeamCounters(),
+        away_id: TeamCounters(),
+    }
+
+    goal, _miss = (
+        Shot.objects.create(
+            match_data=match_data,
+            match_part=part,
+            player=player,
+            team=tracker.home_team,
+            scored=scored,
+            time=timezone.now(),
+        )
+        for scored in (True, False)
+    )
+    PlayerChange.objects.create(
+        match_data=match_data,
+        match_part=part,
+        player_group=group,
+        time=timezone.now(),
+    )
+    timeout = Timeout.objects.create(
+        match_data=match_data,
+        match_part=part,
+        team=tracker.away_team,
+    )
+    assert match_counters(match_data) == {
+        home_id: TeamCounters(goals=1, shots=2),
+        away_id: TeamCounters(substitutions=1, timeouts=1),
+    }
+
+    goal.team = tracker.away_team
+    goal.save()
+    timeout.delete()
+    assert match_counters(match_data) == {
+        home_id: TeamCounters(shots=1),
+        away_id: TeamCounters(goals=1, shots=1, substitutions=1),
+    }
+    assert match_counters(match_data) == count_match_counters(match_data)
+
+
+@pytest.mark.django_db
+def test_reconcile_reports_and_repairs_drift() -> None:
+    """Writes that bypass signals are found and fixed by reconciliation."""
+    tracker = create_tracker_match(prefix="Counters drift")
+    match_data = tracker.match_data
+    home_id = str(tracker.home_team.id_uuid)
+    Shot.objects.bulk_create([
+        Shot(
+            match_data=match_data,
+            player=create_tracker_player(username="counters-drift"),
+            team=tracker.home_team,
+            scored=True,
+            time=timezone.now(),
+        ),
+    ])
+    MatchTeamCounters.objects.filter(
+        match_data=match_data,
+        team=tracker.away_team,
+    ).delete()
+
+    mismatches = reconcile_match_counters(match_data)
+    assert set(mismatches) == {home_id, str(tracker.away_team.id_uuid)}
+    assert mismatches[home_id] == (TeamCounters(), TeamCounters(goals=1, shots=1))
+    assert match_counters(match_data) is None
+
+    out = StringIO()
+    call_command("reconcile_match_counters", "--fix", stdout=out)
+    assert "Fixed 1 of" in out.getvalue()
+    assert match_counters(match_data) == count_match_counters(match_data)
+    assert reconcile_match_counters(match_data) == {}
@@ -0,0 +1,30 @@
+"""Tests for the stored per-team impact features."""
+
+from __future__ import annotations
+
+import pytest
+
+from apps.game_tracker.models import TeamMatchImpactFeatures
+from apps.game_tracker.services.match_impact import (
+    compute_match_team_impact_features,
+    load_match_team_impact_features,
+    persist_match_team_impact_features,
+)
+from apps.game_tracker.tests.tracker_test_helpers import (
+    create_finished_match_with_shots,
+)
+
+
+@pytest.mark.django_db
+def test_stored_features_round_trip_and_respect_versions() -> None:
+    """Loaded features equal the computed ones; other versions are ignored."""
+    match_data = create_finished_match_with_shots(prefix="Impact features")
+    computed = compute_match_team_impact_features(match_data=match_data)
+
+    assert persist_match_team_impact_features(match_data=match_data) == computed
+    assert load_match_team_impact_features() == {str(match_data.id_uuid): computed}
+    assert load_match_team_impact_features(algorithm_version="v1") == {}
+
+    TeamMatchImpactFeatures.objects.update(feature_version=0)
+    assert load_match_team_impact_features() == {}
+
@@ -0,0 +1,184 @@
+"""Tests for the materialized events/shots timeline."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import timedelta
+from typing import Any
+
+from django.utils import timezone
+import pytest
+
+from apps.game_tracker.models import (
+    GoalType,
+    MatchData,
+    MatchLiveChange,
+    MatchTimelineEntry,
+    Pause,
+    Shot,
+)
+from apps.game_tracker.realtime.contracts import LiveResource
+from apps.game_tracker.services.match_timeline_payload import (
+    build_match_events,
+    build_match_shots,
+)
+from apps.game_tracker.services.match_timeline_projection import (
+    read_timeline,
+    read_timeline_delta,
+)
+from apps.game_tracker.tests.tracker_test_helpers import (
+    create_match_part,
+    create_tracker_match,
+    create_tracker_player,
+)
+
+
+@pytest.mark.django_db
+def test_projection_serves_builder_payloads_and_deltas() -> None:
+    """Stored rows match the builders; deltas report upserts and tombstones."""
+    tracker = create_tracker_match(prefix="Timeline rows")
+    part = create_match_part(
+        match_data=tracker.match_data,
+        start_offset=timedelta(minutes=-10),
+    )
+    player = create_tracker_player(username="timeline-rows")
+    goal_type = GoalType.objects.create(name="Timeline goal")
+    goal, miss = (
+        Shot.objects.create(
+            match_data=tracker.match_data,
+            match_part=part,
+            player=player,
+            team=tracker.home_team,
+            shot_type=goal_type,
+            scored=scored,
+            time=timezone.now() - timedelta(minutes=minutes),
+        )
+        for scored, minutes in ((True, 6), (False, 4))
+    )
+    match_data = MatchData.objects.get(pk=tracker.match_data.pk)
+
+    assert read_timeline(match_data, LiveResource.EVENTS) == build_match_events(
+        match_data,
+    )
+    assert read_timeline(match_data, LiveResource.SHOTS) == build_match_shots(
+        match_data,
+    )
+    since = match_data.live_revision
+    goal_id = str(goal.id_uuid)
+
+    goal.delete()
+    match_data.refresh_from_db()
+
+    events = read_timeline_delta(match_data, LiveResource.EVENTS, since_revision=since)
+    shots = read_timeline_delta(match_data, LiveResource.SHOTS, since_revision=since)
+    assert events is not None
+    assert shots is not None
+    assert (events.upsert, events.deleted_ids, events.order) == (
+        [],
+        [goal_id],
+        [],
+    )
+    assert shots.deleted_ids == [goal_id]
+    assert shots.order == [str(miss.id_uuid)]
+    assert MatchTimelineEntry.objects.filter(
+        match_data=match_data,
+        event_id=goal_id,
+        deleted=True,
+    ).count() == 2  # noqa: PLR2004
+
+    # Revisions from before the projection was built cannot be diffed.
+    assert (
+        read_timeline_delta(
+            match_data,
+            LiveResource.SHOTS,
+            since_revision=match_data.timeline_base_revision - 1,
+        )
+        is None
+    )
+
+
+@pytest.mark.django_db
+def test_pause_edits_republish_shifted_shot_times() -> None:
+    """A pause before a shot changes its minute, so the shots stream changes."""
+    tracker = create_tracker_match(prefix="Timeline pause")
+    part = create_match_part(
+        match_data=tracker.match_data,
+        start_offset=timedelta(minutes=-20),
+    )
+    now = timezone.now()
+    shot = Shot.objects.create(
+        match_data=tracker.match_data,
+        match_part=part,
+        player=create_tracker_player(username="timeline-pause"),
+        team=tracker.home_team,
+        scored=False,
+        time=now - timedelta(minutes=1),
+    )
+    match_data = MatchData.objects.get(pk=tracker.match_data.pk)
+    since = match_data.live_revision
+
+    Pause.objects.create(
+        match_data=match_data,
+        match_part=part,
+        start_time=now - timedelta(minutes=15),
+        end_time=now - timedelta(minutes=5),
+        active=False,
+    )
+    match_data.refresh_from_db()
+
+    change = MatchLiveChange.objects.get(
+        match_data=match_data,
+        revision=match_data.live_revision,
+    )
+    assert LiveResource.SHOTS.value in change.resources
+    assert change.changed_ids[LiveResource.SHOTS.value] == [str(shot.id_uuid)]
+    delta = read_timeline_delta(match_data, LiveResource.SHOTS, since_revision=since)
+    assert delta is not None
+    assert [item["time"] for item in delta.upsert] == ["9"]
+    assert build_match_shots(match_data)[0]["time"] == "9"
+
+
+@pytest.mark.django_db
+def test_renames_refresh_stored_timelines(
+    django_capture_on_commit_callbacks: Callable[..., AbstractContextManager[Any]],
+) -> None:
+    """User and goal type renames reach the stored payloads of past matches."""
+    tracker = create_tracker_match(prefix="Timeline rename")
+    part = create_match_part(
+        match_data=tracker.match_data,
+        start_offset=timedelta(minutes=-10),
+    )
+    player = create_tracker_player(username="timeline-old")
+    goal_type = GoalType.objects.create(name="Old goal")
+    Shot.objects.create(
+        match_data=tracker.match_data,
+        match_part=part,
+        player=player,
+        team=tracker.home_team,
+        shot_type=goal_type,
+        scored=True,
+        time=timezone.now() - timedelta(minutes=5),
+    )
+    match_data = MatchData.objects.get(pk=tracker.match_data.pk)
+    assert read_timeline(match_data, LiveResource.EVENTS) is not None
+
+    with django_capture_on_commit_callbacks(execute=True):
+        player.user.username = "timeline-new"
+        player.user.save()
+        match_data.refresh_from_db()
+        # Until the rebuild, reads fall back to the builders.
+        assert read_timeline(match_data, LiveResource.EVENTS) is None
+    with django_capture_on_commit_callbacks(execute=True):
+        goal_type.name = "New goal"
+        goal_type.save(update_fields=["name"])
+
+    match_data.refresh_from_db()
+    events = read_timeline(match_data, LiveResource.EVENTS)
+    assert events == build_match_events(match_data)
+    assert [(event["player"], event["goal_type"]) for event in events] == [
+        ("timeline-new", "New goal"),
+    ]
+    shots = read_timeline(match_data, LiveResource.SHOTS)
+    assert shots is not None
+    assert shots[0]["player"] == "timeline-new"
@@ -0,0 +1,180 @@
+"""Tests for the cached per-club match-player search index."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import timedelta
+from typing import Any, cast
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+import pytest
+
+from apps.club.models import Club
+from apps.game_tracker.services.player_search import player_name_match_score
+from apps.game_tracker.services.player_search_index import (
+    build_player_search_index,
+    clear_local_player_search_indexes,
+    get_player_search_index,
+)
+from apps.player.models import Player, PlayerClubMembership
+from apps.schedule.models import Season
+from apps.team.models import Team, TeamData
+
+
+@pytest.fixture(autouse=True)
+def _reset_indexes() -> None:
+    cache.clear()
+    clear_local_player_search_indexes()
+
+
+def _player(username: str, first_name: str = "", last_name: str = "") -> Player:
+    user = get_user_model().objects.create_user(
+        username=username,
+        password="pw",
+        first_name=first_name,
+        last_name=last_name,
+    )
+    return cast(Player, cast(Any, user).player)
+
+
+def _season() -> Season:
+    return Season.objects.create(
+        name="2025 Season",
+        start_date=timezone.localdate(),
+        end_date=timezone.localdate() + timedelta(days=365),
+    )
+
+
+@pytest.mark.django_db
+def test_index_ranks_like_player_name_match_score() -> None:
+    """Scores and ordering match the per-player scoring function."""
+    club = Club.objects.create(name="Index Club")
+    season = _season()
+    names = [
+        ("joelle_17", "Joëlle", "van Dijk"),
+        ("Daan", "Daan", "de Vries"),
+        ("joele", "", ""),
+        ("jan", "Jan", "Jansen"),
+        ("dijkstra", "Sanne", "Dijkstra"),
+    ]
+    for username, first_name, last_name in names:
+        PlayerClubMembership.objects.create(
+            player=_player(username, first_name, last_name),
+            club=club,
+        )
+    index = build_player_search_index(club_id=str(club.pk), season_id=str(season.pk))
+
+    for query in ("joelle", "joele", "dijk", "jan", "daan vries", "jaen"):
+        expected = sorted(
+            (
+                (score, username.casefold())
+                for username, first_name, last_name in names
+                if (
+                    score := player_name_match_score(
+                        query,
+                        username=username,
+                        first_name=first_name,
+                        last_name=last_name,
+                    )
+                )
+                is not None
+            ),
+        )
+        found = index.search(query, match_date=timezone.localdate())
+        assert [entry.username.casefold() for entry in found] == [
+            username for _, username in expected
+        ], query
+
+
+@pytest.mark.django_db
+def test_index_applies_membership_dates_roster_exclusions_and_limit() -> None:
+    """Eligibility is checked per match date; excluded ids and limit apply."""
+    club = Club.objects.create(name="Index Club")
+    season = _season()
+    today = timezone.localdate()
+    former = _player("sam_former")
+    PlayerClubMembership.objects.create(
+        player=former,
+        club=club,
+        start_date=today - timedelta(days=30),
+        end_date=today - timedelta(days=10),
+    )
+    rostered = _player("sam_roster")
+    team_data = TeamData.objects.create(
+        team=Team.objects.create(name="Team", club=club),
+        season=season,
+    )
+    team_data.players.add(rostered)
+    grouped = _player("sam_grouped")
+    PlayerClubMembership.objects.create(player=grouped, club=club)
+
+    index = build_player_search_index(club_id=str(club.pk), season_id=str(season.pk))
+
+    def usernames(**kwargs: Any) -> list[str]:
+        return [entry.username for entry in index.search("sam", **kwargs)]
+
+    assert usernames(match_date=today) == ["sam_grouped", "sam_roster"]
+    assert usernames(match_date=today - timedelta(days=20)) == [
+        "sam_former",
+        "sam_roster",
+    ]
+    assert usernames(match_date=today, exclude_ids={str(grouped.pk)}) == [
+        "sam_roster",
+    ]
+    assert usernames(match_date=today, limit=1) == ["sam_grouped"]
+
+
+@pytest.mark.django_db
+def test_cached_index_is_reused_and_rebuilt_after_changes(
+    django_assert_num_queries: Callable[[int], AbstractContextManager[None]],
+    django_capture_on_commit_callbacks: Callable[..., AbstractContextManager[Any]],
+) -> None:
+    """Warm lookups skip the database; roster and name changes rebuild."""
+    club = Club.objects.create(name="Index Club")
+    season = _season()
+    first = get_player_search_index(club_id=club.pk, season_id=season.pk)
+    assert first.entries == ()
+
+    with django_assert_num_queries(0):
+        assert get_player_search_index(club_id=club.pk, season_id=season.pk) is first
+    clear_local_player_search_indexes()
+    with django_assert_num_queries(0):
+        shared = get_player_search_index(club_id=club.pk, season_id=season.pk)
+    assert shared.entries == first.entries
+
+    player = _player("newcomer")
+    with django_capture_on_commit_callbacks(execute=True):
+        PlayerClubMembership.objects.create(player=player, club=club)
+    rebuilt = get_player_search_index(club_id=club.pk, season_id=season.pk)
+    assert [entry.username for entry in rebuilt.entries] == ["newcomer"]
+    clear_local_player_search_indexes()
+    shared = get_player_search_index(club_id=club.pk, season_id=season.pk)
+    assert shared.search("newcom", match_date=timezone.localdate())
+
+    other_club = Club.objects.create(name="Other Club")
+    other = get_player_search_index(club_id=other_club.pk, season_id=season.pk)
+    user = cast(Any, player).user
+    user.username = "renamed"
+    with django_capture_on_commit_callbacks() as callbacks:
+        user.save()
+    # The generation only moves once the rename is committed.
+    clear_local_player_search_indexes()
+    assert get_player_search_index(club_id=club.pk, season_id=season.pk).entries == (
+        shared.entries
+    )
+    for callback in callbacks:
+        callback()
+    clear_local_player_search_indexes()
+    renamed = get_player_search_index(club_id=club.pk, season_id=season.pk)
+    assert [entry.username for entry in renamed.entries] == ["renamed"]
+    assert renamed.search("renam", match_date=timezone.localdate())
+    # Clubs the player does not belong to keep their index.
+    with django_assert_num_queries(0):
+        assert (
+            get_player_search_index(club_id=other_club.pk, season_id=season.pk)
+            .entries
+            == other.entries
+        )
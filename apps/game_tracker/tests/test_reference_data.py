@@ -0,0 +1,72 @@
+"""Tests for the process-wide goal/group type registry."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from typing import Any
+
+from django.core.cache import cache
+import pytest
+
+from apps.game_tracker.models import GoalType, GroupType
+from apps.game_tracker.services.reference_data import (
+    _GENERATION_KEY,
+    clear_local_reference_data,
+    reference_data,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry() -> None:
+    cache.clear()
+    clear_local_reference_data()
+
+
+@pytest.mark.django_db
+def test_registry_is_reused_until_a_type_changes(
+    django_assert_num_queries: Callable[[int], AbstractContextManager[None]],
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
+    """Warm lookups skip the database; saves and deletes reload the snapshot."""
+    attack = GroupType.objects.create(name="Aanval", order=1)
+    GroupType.objects.create(name="Reserve", order=3)
+    GoalType.objects.create(name="Schot")
+
+    with django_assert_num_queries(2):
+        first = reference_data()
+    with django_assert_num_queries(0):
+        assert reference_data() is first
+    assert first.group_type_id("Aanval") == attack.id_uuid
+    assert first.group_type(attack.id_uuid) is not None
+    assert [goal_type.name for goal_type in first.goal_types] == ["Schot"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        GoalType.objects.create(name="Doorloopbal")
+        attack.delete()
+    reloaded = reference_data()
+    assert [goal_type.name for goal_type in reloaded.goal_types] == [
+        "Doorloopbal",
+        "Schot",
+    ]
+    assert reloaded.group_type_id("Aanval") is None
+    assert [group_type.name for group_type in reloaded.group_types] == ["Reserve"]
+
+
+@pytest.mark.django_db
+def test_registry_is_invalidated_only_after_commit(
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
+    """Other workers must not reload the snapshot before the change commits."""
+    GoalType.objects.create(name="Schot")
+    generation = reference_data().generation
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        GoalType.objects.create(name="Doorloopbal")
+        # This process already sees the new row; the shared token waits.
+        assert len(reference_data().goal_types) == 2  # noqa: PLR2004
+        assert cache.get(_GENERATION_KEY) == generation
+
+    assert len(callbacks) == 1
+    callbacks[0]()
+    assert cache.get(_GENERATION_KEY) != generation
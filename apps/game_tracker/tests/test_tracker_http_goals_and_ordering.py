@@ -4,11 +4,21 @@
 from datetime import UTC, datetime, timedelta
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 import pytest
 
 from apps.club.models import Club
-from apps.game_tracker.models import GoalType, MatchData, MatchPart
+from apps.game_tracker.models import (
+    Attack,
+    GoalType,
+    MatchData,
+    MatchPart,
+    Pause,
+    Shot,
+)
+from apps.game_tracker.services import tracker_http
 from apps.game_tracker.services.tracker_http import (
     TrackerCommandError,
     apply_tracker_command,
@@ -17,8 +27,10 @@ from apps.game_tracker.services.tracker_http import (
 from apps.game_tracker.tests.tracker_test_helpers import (
     TEST_PASSWORD,
     create_group_types,
+    create_match_part,
     create_player_group,
     create_tracker_match,
+    create_tracker_player,
 )
 from apps.schedule.models import Match, Season
 from apps.team.models import Team
@@ -293,6 +305,45 @@ def test_client_time_keeps_last_event_order_stable() -> None:
     assert state["last_event"]["time_iso"] == late.isoformat()
 
 
+@pytest.mark.django_db
+def test_last_event_is_found_with_one_union_query() -> None:
+    tracker = create_tracker_match(prefix="Last Event Union")
+    match_data = tracker.match_data
+    part = create_match_part(match_data=match_data)
+    now = timezone.now()
+    Shot.objects.create(
+        match_data=match_data,
+        match_part=part,
+        player=create_tracker_player(username="last_event_union"),
+        team=tracker.home_team,
+        scored=False,
+        time=now - timedelta(seconds=5),
+    )
+    pause = Pause.objects.create(
+        match_data=match_data,
+        match_part=part,
+        start_time=now,
+        end_time=now + timedelta(seconds=30),
+        active=False,
+    )
+    attack = Attack.objects.create(
+        match_data=match_data,
+        team=tracker.home_team,
+        time=now,
+    )
+    get_last_event_model = tracker_http._get_last_event_model  # noqa: SLF001
+
+    # The union picks the winner; a second query loads it for serialization.
+    with CaptureQueriesContext(connection) as queries:
+        event = get_last_event_model(match_data)
+    assert len(queries) == 2  # noqa: PLR2004
+    # Attacks win ties with pauses, as they are listed later.
+    assert event == attack
+
+    attack.delete()
+    assert get_last_event_model(match_data) == pause
+
+
 @pytest.mark.django_db
 def test_goal_registration_rejects_player_outside_match_roster() -> None:
     tracker = create_tracker_match(prefix="Roster Boundary")
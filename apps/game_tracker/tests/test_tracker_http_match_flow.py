@@ -10,6 +10,7 @@ import pytest
 
 from apps.club.models import Club
 from apps.game_tracker.models import MatchData, MatchPart, Pause, Timeout
+from apps.game_tracker.services.match_counters import refresh_match_counters
 from apps.game_tracker.services.tracker_http import (
     TrackerCommandError,
     apply_tracker_command,
@@ -304,6 +305,8 @@ def test_timeout_command_enforces_maximum_for_each_team() -> None:
         Timeout(match_data=match_data, match_part=part, team=tracker.home_team),
         Timeout(match_data=match_data, match_part=part, team=tracker.home_team),
     ])
+    # `bulk_create` skips the signals that maintain the per-team counters.
+    refresh_match_counters(match_data)
 
     with pytest.raises(TrackerCommandError) as exc:
         apply_tracker_command(
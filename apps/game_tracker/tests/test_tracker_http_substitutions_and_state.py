@@ -4,13 +4,16 @@
 from datetime import UTC, datetime, timedelta
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import connection
 from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 import pytest
+from pytest_django.fixtures import SettingsWrapper
 
 from apps.club.models import Club
-from apps.game_tracker.models import MatchData, MatchPart, PlayerChange
+from apps.game_tracker.models import MatchData, MatchPart, PlayerChange, Shot
+from apps.game_tracker.services import tracker_http
 from apps.game_tracker.services.tracker_http import (
     TrackerCommandError,
     apply_tracker_command,
@@ -342,6 +345,8 @@ def test_get_tracker_state_query_count_does_not_scale_with_players() -> None:
     defense_group.players.add(create_tracker_player(username="state_defense_1"))
     reserve_group.players.add(create_tracker_player(username="state_reserve_1"))
 
+    # The first call loads the goal/group type registry once per process.
+    get_tracker_state(tracker.match, team=tracker.home_team)
     with CaptureQueriesContext(connection) as baseline_queries:
         get_tracker_state(tracker.match, team=tracker.home_team)
 
@@ -360,3 +365,58 @@ def test_get_tracker_state_query_count_does_not_scale_with_players() -> None:
         get_tracker_state(tracker.match, team=tracker.home_team)
 
     assert len(expanded_queries) == len(baseline_queries)
+
+
+@pytest.mark.django_db
+def test_tracker_state_projects_both_teams_from_one_facts_load(
+    settings: SettingsWrapper,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings.KORFBAL_TRACKER_FACTS_TTL_S = 60
+    cache.clear()
+    tracker = create_tracker_match(prefix="State Facts")
+    tracker.match_data.status = "active"
+    tracker.match_data.save(update_fields=["status"])
+    part = create_match_part(match_data=tracker.match_data, part_number=1)
+    scorer = create_tracker_player(username="state_facts_scorer")
+    Shot.objects.create(
+        match_data=tracker.match_data,
+        match_part=part,
+        player=scorer,
+        team=tracker.home_team,
+        scored=True,
+        time=timezone.now(),
+    )
+
+    loads: list[int] = []
+    load_tracker_facts = tracker_http._load_tracker_facts  # noqa: SLF001
+
+    def counting_load(*args: object) -> tracker_http.TrackerFacts:
+        loads.append(1)
+        return load_tracker_facts(*args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(tracker_http, "_load_tracker_facts", counting_load)
+
+    home_state = get_tracker_state(tracker.match, team=tracker.home_team)
+    away_state = get_tracker_state(tracker.match, team=tracker.away_team)
+
+    assert len(loads) == 1
+    assert home_state["score"] == {"for": 1, "against": 0}
+    assert away_state["score"] == {"for": 0, "against": 1}
+    assert home_state["last_event"]["for_team"] is True
+    assert away_state["last_event"]["for_team"] is False
+
+    # A write advances the live revision, so the next read loads fresh facts.
+    Shot.objects.create(
+        match_data=tracker.match_data,
+        match_part=part,
+        player=scorer,
+        team=tracker.away_team,
+        scored=True,
+        time=timezone.now(),
+    )
+    away_state = get_tracker_state(tracker.match, team=tracker.away_team)
+
+    assert len(loads) == 2  # noqa: PLR2004
+    assert away_state["score"] == {"for": 1, "against": 1}
+    cache.clear()
@@ -11,7 +11,13 @@ from django.contrib.auth.base_user import AbstractBaseUser
 from django.utils import timezone
 
 from apps.club.models import Club
-from apps.game_tracker.models import GroupType, MatchData, MatchPart, PlayerGroup
+from apps.game_tracker.models import (
+    GroupType,
+    MatchData,
+    MatchPart,
+    PlayerGroup,
+    Shot,
+)
 from apps.player.models import Player
 from apps.schedule.models import Match, Season
 from apps.team.models import Team
@@ -118,3 +124,29 @@ def create_match_part(
         end_time=end_time,
         active=active,
     )
+
+
+def create_finished_match_with_shots(*, prefix: str) -> MatchData:
+    """Create a finished 1-0 match with a home goal and a home miss."""
+    tracker = create_tracker_match(prefix=prefix)
+    part = create_match_part(
+        match_data=tracker.match_data,
+        start_offset=timedelta(minutes=-20),
+    )
+    player = create_tracker_player(username=f"{prefix} shooter")
+    for scored, minutes in ((True, 15), (False, 10)):
+        Shot.objects.create(
+            match_data=tracker.match_data,
+            match_part=part,
+            player=player,
+            team=tracker.home_team,
+            scored=scored,
+            time=timezone.now() - timedelta(minutes=minutes),
+        )
+    match_data = MatchData.objects.select_related("match_link").get(
+        pk=tracker.match_data.pk,
+    )
+    match_data.status = "finished"
+    match_data.home_score = 1
+    match_data.save(update_fields=["status", "home_score"])
+    return match_data
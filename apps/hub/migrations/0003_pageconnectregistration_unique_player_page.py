@@ -0,0 +1,54 @@
+"""Make page registrations unique per (player, page) for bulk upserts."""
+
+from __future__ import annotations
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.utils.timezone
+
+
+def remove_duplicate_registrations(apps, schema_editor) -> None:
+    """Keep only the most recent registration per (player, page)."""
+    del schema_editor
+    PageConnectRegistration = apps.get_model("hub", "PageConnectRegistration")
+
+    duplicate_keys = (
+        PageConnectRegistration.objects.values("player_id", "page")
+        .annotate(row_count=Count("id_uuid"))
+        .filter(row_count__gt=1)
+    )
+    for key in list(duplicate_keys):
+        rows = list(
+            PageConnectRegistration.objects.filter(
+                player_id=key["player_id"],
+                page=key["page"],
+            ).order_by("-registration_date", "-id_uuid")
+        )
+        PageConnectRegistration.objects.filter(
+            id_uuid__in=[row.id_uuid for row in rows[1:]]
+        ).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hub", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="pageconnectregistration",
+            name="registration_date",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(
+            remove_duplicate_registrations,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="pageconnectregistration",
+            constraint=models.UniqueConstraint(
+                fields=("player", "page"),
+                name="unique_page_connect_registration_per_player_page",
+            ),
+        ),
+    ]
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from bg_uuidv7 import uuidv7
 from django.db import models
+from django.utils import timezone
 
 from .constants import player_model_string
 
@@ -25,10 +26,21 @@ class PageConnectRegistration(models.Model):
         related_name="page_connect_registrations",
     )
     page: models.CharField[str, str] = models.CharField(max_length=255)
+    # Time of the most recent (buffered) visit; see `apps.hub.services.page_visits`.
     registration_date: models.DateTimeField[datetime, datetime] = models.DateTimeField(
-        auto_now_add=True
+        default=timezone.now,
     )
 
+    class Meta:
+        """Meta options."""
+
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(
+                fields=["player", "page"],
+                name="unique_page_connect_registration_per_player_page",
+            ),
+        ]
+
     def __str__(self) -> str:
         """Return the string representation of the page connect registration.
 
@@ -0,0 +1 @@
+"""Service layer helpers for the hub app."""
@@ -0,0 +1,269 @@
+"""Buffered page-visit tracking.
+
+`VisitorTrackingMiddleware` used to look up the player and upsert a
+`PageConnectRegistration` row on every authenticated request. Visits are now
+collected in a per-process buffer instead:
+
+- paths are normalized (UUID and numeric segments become `{id}`) and a flush
+  window only tracks `KORFBAL_PAGE_VISIT_MAX_PATHS` distinct pages;
+- `KORFBAL_PAGE_VISIT_SAMPLE_PERCENT` of the visits is recorded;
+- repeated (user, page) visits within one flush window collapse into one row;
+- every `KORFBAL_PAGE_VISIT_FLUSH_INTERVAL_S` (or `KORFBAL_PAGE_VISIT_BATCH_SIZE`
+  buffered pairs) the batch is handed to the `flush_page_visits` Celery task,
+  which writes it with one bulk upsert. A timer thread flushes a window that
+  no later visit closes, and the buffer is flushed when the process exits.
+- Batches are sent from a background thread without broker retries, so a
+  slow or unavailable broker never holds up a request. A batch that cannot be
+  sent goes back into the buffer and is retried one interval later; while the
+  broker stays down, the buffer keeps at most a batch worth of visits.
+
+Visits buffered in a process that is killed before its next flush are lost;
+the table only tracks the most recent visit per page, so that is acceptable.
+"""
+
+from __future__ import annotations
+
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+import random
+import re
+import threading
+import time
+from typing import Final
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.hub.models import PageConnectRegistration
+from apps.player.models import Player
+
+
+logger = logging.getLogger(__name__)
+
+ID_PLACEHOLDER: Final[str] = "{id}"
+_PAGE_MAX_LENGTH: Final[int] = PageConnectRegistration._meta.get_field(
+    "page",
+).max_length or 255
+_ID_SEGMENT_RE: Final[re.Pattern[str]] = re.compile(
+    r"^(?:\d+|[0-9a-fA-F]{32}|[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12})$",
+)
+
+PageVisit = tuple[int, str, str]
+"""Serialized visit: (user id, normalized page, ISO timestamp)."""
+
+
+@dataclass(slots=True)
+class _VisitBuffer:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    visits: dict[tuple[int, str], datetime] = field(default_factory=dict)
+    pages: set[str] = field(default_factory=set)
+    window_started: float = field(default_factory=time.monotonic)
+    retry_at: float = 0.0
+    timer: threading.Timer | None = None
+
+
+_buffer = _VisitBuffer()
+_sender = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-visit-flush")
+
+
+def _setting(name: str, default: int) -> int:
+    return int(getattr(settings, name, default))
+
+
+def normalize_page(path: str) -> str:
+    """Return `path` with identifier segments replaced by `{id}`."""
+    segments = [
+        ID_PLACEHOLDER if _ID_SEGMENT_RE.match(segment) else segment
+        for segment in path.split("/")
+    ]
+    return "/".join(segments)[:_PAGE_MAX_LENGTH]
+
+
+def record_page_visit(*, user_id: int, path: str) -> None:
+    """Buffer one page visit; hand the batch off when the window is over."""
+    sample_percent = _setting("KORFBAL_PAGE_VISIT_SAMPLE_PERCENT", 100)
+    if sample_percent <= 0:
+        return
+    if sample_percent < 100 and random.randrange(100) >= sample_percent:  # noqa: S311, PLR2004
+        return
+
+    page = normalize_page(path)
+    max_paths = _setting("KORFBAL_PAGE_VISIT_MAX_PATHS", 1000)
+    batch_size = _setting("KORFBAL_PAGE_VISIT_BATCH_SIZE", 500)
+    with _buffer.lock:
+        if page not in _buffer.pages:
+            if len(_buffer.pages) >= max_paths:
+                return
+            _buffer.pages.add(page)
+        key = (user_id, page)
+        if key not in _buffer.visits and len(_buffer.visits) >= batch_size:
+            # Only while sending is backing off; otherwise the batch is due.
+            return
+        _buffer.visits[key] = timezone.now()
+        batch = _take_batch_if_due()
+        if not batch:
+            _start_timer()
+
+    if batch:
+        _enqueue_flush(batch)
+
+
+def _take_batch_if_due() -> list[PageVisit]:
+    interval_s = _setting("KORFBAL_PAGE_VISIT_FLUSH_INTERVAL_S", 30)
+    batch_size = _setting("KORFBAL_PAGE_VISIT_BATCH_SIZE", 500)
+    now = time.monotonic()
+    if now < _buffer.retry_at:
+        return []
+    elapsed = now - _buffer.window_started
+    if elapsed < interval_s and len(_buffer.visits) < batch_size:
+        return []
+    return _take_batch()
+
+
+def _take_batch() -> list[PageVisit]:
+    batch = [
+        (user_id, page, visited_at.isoformat())
+        for (user_id, page), visited_at in _buffer.visits.items()
+    ]
+    _buffer.visits = {}
+    _buffer.pages = set()
+    _buffer.window_started = time.monotonic()
+    return batch
+
+
+def flush_buffered_visits() -> int:
+    """Hand every buffered visit to the flush task right away.
+
+    Returns:
+        int: Number of buffered (user, page) pairs.
+
+    """
+    with _buffer.lock:
+        batch = _take_batch()
+    if batch:
+        _enqueue_flush(batch)
+    return len(batch)
+
+
+def _start_timer() -> None:
+    # Called with the lock held.
+    if _buffer.timer is not None or not _buffer.visits:
+        return
+    interval_s = max(1, _setting("KORFBAL_PAGE_VISIT_FLUSH_INTERVAL_S", 30))
+    timer = threading.Timer(interval_s, _on_timer)
+    timer.daemon = True
+    try:
+        timer.start()
+    except RuntimeError:
+        # No new threads during interpreter shutdown; `_flush_at_exit` runs.
+        return
+    _buffer.timer = timer
+
+
+def _on_timer() -> None:
+    with _buffer.lock:
+        _buffer.timer = None
+        batch = _take_batch_if_due()
+        if not batch:
+            _start_timer()
+    if batch:
+        _enqueue_flush(batch)
+
+
+def _enqueue_flush(batch: list[PageVisit]) -> None:
+    try:
+        _sender.submit(_send, batch)
+    except RuntimeError:
+        # The interpreter is shutting down; `_flush_at_exit` sends it.
+        _restore(batch)
+
+
+def _send(batch: list[PageVisit]) -> None:
+    from apps.hub.tasks import flush_page_visits
+
+    try:
+        # No publish retries: an unreachable broker fails fast.
+        flush_page_visits.apply_async(args=(batch,), retry=False)
+    except Exception:
+        logger.warning(
+            "Could not enqueue %s page visits; retrying later",
+            len(batch),
+            exc_info=True,
+        )
+        _restore(batch)
+
+
+def _restore(batch: list[PageVisit]) -> None:
+    interval_s = max(1, _setting("KORFBAL_PAGE_VISIT_FLUSH_INTERVAL_S", 30))
+    batch_size = _setting("KORFBAL_PAGE_VISIT_BATCH_SIZE", 500)
+    dropped = 0
+    with _buffer.lock:
+        for user_id, page, visited_at in batch:
+            key = (user_id, page)
+            moment = datetime.fromisoformat(visited_at)
+            current = _buffer.visits.get(key)
+            if current is None and len(_buffer.visits) >= batch_size:
+                dropped += 1
+            elif current is None or current < moment:
+                _buffer.visits[key] = moment
+                _buffer.pages.add(page)
+        _buffer.retry_at = time.monotonic() + interval_s
+        _start_timer()
+    if dropped:
+        logger.warning("Dropped %s buffered page visits", dropped)
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    with _buffer.lock:
+        if _buffer.timer is not None:
+            _buffer.timer.cancel()
+            _buffer.timer = None
+        batch = _take_batch()
+    if batch:
+        _send(batch)
+
+
+def write_page_visits(visits: list[PageVisit]) -> int:
+    """Upsert the latest visit per (player, page) in one statement.
+
+    Users without a player are skipped.
+
+    Returns:
+        int: Number of rows inserted or updated.
+
+    """
+    user_ids = {user_id for user_id, _page, _visited_at in visits}
+    player_ids = dict(
+        Player.objects.filter(user_id__in=user_ids).values_list("user_id", "id_uuid"),
+    )
+    latest: dict[tuple[object, str], datetime] = {}
+    for user_id, page, visited_at in visits:
+        player_id = player_ids.get(user_id)
+        if player_id is None:
+            continue
+        moment = datetime.fromisoformat(visited_at)
+        key = (player_id, page)
+        if key not in latest or latest[key] < moment:
+            latest[key] = moment
+
+    rows = [
+        PageConnectRegistration(
+            player_id=player_id,
+            page=page,
+            registration_date=visited_at,
+        )
+        for (player_id, page), visited_at in latest.items()
+    ]
+    if not rows:
+        return 0
+    PageConnectRegistration.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["player", "page"],
+        update_fields=["registration_date"],
+    )
+    return len(rows)
@@ -0,0 +1,15 @@
+"""Celery tasks for the hub app."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from celery import shared_task
+
+from apps.hub.services.page_visits import PageVisit, write_page_visits
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def flush_page_visits(self: Any, visits: list[PageVisit]) -> int:
+    """Write one batch of buffered page visits."""
+    return write_page_visits([tuple(visit) for visit in visits])
@@ -0,0 +1,214 @@
+"""Tests for buffered page-visit tracking."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.cache import SessionStore
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+from django.utils import timezone
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from apps.hub.models import PageConnectRegistration
+from apps.hub.services import page_visits
+from apps.hub.tasks import flush_page_visits
+from apps.kwt_common.middleware.visitor_tracking import VisitorTrackingMiddleware
+from apps.player.models import Player
+
+
+TEST_PASSWORD = "pass1234"  # nosec B105 - test credential constant
+MATCH_ID = "0192b7c4-5f5e-7c3a-9a51-3f0a8d2e4b11"
+
+
+@pytest.fixture
+def flushed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[list[list[page_visits.PageVisit]]]:
+    """Capture batches instead of sending them to Celery."""
+    batches: list[list[page_visits.PageVisit]] = []
+    buffer = page_visits._VisitBuffer()
+    monkeypatch.setattr(page_visits, "_buffer", buffer)
+    monkeypatch.setattr(page_visits, "_enqueue_flush", batches.append)
+    yield batches
+    if buffer.timer is not None:
+        buffer.timer.cancel()
+
+
+def test_normalize_page_collapses_identifier_segments() -> None:
+    """UUID and numeric segments must not create a page per object."""
+    assert (
+        page_visits.normalize_page(f"/api/matches/{MATCH_ID}/mvp/")
+        == "/api/matches/{id}/mvp/"
+    )
+    assert page_visits.normalize_page("/api/players/42/") == "/api/players/{id}/"
+    assert page_visits.normalize_page("/api/matches/upcoming/") == (
+        "/api/matches/upcoming/"
+    )
+
+
+def test_visits_are_deduplicated_and_capped_per_window(
+    settings: SettingsWrapper,
+    flushed: list[list[page_visits.PageVisit]],
+) -> None:
+    """Repeated visits collapse; pages beyond the cap are not tracked."""
+    settings.KORFBAL_PAGE_VISIT_FLUSH_INTERVAL_S = 3600
+    settings.KORFBAL_PAGE_VISIT_BATCH_SIZE = 1000
+    settings.KORFBAL_PAGE_VISIT_MAX_PATHS = 2
+    settings.KORFBAL_PAGE_VISIT_SAMPLE_PERCENT = 100
+
+    for _ in range(5):
+        page_visits.record_page_visit(user_id=1, path=f"/api/matches/{MATCH_ID}/")
+    page_visits.record_page_visit(user_id=2, path="/api/matches/42/")
+    page_visits.record_page_visit(user_id=1, path="/api/teams/")
+    page_visits.record_page_visit(user_id=1, path="/api/clubs/")
+    assert flushed == []
+
+    assert page_visits.flush_buffered_visits() == 3  # noqa: PLR2004
+    assert sorted((user_id, page) for user_id, page, _at in flushed[0]) == [
+        (1, "/api/matches/{id}/"),
+        (1, "/api/teams/"),
+        (2, "/api/matches/{id}/"),
+    ]
+
+    page_visits.record_page_visit(user_id=1, path="/api/clubs/")
+    assert page_visits.flush_buffered_visits() == 1
+    assert [page for _user_id, page, _at in flushed[1]] == ["/api/clubs/"]
+
+
+@pytest.mark.django_db
+def test_write_page_visits_upserts_latest_visit_per_player_page() -> None:
+    """A batch is one upsert keyed on (player, page); users without player skip."""
+    user = get_user_model().objects.create_user(
+        username="visitor",
+        password=TEST_PASSWORD,
+    )
+    earlier = timezone.now() - timedelta(hours=1)
+    PageConnectRegistration.objects.create(
+        player=user.player,
+        page="/api/teams/",
+        registration_date=earlier,
+    )
+    later = timezone.now()
+
+    written = page_visits.write_page_visits(
+        [
+            (user.pk, "/api/teams/", (later - timedelta(seconds=5)).isoformat()),
+            (user.pk, "/api/teams/", later.isoformat()),
+            (user.pk, "/api/clubs/", later.isoformat()),
+            (user.pk + 1000, "/api/clubs/", later.isoformat()),
+        ],
+    )
+
+    assert written == 2  # noqa: PLR2004
+    registrations = dict(
+        PageConnectRegistration.objects.values_list("page", "registration_date"),
+    )
+    assert registrations == {"/api/teams/": later, "/api/clubs/": later}
+
+
+def test_idle_windows_are_flushed_by_the_timer(
+    settings: SettingsWrapper,
+    flushed: list[list[page_visits.PageVisit]],
+) -> None:
+    """A window no later visit closes is flushed by the timer thread."""
+    settings.KORFBAL_PAGE_VISIT_FLUSH_INTERVAL_S = 3600
+    settings.KORFBAL_PAGE_VISIT_BATCH_SIZE = 1000
+    settings.KORFBAL_PAGE_VISIT_SAMPLE_PERCENT = 100
+
+    page_visits.record_page_visit(user_id=1, path="/api/teams/")
+    timer = page_visits._buffer.timer  # noqa: SLF001
+    assert timer is not None
+    assert flushed == []
+
+    timer.cancel()
+    page_visits._buffer.window_started -= 3600  # noqa: SLF001
+    page_visits._on_timer()  # noqa: SLF001
+
+    assert [[(user_id, page) for user_id, page, _at in batch] for batch in flushed] == [
+        [(1, "/api/teams/")],
+    ]
+    assert page_visits._buffer.timer is None  # noqa: SLF001
+
+
+def test_failed_sends_go_back_into_the_buffer(
+    settings: SettingsWrapper,
+    monkeypatch: pytest.MonkeyPatch,
+    flushed: list[list[page_visits.PageVisit]],
+) -> None:
+    """An unreachable broker neither raises nor loses the batch."""
+    settings.KORFBAL_PAGE_VISIT_FLUSH_INTERVAL_S = 3600
+    settings.KORFBAL_PAGE_VISIT_BATCH_SIZE = 2
+    settings.KORFBAL_PAGE_VISIT_SAMPLE_PERCENT = 100
+    sent: list[list[page_visits.PageVisit]] = []
+
+    def _unreachable(*, args: tuple[object, ...], retry: bool) -> None:
+        assert retry is False
+        msg = "broker down"
+        raise ConnectionError(msg)
+
+    monkeypatch.setattr(flush_page_visits, "apply_async", _unreachable)
+    page_visits.record_page_visit(user_id=1, path="/api/teams/")
+    page_visits.record_page_visit(user_id=2, path="/api/teams/")
+    page_visits._send(flushed.pop())  # noqa: SLF001
+
+    # Backing off: no new batch, and no more than a batch worth of visits.
+    page_visits.record_page_visit(user_id=3, path="/api/teams/")
+    assert flushed == []
+    assert sorted(page_visits._buffer.visits) == [  # noqa: SLF001
+        (1, "/api/teams/"),
+        (2, "/api/teams/"),
+    ]
+
+    monkeypatch.setattr(
+        page_visits,
+        "_send",
+        lambda batch: sent.append(batch),
+    )
+    page_visits._flush_at_exit()  # noqa: SLF001
+    assert len(sent[0]) == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("flushed")
+def test_back_counter_is_only_reset_for_users_with_a_player() -> None:
+    """Users without a player keep an untouched session."""
+
+    def _request(user: object, **session: object) -> HttpRequest:
+        request = RequestFactory().get("/api/teams/")
+        request.user = user
+        request.session = SessionStore()
+        request.session.update(session)
+        request.session.modified = False
+        return request
+
+    def _view(_request: HttpRequest) -> HttpResponse:
+        return HttpResponse("ok")
+
+    middleware = VisitorTrackingMiddleware(_view)
+    with_player = get_user_model().objects.create_user(
+        username="visitor",
+        password=TEST_PASSWORD,
+    )
+    without_player = get_user_model().objects.create_user(
+        username="no_player",
+        password=TEST_PASSWORD,
+    )
+    Player.objects.filter(user=without_player).delete()
+    without_player = get_user_model().objects.get(pk=without_player.pk)
+
+    request = _request(with_player)
+    middleware(request)
+    assert request.session["back_counter"] == 1
+
+    request = _request(with_player, is_back_navigation=True, back_counter=3)
+    middleware(request)
+    assert dict(request.session) == {"back_counter": 3}
+
+    request = _request(without_player, is_back_navigation=True)
+    middleware(request)
+    assert dict(request.session) == {"is_back_navigation": True}
+    assert not request.session.modified
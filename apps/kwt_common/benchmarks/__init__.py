@@ -0,0 +1,16 @@
+"""Benchmark harness for the backend hot paths (see `run_benchmarks`)."""
+
+from .league import GeneratedLeague, LeagueConfig, generate_league
+from .live_reads import measure_tracker_under_read_load
+from .runner import Regression, compare_results, run_benchmarks
+
+
+__all__ = [
+    "GeneratedLeague",
+    "LeagueConfig",
+    "Regression",
+    "compare_results",
+    "generate_league",
+    "measure_tracker_under_read_load",
+    "run_benchmarks",
+]
@@ -0,0 +1,604 @@
+"""Deterministic synthetic league used by the benchmark harness.
+
+The generator builds a small but realistic data set: clubs with ranked teams,
+a current season with rosters and memberships, a schedule of finished matches
+with full event streams (attacks, shots, goals, substitutions, pauses and
+timeouts), one live match and a few upcoming fixtures.
+
+All randomness comes from a seeded `random.Random`, and timestamps are anchored
+to midnight of the current day, so the same config produces the same row counts
+and event shapes on every run. That is what makes benchmark baselines
+comparable between commits.
+
+Events are inserted with `bulk_create`, so the tracker's post_save signals
+(realtime broadcasts, impact/minutes recompute) do not fire while generating;
+the per-team match counters are recounted once per match instead.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+import random
+from typing import Any, cast
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.club.models import Club
+from apps.game_tracker.models import (
+    Attack,
+    GoalType,
+    GroupType,
+    MatchData,
+    MatchPart,
+    MatchPlayer,
+    Pause,
+    PlayerChange,
+    PlayerGroup,
+    Shot,
+    Timeout,
+)
+from apps.game_tracker.services.match_counters import refresh_match_counters
+from apps.game_tracker.services.match_minutes import persist_match_minutes
+from apps.game_tracker.services.player_groups import RESERVE_GROUP_NAME
+from apps.player.models import Player, PlayerClubMembership
+from apps.schedule.models import Match, Season
+from apps.team.models import Team, TeamData
+
+
+ATTACK_GROUP_NAME = "Aanval"
+DEFENCE_GROUP_NAME = "Verdediging"
+GOAL_TYPE_NAMES = (
+    "Afstandschot",
+    "Doorloopbal",
+    "Inloper",
+    "Kort schot",
+    "Strafworp",
+    "Vrije bal",
+)
+
+_FIELD_GROUP_SIZE = 4
+_PART_SECONDS = 1800
+_PARTS = 2
+_HALF_TIME = timedelta(minutes=10)
+_LIVE_ELAPSED_SECONDS = 1200
+_SCORE_PROBABILITY = 0.18
+_SHOTS_PER_ATTACK = (0, 1, 1, 1, 2, 2, 3)
+
+
+@dataclass(frozen=True, slots=True)
+class LeagueConfig:
+    """Size knobs for the synthetic league."""
+
+    seed: int = 1
+    clubs: int = 4
+    teams_per_club: int = 2
+    players_per_team: int = 10
+    rounds: int = 6
+    upcoming_rounds: int = 1
+    prefix: str = "Bench"
+
+
+@dataclass(slots=True)
+class GeneratedLeague:
+    """Handles to the generated objects that benchmark scenarios need."""
+
+    config: LeagueConfig
+    season: Season
+    clubs: list[Club]
+    teams: list[Team]
+    finished_matches: list[Match]
+    live_match: Match
+    upcoming_matches: list[Match]
+    goal_types: list[GoalType]
+    row_counts: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _TeamSide:
+    """Per-team mutable state while a match is being generated."""
+
+    team: Team
+    groups: dict[str, PlayerGroup]
+    members: dict[str, list[Player]]
+    timeouts_left: int = 2
+    substitutions_left: int = 0
+
+
+@dataclass(slots=True)
+class _MatchRows:
+    """Rows collected for one match before bulk insertion."""
+
+    attacks: list[Attack] = field(default_factory=list)
+    shots: list[Shot] = field(default_factory=list)
+    changes: list[PlayerChange] = field(default_factory=list)
+    pauses: list[Pause] = field(default_factory=list)
+    timeouts: list[Timeout] = field(default_factory=list)
+    goals: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+def generate_league(config: LeagueConfig | None = None) -> GeneratedLeague:
+    """Create the synthetic league described by `config`.
+
+    Returns:
+        GeneratedLeague: Handles to the created season, teams and matches.
+
+    """
+    config = config or LeagueConfig()
+    rng = random.Random(config.seed)  # noqa: S311 - deterministic test data
+    anchor = timezone.make_aware(
+        datetime.combine(timezone.localdate(), time.min),
+    )
+
+    group_types = _ensure_group_types()
+    goal_types = _ensure_goal_types()
+    season = Season.objects.create(
+        name=f"{config.prefix} season {config.seed}",
+        start_date=(anchor - timedelta(days=7 * (config.rounds + 4))).date(),
+        end_date=(anchor + timedelta(days=240)).date(),
+    )
+
+    clubs, teams, rosters = _create_clubs(config=config, season=season)
+    schedule = _round_robin(rng, teams, rounds=config.rounds + config.upcoming_rounds)
+
+    finished: list[Match] = []
+    for round_index, pairings in enumerate(schedule[: config.rounds]):
+        kickoff = anchor - timedelta(days=7 * (config.rounds - round_index))
+        kickoff += timedelta(hours=14)
+        for home, away in pairings:
+            match = _create_match(season, home, away, kickoff)
+            _play_match(
+                rng,
+                match=match,
+                rosters=rosters,
+                group_types=group_types,
+                goal_types=goal_types,
+                elapsed_seconds=None,
+            )
+            finished.append(match)
+
+    # Kick off early enough that every generated pause has already ended.
+    live_home, live_away = schedule[0][0]
+    live_match = _create_match(
+        season,
+        live_home,
+        live_away,
+        timezone.now() - timedelta(seconds=_LIVE_ELAPSED_SECONDS) - _HALF_TIME,
+    )
+    _play_match(
+        rng,
+        match=live_match,
+        rosters=rosters,
+        group_types=group_types,
+        goal_types=goal_types,
+        elapsed_seconds=_LIVE_ELAPSED_SECONDS,
+    )
+
+    upcoming: list[Match] = []
+    for round_index, pairings in enumerate(schedule[config.rounds :], start=1):
+        kickoff = anchor + timedelta(days=7 * round_index, hours=14)
+        for home, away in pairings:
+            match = _create_match(season, home, away, kickoff)
+            _assign_groups(
+                match_data=MatchData.objects.get(match_link=match),
+                sides=[home, away],
+                rosters=rosters,
+                group_types=group_types,
+            )
+            upcoming.append(match)
+
+    for match in finished:
+        persist_match_minutes(match_data=MatchData.objects.get(match_link=match))
+
+    league = GeneratedLeague(
+        config=config,
+        season=season,
+        clubs=clubs,
+        teams=teams,
+        finished_matches=finished,
+        live_match=live_match,
+        upcoming_matches=upcoming,
+        goal_types=goal_types,
+    )
+    league.row_counts = _row_counts(league)
+    return league
+
+
+def _ensure_group_types() -> dict[str, GroupType]:
+    names = (ATTACK_GROUP_NAME, DEFENCE_GROUP_NAME, RESERVE_GROUP_NAME)
+    return {
+        name: GroupType.objects.get_or_create(name=name, defaults={"order": order})[0]
+        for order, name in enumerate(names)
+    }
+
+
+def _ensure_goal_types() -> list[GoalType]:
+    return [GoalType.objects.get_or_create(name=name)[0] for name in GOAL_TYPE_NAMES]
+
+
+def _create_clubs(
+    *,
+    config: LeagueConfig,
+    season: Season,
+) -> tuple[list[Club], list[Team], dict[str, list[Player]]]:
+    user_model = cast(Any, get_user_model())
+    clubs: list[Club] = []
+    teams: list[Team] = []
+    rosters: dict[str, list[Player]] = {}
+    memberships: list[PlayerClubMembership] = []
+
+    for club_number in range(1, config.clubs + 1):
+        club = Club.objects.create(name=f"{config.prefix} Club {club_number:02d}")
+        clubs.append(club)
+        for rank in range(1, config.teams_per_club + 1):
+            team = Team.objects.create(name=f"{club.name} {rank}", club=club)
+            team_data = TeamData.objects.create(
+                team=team,
+                season=season,
+                competition="Zaal",
+                wedstrijd_sport=True,
+                team_rank=rank,
+            )
+            roster: list[Player] = []
+            for number in range(1, config.players_per_team + 1):
+                user = user_model(
+                    username=(
+                        f"{config.prefix.lower()}-{club_number:02d}-{rank}-{number:02d}"
+                    ),
+                )
+                user.set_unusable_password()
+                user.save()
+                player = cast(Player, user.player)
+                roster.append(player)
+                memberships.append(
+                    PlayerClubMembership(
+                        player=player,
+                        club=club,
+                        start_date=season.start_date,
+                    ),
+                )
+            team_data.players.add(*roster)
+            rosters[str(team.id_uuid)] = roster
+            teams.append(team)
+
+    PlayerClubMembership.objects.bulk_create(memberships)
+    return clubs, teams, rosters
+
+
+def _round_robin(
+    rng: random.Random,
+    teams: list[Team],
+    *,
+    rounds: int,
+) -> list[list[tuple[Team, Team]]]:
+    """Return `rounds` rounds of pairings using the circle method."""
+    order = list(teams)
+    rng.shuffle(order)
+    if len(order) % 2:
+        order = order[:-1]
+    if len(order) < 2:  # noqa: PLR2004
+        return [[] for _ in range(rounds)]
+
+    schedule: list[list[tuple[Team, Team]]] = []
+    for round_index in range(rounds):
+        half = len(order) // 2
+        pairings = list(zip(order[:half], reversed(order[half:]), strict=True))
+        schedule.append(
+            [(a, b) if round_index % 2 == 0 else (b, a) for a, b in pairings],
+        )
+        order = [order[0], order[-1], *order[1:-1]]
+    return schedule
+
+
+def _create_match(season: Season, home: Team, away: Team, kickoff: datetime) -> Match:
+    # MatchData + empty PlayerGroups are created by the schedule/tracker signals.
+    return Match.objects.create(
+        home_team=home,
+        away_team=away,
+        season=season,
+        start_time=kickoff,
+    )
+
+
+def _assign_groups(
+    *,
+    match_data: MatchData,
+    sides: list[Team],
+    rosters: dict[str, list[Player]],
+    group_types: dict[str, GroupType],
+) -> list[_TeamSide]:
+    groups_by_key = {
+        (group.team_id, group.starting_type_id): group
+        for group in PlayerGroup.objects.filter(match_data=match_data)
+    }
+    team_sides: list[_TeamSide] = []
+    match_players: list[MatchPlayer] = []
+    for team in sides:
+        roster = rosters[str(team.id_uuid)]
+        groups = {
+            name: groups_by_key[(team.id_uuid, group_type.id_uuid)]
+            for name, group_type in group_types.items()
+        }
+        members = {
+            ATTACK_GROUP_NAME: list(roster[:_FIELD_GROUP_SIZE]),
+            DEFENCE_GROUP_NAME: list(roster[_FIELD_GROUP_SIZE : 2 * _FIELD_GROUP_SIZE]),
+            RESERVE_GROUP_NAME: list(roster[2 * _FIELD_GROUP_SIZE :]),
+        }
+        for name, players in members.items():
+            groups[name].players.set(players)
+        match_players.extend(
+            MatchPlayer(match_data=match_data, team=team, player=player)
+            for player in roster
+        )
+        team_sides.append(_TeamSide(team=team, groups=groups, members=members))
+
+    MatchPlayer.objects.bulk_create(match_players, ignore_conflicts=True)
+    return team_sides
+
+
+def _play_match(  # noqa: PLR0913
+    rng: random.Random,
+    *,
+    match: Match,
+    rosters: dict[str, list[Player]],
+    group_types: dict[str, GroupType],
+    goal_types: list[GoalType],
+    elapsed_seconds: int | None,
+) -> None:
+    """Generate a full event stream for `match`.
+
+    `elapsed_seconds=None` plays a finished match; otherwise the match is left
+    active in the first part after that many seconds of play.
+    """
+    match_data = MatchData.objects.get(match_link=match)
+    sides = _assign_groups(
+        match_data=match_data,
+        sides=[match.home_team, match.away_team],
+        rosters=rosters,
+        group_types=group_types,
+    )
+    for side in sides:
+        side.substitutions_left = rng.randint(1, 4)
+
+    rows = _MatchRows()
+    parts = _PARTS if elapsed_seconds is None else 1
+    part_start = match.start_time
+    for part_number in range(1, parts + 1):
+        live = elapsed_seconds is not None
+        play_seconds = elapsed_seconds if live else _PART_SECONDS
+        match_part = MatchPart.objects.create(
+            match_data=match_data,
+            part_number=part_number,
+            start_time=part_start,
+            active=live,
+        )
+        part_end = _play_part(
+            rng,
+            match_data=match_data,
+            match_part=match_part,
+            sides=sides,
+            goal_types=goal_types,
+            play_seconds=int(play_seconds or 0),
+            substitutions=part_number == parts or live,
+            rows=rows,
+        )
+        if not live:
+            match_part.end_time = part_end
+            match_part.save(update_fields=["end_time"])
+        part_start = part_end + _HALF_TIME
+
+    Pause.objects.bulk_create(rows.pauses)
+    Timeout.objects.bulk_create(rows.timeouts)
+    Attack.objects.bulk_create(rows.attacks)
+    Shot.objects.bulk_create(rows.shots)
+    PlayerChange.objects.bulk_create(rows.changes)
+    refresh_match_counters(match_data)
+
+    for side in sides:
+        for name, players in side.members.items():
+            side.groups[name].players.set(players)
+
+    home_id, away_id = str(match.home_team.id_uuid), str(match.away_team.id_uuid)
+    match_data.home_score = rows.goals[home_id]
+    match_data.away_score = rows.goals[away_id]
+    match_data.parts = _PARTS
+    match_data.part_length = _PART_SECONDS
+    match_data.current_part = parts
+    match_data.status = "active" if elapsed_seconds is not None else "finished"
+    match_data.save(
+        update_fields=[
+            "home_score",
+            "away_score",
+            "parts",
+            "part_length",
+            "current_part",
+            "status",
+        ],
+    )
+
+
+def _play_part(  # noqa: PLR0913
+    rng: random.Random,
+    *,
+    match_data: MatchData,
+    match_part: MatchPart,
+    sides: list[_TeamSide],
+    goal_types: list[GoalType],
+    play_seconds: int,
+    substitutions: bool,
+    rows: _MatchRows,
+) -> datetime:
+    """Generate one part's events and return the wall-clock end of the part.
+
+    Event times are generated on the game clock and shifted by the pauses that
+    happened before them, the same way the tracker's timer works.
+    """
+    stoppages = _plan_stoppages(rng, sides=sides, play_seconds=play_seconds)
+    substitution_plan = (
+        _plan_substitutions(rng, sides=sides, play_seconds=play_seconds)
+        if substitutions
+        else []
+    )
+    paused = timedelta()
+
+    def wall(second: int) -> datetime:
+        return match_part.start_time + timedelta(seconds=second) + paused
+
+    clock = 0
+    attacking = rng.randrange(2)
+    while clock < play_seconds:
+        while stoppages and stoppages[0][0] <= clock:
+            at, duration, side = stoppages.pop(0)
+            start = wall(at)
+            pause = Pause(
+                match_data=match_data,
+                match_part=match_part,
+                start_time=start,
+                end_time=start + timedelta(seconds=duration),
+                active=False,
+            )
+            rows.pauses.append(pause)
+            if side is not None:
+                rows.timeouts.append(
+                    Timeout(
+                        match_data=match_data,
+                        match_part=match_part,
+                        team=side.team,
+                        pause=pause,
+                    ),
+                )
+            paused += timedelta(seconds=duration)
+
+        while substitution_plan and substitution_plan[0][0] <= clock:
+            _, side = substitution_plan.pop(0)
+            _substitute(
+                rng,
+                side=side,
+                match_part=match_part,
+                rows=rows,
+                at=wall(clock),
+            )
+
+        side = sides[attacking]
+        rows.attacks.append(
+            Attack(
+                match_data=match_data,
+                match_part=match_part,
+                team=side.team,
+                time=wall(clock),
+            ),
+        )
+        scored = False
+        shot_clock = clock
+        for _ in range(rng.choice(_SHOTS_PER_ATTACK)):
+            shot_clock += rng.randint(4, 18)
+            scored = rng.random() < _SCORE_PROBABILITY
+            shooter_group = (
+                ATTACK_GROUP_NAME if rng.random() < 0.7 else DEFENCE_GROUP_NAME  # noqa: PLR2004
+            )
+            rows.shots.append(
+                Shot(
+                    player=rng.choice(side.members[shooter_group]),
+                    match_data=match_data,
+                    match_part=match_part,
+                    team=side.team,
+                    for_team=True,
+                    scored=scored,
+                    shot_type=rng.choice(goal_types) if scored else None,
+                    time=wall(shot_clock),
+                ),
+            )
+            if scored:
+                rows.goals[str(side.team.id_uuid)] += 1
+                break
+
+        clock = shot_clock + rng.randint(15, 45)
+        # Possession changes after a goal and after most missed attacks.
+        if scored or rng.random() < 0.8:  # noqa: PLR2004
+            attacking = 1 - attacking
+
+    return wall(play_seconds)
+
+
+def _plan_stoppages(
+    rng: random.Random,
+    *,
+    sides: list[_TeamSide],
+    play_seconds: int,
+) -> list[tuple[int, int, _TeamSide | None]]:
+    """Plan pauses on the game clock: referee stoppages plus team timeouts."""
+    plan: list[tuple[int, int, _TeamSide | None]] = [
+        (rng.randint(60, max(61, play_seconds - 60)), rng.randint(20, 120), None)
+        for _ in range(rng.randint(0, 2))
+    ]
+    for side in sides:
+        if side.timeouts_left and rng.random() < 0.5:  # noqa: PLR2004
+            side.timeouts_left -= 1
+            plan.append((rng.randint(60, max(61, play_seconds - 60)), 60, side))
+    return sorted(plan, key=lambda entry: entry[0])
+
+
+def _plan_substitutions(
+    rng: random.Random,
+    *,
+    sides: list[_TeamSide],
+    play_seconds: int,
+) -> list[tuple[int, _TeamSide]]:
+    plan: list[tuple[int, _TeamSide]] = []
+    for side in sides:
+        count = min(side.substitutions_left, len(side.members[RESERVE_GROUP_NAME]))
+        side.substitutions_left -= count
+        plan.extend(
+            (rng.randint(120, max(121, play_seconds - 30)), side) for _ in range(count)
+        )
+    return sorted(plan, key=lambda entry: entry[0])
+
+
+def _substitute(
+    rng: random.Random,
+    *,
+    side: _TeamSide,
+    match_part: MatchPart,
+    rows: _MatchRows,
+    at: datetime,
+) -> None:
+    group_name = rng.choice((ATTACK_GROUP_NAME, DEFENCE_GROUP_NAME))
+    field_players = side.members[group_name]
+    reserves = side.members[RESERVE_GROUP_NAME]
+    player_out = field_players.pop(rng.randrange(len(field_players)))
+    player_in = reserves.pop(rng.randrange(len(reserves)))
+    field_players.append(player_in)
+    reserves.append(player_out)
+    rows.changes.append(
+        PlayerChange(
+            player_in=player_in,
+            player_out=player_out,
+            player_group=side.groups[group_name],
+            match_data=match_part.match_data,
+            match_part=match_part,
+            time=at,
+        ),
+    )
+
+
+def _row_counts(league: GeneratedLeague) -> dict[str, int]:
+    match_data_ids = MatchData.objects.filter(
+        match_link__season=league.season,
+    ).values("id_uuid")
+    return {
+        "clubs": len(league.clubs),
+        "teams": len(league.teams),
+        "players": TeamData.players.through.objects.filter(
+            teamdata__season=league.season,
+        ).count(),
+        "matches": Match.objects.filter(season=league.season).count(),
+        "attacks": Attack.objects.filter(match_data__in=match_data_ids).count(),
+        "shots": Shot.objects.filter(match_data__in=match_data_ids).count(),
+        "player_changes": PlayerChange.objects.filter(
+            match_data__in=match_data_ids,
+        ).count(),
+        "pauses": Pause.objects.filter(match_data__in=match_data_ids).count(),
+        "timeouts": Timeout.objects.filter(match_data__in=match_data_ids).count(),
+    }
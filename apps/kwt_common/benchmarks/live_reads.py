@@ -0,0 +1,138 @@
+"""Measure tracker command latency while spectators poll the live timeline.
+
+Reader threads repeatedly read the events and shots payloads of the live
+match exactly like the public endpoints do (inside `revision_snapshot`), while
+the calling thread times `apply_tracker_command`. Tracker latency is measured
+once without readers and once with them, so any blocking between the two
+paths shows up as a slowdown.
+
+Every reader holds its own database connection: the database must allow at
+least `readers` extra connections. Rows written here are committed, because
+the readers cannot see an uncommitted league.
+"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from typing import Any
+
+from django.db import connection
+
+from apps.game_tracker.models import MatchData, PlayerGroup
+from apps.game_tracker.realtime.contracts import LiveResource
+from apps.game_tracker.services.live_updates import revision_snapshot
+from apps.game_tracker.services.match_timeline_payload import (
+    build_match_events,
+    build_match_shots,
+)
+from apps.game_tracker.services.match_timeline_projection import read_timeline
+from apps.game_tracker.services.tracker_http import apply_tracker_command
+from apps.kwt_common.benchmarks.league import ATTACK_GROUP_NAME, GeneratedLeague
+
+
+def _read_loop(
+    match_data_id: object,
+    *,
+    stop: threading.Event,
+    reads: list[int],
+    index: int,
+) -> None:
+    try:
+        while not stop.is_set():
+            with revision_snapshot():
+                match_data = MatchData.objects.get(pk=match_data_id)
+                if read_timeline(match_data, LiveResource.EVENTS) is None:
+                    build_match_events(match_data)
+                if read_timeline(match_data, LiveResource.SHOTS) is None:
+                    build_match_shots(match_data)
+            reads[index] += 1
+    finally:
+        connection.close()
+
+
+def _time_commands(league: GeneratedLeague, *, commands: int) -> list[float]:
+    live_match = league.live_match
+    team = live_match.home_team
+    shooter_id = str(
+        PlayerGroup.objects
+        .filter(
+            match_data__match_link=live_match,
+            team=team,
+            starting_type__name=ATTACK_GROUP_NAME,
+        )
+        .values_list("players__id_uuid", flat=True)
+        .first(),
+    )
+    timings_ms: list[float] = []
+    for _ in range(commands):
+        started = time.perf_counter()
+        apply_tracker_command(
+            live_match,
+            team=team,
+            payload={"command": "shot_reg", "player_id": shooter_id, "for_team": True},
+        )
+        timings_ms.append((time.perf_counter() - started) * 1000)
+    return timings_ms
+
+
+def _summary(timings_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(timings_ms)
+    p95_index = max(0, round(0.95 * len(ordered)) - 1)
+    return {
+        "median_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[p95_index], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def measure_tracker_under_read_load(
+    league: GeneratedLeague,
+    *,
+    readers: int,
+    commands: int,
+) -> dict[str, Any]:
+    """Time tracker commands without and with `readers` polling threads.
+
+    Returns:
+        dict[str, Any]: JSON-serialisable latency summaries and read counts.
+
+    """
+    match_data_id = MatchData.objects.get(match_link=league.live_match).pk
+    idle = _time_commands(league, commands=commands)
+
+    stop = threading.Event()
+    reads = [0] * readers
+    threads = [
+        threading.Thread(
+            target=_read_loop,
+            args=(match_data_id,),
+            kwargs={"stop": stop, "reads": reads, "index": index},
+            daemon=True,
+        )
+        for index in range(readers)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        loaded = _time_commands(league, commands=commands)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    idle_summary = _summary(idle)
+    loaded_summary = _summary(loaded)
+    return {
+        "readers": readers,
+        "commands": commands,
+        "idle": idle_summary,
+        "under_load": loaded_summary,
+        "reads_completed": sum(reads),
+        "median_slowdown_pct": round(
+            (loaded_summary["median_ms"] / max(idle_summary["median_ms"], 0.001) - 1)
+            * 100,
+            1,
+        ),
+    }
@@ -0,0 +1,276 @@
+"""Time and query-count the backend hot paths against a generated league.
+
+Each scenario is called `repeat` times. The first call is reported separately
+(`first_ms`, `queries_first`) because it runs with cold per-process and shared
+caches; the remaining calls give the steady-state numbers. Query counts come
+from a `CaptureQueriesContext`, wall-clock times from `time.perf_counter`.
+
+Results are plain JSON so baselines can be stored next to a branch and compared
+with `compare_results` on a later commit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import math
+import statistics
+import time
+from typing import Any
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.club.services.eligibility_dashboard import build_club_eligibility_dashboard
+from apps.game_tracker.models import MatchData, PlayerGroup
+from apps.game_tracker.services.match_impact_scorer import (
+    compute_match_impact_breakdown,
+)
+from apps.game_tracker.services.match_stats_payload import build_match_stats_payload
+from apps.game_tracker.services.match_timeline_payload import build_match_events
+from apps.game_tracker.services.tracker_http import (
+    apply_tracker_command,
+    get_tracker_state,
+)
+from apps.kwt_common.benchmarks.league import ATTACK_GROUP_NAME, GeneratedLeague
+from apps.kwt_common.utils.match_summary import (
+    build_match_summaries,
+    load_match_summaries,
+)
+from apps.team.services.overview import (
+    TeamOverviewOptions,
+    build_team_overview_payload,
+)
+
+
+RESULTS_SCHEMA_VERSION = 1
+
+# Match summary scenarios serialize up to this many matches; generate a larger
+# league (e.g. `--clubs 10 --teams-per-club 3 --rounds 40`) to fill the page.
+SUMMARY_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """A named hot path with its benchmark callable."""
+
+    name: str
+    run: Callable[[], object]
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    """A scenario whose numbers got worse than the baseline allows."""
+
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        """Return a one-line, human-readable description."""
+        return (
+            f"{self.scenario}: {self.metric} {self.baseline:g} -> {self.current:g}"
+        )
+
+
+def build_scenarios(league: GeneratedLeague) -> list[Scenario]:
+    """Return the benchmark scenarios for `league`, in reporting order."""
+    live_match = league.live_match
+    live_team = live_match.home_team
+    finished_match = league.finished_matches[-1]
+    finished_data = MatchData.objects.get(match_link=finished_match)
+    overview_team = league.teams[0]
+    shooter_id = str(
+        PlayerGroup.objects
+        .filter(
+            match_data__match_link=live_match,
+            team=live_team,
+            starting_type__name=ATTACK_GROUP_NAME,
+        )
+        .values_list("players__id_uuid", flat=True)
+        .first(),
+    )
+    summary_page = MatchData.objects.filter(match_link__season=league.season).order_by(
+        "match_link__start_time",
+    )[:SUMMARY_PAGE_SIZE]
+    overview_options = TeamOverviewOptions(
+        include_stats=True,
+        include_roster=True,
+        viewer_player=None,
+        viewer_can_manage_goal_songs=False,
+        fallback_goal_song_audio_urls=[],
+        team_payload={"id_uuid": str(overview_team.id_uuid)},
+    )
+
+    return [
+        Scenario(
+            "tracker.get_tracker_state",
+            lambda: get_tracker_state(live_match, team=live_team),
+        ),
+        Scenario(
+            "tracker.apply_tracker_command.shot_reg",
+            lambda: apply_tracker_command(
+                live_match,
+                team=live_team,
+                payload={
+                    "command": "shot_reg",
+                    "player_id": shooter_id,
+                    "for_team": True,
+                },
+            ),
+        ),
+        Scenario(
+            "timeline.build_match_events",
+            lambda: build_match_events(finished_data),
+        ),
+        Scenario(
+            "stats.build_match_stats_payload",
+            lambda: build_match_stats_payload(
+                match=finished_match,
+                match_data=finished_data,
+            ),
+        ),
+        Scenario(
+            "impact.compute_match_impact_breakdown",
+            lambda: compute_match_impact_breakdown(match_data=finished_data),
+        ),
+        Scenario(
+            "team.build_team_overview_payload",
+            lambda: build_team_overview_payload(
+                team=overview_team,
+                season=league.season,
+                seasons=[league.season],
+                options=overview_options,
+            ),
+        ),
+        Scenario(
+            "summaries.build_match_summaries",
+            lambda: build_match_summaries(
+                summary_page.select_related(
+                    "match_link",
+                    "match_link__home_team",
+                    "match_link__home_team__club",
+                    "match_link__away_team",
+                    "match_link__away_team__club",
+                    "match_link__season",
+                ),
+            ),
+        ),
+        Scenario(
+            "summaries.load_match_summaries",
+            lambda: load_match_summaries(summary_page),
+        ),
+        Scenario(
+            "club.build_club_eligibility_dashboard",
+            lambda: build_club_eligibility_dashboard(
+                club=league.clubs[0],
+                season=league.season,
+            ),
+        ),
+    ]
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[index]
+
+
+def measure_scenario(scenario: Scenario, *, repeat: int) -> dict[str, Any]:
+    """Run `scenario` `repeat` times and summarise timings and query counts.
+
+    Returns:
+        dict[str, Any]: JSON-serialisable measurements for the scenario.
+
+    """
+    repeat = max(2, repeat)
+    timings_ms: list[float] = []
+    query_counts: list[int] = []
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            scenario.run()
+            timings_ms.append((time.perf_counter() - started) * 1000)
+        query_counts.append(len(captured.captured_queries))
+
+    warm = timings_ms[1:]
+    return {
+        "first_ms": round(timings_ms[0], 3),
+        "median_ms": round(statistics.median(warm), 3),
+        "p95_ms": round(_percentile(warm, 0.95), 3),
+        "min_ms": round(min(warm), 3),
+        "queries_first": query_counts[0],
+        "queries": max(query_counts[1:]),
+        "runs": repeat,
+    }
+
+
+def run_benchmarks(
+    league: GeneratedLeague,
+    *,
+    repeat: int,
+    only: Iterable[str] = (),
+) -> dict[str, Any]:
+    """Run every (or every selected) scenario and return a results document.
+
+    Returns:
+        dict[str, Any]: Metadata plus per-scenario measurements.
+
+    """
+    selected = set(only)
+    results = {
+        scenario.name: measure_scenario(scenario, repeat=repeat)
+        for scenario in build_scenarios(league)
+        if not selected or scenario.name in selected
+    }
+    return {
+        "schema": RESULTS_SCHEMA_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "database": {
+            "vendor": connection.vendor,
+            # PostgreSQL server version as an integer (e.g. 160004), else None.
+            "version": getattr(connection, "pg_version", None),
+        },
+        "league": {
+            "seed": league.config.seed,
+            "clubs": league.config.clubs,
+            "teams_per_club": league.config.teams_per_club,
+            "players_per_team": league.config.players_per_team,
+            "rounds": league.config.rounds,
+            "rows": league.row_counts,
+        },
+        "scenarios": results,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    time_threshold_pct: float,
+) -> list[Regression]:
+    """Return regressions of `current` against `baseline`.
+
+    Any increase in the steady-state query count is a regression. Median time
+    is only flagged when it grows by more than `time_threshold_pct` percent,
+    since timings are noisy even on an idle machine.
+    """
+    regressions: list[Regression] = []
+    baseline_scenarios = baseline.get("scenarios") or {}
+    for name, now in (current.get("scenarios") or {}).items():
+        before = baseline_scenarios.get(name)
+        if not before:
+            continue
+        for metric in ("queries", "queries_first"):
+            if now[metric] > before[metric]:
+                regressions.append(
+                    Regression(name, metric, before[metric], now[metric]),
+                )
+        limit = before["median_ms"] * (1 + time_threshold_pct / 100)
+        if now["median_ms"] > limit:
+            regressions.append(
+                Regression(name, "median_ms", before["median_ms"], now["median_ms"]),
+            )
+    return regressions
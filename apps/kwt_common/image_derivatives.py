@@ -0,0 +1,299 @@
+"""Fixed-size thumbnails for uploaded images (profile pictures, club logos).
+
+Uploads are stored as-is (often multi-megabyte phone photos). Roster grids and
+match cards only need small avatars, so we generate square derivatives next to
+the original and record them on the owning model in a JSON field:
+
+    {"source": "<original storage key>", "sizes": {"64": "<key>", ...}}
+
+`source` lets callers detect stale derivatives after a new upload without
+touching storage. Pillow is optional (it is only installed in the web/worker
+images); without it no derivatives are produced and callers fall back to the
+original image.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from io import BytesIO
+import logging
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, Any, Final
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Q
+
+from apps.kwt_common.media_urls import cached_storage_url
+
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+    from django.db.models.fields.files import FieldFile
+
+PILImage: Any
+PILImageOps: Any
+
+try:
+    from PIL import Image as _ImportedImage, ImageOps as _ImportedImageOps
+except ImportError:  # pragma: no cover - optional dependency
+    PILImage = None
+    PILImageOps = None
+    _PILLOW_AVAILABLE = False
+else:
+    PILImage = _ImportedImage
+    PILImageOps = _ImportedImageOps
+    _PILLOW_AVAILABLE = True
+
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_SIZES: Final[tuple[int, ...]] = (64, 128, 256)
+DERIVATIVE_DIR: Final[str] = "derivatives"
+# Size requested by list/grid payloads (48px avatars at up to ~2.5x DPR).
+LIST_THUMBNAIL_SIZE: Final[int] = 128
+_WEBP_QUALITY: Final[int] = 80
+_JPEG_QUALITY: Final[int] = 85
+
+
+def pillow_available() -> bool:
+    """Return whether thumbnails can be generated in this process."""
+    return _PILLOW_AVAILABLE
+
+
+def derivatives_are_current(field_file: FieldFile, derivatives: object) -> bool:
+    """Return whether `derivatives` were generated from the current file."""
+    if not field_file:
+        return not derivatives
+    if not isinstance(derivatives, dict):
+        return False
+    return derivatives.get("source") == field_file.name
+
+
+def derivative_name(source_name: str, size: int, extension: str) -> str:
+    """Return the storage key for a derivative of `source_name`."""
+    source = PurePosixPath(source_name)
+    return str(source.parent / DERIVATIVE_DIR / f"{source.stem}_{size}.{extension}")
+
+
+def _encode(image: Any) -> tuple[bytes, str]:
+    """Encode a thumbnail as WebP, falling back to JPEG when unsupported."""
+    buffer = BytesIO()
+    try:
+        image.save(buffer, format="WEBP", quality=_WEBP_QUALITY, method=4)
+    except (KeyError, OSError):
+        buffer = BytesIO()
+        image.convert("RGB").save(
+            buffer,
+            format="JPEG",
+            quality=_JPEG_QUALITY,
+            optimize=True,
+        )
+        return buffer.getvalue(), "jpg"
+    return buffer.getvalue(), "webp"
+
+
+def generate_image_derivatives(
+    field_file: FieldFile,
+    *,
+    sizes: tuple[int, ...] = DERIVATIVE_SIZES,
+) -> dict[str, Any]:
+    """Create square thumbnails for `field_file` and return the derivatives map.
+
+    Returns an empty map when there is no file. When Pillow is unavailable or
+    the image cannot be decoded the map has no sizes, so callers keep serving
+    the original without retrying on every save.
+    """
+    if not field_file:
+        return {}
+
+    storage = field_file.storage
+    source_name = str(field_file.name)
+    if not _PILLOW_AVAILABLE:
+        return {"source": source_name, "sizes": {}}
+
+    try:
+        with storage.open(source_name, "rb") as handle:
+            source = PILImage.open(handle)
+            source.load()
+    except (OSError, ValueError, PILImage.DecompressionBombError):
+        # Missing files and unreadable, truncated or oversized images.
+        logger.warning("Could not decode image %s for derivatives", source_name)
+        return {"source": source_name, "sizes": {}}
+
+    source = PILImageOps.exif_transpose(source)
+    if source.mode not in {"RGB", "RGBA"}:
+        source = source.convert("RGBA" if "A" in source.getbands() else "RGB")
+
+    generated: dict[str, str] = {}
+    for size in sorted(set(sizes)):
+        thumbnail = PILImageOps.fit(
+            source,
+            (size, size),
+            method=PILImage.Resampling.LANCZOS,
+        )
+        payload, extension = _encode(thumbnail)
+        name = derivative_name(source_name, size, extension)
+        if storage.exists(name):
+            storage.delete(name)
+        generated[str(size)] = storage.save(name, ContentFile(payload))
+
+    return {"source": source_name, "sizes": generated}
+
+
+def delete_image_derivatives(field_file: FieldFile, derivatives: object) -> None:
+    """Best-effort removal of previously generated derivative files."""
+    if not isinstance(derivatives, dict):
+        return
+    sizes = derivatives.get("sizes")
+    if not isinstance(sizes, dict):
+        return
+    storage = field_file.storage
+    for name in sizes.values():
+        try:
+            storage.delete(str(name))
+        except Exception:  # noqa: BLE001
+            # Remote storage backends raise their own (non-OSError) errors.
+            logger.warning("Could not delete image derivative %s", name)
+
+
+def refresh_image_derivatives(
+    instance: Model,
+    *,
+    image_field: str,
+    derivatives_field: str,
+    force: bool = False,
+) -> bool:
+    """Regenerate derivatives for `instance.<image_field>` when stale.
+
+    The result is written with a conditional `UPDATE` (no `save()`, so no
+    signals fire) that only applies while the image is unchanged; a newer
+    upload racing this call keeps its own pending refresh.
+
+    Returns:
+        True when the derivatives were (re)generated and stored.
+
+    """
+    field_file = getattr(instance, image_field)
+    previous = getattr(instance, derivatives_field)
+    if not force and derivatives_are_current(field_file, previous):
+        return False
+
+    derivatives = generate_image_derivatives(field_file)
+    unchanged = (
+        Q(**{image_field: field_file.name})
+        if field_file
+        else Q(**{image_field: ""}) | Q(**{f"{image_field}__isnull": True})
+    )
+    updated = (
+        type(instance)
+        ._default_manager.filter(unchanged, pk=instance.pk)
+        .update(**{derivatives_field: derivatives})
+    )
+    if not updated:
+        if derivatives:
+            delete_image_derivatives(field_file, derivatives)
+        return False
+
+    kept = set((derivatives.get("sizes") or {}).values()) if derivatives else set()
+    if isinstance(previous, dict) and isinstance(previous.get("sizes"), dict):
+        delete_image_derivatives(
+            field_file,
+            {
+                "sizes": {
+                    key: name
+                    for key, name in previous["sizes"].items()
+                    if name not in kept
+                }
+            },
+        )
+    setattr(instance, derivatives_field, derivatives)
+    return True
+
+
+def image_field_needs_derivatives(
+    instance: Model,
+    *,
+    image_field: str,
+    derivatives_field: str,
+    update_fields: object = None,
+) -> bool:
+    """Return whether a just-saved instance needs its derivatives refreshed.
+
+    Cheap enough for `post_save`: no queries, and saves that did not touch the
+    image (or loaded it deferred) are skipped.
+    """
+    if update_fields is not None and image_field not in update_fields:
+        return False
+    deferred = instance.get_deferred_fields()
+    if image_field in deferred or derivatives_field in deferred:
+        return False
+    return not derivatives_are_current(
+        getattr(instance, image_field),
+        getattr(instance, derivatives_field),
+    )
+
+
+def schedule_image_derivatives(*, task_path: str, object_id: str) -> None:
+    """Best-effort enqueue of a derivatives task once the transaction commits.
+
+    Args:
+        task_path: Dotted path to the Celery task (`module.task_name`).
+        object_id: Primary key of the owning row (string form).
+
+    """
+
+    def _enqueue() -> None:
+        module_path, _, task_name = task_path.rpartition(".")
+        try:
+            # Avoid importing Celery tasks at module import time.
+            task: Any = getattr(import_module(module_path), task_name)
+            task.delay(object_id)
+        except Exception:
+            logger.exception(
+                "Failed to enqueue %s(%s). Continuing without blocking.",
+                task_path,
+                object_id,
+            )
+
+    transaction.on_commit(_enqueue)
+
+
+def image_name_for_size(
+    field_file: FieldFile,
+    derivatives: object,
+    size: int | None,
+) -> str:
+    """Return the storage name of the smallest derivative covering `size`.
+
+    Falls back to the original image when no size is requested, the derivatives
+    are stale, or none is large enough.
+    """
+    if size is not None and derivatives_are_current(field_file, derivatives):
+        sizes = derivatives.get("sizes") if isinstance(derivatives, dict) else None
+        if isinstance(sizes, dict):
+            candidates = sorted(
+                (int(key), str(name))
+                for key, name in sizes.items()
+                if str(key).isdigit() and name
+            )
+            for candidate_size, name in candidates:
+                if candidate_size >= size:
+                    return name
+
+    return str(field_file.name or "")
+
+
+def image_url_for_size(
+    field_file: FieldFile,
+    derivatives: object,
+    size: int | None,
+) -> str:
+    """Return the URL of the smallest derivative covering `size`.
+
+    See `image_name_for_size` for the fallbacks.
+    """
+    return cached_storage_url(
+        field_file.storage,
+        image_name_for_size(field_file, derivatives, size),
+    )
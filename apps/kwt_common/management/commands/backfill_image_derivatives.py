@@ -0,0 +1,115 @@
+"""Generate thumbnails for existing profile pictures and club logos.
+
+New uploads get their derivatives from a Celery task scheduled on save. Images
+uploaded before the derivative pipeline existed (or while Celery was down) only
+have the original; this command backfills them.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db.models import Model, QuerySet
+
+from apps.club.models.club import Club
+from apps.kwt_common.image_derivatives import (
+    derivatives_are_current,
+    pillow_available,
+    refresh_image_derivatives,
+)
+from apps.player.models.player import Player
+
+
+_TARGETS: dict[str, tuple[str, str]] = {
+    "players": ("profile_picture", "profile_picture_derivatives"),
+    "clubs": ("logo", "logo_derivatives"),
+}
+
+
+def _queryset_for(target: str) -> QuerySet[Any]:
+    image_field, derivatives_field = _TARGETS[target]
+    model: type[Model] = Player if target == "players" else Club
+    return (
+        model._default_manager
+        .exclude(**{image_field: ""})
+        .exclude(**{f"{image_field}__isnull": True})
+        .only("pk", image_field, derivatives_field)
+        .order_by("pk")
+    )
+
+
+class Command(BaseCommand):
+    """Django management command to backfill image thumbnails."""
+
+    help = (
+        "Generate fixed-size thumbnails for profile pictures and club logos that "
+        "do not have current derivatives yet."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Register CLI arguments for this command."""
+        parser.add_argument(
+            "--only",
+            choices=sorted(_TARGETS),
+            help="Restrict the backfill to players or clubs",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate derivatives even when they look current",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many images would be processed",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=0,
+            help="Optional limit on images processed per target (0 = no limit)",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Execute the backfill for the requested targets."""
+        only = options.get("only")
+        force = bool(options.get("force"))
+        dry_run = bool(options.get("dry_run"))
+        limit_opt = options.get("limit")
+        limit = max(0, limit_opt) if isinstance(limit_opt, int) else 0
+
+        if not dry_run and not pillow_available():
+            self.stderr.write("Pillow is not installed; cannot generate thumbnails.")
+            return
+
+        targets = [str(only)] if only else sorted(_TARGETS)
+        for target in targets:
+            image_field, derivatives_field = _TARGETS[target]
+            processed = 0
+            for instance in _queryset_for(target).iterator(chunk_size=200):
+                if limit and processed >= limit:
+                    break
+                if not force and derivatives_are_current(
+                    getattr(instance, image_field),
+                    getattr(instance, derivatives_field),
+                ):
+                    continue
+
+                processed += 1
+                if dry_run:
+                    self.stdout.write(f"{target} {instance.pk}: would regenerate")
+                    continue
+
+                refresh_image_derivatives(
+                    instance,
+                    image_field=image_field,
+                    derivatives_field=derivatives_field,
+                    force=force,
+                )
+                self.stdout.write(f"{target} {instance.pk}: regenerated")
+
+            self.stdout.write(
+                self.style.SUCCESS(f"Done. Processed {processed} {target}.")
+            )
@@ -0,0 +1,151 @@
+"""Load-test tracker commands against concurrent public timeline readers.
+
+Run it against PostgreSQL with enough connections for every reader (for 500
+readers, raise `max_connections` or put PgBouncer in front). The generated
+league has to be committed so reader threads can see it; it is deleted again
+afterwards unless `--keep-data` is given.
+
+    python manage.py benchmark_live_reads --readers 500 --output live_reads.json
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from datetime import UTC, datetime
+import json
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.game_tracker.services.live_update_signal_control import (
+    suppress_live_update_signals,
+)
+from apps.kwt_common.benchmarks import (
+    GeneratedLeague,
+    LeagueConfig,
+    generate_league,
+    measure_tracker_under_read_load,
+)
+from apps.kwt_common.benchmarks.runner import RESULTS_SCHEMA_VERSION
+
+
+_PREFIX = "LiveReadBench"
+
+
+def _delete_league(league: GeneratedLeague) -> None:
+    # Cascading event deletes would otherwise record live changes for the
+    # matches being deleted.
+    with transaction.atomic(), suppress_live_update_signals():
+        for club in league.clubs:
+            club.delete()
+        league.season.delete()
+        get_user_model().objects.filter(
+            username__startswith=f"{_PREFIX.lower()}-",
+        ).delete()
+
+
+class Command(BaseCommand):
+    """Django management command to load-test live timeline reads."""
+
+    help = (
+        "Time tracker commands on a live match while many threads poll its "
+        "public events and shots payloads."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Register CLI arguments for this command."""
+        parser.add_argument(
+            "--readers",
+            type=int,
+            default=100,
+            help="Concurrent reader threads (one database connection each)",
+        )
+        parser.add_argument(
+            "--commands",
+            type=int,
+            default=50,
+            help="Tracker commands timed per phase (idle and under load)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=1,
+            help="Seed for the synthetic league (same seed = same data)",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON results to this file instead of stdout",
+        )
+        parser.add_argument(
+            "--keep-data",
+            action="store_true",
+            help="Keep the generated league instead of deleting it afterwards",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Generate a league, run both phases and report tracker latency.
+
+        Raises:
+            CommandError: On invalid options.
+
+        """
+        readers = options.get("readers")
+        commands = options.get("commands")
+        if not isinstance(readers, int) or readers < 1:
+            raise CommandError("--readers must be >= 1")
+        if not isinstance(commands, int) or commands < 2:  # noqa: PLR2004
+            raise CommandError("--commands must be >= 2")
+        if connection.vendor != "postgresql":
+            self.stdout.write(
+                self.style.WARNING(
+                    "Concurrency differs outside PostgreSQL; numbers will not be "
+                    "representative."
+                ),
+            )
+
+        config = LeagueConfig(
+            seed=int(options.get("seed") or 0),
+            clubs=2,
+            teams_per_club=1,
+            rounds=1,
+            prefix=_PREFIX,
+        )
+        with transaction.atomic():
+            league = generate_league(config)
+        try:
+            results = measure_tracker_under_read_load(
+                league,
+                readers=readers,
+                commands=commands,
+            )
+        finally:
+            if not options.get("keep_data"):
+                _delete_league(league)
+
+        document = json.dumps(
+            {
+                "schema": RESULTS_SCHEMA_VERSION,
+                "created_at": datetime.now(UTC).isoformat(),
+                "database": {
+                    "vendor": connection.vendor,
+                    "version": getattr(connection, "pg_version", None),
+                },
+                "live_reads": results,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        output = options.get("output")
+        if output:
+            Path(str(output)).write_text(document + "\n", encoding="utf-8")
+            self.stdout.write(f"Wrote results to {output}")
+        else:
+            self.stdout.write(document)
+
+        self.stdout.write(
+            f"tracker command median {results['idle']['median_ms']} ms idle, "
+            f"{results['under_load']['median_ms']} ms with {readers} readers "
+            f"({results['median_slowdown_pct']:+.1f}%)",
+        )
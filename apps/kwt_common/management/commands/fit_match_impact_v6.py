@@ -1,8 +1,10 @@
 """Fit tuned match-impact weights from historical match data.
 
-This command pulls finished matches from Postgres and builds per-team feature
-vectors that are sufficient to compute team impact totals as a linear function
-of a small set of weights.
+This command pulls finished matches from Postgres and their per-team feature
+vectors, which are sufficient to compute team impact totals as a linear function
+of a small set of weights. Feature vectors are read from
+`TeamMatchImpactFeatures` (kept current by the impact recompute task); matches
+without current rows are computed once and stored.
 
 It then runs a lightweight random search to find weights that better correlate
 with real match outcomes (goal differential).
@@ -28,7 +30,8 @@ from apps.game_tracker.services.match_impact import (
     LATEST_MATCH_IMPACT_ALGORITHM_VERSION,
     MatchTeamImpactFeatures,
     ShotImpactWeights,
-    compute_match_team_impact_features,
+    load_match_team_impact_features,
+    persist_match_team_impact_features,
     shot_impact_weights_for_version,
 )
 
@@ -128,41 +131,62 @@ def _sample_candidate(
     )
 
 
-def _load_match_rows(*, max_matches: int) -> list[dict[str, object]]:
+def _load_match_rows(
+    *,
+    max_matches: int,
+    refresh_features: bool = False,
+) -> list[dict[str, object]]:
     qs = (
         MatchData.objects
-        .select_related(
-            "match_link__home_team",
-            "match_link__away_team",
-        )
-        .filter(status="finished")
+        .filter(status="finished", match_link__isnull=False)
         .order_by("id_uuid")
+        .values_list(
+            "id_uuid",
+            "match_link__home_team_id",
+            "match_link__away_team_id",
+            "home_score",
+            "away_score",
+        )
     )
     if max_matches > 0:
         qs = qs[:max_matches]
+    matches = list(qs)
+
+    # Stored feature rows cover every match the recompute task has finished;
+    # only the rest are replayed (and stored for the next run).
+    stored: dict[str, dict[str, MatchTeamImpactFeatures]] = {}
+    if not refresh_features:
+        stored = load_match_team_impact_features(
+            match_data_ids=(
+                [str(match_data_id) for match_data_id, *_ in matches]
+                if max_matches > 0
+                else None
+            ),
+        )
 
     match_rows: list[dict[str, object]] = []
 
-    for md in qs.iterator(chunk_size=200):
-        match = md.match_link
-        if not match:
-            continue
-
-        home_team_id = str(match.home_team_id)
-        away_team_id = str(match.away_team_id)
-        features_by_team = compute_match_team_impact_features(
-            match_data=md,
-            algorithm_version=LATEST_MATCH_IMPACT_ALGORITHM_VERSION,
-        )
+    for match_data_id, home_team, away_team, home_score, away_score in matches:
+        home_team_id = str(home_team)
+        away_team_id = str(away_team)
+        features_by_team = stored.get(str(match_data_id), {})
+        if home_team_id not in features_by_team or away_team_id not in features_by_team:
+            match_data = MatchData.objects.select_related("match_link").get(
+                id_uuid=match_data_id,
+            )
+            features_by_team = persist_match_team_impact_features(
+                match_data=match_data,
+                algorithm_version=LATEST_MATCH_IMPACT_ALGORITHM_VERSION,
+            )
         if home_team_id not in features_by_team:
             continue
         if away_team_id not in features_by_team:
             continue
 
-        goal_diff = float(md.home_score - md.away_score)
+        goal_diff = float(home_score - away_score)
 
         match_rows.append({
-            "match_data_id": str(md.id_uuid),
+            "match_data_id": str(match_data_id),
             "goal_diff": goal_diff,
             "features_home": features_by_team[home_team_id],
             "features_away": features_by_team[away_team_id],
@@ -296,6 +320,11 @@ class Command(BaseCommand):
             default=5,
             help="K for K-fold CV (used for selecting best candidate).",
         )
+        parser.add_argument(
+            "--refresh-features",
+            action="store_true",
+            help="Recompute (and store) team features instead of reading them.",
+        )
         parser.add_argument(
             "--output-json",
             type=str,
@@ -311,12 +340,16 @@ class Command(BaseCommand):
         train_frac = cast(float, options.get("train_frac", 0.8))
         kfold = cast(int, options.get("kfold", 5))
         output_json = str(options.get("output_json", "") or "").strip()
+        refresh_features = bool(options.get("refresh_features", False))
 
         # Deterministic random search for weight tuning (not for crypto).
         rng = random.Random(seed)  # nosec B311
 
-        self.stdout.write("Loading finished matches and building features...")
-        match_rows = _load_match_rows(max_matches=max_matches)
+        self.stdout.write("Loading finished matches and their team features...")
+        match_rows = _load_match_rows(
+            max_matches=max_matches,
+            refresh_features=refresh_features,
+        )
 
         if not match_rows:
             self.stdout.write(self.style.WARNING("No usable finished matches found."))
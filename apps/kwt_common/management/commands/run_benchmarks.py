@@ -0,0 +1,191 @@
+"""Benchmark the tracker, stats, overview and eligibility hot paths.
+
+The command generates a deterministic synthetic league, runs every scenario a
+number of times and prints (or writes) a JSON results document. Run it against
+a local PostgreSQL database so numbers are representative; by default all
+generated rows are rolled back afterwards.
+
+Typical use when working on a performance change:
+
+    python manage.py run_benchmarks --output before.json
+    # ...apply the change...
+    python manage.py run_benchmarks --compare before.json --output after.json
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+import json
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.kwt_common.benchmarks import (
+    LeagueConfig,
+    compare_results,
+    generate_league,
+    run_benchmarks,
+)
+
+
+def _int_option(options: dict[str, object], key: str, *, minimum: int) -> int:
+    value = options.get(key)
+    if not isinstance(value, int) or value < minimum:
+        raise CommandError(f"--{key.replace('_', '-')} must be >= {minimum}")
+    return value
+
+
+class Command(BaseCommand):
+    """Django management command to run the backend benchmark suite."""
+
+    help = (
+        "Generate a synthetic league and time/count queries for the backend hot "
+        "paths. Writes JSON baselines that can be compared between commits."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Register CLI arguments for this command."""
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=1,
+            help="Seed for the synthetic league (same seed = same data)",
+        )
+        parser.add_argument(
+            "--clubs",
+            type=int,
+            default=4,
+            help="Number of clubs to generate",
+        )
+        parser.add_argument(
+            "--teams-per-club",
+            type=int,
+            default=2,
+            help="Ranked teams per club",
+        )
+        parser.add_argument(
+            "--players-per-team",
+            type=int,
+            default=10,
+            help="Roster size per team (8 field players + reserves)",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=6,
+            help="Number of played rounds in the season",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=10,
+            help="Calls per scenario (the first call is reported as cold)",
+        )
+        parser.add_argument(
+            "--only",
+            action="append",
+            default=[],
+            help="Run only the named scenario (repeatable)",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON results to this file instead of stdout",
+        )
+        parser.add_argument(
+            "--compare",
+            help="Baseline JSON file to compare the results against",
+        )
+        parser.add_argument(
+            "--time-threshold",
+            type=float,
+            default=20.0,
+            help="Allowed median time increase in percent before flagging",
+        )
+        parser.add_argument(
+            "--fail-on-regression",
+            action="store_true",
+            help="Exit with an error when --compare finds regressions",
+        )
+        parser.add_argument(
+            "--keep-data",
+            action="store_true",
+            help="Commit the generated league instead of rolling it back",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Generate the league, run the scenarios and report the results.
+
+        Raises:
+            CommandError: On invalid options or (optionally) on regressions.
+
+        """
+        config = LeagueConfig(
+            seed=int(options.get("seed") or 0),
+            clubs=_int_option(options, "clubs", minimum=1),
+            teams_per_club=_int_option(options, "teams_per_club", minimum=1),
+            players_per_team=_int_option(options, "players_per_team", minimum=10),
+            rounds=_int_option(options, "rounds", minimum=1),
+        )
+        if config.clubs * config.teams_per_club < 2:  # noqa: PLR2004
+            raise CommandError("The league needs at least two teams.")
+        repeat = _int_option(options, "repeat", minimum=2)
+        only_opt = options.get("only")
+        only = [str(name) for name in only_opt] if isinstance(only_opt, list) else []
+
+        baseline: dict[str, Any] | None = None
+        compare_path = options.get("compare")
+        if compare_path:
+            baseline = json.loads(Path(str(compare_path)).read_text(encoding="utf-8"))
+
+        with transaction.atomic():
+            league = generate_league(config)
+            results = run_benchmarks(league, repeat=repeat, only=only)
+            if not options.get("keep_data"):
+                transaction.set_rollback(True)
+
+        document = json.dumps(results, indent=2, sort_keys=True)
+        output = options.get("output")
+        if output:
+            Path(str(output)).write_text(document + "\n", encoding="utf-8")
+            self.stdout.write(f"Wrote results to {output}")
+        else:
+            self.stdout.write(document)
+
+        for name, numbers in results["scenarios"].items():
+            self.stdout.write(
+                f"{name}: median {numbers['median_ms']} ms, "
+                f"{numbers['queries']} queries (cold {numbers['queries_first']})",
+            )
+
+        if baseline is None:
+            return
+
+        if baseline.get("league") != results["league"]:
+            self.stdout.write(
+                self.style.WARNING("Baseline was generated with a different league."),
+            )
+        if baseline.get("database", {}).get("vendor") != results["database"]["vendor"]:
+            self.stdout.write(
+                self.style.WARNING("Baseline was generated on a different database."),
+            )
+
+        time_threshold = options.get("time_threshold")
+        regressions = compare_results(
+            baseline,
+            results,
+            time_threshold_pct=(
+                float(time_threshold)
+                if isinstance(time_threshold, (int, float))
+                else 20.0
+            ),
+        )
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS("No regressions against baseline."))
+            return
+
+        for regression in regressions:
+            self.stdout.write(self.style.ERROR(f"Regression: {regression}"))
+        if options.get("fail_on_regression"):
+            raise CommandError(f"{len(regressions)} benchmark regression(s) found.")
@@ -0,0 +1,159 @@
+"""Presigned media URL cache.
+
+With `AWS_QUERYSTRING_AUTH=True` every `FieldFile.url` call computes a fresh
+S3 signature. List endpoints (rosters, match summaries, MVP candidates) resolve
+dozens to hundreds of logos/avatars per response, so we reuse signatures.
+
+URLs are cached per (storage key, expiry bucket):
+- The bucket width is `AWS_QUERYSTRING_EXPIRE - KORFBAL_MEDIA_URL_MIN_VALIDITY_S`,
+  so a cached URL always has at least `KORFBAL_MEDIA_URL_MIN_VALIDITY_S` left
+  when handed out.
+- A small per-process LRU avoids cache round trips for hot keys; the shared
+  cache (Valkey) lets workers reuse each other's signatures.
+
+Storages without querystring auth (local filesystem, public buckets) are
+resolved directly: building those URLs is already cheap.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import contextlib
+import threading
+import time
+from typing import TYPE_CHECKING, Final
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.kwt_common.metrics import record_media_url_lookup
+
+
+if TYPE_CHECKING:
+    from django.core.files.storage import Storage
+    from django.db.models.fields.files import FieldFile
+
+
+_CACHE_KEY_PREFIX: Final[str] = "korfbal:media-url:v1"
+_LOCAL_MAX_ENTRIES: Final[int] = 2048
+
+_local_lock = threading.Lock()
+_local_urls: OrderedDict[str, tuple[float, str]] = OrderedDict()
+# Moving average of observed signing cost, used to report time saved by hits.
+_avg_sign_ms = 0.0
+
+
+def _querystring_expire_s(storage: object) -> int:
+    expire = getattr(storage, "querystring_expire", None)
+    if expire is None:
+        expire = getattr(settings, "AWS_QUERYSTRING_EXPIRE", 3600)
+    return max(0, int(expire))
+
+
+def _bucket_width_s(expire_s: int) -> int:
+    """Return how long a signature may be reused (0 disables caching)."""
+    if not bool(getattr(settings, "KORFBAL_MEDIA_URL_CACHE_ENABLED", True)):
+        return 0
+    min_validity_s = int(getattr(settings, "KORFBAL_MEDIA_URL_MIN_VALIDITY_S", 300))
+    return max(0, expire_s - max(0, min_validity_s))
+
+
+def _local_get(key: str, now: float) -> str | None:
+    with _local_lock:
+        entry = _local_urls.get(key)
+        if entry is None:
+            return None
+        expires_at, url = entry
+        if expires_at <= now:
+            del _local_urls[key]
+            return None
+        _local_urls.move_to_end(key)
+        return url
+
+
+def _local_set(key: str, url: str, expires_at: float) -> None:
+    with _local_lock:
+        _local_urls[key] = (expires_at, url)
+        _local_urls.move_to_end(key)
+        while len(_local_urls) > _LOCAL_MAX_ENTRIES:
+            _local_urls.popitem(last=False)
+
+
+def _observe_sign_ms(sign_ms: float) -> None:
+    global _avg_sign_ms  # noqa: PLW0603
+    with _local_lock:
+        if _avg_sign_ms <= 0:
+            _avg_sign_ms = sign_ms
+        else:
+            _avg_sign_ms = (_avg_sign_ms * 0.9) + (sign_ms * 0.1)
+
+
+def clear_local_media_url_cache() -> None:
+    """Drop the per-process URL cache (tests, storage reconfiguration)."""
+    with _local_lock:
+        _local_urls.clear()
+
+
+def cached_media_url(field_file: FieldFile) -> str:
+    """Return the URL for a stored file, reusing presigned URLs when possible.
+
+    Args:
+        field_file: A non-empty `FieldFile` (e.g. `player.profile_picture`).
+
+    Returns:
+        The (possibly presigned) URL for the file.
+
+    """
+    return cached_storage_url(field_file.storage, str(field_file.name or ""))
+
+
+def cached_storage_url(storage: Storage, name: str) -> str:
+    """Return the URL for `name` in `storage`, reusing presigned URLs when possible.
+
+    Args:
+        storage: The storage backend holding the file.
+        name: The storage key of the file.
+
+    Returns:
+        The (possibly presigned) URL for the file.
+
+    """
+    if not name or not bool(getattr(storage, "querystring_auth", False)):
+        return storage.url(name)
+
+    expire_s = _querystring_expire_s(storage)
+    bucket_width_s = _bucket_width_s(expire_s)
+    if bucket_width_s <= 0:
+        return storage.url(name)
+
+    now = time.time()
+    bucket = int(now // bucket_width_s)
+    bucket_ends_at = (bucket + 1) * bucket_width_s
+    bucket_name = str(getattr(storage, "bucket_name", "") or "")
+    key = f"{_CACHE_KEY_PREFIX}:{bucket_name}:{bucket_width_s}:{bucket}:{name}"
+
+    url = _local_get(key, now)
+    if url is not None:
+        record_media_url_lookup(result="local", saved_ms=_avg_sign_ms)
+        return url
+
+    try:
+        shared = cache.get(key)
+    except Exception:  # noqa: BLE001
+        shared = None
+    if isinstance(shared, str) and shared:
+        _local_set(key, shared, bucket_ends_at)
+        record_media_url_lookup(result="shared", saved_ms=_avg_sign_ms)
+        return shared
+
+    start = time.perf_counter()
+    url = storage.url(name)
+    sign_ms = (time.perf_counter() - start) * 1000.0
+    _observe_sign_ms(sign_ms)
+    record_media_url_lookup(result="signed", sign_ms=sign_ms)
+
+    ttl_s = max(1, int(bucket_ends_at - now))
+    _local_set(key, url, bucket_ends_at)
+    with contextlib.suppress(Exception):
+        cache.set(key, url, timeout=ttl_s)
+    return url
@@ -7,19 +7,23 @@ from typing import Any, Final, cast
 
 
 PrometheusCounter: Any
+PrometheusGauge: Any
 PrometheusHistogram: Any
 
 try:
     from prometheus_client import (
         Counter as _ImportedPrometheusCounter,
+        Gauge as _ImportedPrometheusGauge,
         Histogram as _ImportedPrometheusHistogram,
     )
 except Exception:  # pragma: no cover - optional dependency
     PrometheusCounter = None
+    PrometheusGauge = None
     PrometheusHistogram = None
     _PROMETHEUS_AVAILABLE = False
 else:
     PrometheusCounter = _ImportedPrometheusCounter
+    PrometheusGauge = _ImportedPrometheusGauge
     PrometheusHistogram = _ImportedPrometheusHistogram
     _PROMETHEUS_AVAILABLE = True
 
@@ -40,6 +44,7 @@ def _safe_label(value: object, default: str = "unknown") -> str:
 
 if _PROMETHEUS_AVAILABLE:
     counter_factory = cast(Any, PrometheusCounter)
+    gauge_factory = cast(Any, PrometheusGauge)
     histogram_factory = cast(Any, PrometheusHistogram)
 
     REQUEST_DURATION_MS = histogram_factory(
@@ -146,6 +151,44 @@ if _PROMETHEUS_AVAILABLE:
             10000,
         ],
     )
+    MEDIA_URL_LOOKUPS_TOTAL = counter_factory(
+        "korfbal_media_url_lookups_total",
+        "Media URL resolutions by cache result (local, shared, signed)",
+        ["result"],
+    )
+    MEDIA_URL_SIGN_DURATION_MS = histogram_factory(
+        "korfbal_media_url_sign_duration_ms",
+        "Time spent computing presigned media URLs in milliseconds",
+        buckets=[0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50],
+    )
+    MEDIA_URL_SIGN_MS_SAVED_TOTAL = counter_factory(
+        "korfbal_media_url_sign_ms_saved_total",
+        "Estimated signing time saved by cached media URLs in milliseconds",
+    )
+    PUBLIC_CACHE_LOOKUPS_TOTAL = counter_factory(
+        "korfbal_public_cache_lookups_total",
+        "Public response cache lookups by scope and result (fresh, stale, miss)",
+        ["scope", "result"],
+    )
+    QUERY_BUDGET_EXCEEDED_TOTAL = counter_factory(
+        "korfbal_query_budget_exceeded_total",
+        "Requests that ran more SQL queries than their view's budget",
+        ["view"],
+    )
+    AUDIT_INGEST_QUEUE_DEPTH = gauge_factory(
+        "korfbal_audit_ingest_queue_depth",
+        "Audit events waiting in the buffered ingest stream",
+    )
+    AUDIT_INGEST_FLUSH_DURATION_MS = histogram_factory(
+        "korfbal_audit_ingest_flush_duration_ms",
+        "Time to write one buffered audit ingest batch in milliseconds",
+        buckets=[5, 10, 25, 50, 100, 200, 500, 1000, 2000, 5000, 10000],
+    )
+    AUDIT_INGEST_EVENTS_TOTAL = counter_factory(
+        "korfbal_audit_ingest_events_total",
+        "Buffered audit events by outcome (written, dead_lettered, rejected)",
+        ["outcome"],
+    )
 
 
 @dataclass(frozen=True)
@@ -197,3 +240,68 @@ def record_slow_db_query(*, alias: str, elapsed_ms: int) -> None:
     SLOW_DB_QUERY_DURATION_MS.labels(alias=_safe_label(alias)).observe(
         max(0, elapsed_ms)
     )
+
+
+def record_media_url_lookup(
+    *,
+    result: str,
+    sign_ms: float | None = None,
+    saved_ms: float | None = None,
+) -> None:
+    """Record media URL cache metrics when Prometheus is available."""
+    if not _PROMETHEUS_AVAILABLE:
+        return
+
+    MEDIA_URL_LOOKUPS_TOTAL.labels(result=_safe_label(result)).inc()
+    if sign_ms is not None:
+        MEDIA_URL_SIGN_DURATION_MS.observe(max(0.0, sign_ms))
+    if saved_ms is not None and saved_ms > 0:
+        MEDIA_URL_SIGN_MS_SAVED_TOTAL.inc(saved_ms)
+
+
+def record_public_cache_lookup(*, scope: str, result: str) -> None:
+    """Record a public response cache lookup when Prometheus is available."""
+    if not _PROMETHEUS_AVAILABLE:
+        return
+
+    PUBLIC_CACHE_LOOKUPS_TOTAL.labels(
+        scope=_safe_label(scope),
+        result=_safe_label(result),
+    ).inc()
+
+
+def record_query_budget_exceeded(*, view: str) -> None:
+    """Record a query budget overrun when Prometheus is available."""
+    if not _PROMETHEUS_AVAILABLE:
+        return
+
+    QUERY_BUDGET_EXCEEDED_TOTAL.labels(view=_safe_label(view)).inc()
+
+
+def record_audit_ingest_flush(
+    *,
+    written: int,
+    dead_lettered: int,
+    elapsed_ms: float | None,
+    queue_depth: int,
+) -> None:
+    """Record a buffered audit ingest flush when Prometheus is available."""
+    if not _PROMETHEUS_AVAILABLE:
+        return
+
+    AUDIT_INGEST_QUEUE_DEPTH.set(max(0, queue_depth))
+    if elapsed_ms is not None:
+        AUDIT_INGEST_FLUSH_DURATION_MS.observe(max(0.0, elapsed_ms))
+    if written:
+        AUDIT_INGEST_EVENTS_TOTAL.labels(outcome="written").inc(written)
+    if dead_lettered:
+        AUDIT_INGEST_EVENTS_TOTAL.labels(outcome="dead_lettered").inc(dead_lettered)
+
+
+def record_audit_ingest_rejected(*, queue_depth: int) -> None:
+    """Record a buffered audit ingest rejected by backpressure."""
+    if not _PROMETHEUS_AVAILABLE:
+        return
+
+    AUDIT_INGEST_QUEUE_DEPTH.set(max(0, queue_depth))
+    AUDIT_INGEST_EVENTS_TOTAL.labels(outcome="rejected").inc()
@@ -27,6 +27,7 @@ from django.http import HttpRequest, HttpResponse
 from django.utils import timezone
 
 from apps.kwt_common.metrics import RequestMetrics, record_request_metrics
+from apps.kwt_common.overview_sections import SectionTiming, collect_section_timings
 from apps.kwt_common.utils.slow_requests import slow_request_buffer_ttl_s
 
 
@@ -42,6 +43,13 @@ def _append_server_timing(existing: str | None, value: str) -> str:
     return f"{existing}, {value}"
 
 
+def _section_server_timing(timing: SectionTiming) -> str:
+    value = f"{timing.name};dur={timing.duration_ms:.1f}"
+    if timing.outcome != "ok":
+        value = f'{value};desc="{timing.outcome}"'
+    return value
+
+
 def _response_size_bytes(response: HttpResponse) -> int | None:
     """Measure non-streaming response bytes without consuming stream content."""
     content_length = response.headers.get("Content-Length")
@@ -73,7 +81,8 @@ class RequestTimingMiddleware:
     def __call__(self, request: HttpRequest) -> HttpResponse:
         """Time the request and optionally record slow requests."""
         start = time.perf_counter()
-        response = self.get_response(request)
+        with collect_section_timings() as section_timings:
+            response = self.get_response(request)
         elapsed_ms = int((time.perf_counter() - start) * 1000)
 
         # Always attach lightweight timing signals.
@@ -82,6 +91,12 @@ class RequestTimingMiddleware:
             response.headers.get("Server-Timing"),
             f"app;dur={elapsed_ms}",
         )
+        # Overview sections (see `apps.kwt_common.overview_sections`).
+        for timing in section_timings:
+            response["Server-Timing"] = _append_server_timing(
+                response.headers.get("Server-Timing"),
+                _section_server_timing(timing),
+            )
 
         resolver_match = getattr(request, "resolver_match", None)
         view_name = getattr(resolver_match, "view_name", None)
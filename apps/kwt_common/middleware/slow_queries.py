@@ -7,6 +7,9 @@ Goal:
 This middleware is opt-in via settings:
 - KORFBAL_LOG_SLOW_DB_QUERIES (bool)
 - KORFBAL_SLOW_DB_QUERY_MS (int)
+- KORFBAL_QUERY_BUDGETS_ENABLED (bool): also count every query and report
+  requests that exceed their viewset action's query budget (see
+  `apps.kwt_common.query_budget`).
 
 It uses Django's connection execute wrapper, so it can work outside DEBUG.
 
@@ -18,6 +21,7 @@ from collections.abc import Callable
 from contextlib import ExitStack
 import logging
 import operator
+import threading
 import time
 from typing import Any, cast
 
@@ -25,7 +29,8 @@ from django.conf import settings
 from django.db import connections
 from django.http import HttpRequest, HttpResponse
 
-from apps.kwt_common.metrics import record_slow_db_query
+from apps.kwt_common.metrics import record_query_budget_exceeded, record_slow_db_query
+from apps.kwt_common.query_budget import QueryRecorder, query_budget_for_view
 
 
 logger = logging.getLogger("apps.kwt_common.slow_queries")
@@ -47,7 +52,9 @@ class SlowQueryLoggingMiddleware:
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
         """Wrap DB execution during a request and log the slowest queries."""
-        if not bool(getattr(settings, "KORFBAL_LOG_SLOW_DB_QUERIES", False)):
+        log_slow = bool(getattr(settings, "KORFBAL_LOG_SLOW_DB_QUERIES", False))
+        check_budgets = bool(getattr(settings, "KORFBAL_QUERY_BUDGETS_ENABLED", False))
+        if not log_slow and not check_budgets:
             return self.get_response(request)
 
         threshold_ms = int(getattr(settings, "KORFBAL_SLOW_DB_QUERY_MS", 200))
@@ -55,6 +62,9 @@ class SlowQueryLoggingMiddleware:
 
         # Keep a small top list (slowest queries) so logs stay readable.
         slowest: list[tuple[float, str, str, object]] = []
+        # Overview sections can run queries on helper threads.
+        slowest_lock = threading.Lock()
+        recorder = QueryRecorder() if check_budgets else None
 
         def _execute_wrapper_for_alias(alias: str) -> Callable[..., object]:
             def _execute_wrapper(
@@ -64,17 +74,20 @@ class SlowQueryLoggingMiddleware:
                 many: bool,
                 context: dict[str, object],
             ) -> object:
+                if recorder is not None:
+                    recorder.record(sql)
                 start = time.perf_counter()
                 try:
                     return execute(sql, params, many, context)
                 finally:
                     elapsed = time.perf_counter() - start
-                    if elapsed >= threshold_s:
+                    if log_slow and elapsed >= threshold_s:
                         elapsed_ms = int(elapsed * 1000)
                         record_slow_db_query(alias=alias, elapsed_ms=elapsed_ms)
-                        slowest.append((elapsed, alias, sql, params))
-                        slowest.sort(key=operator.itemgetter(0), reverse=True)
-                        del slowest[10:]
+                        with slowest_lock:
+                            slowest.append((elapsed, alias, sql, params))
+                            slowest.sort(key=operator.itemgetter(0), reverse=True)
+                            del slowest[10:]
 
             return _execute_wrapper
 
@@ -88,6 +101,11 @@ class SlowQueryLoggingMiddleware:
                 )
             response = self.get_response(request)
 
+        if recorder is not None:
+            self._report_query_budget(request, recorder)
+        if not log_slow:
+            return response
+
         include_sql = bool(getattr(settings, "KORFBAL_SLOW_DB_INCLUDE_SQL", False))
         request_with_metrics = cast(Any, request)
         if slowest:
@@ -121,3 +139,29 @@ class SlowQueryLoggingMiddleware:
                 )
 
         return response
+
+    @staticmethod
+    def _report_query_budget(request: HttpRequest, recorder: QueryRecorder) -> None:
+        """Log a structured report when the view exceeded its query budget."""
+        budget = query_budget_for_view(
+            getattr(getattr(request, "resolver_match", None), "func", None),
+            request.method or "GET",
+        )
+        if budget is None:
+            return
+
+        report = recorder.report(budget)
+        if not report.exceeded:
+            return
+
+        record_query_budget_exceeded(view=report.view)
+        logger.warning(
+            "Query budget exceeded view=%s queries=%s budget=%s path=%s",
+            report.view,
+            report.executed,
+            report.budget,
+            request.path,
+            extra={"query_budget": report.as_dict()},
+        )
+        for fingerprint, count in report.repeated:
+            logger.warning("  %dx %s", count, fingerprint)
@@ -3,14 +3,17 @@
 from collections.abc import Callable
 
 from django.http import HttpRequest, HttpResponse
-from django.utils import timezone
 
-from apps.hub.models import PageConnectRegistration
-from apps.player.models import Player
+from apps.hub.services.page_visits import record_page_visit
+from apps.player.services.viewer_identity import viewer_player_for
 
 
 class VisitorTrackingMiddleware:
-    """Middleware to track the pages visited by the player."""
+    """Middleware to track the pages visited by the player.
+
+    Visits are buffered and written in batches (see
+    `apps.hub.services.page_visits`), so requests do not touch the database.
+    """
 
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
         """Initialize the middleware."""
@@ -24,24 +27,17 @@ class VisitorTrackingMiddleware:
 
         """
         if request.user.is_authenticated:
-            try:
-                player = Player.objects.get(user=request.user)
-                page, created = PageConnectRegistration.objects.get_or_create(
-                    player=player,
-                    page=request.path,
-                )
-
-                if not created:
-                    # Update the registration date if it's not a new record
-                    page.registration_date = timezone.now()
-                    page.save()
-
-                # Reset the back_counter only if this is not a back navigation
-                if not request.session.pop("is_back_navigation", False):
-                    request.session["back_counter"] = 1
-
-            except Player.DoesNotExist:
-                # Handle the case where the player does not exist
-                pass
+            record_page_visit(user_id=request.user.pk, path=request.path)
+
+            # Reset the back_counter only if this is not a back navigation,
+            # and only for users with a player. Unchanged values are not
+            # written (so the session is not saved on every request), and
+            # the player is only looked up when something would change.
+            session = request.session
+            if (
+                session.get("is_back_navigation") or session.get("back_counter") != 1
+            ) and viewer_player_for(request) is not None:
+                if not session.pop("is_back_navigation", False):
+                    session["back_counter"] = 1
 
         return self.get_response(request)
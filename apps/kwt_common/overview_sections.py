@@ -0,0 +1,290 @@
+"""Run the independent sections of an overview payload concurrently.
+
+Club, team and player overviews are assembled from sections (match lists,
+stats, roster, season options) that each run their own queries and do not
+depend on each other. `compose_sections` computes them on the request thread
+plus at most `KORFBAL_OVERVIEW_SECTION_WORKERS` helpers:
+
+- The request thread always takes sections itself; helpers come from a
+  process-wide pool of that size and take the remaining ones while it is busy.
+  When the pool is saturated the request simply runs its sections one after
+  the other, it never queues behind other requests.
+- Helpers keep their database connection between requests, so the pool is
+  only used with persistent connections (`CONN_MAX_AGE`); otherwise every
+  section would open and close its own connection.
+- The execute wrappers installed on the request thread's connections (query
+  budgets, slow-query logging) are installed around each helper section too,
+  so its queries count towards the request.
+- Once the request thread runs out of sections it waits at most
+  `KORFBAL_OVERVIEW_SECTION_TIMEOUT_MS` (from the start) for the helpers.
+  Sections still running then, or that raised, are replaced by their
+  `fallback` and listed in `SectionResults.partial`. Payloads built from
+  partial results report them in `meta.partial_sections` and are not stored
+  in the public response cache.
+- A section with a `cache_key` goes through the public response cache
+  (`apps.kwt_common.public_cache`) under its tags, so match changes
+  invalidate it. Its value must not depend on the viewer.
+- Durations are collected per request and sent as `Server-Timing` entries by
+  `RequestTimingMiddleware`.
+
+Sections also run on the request thread only inside a transaction, whose
+uncommitted rows other connections cannot see.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any, Final, Literal
+
+from django.conf import settings
+from django.db import close_old_connections, connection, connections
+
+from apps.kwt_common.public_cache import cached_public_payload
+
+
+logger = logging.getLogger(__name__)
+
+SectionOutcome = Literal["ok", "timeout", "error"]
+_Outcome = tuple[Any, float, SectionOutcome]
+_ExecuteWrappers = dict[str, tuple[Callable[..., object], ...]]
+
+_THREAD_NAME_PREFIX: Final[str] = "overview-section"
+
+_pool_lock = threading.Lock()
+_pools: dict[int, ThreadPoolExecutor] = {}
+_request_timings: ContextVar[list[SectionTiming] | None] = ContextVar(
+    "korfbal_overview_section_timings",
+    default=None,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class OverviewSection:
+    """One independently computed part of an overview payload."""
+
+    name: str
+    compute: Callable[[], Any]
+    fallback: Any = None
+    cache_key: str | None = None
+    cache_tags: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class SectionTiming:
+    """How long a section took and how it ended."""
+
+    name: str
+    duration_ms: float
+    outcome: SectionOutcome
+
+
+@dataclass(frozen=True, slots=True)
+class SectionResults:
+    """Section values by name, with fallbacks for the partial ones."""
+
+    values: Mapping[str, Any]
+    partial: tuple[str, ...]
+    timings: tuple[SectionTiming, ...]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return the value of section `name`, or `default` if it was not run."""
+        return self.values.get(name, default)
+
+
+def overview_section_workers() -> int:
+    """Return the number of helper threads (0 runs sections inline)."""
+    return max(0, int(getattr(settings, "KORFBAL_OVERVIEW_SECTION_WORKERS", 4)))
+
+
+def _timeout_s() -> float | None:
+    timeout_ms = max(
+        0,
+        int(getattr(settings, "KORFBAL_OVERVIEW_SECTION_TIMEOUT_MS", 3000)),
+    )
+    return timeout_ms / 1000 if timeout_ms else None
+
+
+def _persistent_connections() -> bool:
+    max_age = connection.settings_dict.get("CONN_MAX_AGE", 0)
+    return max_age is None or max_age > 0
+
+
+def _pool(workers: int) -> ThreadPoolExecutor:
+    with _pool_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix=_THREAD_NAME_PREFIX,
+            )
+            _pools[workers] = pool
+        return pool
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+def _run(section: OverviewSection) -> _Outcome:
+    start = time.perf_counter()
+    try:
+        if section.cache_key is None:
+            value = section.compute()
+        else:
+            value = cached_public_payload(
+                section.cache_key,
+                tags=section.cache_tags,
+                compute=section.compute,
+            )
+    except Exception:
+        logger.exception("Overview section %s failed", section.name)
+        return section.fallback, _elapsed_ms(start), "error"
+    return value, _elapsed_ms(start), "ok"
+
+
+class _SectionQueue:
+    """Sections of one composition not yet taken by a thread."""
+
+    def __init__(self, sections: list[OverviewSection]) -> None:
+        self._pending = deque(enumerate(sections))
+        self._lock = threading.Lock()
+        self.futures: list[Future[_Outcome]] = [Future() for _ in sections]
+
+    def drain(self) -> None:
+        """Run pending sections until none are left."""
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return
+                index, section = self._pending.popleft()
+            self.futures[index].set_result(_run(section))
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return not self._pending
+
+
+def _request_execute_wrappers() -> _ExecuteWrappers:
+    return {alias: tuple(connections[alias].execute_wrappers) for alias in connections}
+
+
+def _help(queue: _SectionQueue, wrappers: _ExecuteWrappers) -> None:
+    # Started after the request thread took every section: nothing to do.
+    if queue.is_empty():
+        return
+    close_old_connections()
+    try:
+        with ExitStack() as stack:
+            for alias, alias_wrappers in wrappers.items():
+                for wrapper in alias_wrappers:
+                    stack.enter_context(connections[alias].execute_wrapper(wrapper))
+            queue.drain()
+    finally:
+        close_old_connections()
+
+
+def _run_with_helpers(
+    sections: list[OverviewSection],
+    workers: int,
+) -> list[_Outcome]:
+    start = time.perf_counter()
+    timeout_s = _timeout_s()
+    queue = _SectionQueue(sections)
+    wrappers = _request_execute_wrappers()
+    pool = _pool(workers)
+    for _ in range(min(workers, len(sections) - 1)):
+        pool.submit(_help, queue, wrappers)
+
+    queue.drain()
+    remaining = None if timeout_s is None else timeout_s - (time.perf_counter() - start)
+    wait(queue.futures, timeout=None if remaining is None else max(0.0, remaining))
+
+    outcomes: list[_Outcome] = []
+    for section, future in zip(sections, queue.futures, strict=True):
+        if future.done():
+            outcomes.append(future.result())
+            continue
+        # The helper keeps running it (and may still fill its cache entry).
+        logger.warning("Overview section %s timed out", section.name)
+        outcomes.append((section.fallback, _elapsed_ms(start), "timeout"))
+    return outcomes
+
+
+def compose_sections(
+    scope: str,
+    sections: Iterable[OverviewSection],
+) -> SectionResults:
+    """Compute `sections`, concurrently when possible.
+
+    Args:
+        scope: Overview name, used as prefix of the `Server-Timing` entries.
+        sections: Sections to compute; names must be unique.
+
+    Returns:
+        SectionResults: Values (or fallbacks), partial section names, timings.
+
+    """
+    section_list = list(sections)
+    workers = overview_section_workers()
+    if (
+        workers <= 0
+        or len(section_list) <= 1
+        or connection.in_atomic_block
+        or not _persistent_connections()
+    ):
+        outcomes = [_run(section) for section in section_list]
+    else:
+        outcomes = _run_with_helpers(section_list, workers)
+
+    values: dict[str, Any] = {}
+    partial: list[str] = []
+    timings: list[SectionTiming] = []
+    for section, (value, duration_ms, outcome) in zip(
+        section_list,
+        outcomes,
+        strict=True,
+    ):
+        values[section.name] = value
+        if outcome != "ok":
+            partial.append(section.name)
+        timings.append(
+            SectionTiming(
+                name=f"{scope}-{section.name}",
+                duration_ms=duration_ms,
+                outcome=outcome,
+            ),
+        )
+
+    collected = _request_timings.get()
+    if collected is not None:
+        collected.extend(timings)
+    return SectionResults(
+        values=values,
+        partial=tuple(partial),
+        timings=tuple(timings),
+    )
+
+
+def is_complete_overview(payload: Any) -> bool:
+    """Return False for overview payloads built from partial sections."""
+    meta = payload.get("meta") if isinstance(payload, dict) else None
+    return not (isinstance(meta, dict) and meta.get("partial_sections"))
+
+
+@contextmanager
+def collect_section_timings() -> Iterator[list[SectionTiming]]:
+    """Collect the timings of every composition run inside the block."""
+    timings: list[SectionTiming] = []
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
@@ -0,0 +1,196 @@
+"""Shared cache for anonymous (public) API responses.
+
+Public endpoints (schedule lists, club and team overviews) are polled by every
+anonymous visitor, so their payloads are cached in the shared cache (Valkey):
+
+- Keys are built from a scope plus the query parameters that affect the
+  payload, sorted, so `?a=1&b=2` and `?b=2&a=1` share an entry and unrelated
+  parameters (cache busters, tracking tags) do not create new ones.
+- Every entry records the version of each of its tags (for example
+  `team:<id>`). `invalidate_public_tags` gives a tag a new version, which makes
+  all entries carrying it stale; match changes do this after commit.
+- Entries are fresh for `KORFBAL_PUBLIC_CACHE_TTL_S` and kept for another
+  `KORFBAL_PUBLIC_CACHE_STALE_S`. A stale entry is recomputed by one worker
+  (a `cache.add` lock) while concurrent requests keep getting the stale
+  payload. Without any entry, other workers briefly wait for the lock holder.
+
+Cache failures are never fatal: the payload is then computed directly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import contextlib
+import hashlib
+import time
+from typing import Any, Final, Protocol
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.kwt_common.metrics import record_public_cache_lookup
+
+
+_CACHE_KEY_PREFIX: Final[str] = "korfbal:public:v1"
+_LOCK_TIMEOUT_S: Final[int] = 30
+_MISS_WAIT_S: Final[float] = 1.0
+_MISS_POLL_S: Final[float] = 0.05
+
+SCHEDULE_TAG: Final[str] = "schedule"
+
+
+class QueryParams(Protocol):
+    """Multi-valued query parameters (a `QueryDict`)."""
+
+    def getlist(self, key: str) -> list[str]:
+        """Return every value of `key`."""
+        ...
+
+
+def team_tag(team_id: object) -> str:
+    """Return the tag of payloads that depend on one team's matches."""
+    return f"team:{team_id}"
+
+
+def club_tag(club_id: object) -> str:
+    """Return the tag of payloads that depend on one club's matches."""
+    return f"club:{club_id}"
+
+
+def public_cache_ttl() -> int:
+    """Return how long a public payload is served as fresh (0 disables)."""
+    return max(0, int(getattr(settings, "KORFBAL_PUBLIC_CACHE_TTL_S", 60)))
+
+
+def _stale_window() -> int:
+    return max(0, int(getattr(settings, "KORFBAL_PUBLIC_CACHE_STALE_S", 30)))
+
+
+def _tag_key(tag: str) -> str:
+    return f"{_CACHE_KEY_PREFIX}:tag:{tag}"
+
+
+def public_cache_key(
+    scope: str,
+    params: QueryParams | None,
+    *,
+    fields: Iterable[str] = (),
+    subject: object | None = None,
+) -> str:
+    """Return a normalized cache key for `scope` and the relevant params.
+
+    `subject` identifies the object a detail endpoint is about (a club or team
+    id). Only parameters listed in `fields` take part; their values are sorted
+    and empty values dropped, so parameter order never matters. Keys that do
+    not depend on a request pass `params=None`.
+    """
+    parts: list[str] = []
+    if params is not None:
+        for name in sorted(set(fields)):
+            values = sorted(value for value in params.getlist(name) if value)
+            if values:
+                parts.append(f"{name}={','.join(values)}")
+    digest = hashlib.sha256("&".join(parts).encode()).hexdigest()[:32]
+    if subject is None:
+        return f"{_CACHE_KEY_PREFIX}:{scope}:{digest}"
+    return f"{_CACHE_KEY_PREFIX}:{scope}:{subject}:{digest}"
+
+
+def _read(key: str, tags: list[str]) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+    try:
+        found = cache.get_many([key, *map(_tag_key, tags)])
+    except Exception:  # noqa: BLE001
+        return None, {}
+    entry = found.get(key)
+    versions = {tag: found.get(_tag_key(tag)) for tag in tags}
+    return (entry if isinstance(entry, dict) else None), versions
+
+
+def _is_fresh(entry: dict[str, Any], versions: dict[str, Any]) -> bool:
+    return entry.get("tags") == versions and entry.get("fresh_until", 0) > time.time()
+
+
+def _wait_for_entry(key: str, tags: list[str]) -> dict[str, Any] | None:
+    deadline = time.monotonic() + _MISS_WAIT_S
+    while time.monotonic() < deadline:
+        time.sleep(_MISS_POLL_S)
+        entry, versions = _read(key, tags)
+        if entry is not None and _is_fresh(entry, versions):
+            return entry
+    return None
+
+
+def cached_public_payload(
+    key: str,
+    *,
+    tags: Iterable[str],
+    compute: Callable[[], Any],
+    cacheable: Callable[[Any], bool] | None = None,
+) -> Any:
+    """Return the cached payload for `key`, computing it at most once at a time.
+
+    A computed payload for which `cacheable` returns False (for example a
+    partial overview) is returned without being stored.
+
+    Returns:
+        Any: The cached (possibly stale while being recomputed) or new payload.
+
+    """
+    ttl = public_cache_ttl()
+    if ttl <= 0:
+        return compute()
+
+    scope = key.removeprefix(f"{_CACHE_KEY_PREFIX}:").split(":", 1)[0]
+    tag_list = sorted(set(tags))
+    entry, versions = _read(key, tag_list)
+    if entry is not None and _is_fresh(entry, versions):
+        record_public_cache_lookup(scope=scope, result="fresh")
+        return entry["payload"]
+
+    lock_key = f"{key}:lock"
+    locked = False
+    with contextlib.suppress(Exception):
+        locked = bool(cache.add(lock_key, 1, timeout=_LOCK_TIMEOUT_S))
+    if not locked:
+        if entry is None:
+            entry = _wait_for_entry(key, tag_list)
+        if entry is not None:
+            record_public_cache_lookup(scope=scope, result="stale")
+            return entry["payload"]
+
+    record_public_cache_lookup(scope=scope, result="miss")
+    try:
+        payload = compute()
+        if cacheable is not None and not cacheable(payload):
+            return payload
+        # Versions were read before computing: a tag bumped meanwhile leaves
+        # this entry stale instead of hiding the change.
+        with contextlib.suppress(Exception):
+            cache.set(
+                key,
+                {
+                    "payload": payload,
+                    "tags": versions,
+                    "fresh_until": time.time() + ttl,
+                },
+                timeout=ttl + _stale_window(),
+            )
+    finally:
+        if locked:
+            with contextlib.suppress(Exception):
+                cache.delete(lock_key)
+    return payload
+
+
+def invalidate_public_tags(tags: Iterable[str]) -> None:
+    """Mark every cached public payload carrying one of `tags` as stale."""
+    # Entries never outlive TTL + stale window, so versions only need as long.
+    timeout = max(1, public_cache_ttl() + _stale_window())
+    version = uuid.uuid4().hex
+    with contextlib.suppress(Exception):
+        cache.set_many(
+            {_tag_key(tag): version for tag in set(tags)},
+            timeout=timeout,
+        )
+
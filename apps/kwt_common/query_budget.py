@@ -0,0 +1,214 @@
+"""Declarative per-endpoint SQL query budgets.
+
+Viewsets declare how many queries each action may run:
+
+    class MatchViewSet(...):
+        query_budgets: ClassVar[dict[str, int]] = {"stats": 20, "list": 6}
+
+Budgets are enforced in tests with `assert_within_query_budget`, and can be
+reported in production by `SlowQueryLoggingMiddleware` when
+`KORFBAL_QUERY_BUDGETS_ENABLED` is set. Either way an overrun produces a
+`QueryBudgetReport` listing the SQL fingerprints that ran more than once, which
+is usually enough to point at the N+1 loop responsible.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+import re
+import threading
+from typing import Any, Final
+
+from django.db import connections
+
+
+QUERY_BUDGETS_ATTRIBUTE: Final[str] = "query_budgets"
+_REPORT_TOP_N: Final[int] = 10
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST_RE = re.compile(r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)")
+
+
+def fingerprint_sql(sql: str) -> str:
+    """Normalise `sql` so repeated statements with different values collapse.
+
+    Literals become `?` and `IN (...)` lists of any length become `(...)`, so
+    `WHERE id IN (%s, %s)` and `WHERE id IN (%s)` share one fingerprint.
+    """
+    normalized = _STRING_LITERAL_RE.sub("?", sql)
+    normalized = _NUMBER_LITERAL_RE.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST_RE.sub("(...)", normalized)
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+@dataclass(frozen=True, slots=True)
+class ViewQueryBudget:
+    """The budget registered for one viewset action."""
+
+    view: str
+    budget: int
+
+
+@dataclass(frozen=True, slots=True)
+class QueryBudgetReport:
+    """Outcome of a request measured against its query budget."""
+
+    view: str
+    budget: int
+    executed: int
+    repeated: tuple[tuple[str, int], ...]
+
+    @property
+    def exceeded(self) -> bool:
+        """Return whether more queries ran than the budget allows."""
+        return self.executed > self.budget
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly representation for structured logs."""
+        return {
+            "view": self.view,
+            "budget": self.budget,
+            "executed": self.executed,
+            "repeated": [
+                {"fingerprint": fingerprint, "count": count}
+                for fingerprint, count in self.repeated
+            ],
+        }
+
+    def __str__(self) -> str:
+        """Return a multi-line description suitable for assertion messages."""
+        lines = [f"{self.view} ran {self.executed} queries (budget {self.budget})"]
+        lines.extend(
+            f"  {count}x {fingerprint}" for fingerprint, count in self.repeated
+        )
+        return "\n".join(lines)
+
+
+class QueryBudgetExceededError(AssertionError):
+    """Raised by `assert_within_query_budget` when a view overruns its budget."""
+
+    def __init__(self, report: QueryBudgetReport) -> None:
+        """Store the report and use it as the assertion message."""
+        super().__init__(str(report))
+        self.report = report
+
+
+class QueryRecorder:
+    """Connection execute wrapper that counts statements by fingerprint."""
+
+    def __init__(self) -> None:
+        """Start with no recorded queries."""
+        self.fingerprints: Counter[str] = Counter()
+        # Overview sections may run queries on helper threads (see
+        # `apps.kwt_common.overview_sections`).
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        """Return the total number of statements executed."""
+        return sum(self.fingerprints.values())
+
+    def __call__(
+        self,
+        execute: Callable[[str, object, bool, dict[str, object]], object],
+        sql: str,
+        params: object,
+        many: bool,
+        context: dict[str, object],
+    ) -> object:
+        """Record `sql` and run it."""
+        self.record(sql)
+        return execute(sql, params, many, context)
+
+    def record(self, sql: str) -> None:
+        """Count one execution of `sql`."""
+        fingerprint = fingerprint_sql(sql)
+        with self._lock:
+            self.fingerprints[fingerprint] += 1
+
+    def report(self, budget: ViewQueryBudget) -> QueryBudgetReport:
+        """Build a report of this recording against `budget`.
+
+        Returns:
+            QueryBudgetReport: Totals plus the most repeated fingerprints.
+
+        """
+        repeated = tuple(
+            (fingerprint, count)
+            for fingerprint, count in self.fingerprints.most_common(_REPORT_TOP_N)
+            if count > 1
+        )
+        return QueryBudgetReport(
+            view=budget.view,
+            budget=budget.budget,
+            executed=self.count,
+            repeated=repeated,
+        )
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryRecorder]:
+    """Record every statement executed on any configured connection."""
+    recorder = QueryRecorder()
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(recorder))
+        yield recorder
+
+
+def query_budget_for_view(view_func: object, method: str) -> ViewQueryBudget | None:
+    """Return the budget registered for the viewset action behind `view_func`.
+
+    `view_func` is what URL resolution returns (`request.resolver_match.func`);
+    DRF viewsets expose the viewset class and the method-to-action mapping on
+    it. Plain Django views and undeclared actions have no budget.
+    """
+    view_class = getattr(view_func, "cls", None)
+    actions = getattr(view_func, "actions", None)
+    if view_class is None or not isinstance(actions, dict):
+        return None
+
+    action = actions.get(method.lower())
+    budgets = getattr(view_class, QUERY_BUDGETS_ATTRIBUTE, None)
+    if not action or not isinstance(budgets, dict) or action not in budgets:
+        return None
+    return ViewQueryBudget(
+        view=f"{view_class.__name__}.{action}",
+        budget=int(budgets[action]),
+    )
+
+
+def assert_within_query_budget(send: Callable[[], Any]) -> Any:
+    """Send a test-client request and fail if it exceeds the view's budget.
+
+    Usage: `assert_within_query_budget(lambda: client.get(url))`.
+
+    Returns:
+        The response returned by `send`.
+
+    Raises:
+        AssertionError: If the resolved view has no registered budget.
+        QueryBudgetExceededError: If the request ran more queries than allowed.
+
+    """
+    with record_queries() as recorder:
+        response = send()
+
+    resolver_match = getattr(response, "resolver_match", None)
+    request = getattr(response, "request", None) or {}
+    budget = query_budget_for_view(
+        getattr(resolver_match, "func", None),
+        str(request.get("REQUEST_METHOD", "GET")),
+    )
+    if budget is None:
+        raise AssertionError("The requested view does not declare a query budget.")
+
+    report = recorder.report(budget)
+    if report.exceeded:
+        raise QueryBudgetExceededError(report)
+    return response
@@ -0,0 +1,88 @@
+"""Tests for the synthetic league generator and benchmark runner."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from apps.game_tracker.models import MatchData, MatchPart, Pause
+from apps.kwt_common.benchmarks import (
+    LeagueConfig,
+    compare_results,
+    generate_league,
+    run_benchmarks,
+)
+
+
+_SMALL_LEAGUE = LeagueConfig(
+    seed=7,
+    clubs=2,
+    teams_per_club=1,
+    players_per_team=10,
+    rounds=2,
+    prefix="Bt",
+)
+
+
+@pytest.mark.django_db
+def test_generated_league_is_deterministic() -> None:
+    """The same seed yields the same event volumes on every run."""
+    first = generate_league(_SMALL_LEAGUE)
+    second = generate_league(replace(_SMALL_LEAGUE, prefix="Bt2"))
+
+    assert second.row_counts == first.row_counts
+    assert first.row_counts["shots"] > 0
+    assert first.row_counts["player_changes"] > 0
+
+
+@pytest.mark.django_db
+def test_generated_league_has_a_live_match() -> None:
+    """The live match has an open first part and no running pause."""
+    league = generate_league(_SMALL_LEAGUE)
+    match_data = MatchData.objects.get(match_link=league.live_match)
+
+    assert match_data.status == "active"
+    assert MatchPart.objects.filter(match_data=match_data, active=True).exists()
+    assert not Pause.objects.filter(match_data=match_data, active=True).exists()
+
+
+@pytest.mark.django_db
+def test_run_benchmarks_reports_every_scenario() -> None:
+    """Each hot path is measured with timings and query counts."""
+    league = generate_league(_SMALL_LEAGUE)
+
+    results = run_benchmarks(league, repeat=2)
+
+    assert set(results["scenarios"]) >= {
+        "tracker.get_tracker_state",
+        "tracker.apply_tracker_command.shot_reg",
+        "club.build_club_eligibility_dashboard",
+    }
+    for numbers in results["scenarios"].values():
+        assert numbers["queries"] >= 0
+        assert numbers["median_ms"] >= 0
+
+
+def test_compare_results_flags_query_and_time_regressions() -> None:
+    """More queries always regress; time only beyond the threshold."""
+    baseline = {
+        "scenarios": {
+            "a": {"queries": 5, "queries_first": 8, "median_ms": 10.0},
+            "b": {"queries": 5, "queries_first": 8, "median_ms": 10.0},
+        },
+    }
+    current = {
+        "scenarios": {
+            "a": {"queries": 6, "queries_first": 8, "median_ms": 11.0},
+            "b": {"queries": 5, "queries_first": 8, "median_ms": 13.0},
+            "new": {"queries": 1, "queries_first": 1, "median_ms": 1.0},
+        },
+    }
+
+    regressions = compare_results(baseline, current, time_threshold_pct=20)
+
+    assert [(r.scenario, r.metric) for r in regressions] == [
+        ("a", "queries"),
+        ("b", "median_ms"),
+    ]
@@ -0,0 +1,28 @@
+"""Tests for the impact weight fitting command."""
+
+from __future__ import annotations
+
+import pytest
+
+from apps.game_tracker.tests.tracker_test_helpers import (
+    create_finished_match_with_shots,
+)
+from apps.kwt_common.management.commands import fit_match_impact_v6
+
+
+@pytest.mark.django_db
+def test_fit_reads_stored_features_without_replaying_matches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Only matches without current rows are computed during fitting."""
+    match_data = create_finished_match_with_shots(prefix="Impact fit")
+
+    rows = fit_match_impact_v6._load_match_rows(max_matches=0)  # noqa: SLF001
+    assert [row["match_data_id"] for row in rows] == [str(match_data.id_uuid)]
+    assert rows[0]["goal_diff"] == 1.0
+
+    def fail(**kwargs: object) -> None:
+        raise AssertionError(kwargs)
+
+    monkeypatch.setattr(fit_match_impact_v6, "persist_match_team_impact_features", fail)
+    assert fit_match_impact_v6._load_match_rows(max_matches=0) == rows  # noqa: SLF001
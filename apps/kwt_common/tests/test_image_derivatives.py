@@ -0,0 +1,90 @@
+"""Unit tests for profile picture / club logo thumbnail generation."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Any, cast
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+import pytest
+
+from apps.kwt_common import image_derivatives
+
+
+PIL_Image = pytest.importorskip("PIL.Image")
+
+
+@dataclass
+class _FakeFieldFile:
+    name: str
+    storage: FileSystemStorage
+
+    def __bool__(self) -> bool:
+        return bool(self.name)
+
+
+def _stored_image(tmp_path: Path, *, size: tuple[int, int]) -> _FakeFieldFile:
+    storage = FileSystemStorage(location=tmp_path, base_url="/media/")
+    buffer = BytesIO()
+    PIL_Image.new("RGB", size, color=(200, 20, 20)).save(buffer, format="PNG")
+    name = storage.save("profile_pictures/photo.png", ContentFile(buffer.getvalue()))
+    return _FakeFieldFile(name=name, storage=storage)
+
+
+def test_generates_square_thumbnails_for_each_size(tmp_path: Path) -> None:
+    """Every configured size is written next to the original."""
+    field_file = _stored_image(tmp_path, size=(1200, 800))
+
+    derivatives = image_derivatives.generate_image_derivatives(cast(Any, field_file))
+
+    assert derivatives["source"] == field_file.name
+    assert sorted(derivatives["sizes"], key=int) == ["64", "128", "256"]
+    for size, name in derivatives["sizes"].items():
+        assert "/derivatives/" in name
+        with field_file.storage.open(name, "rb") as handle:
+            assert PIL_Image.open(handle).size == (int(size), int(size))
+
+
+def test_url_for_size_picks_smallest_covering_derivative(tmp_path: Path) -> None:
+    """Requested sizes map to the smallest thumbnail that is large enough."""
+    field_file = _stored_image(tmp_path, size=(600, 600))
+    derivatives = image_derivatives.generate_image_derivatives(cast(Any, field_file))
+
+    url_48 = image_derivatives.image_url_for_size(
+        cast(Any, field_file), derivatives, 48
+    )
+    url_200 = image_derivatives.image_url_for_size(
+        cast(Any, field_file), derivatives, 200
+    )
+    url_full = image_derivatives.image_url_for_size(
+        cast(Any, field_file), derivatives, None
+    )
+
+    assert url_48.endswith(derivatives["sizes"]["64"])
+    assert url_200.endswith(derivatives["sizes"]["256"])
+    assert url_full.endswith(field_file.name)
+
+
+def test_stale_derivatives_fall_back_to_original(tmp_path: Path) -> None:
+    """Derivatives of a previous upload are never served for a new image."""
+    field_file = _stored_image(tmp_path, size=(300, 300))
+    stale = {"source": "profile_pictures/old.png", "sizes": {"64": "old_64.webp"}}
+
+    url = image_derivatives.image_url_for_size(cast(Any, field_file), stale, 64)
+
+    assert not image_derivatives.derivatives_are_current(cast(Any, field_file), stale)
+    assert url.endswith(field_file.name)
+
+
+def test_undecodable_upload_gets_no_sizes(tmp_path: Path) -> None:
+    """A file Pillow cannot read is recorded without derivatives."""
+    storage = FileSystemStorage(location=tmp_path, base_url="/media/")
+    name = storage.save("profile_pictures/photo.png", ContentFile(b"not an image"))
+    field_file = _FakeFieldFile(name=name, storage=storage)
+
+    derivatives = image_derivatives.generate_image_derivatives(cast(Any, field_file))
+
+    assert derivatives == {"source": name, "sizes": {}}
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from contextlib import AbstractContextManager
+from datetime import timedelta
 
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -15,7 +16,10 @@ import pytest
 
 from apps.club.models import Club
 from apps.game_tracker.models import MatchData, Shot
-from apps.kwt_common.utils.match_summary import build_match_summaries
+from apps.kwt_common.utils.match_summary import (
+    build_match_summaries,
+    load_match_summaries,
+)
 from apps.schedule.models import Match, Season
 from apps.team.models import Team
 
@@ -229,3 +233,60 @@ def test_build_match_summaries_active_match_uses_shots(
         payload = build_match_summaries(entries)
 
     assert payload[0]["score"] == {"home": 3, "away": 2}
+
+
+@pytest.mark.django_db
+def test_load_match_summaries_projects_rows_in_one_query(
+    django_assert_num_queries: Callable[[int], AbstractContextManager[None]],
+) -> None:
+    """The projected loader matches the instance serializer with one query."""
+    today = timezone.now().date()
+    season = Season.objects.create(
+        name="2025",
+        start_date=today,
+        end_date=today,
+    )
+
+    home_club = Club.objects.create(name="Home Club")
+    away_club = Club.objects.create(name="Away Club")
+    home_team = Team.objects.create(name="Home Team", club=home_club)
+    away_team = Team.objects.create(name="Away Team", club=away_club)
+
+    for offset, (home, away) in enumerate(((4, 2), (1, 3))):
+        match = Match.objects.create(
+            home_team=home_team if offset == 0 else away_team,
+            away_team=away_team if offset == 0 else home_team,
+            season=season,
+            start_time=timezone.now() + timedelta(days=offset),
+        )
+        MatchData.objects.filter(match_link=match).update(
+            status="finished",
+            home_score=home,
+            away_score=away,
+        )
+
+    qs = MatchData.objects.filter(match_link__season=season).order_by(
+        "match_link__start_time",
+    )
+    expected = build_match_summaries(
+        list(
+            qs.select_related(
+                "match_link",
+                "match_link__home_team",
+                "match_link__home_team__club",
+                "match_link__away_team",
+                "match_link__away_team__club",
+                "match_link__season",
+            )
+        )
+    )
+
+    with django_assert_num_queries(1):
+        payload = load_match_summaries(qs[:10])
+
+    assert payload == expected
+    assert [entry["score"] for entry in payload] == [
+        {"home": 4, "away": 2},
+        {"home": 1, "away": 3},
+    ]
+    assert payload[1]["location"] == "Away Club"
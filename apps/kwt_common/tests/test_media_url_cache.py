@@ -0,0 +1,108 @@
+"""Unit tests for the presigned media URL cache."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from django.core.cache import cache
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from apps.kwt_common import media_urls
+
+
+@dataclass
+class _FakeStorage:
+    querystring_auth: bool = True
+    querystring_expire: int = 3600
+    bucket_name: str = "media"
+    signed: int = 0
+
+    def url(self, name: str) -> str:
+        self.signed += 1
+        return f"https://media.example/{name}?sig={self.signed}"
+
+
+@dataclass
+class _FakeFieldFile:
+    name: str
+    storage: _FakeStorage = field(default_factory=_FakeStorage)
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Iterator[None]:
+    media_urls.clear_local_media_url_cache()
+    cache.clear()
+    yield
+    media_urls.clear_local_media_url_cache()
+    cache.clear()
+
+
+def _freeze_time(monkeypatch: pytest.MonkeyPatch, now: float) -> None:
+    monkeypatch.setattr(media_urls.time, "time", lambda: now)
+
+
+def test_signature_is_reused_within_bucket(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeated lookups inside one expiry bucket sign only once."""
+    _freeze_time(monkeypatch, 10_000.0)
+    file = _FakeFieldFile(name="profile_pictures/a.png")
+
+    first = media_urls.cached_media_url(cast(Any, file))
+    second = media_urls.cached_media_url(cast(Any, file))
+
+    assert first == second
+    assert file.storage.signed == 1
+
+
+def test_shared_cache_is_used_across_processes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A signature stored by another worker is reused from the shared cache."""
+    _freeze_time(monkeypatch, 10_000.0)
+    file = _FakeFieldFile(name="club_pictures/logo.png")
+
+    url = media_urls.cached_media_url(cast(Any, file))
+    media_urls.clear_local_media_url_cache()
+
+    assert media_urls.cached_media_url(cast(Any, file)) == url
+    assert file.storage.signed == 1
+
+
+def test_new_bucket_signs_again(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Crossing into the next bucket produces a fresh signature."""
+    file = _FakeFieldFile(name="profile_pictures/a.png")
+
+    _freeze_time(monkeypatch, 0.0)
+    first = media_urls.cached_media_url(cast(Any, file))
+    # Default bucket width: 3600s expiry - 300s minimum remaining validity.
+    _freeze_time(monkeypatch, 3300.0)
+    second = media_urls.cached_media_url(cast(Any, file))
+
+    assert first != second
+    assert file.storage.signed == 2  # noqa: PLR2004
+
+
+def test_unsigned_storage_bypasses_cache() -> None:
+    """Storages without querystring auth are resolved directly every time."""
+    file = _FakeFieldFile(
+        name="profile_pictures/a.png",
+        storage=_FakeStorage(querystring_auth=False),
+    )
+
+    media_urls.cached_media_url(cast(Any, file))
+    media_urls.cached_media_url(cast(Any, file))
+
+    assert file.storage.signed == 2  # noqa: PLR2004
+
+
+def test_cache_can_be_disabled(settings: SettingsWrapper) -> None:
+    """The cache can be switched off per environment."""
+    settings.KORFBAL_MEDIA_URL_CACHE_ENABLED = False
+    file = _FakeFieldFile(name="profile_pictures/a.png")
+
+    media_urls.cached_media_url(cast(Any, file))
+    media_urls.cached_media_url(cast(Any, file))
+
+    assert file.storage.signed == 2  # noqa: PLR2004
@@ -0,0 +1,187 @@
+"""Tests for concurrent overview section composition."""
+
+from __future__ import annotations
+
+import threading
+
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from apps.club.models import Club
+from apps.kwt_common.middleware.request_timing import RequestTimingMiddleware
+from apps.kwt_common.overview_sections import (
+    OverviewSection,
+    collect_section_timings,
+    compose_sections,
+    is_complete_overview,
+)
+from apps.kwt_common.query_budget import record_queries
+
+
+@pytest.fixture
+def persistent_connections(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Let compositions use helper threads (they need persistent connections)."""
+    monkeypatch.setitem(connection.settings_dict, "CONN_MAX_AGE", 60)
+
+
+def _fail() -> int:
+    msg = "section failed"
+    raise RuntimeError(msg)
+
+
+@pytest.mark.usefixtures("persistent_connections")
+def test_sections_run_concurrently_with_timeouts_and_fallbacks(
+    settings: SettingsWrapper,
+) -> None:
+    """Slow and failing sections fall back without holding up the others."""
+    settings.KORFBAL_OVERVIEW_SECTION_WORKERS = 3
+    settings.KORFBAL_OVERVIEW_SECTION_TIMEOUT_MS = 200
+    release = threading.Event()
+    started = threading.Barrier(2, timeout=5)
+
+    def _first() -> str:
+        started.wait()
+        return "first"
+
+    def _second() -> str:
+        # Only finishes if `_first` runs at the same time.
+        started.wait()
+        return "second"
+
+    try:
+        with collect_section_timings() as timings:
+            results = compose_sections(
+                "test",
+                (
+                    OverviewSection(name="first", compute=_first),
+                    OverviewSection(name="second", compute=_second),
+                    OverviewSection(
+                        name="slow",
+                        compute=lambda: release.wait(5),
+                        fallback=False,
+                    ),
+                ),
+            )
+            failed = compose_sections(
+                "test",
+                (
+                    OverviewSection(name="boom", compute=_fail, fallback=0),
+                    OverviewSection(name="ok", compute=lambda: 1),
+                ),
+            )
+    finally:
+        release.set()
+
+    assert dict(results.values) == {"first": "first", "second": "second", "slow": False}
+    assert results.partial == ("slow",)
+    assert dict(failed.values) == {"boom": 0, "ok": 1}
+    assert failed.partial == ("boom",)
+    assert [(timing.name, timing.outcome) for timing in timings] == [
+        ("test-first", "ok"),
+        ("test-second", "ok"),
+        ("test-slow", "timeout"),
+        ("test-boom", "error"),
+        ("test-ok", "ok"),
+    ]
+    assert not is_complete_overview({"meta": {"partial_sections": ["slow"]}})
+    assert is_complete_overview({"meta": {"partial_sections": []}})
+
+
+def test_request_timing_middleware_reports_section_timings(
+    settings: SettingsWrapper,
+) -> None:
+    """Section durations are appended to the Server-Timing header."""
+    settings.KORFBAL_OVERVIEW_SECTION_WORKERS = 0
+    settings.KORFBAL_LOG_SLOW_REQUESTS = False
+
+    def view(_request: HttpRequest) -> HttpResponse:
+        compose_sections(
+            "test",
+            (
+                OverviewSection(name="ok", compute=lambda: 1),
+                OverviewSection(name="boom", compute=_fail),
+            ),
+        )
+        return HttpResponse("ok")
+
+    response = RequestTimingMiddleware(view)(RequestFactory().get("/api/x"))
+
+    entries = [entry.strip() for entry in response["Server-Timing"].split(",")]
+    assert entries[0].startswith("app;dur=")
+    assert entries[1].startswith("test-ok;dur=")
+    assert entries[2].startswith("test-boom;dur=")
+    assert entries[2].endswith(';desc="error"')
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("persistent_connections")
+def test_sections_run_inline_inside_a_transaction(
+    settings: SettingsWrapper,
+) -> None:
+    """Uncommitted rows stay visible: sections share the caller's connection."""
+    settings.KORFBAL_OVERVIEW_SECTION_WORKERS = 3
+    caller = threading.get_ident()
+
+    results = compose_sections(
+        "test",
+        (
+            OverviewSection(name="a", compute=threading.get_ident),
+            OverviewSection(name="b", compute=threading.get_ident),
+        ),
+    )
+
+    assert dict(results.values) == {"a": caller, "b": caller}
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures("persistent_connections")
+def test_helper_sections_query_the_database_and_count_towards_the_request(
+    settings: SettingsWrapper,
+) -> None:
+    """Helper threads see committed rows and their queries are recorded."""
+    settings.KORFBAL_OVERVIEW_SECTION_WORKERS = 2
+    Club.objects.create(name="Sections Club")
+    caller = threading.get_ident()
+    both_running = threading.Barrier(2, timeout=5)
+
+    def _count_clubs() -> tuple[int, int]:
+        # Only passes if the other section runs on another thread meanwhile.
+        both_running.wait()
+        return threading.get_ident(), Club.objects.count()
+
+    with record_queries() as recorder:
+        results = compose_sections(
+            "test",
+            (
+                OverviewSection(name="a", compute=_count_clubs),
+                OverviewSection(name="b", compute=_count_clubs),
+            ),
+        )
+
+    assert results.partial == ()
+    threads = {results.get("a")[0], results.get("b")[0]}
+    assert caller in threads
+    assert len(threads) == 2  # noqa: PLR2004
+    assert results.get("a")[1] == results.get("b")[1] == 1
+    assert recorder.count == 2  # noqa: PLR2004
+
+
+def test_sections_run_inline_without_persistent_connections(
+    settings: SettingsWrapper,
+) -> None:
+    """Without CONN_MAX_AGE every helper section would open a new connection."""
+    settings.KORFBAL_OVERVIEW_SECTION_WORKERS = 3
+    caller = threading.get_ident()
+
+    results = compose_sections(
+        "test",
+        (
+            OverviewSection(name="a", compute=threading.get_ident),
+            OverviewSection(name="b", compute=threading.get_ident),
+        ),
+    )
+
+    assert dict(results.values) == {"a": caller, "b": caller}
@@ -9,7 +9,6 @@ from __future__ import annotations
 from datetime import timedelta
 from decimal import Decimal
 
-from asgiref.sync import async_to_sync
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 import pytest
@@ -82,7 +81,7 @@ def test_build_player_stats_recomputes_outdated_match_impacts() -> None:
     )
 
     # build_player_stats should recompute the match impacts to latest and return them.
-    rows = async_to_sync(build_player_stats)(
+    rows = build_player_stats(
         [player],
         MatchData.objects.filter(id_uuid=match_data.id_uuid),
     )
@@ -153,7 +152,7 @@ def test_build_player_stats_five_misses_uses_latest_weights() -> None:
         },
     )
 
-    rows = async_to_sync(build_player_stats)(
+    rows = build_player_stats(
         [player],
         MatchData.objects.filter(id_uuid=match_data.id_uuid),
     )
@@ -19,7 +19,11 @@ from pytest_django.fixtures import SettingsWrapper
 from apps.club.models import Club
 from apps.game_tracker.models import MatchData, MatchPart, PlayerMatchMinutes, Shot
 from apps.game_tracker.models.player_match_minutes import LATEST_MATCH_MINUTES_VERSION
-from apps.kwt_common.utils.players_stats import build_player_stats
+from apps.kwt_common.utils.general_stats import (
+    abuild_general_stats,
+    build_general_stats,
+)
+from apps.kwt_common.utils.players_stats import abuild_player_stats, build_player_stats
 from apps.player.models.player import Player
 from apps.schedule.models import Match, Season
 from apps.team.models import Team
@@ -94,10 +98,8 @@ def test_build_player_stats_minutes_missing_returns_null(
         defaults={"minutes_played": Decimal("10.00")},
     )
 
-    rows = async_to_sync(build_player_stats)(
-        [player_a, player_b],
-        MatchData.objects.filter(id_uuid=match_data.id_uuid),
-    )
+    match_dataset = MatchData.objects.filter(id_uuid=match_data.id_uuid)
+    rows = build_player_stats([player_a, player_b], match_dataset)
 
     expected_rows = 2
     minutes_a = 10.0
@@ -107,3 +109,48 @@ def test_build_player_stats_minutes_missing_returns_null(
     minutes_by_username = {row["username"]: row["minutes_played"] for row in rows}
     assert minutes_by_username["minutes_a"] == minutes_a
     assert minutes_by_username["minutes_b"] is None
+
+
+@pytest.mark.django_db
+def test_async_stats_builders_match_sync_builders() -> None:
+    """The async ORM variants return the same payloads as the sync cores."""
+    home_club = Club.objects.create(name="Async Home Club")
+    away_club = Club.objects.create(name="Async Away Club")
+    home_team = Team.objects.create(name="Async Home Team", club=home_club)
+    away_team = Team.objects.create(name="Async Away Team", club=away_club)
+    season = Season.objects.create(
+        name="2025 Season - async stats",
+        start_date=timezone.now().date() - timedelta(days=1),
+        end_date=timezone.now().date() + timedelta(days=1),
+    )
+    match = Match.objects.create(
+        home_team=home_team,
+        away_team=away_team,
+        season=season,
+        start_time=timezone.now(),
+    )
+    match_data = MatchData.objects.get(match_link=match)
+    user = get_user_model().objects.create_user(username="async_stats")
+    player = getattr(user, "player", None) or Player.objects.create(user=user)
+    Shot.objects.create(
+        player=player,
+        match_data=match_data,
+        team=home_team,
+        for_team=True,
+        scored=True,
+        time=timezone.now(),
+    )
+    PlayerMatchMinutes.objects.create(
+        match_data=match_data,
+        player=player,
+        algorithm_version=LATEST_MATCH_MINUTES_VERSION,
+        minutes_played=Decimal("12.50"),
+    )
+    match_dataset = MatchData.objects.filter(id_uuid=match_data.id_uuid)
+
+    rows = build_player_stats([player], match_dataset)
+    assert rows[0]["minutes_played"] == 12.5  # noqa: PLR2004
+    assert async_to_sync(abuild_player_stats)([player], match_dataset) == rows
+    assert async_to_sync(abuild_general_stats)(match_dataset) == build_general_stats(
+        match_dataset,
+    )
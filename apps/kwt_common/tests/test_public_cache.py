@@ -0,0 +1,65 @@
+"""Unit tests for the public response cache."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from django.core.cache import cache
+from django.http import QueryDict
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from apps.kwt_common import public_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache(settings: SettingsWrapper) -> Iterator[None]:
+    settings.KORFBAL_PUBLIC_CACHE_TTL_S = 60
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_cache_key_ignores_param_order_and_unrelated_params() -> None:
+    """Only the listed params take part, in a normalized order."""
+    fields = ("club", "limit", "team")
+    key = public_cache.public_cache_key(
+        "schedule-finished",
+        QueryDict("team=b&limit=3&team=a"),
+        fields=fields,
+    )
+
+    assert key == public_cache.public_cache_key(
+        "schedule-finished",
+        QueryDict("limit=3&team=a&team=b&_=1700000000&club="),
+        fields=fields,
+    )
+    assert key != public_cache.public_cache_key(
+        "schedule-finished",
+        QueryDict("limit=5&team=a&team=b"),
+        fields=fields,
+    )
+
+
+def test_stale_payload_is_served_while_another_worker_recomputes() -> None:
+    """Invalidated entries are recomputed once; concurrent callers get stale data."""
+    key = public_cache.public_cache_key("club-overview", QueryDict(), subject="c1")
+    tags = [public_cache.club_tag("c1")]
+
+    def cached(payload: str) -> str:
+        return public_cache.cached_public_payload(
+            key,
+            tags=tags,
+            compute=lambda: payload,
+        )
+
+    assert cached("first") == "first"
+
+    public_cache.invalidate_public_tags(tags)
+    # Another worker holds the recompute lock.
+    cache.add(f"{key}:lock", 1)
+    assert cached("second") == "first"
+
+    cache.delete(f"{key}:lock")
+    assert cached("third") == "third"
+    assert cached("fourth") == "third"
@@ -0,0 +1,145 @@
+"""Tests for per-view query budgets and their middleware reporting."""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+from django.contrib.auth import get_user_model
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+from django.urls import URLPattern, URLResolver, get_resolver
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from apps.club.api.views import ClubViewSet
+from apps.kwt_common.middleware.slow_queries import SlowQueryLoggingMiddleware
+from apps.kwt_common.query_budget import (
+    QueryBudgetExceededError,
+    ViewQueryBudget,
+    assert_within_query_budget,
+    fingerprint_sql,
+    query_budget_for_view,
+    record_queries,
+)
+from apps.schedule.api.views import MatchViewSet
+from apps.team.api.views import TeamViewSet
+
+
+_BUDGETED_VIEWSETS = (MatchViewSet, TeamViewSet, ClubViewSet)
+
+
+class _BudgetedViewSet:
+    query_budgets: ClassVar[dict[str, int]] = {"retrieve": 1}
+
+
+def _viewset_view(actions: dict[str, str]) -> Any:
+    def view(request: HttpRequest) -> HttpResponse:
+        get_user_model().objects.count()
+        get_user_model().objects.count()
+        return HttpResponse("ok")
+
+    view.cls = _BudgetedViewSet  # type: ignore[attr-defined]
+    view.actions = actions  # type: ignore[attr-defined]
+    return view
+
+
+def _routed_actions() -> dict[type, set[str]]:
+    routed: dict[type, set[str]] = {viewset: set() for viewset in _BUDGETED_VIEWSETS}
+
+    def walk(patterns: list[URLPattern | URLResolver]) -> None:
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                walk(pattern.url_patterns)
+                continue
+            view_class = getattr(pattern.callback, "cls", None)
+            if view_class in routed:
+                routed[view_class].update(pattern.callback.actions.values())
+
+    walk(get_resolver().url_patterns)
+    return routed
+
+
+def test_every_routed_action_declares_a_budget() -> None:
+    """Match, team and club endpoints must all declare a query budget."""
+    for viewset, actions in _routed_actions().items():
+        assert actions, f"{viewset.__name__} is not routed"
+        missing = actions - set(viewset.query_budgets)
+        assert not missing, f"{viewset.__name__} lacks budgets for {sorted(missing)}"
+
+
+def test_fingerprint_collapses_literals_and_in_lists() -> None:
+    """Statements that differ only in values share one fingerprint."""
+    first = fingerprint_sql('SELECT * FROM "t" WHERE "id" IN (%s, %s) LIMIT 21')
+    second = fingerprint_sql('SELECT * FROM "t"  WHERE "id" IN (%s) LIMIT 1')
+
+    assert first == second
+    assert fingerprint_sql("SELECT 'a''b', 1.5") == "SELECT ?, ?"
+
+
+def test_query_budget_for_view_resolves_the_action() -> None:
+    """Budgets are looked up via the HTTP method's viewset action."""
+    view = _viewset_view({"get": "retrieve", "post": "create"})
+
+    assert query_budget_for_view(view, "GET") == ViewQueryBudget(
+        view="_BudgetedViewSet.retrieve",
+        budget=1,
+    )
+    assert query_budget_for_view(view, "POST") is None
+    assert query_budget_for_view(lambda request: request, "GET") is None
+
+
+@pytest.mark.django_db
+def test_recorder_reports_repeated_fingerprints() -> None:
+    """The report lists statements that ran more than once."""
+    with record_queries() as recorder:
+        for _ in range(3):
+            get_user_model().objects.filter(pk=1).exists()
+
+    report = recorder.report(ViewQueryBudget(view="V.a", budget=2))
+
+    assert report.exceeded
+    assert report.executed == 3  # noqa: PLR2004
+    assert [count for _, count in report.repeated] == [3]
+
+
+@pytest.mark.django_db
+def test_assert_within_query_budget_raises_with_report() -> None:
+    """Exceeding a budget fails with the repeated SQL in the message."""
+
+    class _Response:
+        resolver_match = type("Match", (), {"func": _viewset_view({"get": "retrieve"})})
+        request: ClassVar[dict[str, str]] = {"REQUEST_METHOD": "GET"}
+
+    def send() -> _Response:
+        get_user_model().objects.count()
+        get_user_model().objects.count()
+        return _Response()
+
+    with pytest.raises(QueryBudgetExceededError) as excinfo:
+        assert_within_query_budget(send)
+
+    assert excinfo.value.report.executed == 2  # noqa: PLR2004
+    assert "2x SELECT COUNT(*)" in str(excinfo.value)
+
+
+@pytest.mark.django_db
+def test_middleware_logs_budget_overruns(
+    settings: SettingsWrapper,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """With budgets enabled the middleware logs a structured report."""
+    settings.KORFBAL_LOG_SLOW_DB_QUERIES = False
+    settings.KORFBAL_QUERY_BUDGETS_ENABLED = True
+    view = _viewset_view({"get": "retrieve"})
+
+    def get_response(request: HttpRequest) -> HttpResponse:
+        request.resolver_match = type("Match", (), {"func": view})()  # type: ignore[assignment]
+        return view(request)
+
+    request = RequestFactory().get("/x")
+    SlowQueryLoggingMiddleware(get_response)(request)
+
+    records = [r for r in caplog.records if r.getMessage().startswith("Query budget")]
+    assert len(records) == 1
+    assert records[0].query_budget["executed"] == 2  # noqa: PLR2004
+    assert not hasattr(request, "_korfbal_slow_queries")
@@ -1,55 +1,56 @@
-"""Module contains general_stats function that returns general statistics of a match."""
+"""Module contains general_stats function that returns general statistics of a match.
 
+`build_general_stats` is the synchronous core used by the REST views;
+`abuild_general_stats` runs the same independent queries concurrently through
+Django's async ORM for websocket consumers.
+"""
+
+import asyncio
 from collections.abc import Iterable
 import json
 from typing import Any
 
 from asgiref.sync import sync_to_async
-from django.db.models import Count, Q
+from django.db.models import Count, Q, QuerySet
 
-from apps.game_tracker.models import GoalType, Shot
+from apps.game_tracker.models import Shot
+from apps.game_tracker.services.reference_data import GoalTypeRef, reference_data
 
 
-async def build_general_stats(match_dataset: Iterable[Any]) -> dict[str, Any]:
-    """Assemble the general statistics payload for a collection of matches.
+def _shot_totals_kwargs() -> dict[str, Count]:
+    return {
+        "shots_for": Count("id_uuid", filter=Q(for_team=True)),
+        "shots_against": Count("id_uuid", filter=Q(for_team=False)),
+        "goals_for": Count("id_uuid", filter=Q(for_team=True, scored=True)),
+        "goals_against": Count("id_uuid", filter=Q(for_team=False, scored=True)),
+    }
 
-    Returns:
-        dict[str, Any]: General stats payload.
 
-    """
-    goal_types = await sync_to_async(
-        lambda: list(GoalType.objects.all().values("id_uuid", "name").order_by("name"))
-    )()
+def _goal_type_rows_queryset(shot_qs: QuerySet[Shot]) -> QuerySet[Shot, dict[str, Any]]:
+    return (
+        shot_qs
+        .filter(scored=True, shot_type__isnull=False)
+        .values("shot_type__name", "for_team")
+        .annotate(count=Count("id_uuid"))
+    )
 
+
+def _general_stats_payload(
+    *,
+    goal_types: Iterable[GoalTypeRef],
+    aggregated: dict[str, Any],
+    goal_type_rows: Iterable[dict[str, Any]],
+) -> dict[str, Any]:
     goal_types_json = [
-        {"id": str(row["id_uuid"]), "name": row["name"]} for row in goal_types
+        {"id": str(goal_type.id_uuid), "name": goal_type.name}
+        for goal_type in goal_types
     ]
 
-    shot_qs = Shot.objects.filter(match_data__in=match_dataset)
-
-    aggregated = await sync_to_async(
-        lambda: shot_qs.aggregate(
-            shots_for=Count("id_uuid", filter=Q(for_team=True)),
-            shots_against=Count("id_uuid", filter=Q(for_team=False)),
-            goals_for=Count("id_uuid", filter=Q(for_team=True, scored=True)),
-            goals_against=Count("id_uuid", filter=Q(for_team=False, scored=True)),
-        ),
-    )()
-
     team_goal_stats: dict[str, dict[str, int]] = {
-        row["name"]: {"goals_by_player": 0, "goals_against_player": 0}
-        for row in goal_types
+        goal_type.name: {"goals_by_player": 0, "goals_against_player": 0}
+        for goal_type in goal_types
     }
 
-    goal_type_rows = await sync_to_async(
-        lambda: list(
-            shot_qs
-            .filter(scored=True, shot_type__isnull=False)
-            .values("shot_type__name", "for_team")
-            .annotate(count=Count("id_uuid"))
-        )
-    )()
-
     for row in goal_type_rows:
         name = row.get("shot_type__name")
         if not name:
@@ -73,6 +74,48 @@ async def build_general_stats(match_dataset: Iterable[Any]) -> dict[str, Any]:
     }
 
 
+def build_general_stats(match_dataset: Iterable[Any]) -> dict[str, Any]:
+    """Assemble the general statistics payload for a collection of matches.
+
+    Returns:
+        dict[str, Any]: General stats payload.
+
+    """
+    shot_qs = Shot.objects.filter(match_data__in=match_dataset)
+    return _general_stats_payload(
+        goal_types=reference_data().goal_types,
+        aggregated=shot_qs.aggregate(**_shot_totals_kwargs()),
+        goal_type_rows=list(_goal_type_rows_queryset(shot_qs)),
+    )
+
+
+async def abuild_general_stats(match_dataset: Iterable[Any]) -> dict[str, Any]:
+    """Async variant of `build_general_stats`.
+
+    The totals and the per-goal-type breakdown are independent, so they are
+    awaited together instead of one after the other.
+
+    Returns:
+        dict[str, Any]: General stats payload.
+
+    """
+    shot_qs = Shot.objects.filter(match_data__in=match_dataset)
+
+    async def _goal_type_rows() -> list[dict[str, Any]]:
+        return [row async for row in _goal_type_rows_queryset(shot_qs).aiterator()]
+
+    reference, aggregated, goal_type_rows = await asyncio.gather(
+        sync_to_async(reference_data)(),
+        shot_qs.aaggregate(**_shot_totals_kwargs()),
+        _goal_type_rows(),
+    )
+    return _general_stats_payload(
+        goal_types=reference.goal_types,
+        aggregated=aggregated,
+        goal_type_rows=goal_type_rows,
+    )
+
+
 async def general_stats(match_dataset: Iterable[Any]) -> str:
     """Return the general statistics of a match as JSON for websocket clients.
 
@@ -80,7 +123,7 @@ async def general_stats(match_dataset: Iterable[Any]) -> str:
         str: JSON string of general stats.
 
     """
-    stats = await build_general_stats(match_dataset)
+    stats = await abuild_general_stats(match_dataset)
     return json.dumps(
         {
             "command": "stats",
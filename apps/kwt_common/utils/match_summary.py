@@ -1,81 +1,219 @@
-"""Helpers to transform match data objects into API friendly dictionaries."""
+"""Helpers to transform match data objects into API friendly dictionaries.
+
+List endpoints (schedule, club, team and player pages) should use
+`load_match_summaries`: it reads only the ~20 columns a summary needs with one
+`values_list` query instead of loading full `MatchData`, `Match`, `Team`,
+`Club` and `Season` instances. Club logo URLs are resolved once per club per
+call. `build_match_summaries` serializes instances that are already loaded.
+"""
 
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import Any, cast
+from datetime import datetime
+from typing import Any, Final, NamedTuple, cast
 from uuid import UUID
 
+from django.db.models import QuerySet
 from django.utils.timezone import localtime
 
+from apps.club.models import Club
 from apps.game_tracker.models import MatchData
 from apps.game_tracker.services.match_scores import compute_scores_for_matchdata_ids
-from apps.kwt_common.utils.time_utils import get_time_display
+from apps.kwt_common.image_derivatives import LIST_THUMBNAIL_SIZE
+from apps.kwt_common.utils.time_utils import format_part_length
+from apps.schedule.models import Match
 
 
 MatchSummary = dict[str, Any]
 
 
-def build_match_summaries(match_data: Iterable[MatchData]) -> list[MatchSummary]:
-    """Serialize match data rows into a lightweight summary payload.
-
-    Returns:
-        list[MatchSummary]: List of match summaries.
-
-    """
-    entries = list(match_data)
-
+class MatchSummaryRow(NamedTuple):
+    """The columns of one match summary."""
+
+    match_data_id: UUID
+    status: str
+    home_score: int | None
+    away_score: int | None
+    current_part: int
+    parts: int
+    part_length: int
+    match_id: UUID
+    start_time: datetime
+    season_name: str
+    home_team_name: str
+    home_club_id: UUID
+    home_club_name: str
+    home_club_logo: str | None
+    home_club_logo_derivatives: object
+    away_team_name: str
+    away_club_id: UUID
+    away_club_name: str
+    away_club_logo: str | None
+    away_club_logo_derivatives: object
+
+
+# ORM paths of the `MatchSummaryRow` fields, in order.
+_ROW_FIELDS: Final[tuple[str, ...]] = (
+    "id_uuid",
+    "status",
+    "home_score",
+    "away_score",
+    "current_part",
+    "parts",
+    "part_length",
+    "match_link_id",
+    "match_link__start_time",
+    "match_link__season__name",
+    "match_link__home_team__name",
+    "match_link__home_team__club_id",
+    "match_link__home_team__club__name",
+    "match_link__home_team__club__logo",
+    "match_link__home_team__club__logo_derivatives",
+    "match_link__away_team__name",
+    "match_link__away_team__club_id",
+    "match_link__away_team__club__name",
+    "match_link__away_team__club__logo",
+    "match_link__away_team__club__logo_derivatives",
+)
+
+
+def _row_from_instance(entry: MatchData) -> MatchSummaryRow:
+    match = entry.match_link
+    home_club = match.home_team.club
+    away_club = match.away_team.club
+    return MatchSummaryRow(
+        match_data_id=cast(UUID, entry.id_uuid),
+        status=entry.status,
+        home_score=getattr(entry, "home_score", 0),
+        away_score=getattr(entry, "away_score", 0),
+        current_part=entry.current_part,
+        parts=entry.parts,
+        part_length=entry.part_length,
+        match_id=cast(UUID, match.id_uuid),
+        start_time=match.start_time,
+        season_name=match.season.name,
+        home_team_name=match.home_team.name,
+        home_club_id=cast(UUID, home_club.id_uuid),
+        home_club_name=home_club.name,
+        home_club_logo=home_club.logo.name if home_club.logo else None,
+        home_club_logo_derivatives=home_club.logo_derivatives,
+        away_team_name=match.away_team.name,
+        away_club_id=cast(UUID, away_club.id_uuid),
+        away_club_name=away_club.name,
+        away_club_logo=away_club.logo.name if away_club.logo else None,
+        away_club_logo_derivatives=away_club.logo_derivatives,
+    )
+
+
+class _ClubLogos:
+    """Logo URLs by club id, resolved once per club."""
+
+    def __init__(self) -> None:
+        self._urls: dict[UUID, str] = {}
+
+    def url(
+        self,
+        club_id: UUID,
+        *,
+        name: str,
+        logo: str | None,
+        derivatives: object,
+    ) -> str:
+        url = self._urls.get(club_id)
+        if url is None:
+            # An unsaved instance reuses the model's logo fallbacks.
+            url = Club(
+                id_uuid=club_id,
+                name=name,
+                logo=logo or "",
+                logo_derivatives=derivatives or {},
+            ).get_club_logo(size=LIST_THUMBNAIL_SIZE)
+            self._urls[club_id] = url
+        return url
+
+
+def _summaries_from_rows(rows: list[MatchSummaryRow]) -> list[MatchSummary]:
     # Active matches should show the current score, which is derived from shots.
-    active_match_data_ids: list[UUID] = [
-        cast(UUID, entry.id_uuid) for entry in entries if entry.status == "active"
-    ]
-    active_scores = compute_scores_for_matchdata_ids(active_match_data_ids)
+    active_scores = compute_scores_for_matchdata_ids([
+        row.match_data_id for row in rows if row.status == "active"
+    ])
+    logos = _ClubLogos()
 
     summaries: list[MatchSummary] = []
-    for entry in entries:
-        match = entry.match_link
-        home_team = match.home_team
-        away_team = match.away_team
-
-        entry_uuid = cast(UUID, entry.id_uuid)
-
-        if entry.status == "active":
-            computed = active_scores.get(entry_uuid)
-            if computed is not None:
-                home_score, away_score = computed
-            else:
-                home_score = 0
-                away_score = 0
+    for row in rows:
+        if row.status == "active":
+            home_score, away_score = active_scores.get(row.match_data_id, (0, 0))
         else:
             # Upcoming + finished matches use the persisted scores.
-            home_score = int(getattr(entry, "home_score", 0) or 0)
-            away_score = int(getattr(entry, "away_score", 0) or 0)
+            home_score = int(row.home_score or 0)
+            away_score = int(row.away_score or 0)
 
         summaries.append({
-            "id_uuid": str(match.id_uuid),
-            "match_data_id": str(entry_uuid),
-            "start_time": localtime(match.start_time).isoformat(),
-            "status": entry.status,
-            "competition": match.season.name,
-            "location": home_team.club.name,
-            "match_url": match.get_absolute_url(),
+            "id_uuid": str(row.match_id),
+            "match_data_id": str(row.match_data_id),
+            "start_time": localtime(row.start_time).isoformat(),
+            "status": row.status,
+            "competition": row.season_name,
+            "location": row.home_club_name,
+            "match_url": Match(id_uuid=row.match_id).get_absolute_url(),
             "score": {
                 "home": home_score,
                 "away": away_score,
             },
             "home": {
-                "name": home_team.name,
-                "club": home_team.club.name,
-                "logo_url": home_team.club.get_club_logo(),
+                "name": row.home_team_name,
+                "club": row.home_club_name,
+                "logo_url": logos.url(
+                    row.home_club_id,
+                    name=row.home_club_name,
+                    logo=row.home_club_logo,
+                    derivatives=row.home_club_logo_derivatives,
+                ),
             },
             "away": {
-                "name": away_team.name,
-                "club": away_team.club.name,
-                "logo_url": away_team.club.get_club_logo(),
+                "name": row.away_team_name,
+                "club": row.away_club_name,
+                "logo_url": logos.url(
+                    row.away_club_id,
+                    name=row.away_club_name,
+                    logo=row.away_club_logo,
+                    derivatives=row.away_club_logo_derivatives,
+                ),
             },
-            "current_part": entry.current_part,
-            "parts": entry.parts,
-            "time_display": get_time_display(entry),
+            "current_part": row.current_part,
+            "parts": row.parts,
+            "time_display": format_part_length(row.part_length),
         })
 
     return summaries
+
+
+def load_match_summaries(queryset: QuerySet[MatchData]) -> list[MatchSummary]:
+    """Load and serialize match summaries with a single projected query.
+
+    Args:
+        queryset: Filtered, ordered and possibly sliced match data rows;
+            `select_related` on it is ignored.
+
+    Returns:
+        list[MatchSummary]: List of match summaries, in queryset order.
+
+    """
+    return _summaries_from_rows([
+        MatchSummaryRow._make(values)
+        for values in queryset.values_list(*_ROW_FIELDS)
+    ])
+
+
+def build_match_summaries(match_data: Iterable[MatchData]) -> list[MatchSummary]:
+    """Serialize match data rows into a lightweight summary payload.
+
+    The instances need their match, teams, clubs and season loaded
+    (`select_related`); prefer `load_match_summaries` for querysets.
+
+    Returns:
+        list[MatchSummary]: List of match summaries.
+
+    """
+    return _summaries_from_rows([_row_from_instance(entry) for entry in match_data])
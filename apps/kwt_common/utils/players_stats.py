@@ -7,10 +7,14 @@ We achieve this by:
 - aggregating those persisted rows for team/season totals
 
 When persisted rows are missing or outdated, we opportunistically recompute them.
+
+`build_player_stats` is the synchronous core used by the REST views;
+`abuild_player_stats` serves websocket consumers through Django's async ORM.
 """
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 import json
 import logging
@@ -68,12 +72,12 @@ def _impact_autorecompute_limit() -> int:
     return max(0, min(int(configured), 200))
 
 
-def _persisted_minutes_by_username(
+def _persisted_minutes_queryset(
     *,
     players: list[Any],
     match_qs: QuerySet[MatchData],
-) -> dict[str, float]:
-    rows = (
+) -> QuerySet[PlayerMatchMinutes, dict[str, Any]]:
+    return (
         PlayerMatchMinutes.objects
         .filter(
             match_data__in=match_qs,
@@ -84,13 +88,19 @@ def _persisted_minutes_by_username(
         .annotate(total=Sum("minutes_played"))
     )
 
+
+def _totals_by_username(
+    rows: Iterable[dict[str, Any]],
+    *,
+    ndigits: int,
+) -> dict[str, float]:
     out: dict[str, float] = {}
     for row in rows:
         username = str(row.get("player__user__username") or "").strip()
         total = row.get("total")
         if not username or total is None:
             continue
-        out[username] = round(float(total), 2)
+        out[username] = round(float(total), ndigits)
     return out
 
 
@@ -221,22 +231,16 @@ def _ensure_latest_match_impacts(*, match_dataset: Iterable[Any]) -> None:
     _recompute_impacts_for_matches(matches=needs_recompute, limit=limit)
 
 
-def _dataset_has_complete_latest_impacts(*, match_dataset: Iterable[Any]) -> bool:
-    """Return True when all finished matches have latest-version impact rows.
+def _impact_coverage_querysets(
+    match_qs: QuerySet[MatchData],
+) -> tuple[QuerySet[MatchData], QuerySet[PlayerMatchImpact, dict[str, Any]]]:
+    """Return the finished matches and the distinct matches with latest impacts.
 
-    This is used to avoid reporting partial persisted totals as if they were
-    canonical.
+    A dataset has complete persisted impacts when both counts are equal; only
+    then are persisted totals reported as canonical rather than partial.
     """
-    match_qs = _resolve_match_queryset(match_dataset)
-    if match_qs is None:
-        return False
-
     finished_qs = match_qs.filter(status="finished")
-    finished_count = finished_qs.count()
-    if finished_count <= 0:
-        return True
-
-    impacted_match_count = (
+    impacted_qs = (
         PlayerMatchImpact.objects
         .filter(
             match_data__in=finished_qs,
@@ -244,9 +248,12 @@ def _dataset_has_complete_latest_impacts(*, match_dataset: Iterable[Any]) -> boo
         )
         .values("match_data_id")
         .distinct()
-        .count()
     )
-    return impacted_match_count == finished_count
+    return finished_qs, impacted_qs
+
+
+def _has_complete_impacts(*, finished_count: int, impacted_count: int) -> bool:
+    return finished_count <= 0 or impacted_count == finished_count
 
 
 def _resolve_match_queryset(match_dataset: Iterable[Any]) -> QuerySet[MatchData] | None:
@@ -271,96 +278,60 @@ def _resolve_match_queryset(match_dataset: Iterable[Any]) -> QuerySet[MatchData]
         return None
 
 
-def _minutes_played_by_username(
+def _shot_rows_queryset(
     *, players: list[Any], match_dataset: Iterable[Any]
-) -> dict[str, float]:
-    match_qs = _resolve_match_queryset(match_dataset)
-    if match_qs is None:
-        return {}
-
-    # Minutes-played should be computed only by the background task that
-    # persists `PlayerMatchMinutes`. Request handlers should never recompute.
-    return _persisted_minutes_by_username(players=players, match_qs=match_qs)
-
-
-async def build_player_stats(
-    players: list[Any], match_dataset: Iterable[Any]
-) -> list[PlayerStatRow]:
-    """Compute the raw player statistics for a collection of matches.
-
-    Returns:
-        list[PlayerStatRow]: List of player stats.
-
-    """
-    if not players:
-        return []
-
-    def _fetch() -> tuple[
-        list[dict[str, object]],
-        dict[str, float],
-        dict[str, float],
-        bool,
-    ]:
-        _ensure_latest_match_impacts(match_dataset=match_dataset)
-
-        dataset_has_full_impacts = _dataset_has_complete_latest_impacts(
-            match_dataset=match_dataset,
+) -> QuerySet[Shot, dict[str, Any]]:
+    return (
+        Shot.objects
+        .filter(
+            match_data__in=match_dataset,
+            player__in=players,
         )
-
-        minutes_by_username = _minutes_played_by_username(
-            players=players,
-            match_dataset=match_dataset,
+        .values("player__user__username")
+        .annotate(
+            shots_for=Count("id_uuid", filter=Q(for_team=True)),
+            shots_against=Count("id_uuid", filter=Q(for_team=False)),
+            goals_for=Count("id_uuid", filter=Q(for_team=True, scored=True)),
+            goals_against=Count("id_uuid", filter=Q(for_team=False, scored=True)),
         )
+        .order_by("-goals_for", "player__user__username")
+    )
 
-        shot_rows = list(
-            Shot.objects
-            .filter(
-                match_data__in=match_dataset,
-                player__in=players,
-            )
-            .values("player__user__username")
-            .annotate(
-                shots_for=Count("id_uuid", filter=Q(for_team=True)),
-                shots_against=Count("id_uuid", filter=Q(for_team=False)),
-                goals_for=Count("id_uuid", filter=Q(for_team=True, scored=True)),
-                goals_against=Count("id_uuid", filter=Q(for_team=False, scored=True)),
-            )
-            .order_by("-goals_for", "player__user__username")
-        )
 
-        impact_rows = (
-            PlayerMatchImpact.objects
-            .filter(
-                match_data__in=match_dataset,
-                player__in=players,
-                algorithm_version=LATEST_MATCH_IMPACT_ALGORITHM_VERSION,
-            )
-            .values("player__user__username")
-            .annotate(total=Sum("impact_score"))
+def _impact_rows_queryset(
+    *, players: list[Any], match_dataset: Iterable[Any]
+) -> QuerySet[PlayerMatchImpact, dict[str, Any]]:
+    return (
+        PlayerMatchImpact.objects
+        .filter(
+            match_data__in=match_dataset,
+            player__in=players,
+            algorithm_version=LATEST_MATCH_IMPACT_ALGORITHM_VERSION,
         )
+        .values("player__user__username")
+        .annotate(total=Sum("impact_score"))
+    )
 
-        impact_by_username: dict[str, float] = {}
-        for row in impact_rows:
-            username = str(row.get("player__user__username") or "").strip()
-            total = row.get("total")
-            if not username or total is None:
-                continue
-            impact_by_username[username] = round(float(total), 1)
 
-        return (
-            shot_rows,
-            impact_by_username,
-            minutes_by_username,
-            dataset_has_full_impacts,
-        )
+def _prepare_match_queryset(
+    match_dataset: Iterable[Any],
+) -> QuerySet[MatchData] | None:
+    """Recompute outdated impacts, then resolve the dataset to a queryset.
 
-    (
-        rows,
-        impact_by_username,
-        minutes_by_username,
-        dataset_has_full_impacts,
-    ) = await sync_to_async(_fetch)()
+    Impact recomputation writes the rows the stats read, so it has to finish
+    before any of the (otherwise independent) stats queries run.
+    """
+    _ensure_latest_match_impacts(match_dataset=match_dataset)
+    return _resolve_match_queryset(match_dataset)
 
+
+def _player_stat_rows(
+    *,
+    shot_rows: Iterable[dict[str, Any]],
+    impact_by_username: dict[str, float],
+    minutes_by_username: dict[str, float],
+    dataset_has_full_impacts: bool,
+) -> list[PlayerStatRow]:
     player_rows: list[PlayerStatRow] = [
         {
             "username": (username := str(row.get("player__user__username") or "")),
@@ -383,13 +354,116 @@ async def build_player_stats(
                 else None
             ),
         }
-        for row in rows
+        for row in shot_rows
         if row.get("player__user__username")
     ]
 
     return sorted(player_rows, key=operator.itemgetter("goals_for"), reverse=True)
 
 
+def build_player_stats(
+    players: list[Any], match_dataset: Iterable[Any]
+) -> list[PlayerStatRow]:
+    """Compute the raw player statistics for a collection of matches.
+
+    Returns:
+        list[PlayerStatRow]: List of player stats.
+
+    """
+    if not players:
+        return []
+
+    match_qs = _prepare_match_queryset(match_dataset)
+    if match_qs is None:
+        dataset_has_full_impacts = False
+        minutes_by_username: dict[str, float] = {}
+    else:
+        finished_qs, impacted_qs = _impact_coverage_querysets(match_qs)
+        dataset_has_full_impacts = _has_complete_impacts(
+            finished_count=finished_qs.count(),
+            impacted_count=impacted_qs.count(),
+        )
+        # Minutes-played should be computed only by the background task that
+        # persists `PlayerMatchMinutes`. Request handlers should never recompute.
+        minutes_by_username = _totals_by_username(
+            _persisted_minutes_queryset(players=players, match_qs=match_qs),
+            ndigits=2,
+        )
+
+    return _player_stat_rows(
+        shot_rows=list(
+            _shot_rows_queryset(players=players, match_dataset=match_dataset)
+        ),
+        impact_by_username=_totals_by_username(
+            _impact_rows_queryset(players=players, match_dataset=match_dataset),
+            ndigits=1,
+        ),
+        minutes_by_username=minutes_by_username,
+        dataset_has_full_impacts=dataset_has_full_impacts,
+    )
+
+
+async def _alist(queryset: QuerySet[Any, dict[str, Any]]) -> list[dict[str, Any]]:
+    return [row async for row in queryset.aiterator()]
+
+
+async def _acount(queryset: QuerySet[Any, Any] | None) -> int:
+    return 0 if queryset is None else await queryset.acount()
+
+
+async def abuild_player_stats(
+    players: list[Any], match_dataset: Iterable[Any]
+) -> list[PlayerStatRow]:
+    """Async variant of `build_player_stats`.
+
+    After the impact recompute, the shot, impact, minutes and coverage queries
+    do not depend on each other and are awaited together.
+
+    Returns:
+        list[PlayerStatRow]: List of player stats.
+
+    """
+    if not players:
+        return []
+
+    match_qs = await sync_to_async(_prepare_match_queryset)(match_dataset)
+    finished_qs, impacted_qs = (
+        _impact_coverage_querysets(match_qs) if match_qs is not None else (None, None)
+    )
+    minutes_qs = (
+        _persisted_minutes_queryset(players=players, match_qs=match_qs)
+        if match_qs is not None
+        else PlayerMatchMinutes.objects.none().values("player__user__username")
+    )
+
+    (
+        shot_rows,
+        impact_rows,
+        minutes_rows,
+        finished_count,
+        impacted_count,
+    ) = await asyncio.gather(
+        _alist(_shot_rows_queryset(players=players, match_dataset=match_dataset)),
+        _alist(_impact_rows_queryset(players=players, match_dataset=match_dataset)),
+        _alist(minutes_qs),
+        _acount(finished_qs),
+        _acount(impacted_qs),
+    )
+
+    return _player_stat_rows(
+        shot_rows=shot_rows,
+        impact_by_username=_totals_by_username(impact_rows, ndigits=1),
+        minutes_by_username=_totals_by_username(minutes_rows, ndigits=2),
+        dataset_has_full_impacts=(
+            match_qs is not None
+            and _has_complete_impacts(
+                finished_count=finished_count,
+                impacted_count=impacted_count,
+            )
+        ),
+    )
+
+
 async def players_stats(players: list[Any], match_dataset: Iterable[Any]) -> str:
     """Return statistics of players in a match as websocket-friendly JSON.
 
@@ -397,7 +471,7 @@ async def players_stats(players: list[Any], match_dataset: Iterable[Any]) -> str
         str: JSON string of player stats.
 
     """
-    player_rows = await build_player_stats(players, match_dataset)
+    player_rows = await abuild_player_stats(players, match_dataset)
     return json.dumps(
         {
             "command": "stats",
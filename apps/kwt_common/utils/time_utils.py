@@ -108,10 +108,21 @@ def get_time_display(match_data: MatchData) -> str:
         The time display for the match.
 
     """
-    time_left = match_data.part_length
+    return format_part_length(match_data.part_length)
 
+
+def format_part_length(part_length: float) -> str:
+    """Format a part length in seconds as `MM:SS`.
+
+    Args:
+        part_length: The part length in seconds.
+
+    Returns:
+        The formatted part length.
+
+    """
     # convert the seconds to minutes and seconds to display on the page make the numbers
     # look nice with the %02d
-    minutes = int(time_left / 60)
-    seconds = int(time_left % 60)
+    minutes = int(part_length / 60)
+    seconds = int(part_length % 60)
     return f"{minutes:02d}:{seconds:02d}"
@@ -8,6 +8,7 @@ from typing import Any
 from asgiref.sync import sync_to_async
 
 from apps.game_tracker.models import MatchData, Shot
+from apps.kwt_common.image_derivatives import LIST_THUMBNAIL_SIZE
 
 from .time_utils import get_time_display
 
@@ -50,14 +51,18 @@ async def transform_match_data(matches_data: list[MatchData]) -> list[dict[str,
                 "id_uuid": str(match_data.match_link.id_uuid),
                 "match_data_id": str(match_data.id_uuid),
                 "home_team": await sync_to_async(home_team.__str__)(),
-                "home_team_logo": home_team.club.get_club_logo(),
+                "home_team_logo": home_team.club.get_club_logo(
+                    size=LIST_THUMBNAIL_SIZE
+                ),
                 "home_score": await Shot.objects.filter(
                     match_data=match_data,
                     team=home_team,
                     scored=True,
                 ).acount(),
                 "away_team": await sync_to_async(away_team.__str__)(),
-                "away_team_logo": away_team.club.get_club_logo(),
+                "away_team_logo": away_team.club.get_club_logo(
+                    size=LIST_THUMBNAIL_SIZE
+                ),
                 "away_score": await Shot.objects.filter(
                     match_data=match_data,
                     team=away_team,
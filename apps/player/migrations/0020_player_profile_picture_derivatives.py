@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("player", "0019_backfill_legacy_goal_songs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="profile_picture_derivatives",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -11,6 +11,8 @@ from django.db import models
 from django.db.models import Q
 from django.utils import timezone
 
+from apps.kwt_common.image_derivatives import image_url_for_size
+
 from .constants import club_model_string, team_model_string
 
 
@@ -54,6 +56,12 @@ class Player(models.Model):
         null=True,
     )
 
+    # Generated thumbnails, see `apps.kwt_common.image_derivatives`.
+    profile_picture_derivatives: models.JSONField[dict[str, Any]] = models.JSONField(
+        default=dict,
+        blank=True,
+    )
+
     profile_picture_visibility: models.CharField[str, str] = models.CharField(
         max_length=16,
         choices=Visibility.choices,
@@ -142,15 +150,24 @@ class Player(models.Model):
             .distinct()
         )
 
-    def get_profile_picture(self) -> str:
+    def get_profile_picture(self, size: int | None = None) -> str:
         """Get the URL of the player's profile picture.
 
+        Args:
+            size: Optional display size in pixels. When set, the smallest
+                generated thumbnail covering it is returned instead of the
+                original upload.
+
         Returns:
             str: The URL of the profile picture or a default image URL.
 
         """
         if self.profile_picture:
-            return self.profile_picture.url
+            return image_url_for_size(
+                self.profile_picture,
+                self.profile_picture_derivatives,
+                size,
+            )
 
         return self.get_placeholder_profile_picture_url()
 
@@ -18,7 +18,8 @@ from django.db.models import (
 from django.utils import timezone
 
 from apps.game_tracker.models import MatchData, MatchPlayer, PlayerGroup, Shot
-from apps.kwt_common.utils.match_summary import build_match_summaries
+from apps.kwt_common.overview_sections import OverviewSection, compose_sections
+from apps.kwt_common.utils.match_summary import load_match_summaries
 from apps.player.models.player import Player
 from apps.schedule.models import Season
 from apps.schedule.models.mvp import MatchMvp
@@ -88,16 +89,7 @@ def match_queryset_for_player(
     include_roster: bool,
 ) -> QuerySet[MatchData]:
     """Return an optimized player-centric MatchData queryset."""
-    queryset = MatchData.objects.select_related(
-        "match_link",
-        "match_link__home_team",
-        "match_link__home_team__club",
-        "match_link__away_team",
-        "match_link__away_team__club",
-        "match_link__season",
-    )
-
-    queryset = queryset.annotate(
+    queryset = MatchData.objects.annotate(
         has_player_group=Exists(
             PlayerGroup.objects.filter(
                 match_data=OuterRef("pk"),
@@ -179,35 +171,53 @@ def build_player_overview_payload(
     seasons: list[Season],
 ) -> dict[str, Any]:
     """Build the player overview payload."""
-    upcoming_matches = build_match_summaries(
-        match_queryset_for_player(
-            player,
-            season,
-            include_roster=True,
-        )
-        .filter(status__in=["upcoming", "active"])
-        .order_by("match_link__start_time")[:10]
-    )
-
-    recent_matches = build_match_summaries(
-        match_queryset_for_player(
-            player,
-            season,
-            include_roster=False,
-        )
-        .filter(status="finished")
-        .order_by("-match_link__start_time")[:10]
+    results = compose_sections(
+        "player",
+        (
+            OverviewSection(
+                name="upcoming",
+                compute=lambda: load_match_summaries(
+                    match_queryset_for_player(
+                        player,
+                        season,
+                        include_roster=True,
+                    )
+                    .filter(status__in=["upcoming", "active"])
+                    .order_by("match_link__start_time")[:10]
+                ),
+                fallback=[],
+            ),
+            OverviewSection(
+                name="recent",
+                compute=lambda: load_match_summaries(
+                    match_queryset_for_player(
+                        player,
+                        season,
+                        include_roster=False,
+                    )
+                    .filter(status="finished")
+                    .order_by("-match_link__start_time")[:10]
+                ),
+                fallback=[],
+            ),
+            OverviewSection(
+                name="seasons",
+                compute=lambda: build_seasons_payload(seasons),
+                fallback=[],
+            ),
+        ),
     )
 
     return {
         "matches": {
-            "upcoming": upcoming_matches,
-            "recent": recent_matches,
+            "upcoming": results.get("upcoming"),
+            "recent": results.get("recent"),
         },
-        "seasons": build_seasons_payload(seasons),
+        "seasons": results.get("seasons"),
         "meta": {
             "season_id": str(season.id_uuid) if season else None,
             "season_name": season.name if season else None,
+            "partial_sections": list(results.partial),
         },
     }
 
@@ -226,14 +236,6 @@ def connected_club_recent_results(
 
     queryset = (
         MatchData.objects
-        .select_related(
-            "match_link",
-            "match_link__home_team",
-            "match_link__home_team__club",
-            "match_link__away_team",
-            "match_link__away_team__club",
-            "match_link__season",
-        )
         .filter(status="finished")
         .filter(
             Q(match_link__home_team__club__in=clubs_qs)
@@ -249,7 +251,7 @@ def connected_club_recent_results(
         cutoff = timezone.now() - timedelta(days=days)
         queryset = queryset.filter(match_link__start_time__gte=cutoff)
 
-    return build_match_summaries(queryset.order_by("-match_link__start_time")[:limit])
+    return load_match_summaries(queryset.order_by("-match_link__start_time")[:limit])
 
 
 def goal_type_breakdown(
@@ -296,21 +298,13 @@ def build_player_stats_payload(
     if mvp_match_ids:
         mvp_matchdata_queryset = (
             MatchData.objects
-            .select_related(
-                "match_link",
-                "match_link__home_team",
-                "match_link__home_team__club",
-                "match_link__away_team",
-                "match_link__away_team__club",
-                "match_link__season",
-            )
             .filter(
                 status="finished",
                 match_link_id__in=mvp_match_ids,
             )
             .distinct()
         )
-        mvp_matches = build_match_summaries(
+        mvp_matches = load_match_summaries(
             mvp_matchdata_queryset.order_by("-match_link__start_time")
         )
 
@@ -0,0 +1,164 @@
+"""Cached identity (user + player) for authenticated API requests.
+
+Bearer-authenticated clients poll the API every few seconds, and every call used
+to load the user row and then, in most views, the viewer's `Player` row. Both
+are cached together for a short TTL, keyed by user id and the token's `iat`
+claim so a freshly issued token always starts from the database.
+
+Only field values are cached (never the password hash); instances are rebuilt
+with `Model.from_db`, leaving excluded fields deferred. User/player saves bump a
+per-user generation token which makes older entries miss.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass
+from typing import Any, Final, cast
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractBaseUser
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+
+from apps.player.models.player import Player
+
+
+IDENTITY_CACHE_PREFIX: Final[str] = "korfbal:identity:v1"
+_EXCLUDED_FIELDS: Final[frozenset[str]] = frozenset({"password"})
+_VIEWER_PLAYER_ATTR: Final[str] = "_korfbal_viewer_player"
+_UNRESOLVED: Final = object()
+
+
+@dataclass(frozen=True, slots=True)
+class RequestIdentity:
+    """The authenticated user and their player profile (if any)."""
+
+    user: AbstractBaseUser
+    player: Player | None
+
+
+def _identity_ttl() -> int:
+    return max(0, int(getattr(settings, "KORFBAL_IDENTITY_CACHE_TTL_S", 60)))
+
+
+def _entry_key(user_id: object, issued_at: object) -> str:
+    return f"{IDENTITY_CACHE_PREFIX}:{user_id}:{issued_at}"
+
+
+def _generation_key(user_id: object) -> str:
+    return f"{IDENTITY_CACHE_PREFIX}:gen:{user_id}"
+
+
+def _cached_field_names(model: type[Model]) -> list[str]:
+    return [
+        field.attname
+        for field in model._meta.concrete_fields
+        if field.name not in _EXCLUDED_FIELDS
+    ]
+
+
+def _load_row(model: type[Model], **filters: object) -> dict[str, Any] | None:
+    return (
+        model._default_manager
+        .filter(**filters)
+        .values(*_cached_field_names(model))
+        .first()
+    )
+
+
+def _build_instance(model: type[Model], row: dict[str, Any]) -> Any:
+    names = [name for name in _cached_field_names(model) if name in row]
+    return model.from_db(DEFAULT_DB_ALIAS, names, [row[name] for name in names])
+
+
+def _identity_from_rows(
+    user_row: dict[str, Any],
+    player_row: dict[str, Any] | None,
+) -> RequestIdentity:
+    user = _build_instance(get_user_model(), user_row)
+    player = _build_instance(Player, player_row) if player_row else None
+    if player is not None:
+        # Caches both `player.user` and `user.player` so neither hits the DB.
+        player.user = user
+    return RequestIdentity(user=cast(AbstractBaseUser, user), player=player)
+
+
+def resolve_identity(user_id: object, *, issued_at: object) -> RequestIdentity | None:
+    """Return the user and player for `user_id`, from cache when possible.
+
+    Args:
+        user_id: Primary key of the user (the token `sub` claim).
+        issued_at: The token `iat` claim; without it the cache is bypassed.
+
+    Returns:
+        RequestIdentity | None: None when the user does not exist.
+
+    """
+    ttl = _identity_ttl()
+    use_cache = ttl > 0 and issued_at is not None
+    entry_key = _entry_key(user_id, issued_at)
+    generation: object = None
+    if use_cache:
+        try:
+            cached = cache.get_many([entry_key, _generation_key(user_id)])
+        except Exception:  # noqa: BLE001
+            cached = {}
+        generation = cached.get(_generation_key(user_id))
+        entry = cached.get(entry_key)
+        if isinstance(entry, dict) and entry.get("generation") == generation:
+            return _identity_from_rows(entry["user"], entry["player"])
+
+    user_model = get_user_model()
+    user_row = _load_row(user_model, pk=user_id)
+    if user_row is None:
+        return None
+    player_row = _load_row(Player, user_id=user_row[user_model._meta.pk.attname])
+
+    if use_cache:
+        with contextlib.suppress(Exception):
+            cache.set(
+                entry_key,
+                {"generation": generation, "user": user_row, "player": player_row},
+                timeout=ttl,
+            )
+    return _identity_from_rows(user_row, player_row)
+
+
+def invalidate_identity(user_id: object) -> None:
+    """Make every cached identity of `user_id` miss on the next lookup."""
+    ttl = _identity_ttl()
+    if not ttl or user_id is None:
+        return
+    # Entries never outlive the TTL, so the token only needs to live as long.
+    with contextlib.suppress(Exception):
+        cache.set(_generation_key(user_id), uuid.uuid4().hex, timeout=ttl)
+
+
+def remember_viewer_player(request: object, player: Player | None) -> None:
+    """Attach the resolved viewer player to the underlying Django request."""
+    setattr(getattr(request, "_request", request), _VIEWER_PLAYER_ATTR, player)
+
+
+def viewer_player_for(request: object) -> Player | None:
+    """Return the authenticated viewer's player, resolving it once per request.
+
+    Bearer-authenticated requests already carry the player from
+    `resolve_identity`; session-authenticated ones are looked up on first use.
+    """
+    target = getattr(request, "_request", request)
+    player = getattr(target, _VIEWER_PLAYER_ATTR, _UNRESOLVED)
+    if player is not _UNRESOLVED:
+        return cast(Player | None, player)
+
+    user = getattr(request, "user", None)
+    resolved = (
+        Player.objects.filter(user=user).first()
+        if user is not None and getattr(user, "is_authenticated", False)
+        else None
+    )
+    remember_viewer_player(request, resolved)
+    return resolved
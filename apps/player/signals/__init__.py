@@ -1,6 +1,16 @@
 """Module contains signals for the player app."""
 
-from .player_signals import create_player_for_new_user
+from .player_signals import (
+    create_player_for_new_user,
+    invalidate_player_identity,
+    invalidate_user_identity,
+    schedule_profile_picture_derivatives,
+)
 
 
-__all__ = ["create_player_for_new_user"]
+__all__ = [
+    "create_player_for_new_user",
+    "invalidate_player_identity",
+    "invalidate_user_identity",
+    "schedule_profile_picture_derivatives",
+]
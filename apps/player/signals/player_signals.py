@@ -1,10 +1,18 @@
 """File contains signals for the Player model."""
 
+from functools import partial
+
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from apps.kwt_common.image_derivatives import (
+    image_field_needs_derivatives,
+    schedule_image_derivatives,
+)
 from apps.player.models import Player
+from apps.player.services.viewer_identity import invalidate_identity
 
 
 @receiver(post_save, sender=User)
@@ -26,3 +34,49 @@ def create_player_for_new_user(
     if created:
         # If the user is just created, create a Player instance
         Player.objects.create(user=instance)
+
+
+@receiver(post_save, sender=Player)
+def schedule_profile_picture_derivatives(
+    sender: type[Player],
+    instance: Player,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,
+) -> None:
+    """Generate profile picture thumbnails after a new upload is committed."""
+    if image_field_needs_derivatives(
+        instance,
+        image_field="profile_picture",
+        derivatives_field="profile_picture_derivatives",
+        update_fields=update_fields,
+    ):
+        schedule_image_derivatives(
+            task_path="apps.player.tasks.generate_profile_picture_derivatives",
+            object_id=str(instance.id_uuid),
+        )
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_identity(
+    sender: type[User],
+    instance: User,
+    **kwargs: object,
+) -> None:
+    """Drop cached request identities once a user change is committed.
+
+    Bumping earlier would let a concurrent request cache the old row under
+    the new generation.
+    """
+    transaction.on_commit(partial(invalidate_identity, instance.pk))
+
+
+@receiver(post_save, sender=Player)
+@receiver(post_delete, sender=Player)
+def invalidate_player_identity(
+    sender: type[Player],
+    instance: Player,
+    **kwargs: object,
+) -> None:
+    """Drop cached request identities once a player change is committed."""
+    transaction.on_commit(partial(invalidate_identity, instance.user_id))
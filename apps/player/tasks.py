@@ -18,6 +18,7 @@ from django.utils import timezone
 from apps.awards.models.mvp import MatchMvpVote
 from apps.awards.services import mvp as mvp_service
 from apps.game_tracker.models import MatchData
+from apps.kwt_common.image_derivatives import refresh_image_derivatives
 from apps.player.composition import send_expo_push
 from apps.player.models.cached_song import CachedSong, CachedSongStatus
 from apps.player.models.player import Player
@@ -494,3 +495,29 @@ def download_player_song(self: Any, song_id: str) -> None:
         song.error_message = str(exc)
         song.save(update_fields=["status", "error_message", "updated_at"])
         raise
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def generate_profile_picture_derivatives(
+    self: Any,
+    player_id: str,
+    *,
+    force: bool = False,
+) -> dict[str, str]:
+    """Generate fixed-size thumbnails for a player's profile picture."""
+    player = (
+        Player.objects
+        .filter(id_uuid=player_id)
+        .only("id_uuid", "profile_picture", "profile_picture_derivatives")
+        .first()
+    )
+    if player is None:
+        return {"player_id": player_id, "status": "not_found"}
+
+    refreshed = refresh_image_derivatives(
+        player,
+        image_field="profile_picture",
+        derivatives_field="profile_picture_derivatives",
+        force=force,
+    )
+    return {"player_id": player_id, "status": "ok" if refreshed else "current"}
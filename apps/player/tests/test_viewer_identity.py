@@ -0,0 +1,129 @@
+"""Tests for the cached request identity (user + player) resolution."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import RequestFactory
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from apps.player.models.player import Player
+from apps.player.services.viewer_identity import (
+    IDENTITY_CACHE_PREFIX,
+    remember_viewer_player,
+    resolve_identity,
+    viewer_player_for,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_resolve_identity_is_served_from_cache(
+    django_assert_num_queries: Callable[[int], AbstractContextManager[None]],
+) -> None:
+    """A second lookup for the same token costs no queries."""
+    user = get_user_model().objects.create_user(username="ident_a", password="pw")
+
+    with django_assert_num_queries(2):
+        first = resolve_identity(user.pk, issued_at=1000)
+    with django_assert_num_queries(0):
+        second = resolve_identity(user.pk, issued_at=1000)
+
+    assert first is not None
+    assert second is not None
+    assert second.user.pk == user.pk
+    assert second.player is not None
+    assert second.player.user_id == user.pk
+    with django_assert_num_queries(0):
+        assert second.player.user is second.user
+        assert second.user.player is second.player  # type: ignore[attr-defined]
+
+
+@pytest.mark.django_db
+def test_resolve_identity_never_caches_the_password_hash() -> None:
+    """The password stays deferred and is never written to the cache."""
+    user = get_user_model().objects.create_user(username="ident_b", password="pw")
+
+    identity = resolve_identity(user.pk, issued_at=1)
+
+    assert identity is not None
+    assert "password" in identity.user.get_deferred_fields()
+    entry = cache.get(f"{IDENTITY_CACHE_PREFIX}:{user.pk}:1")
+    assert entry["user"]["username"] == "ident_b"
+    assert "password" not in entry["user"]
+
+
+@pytest.mark.django_db
+def test_saving_user_or_player_invalidates_identity(
+    django_capture_on_commit_callbacks: Callable[..., AbstractContextManager[list]],
+) -> None:
+    """Profile changes are visible on the next request once committed."""
+    user = get_user_model().objects.create_user(username="ident_c", password="pw")
+    resolve_identity(user.pk, issued_at=1)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        user.is_active = False
+        user.save(update_fields=["is_active"])
+        # Until the commit, other requests may still read the old row.
+        identity = resolve_identity(user.pk, issued_at=1)
+        assert identity is not None
+        assert identity.user.is_active is True
+    for callback in callbacks:
+        callback()
+    identity = resolve_identity(user.pk, issued_at=1)
+    assert identity is not None
+    assert identity.user.is_active is False
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Player.objects.filter(user=user).get().delete()
+    identity = resolve_identity(user.pk, issued_at=1)
+    assert identity is not None
+    assert identity.player is None
+
+
+@pytest.mark.django_db
+def test_resolve_identity_without_iat_or_ttl_bypasses_cache(
+    settings: SettingsWrapper,
+    django_assert_num_queries: Callable[[int], AbstractContextManager[None]],
+) -> None:
+    """Tokens without `iat` and a zero TTL always read the database."""
+    user = get_user_model().objects.create_user(username="ident_d", password="pw")
+    resolve_identity(user.pk, issued_at=None)
+    with django_assert_num_queries(2):
+        resolve_identity(user.pk, issued_at=None)
+
+    settings.KORFBAL_IDENTITY_CACHE_TTL_S = 0
+    resolve_identity(user.pk, issued_at=5)
+    with django_assert_num_queries(2):
+        resolve_identity(user.pk, issued_at=5)
+    assert resolve_identity(-1, issued_at=5) is None
+
+
+@pytest.mark.django_db
+def test_viewer_player_for_resolves_once_per_request(
+    django_assert_num_queries: Callable[[int], AbstractContextManager[None]],
+) -> None:
+    """Session requests look the player up once; bearer requests never."""
+    user = get_user_model().objects.create_user(username="ident_e", password="pw")
+    request = RequestFactory().get("/")
+    request.user = user
+
+    with django_assert_num_queries(1):
+        player = viewer_player_for(request)
+        assert viewer_player_for(request) is player
+    assert player is not None
+    assert player.user_id == user.pk
+
+    other = RequestFactory().get("/")
+    other.user = user
+    remember_viewer_player(other, None)
+    with django_assert_num_queries(0):
+        assert viewer_player_for(other) is None
@@ -4,14 +4,12 @@ from __future__ import annotations
 
 from typing import Any, Protocol
 
-from django.db import transaction
 from rest_framework import permissions, status
 from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from apps.game_tracker.models import (
-    GoalType,
     MatchData,
     MatchPart,
     Pause,
@@ -20,7 +18,7 @@ from apps.game_tracker.models import (
     Timeout,
 )
 from apps.game_tracker.realtime.contracts import LiveResource
-from apps.game_tracker.services.live_updates import summarize_match_changes
+from apps.game_tracker.services.live_updates import revision_snapshot
 from apps.game_tracker.services.match_timeline_payload import (
     build_match_events,
     build_match_shots,
@@ -28,6 +26,11 @@ from apps.game_tracker.services.match_timeline_payload import (
     serialize_pause_event,
     serialize_substitute_event,
 )
+from apps.game_tracker.services.match_timeline_projection import (
+    read_timeline,
+    read_timeline_delta,
+)
+from apps.game_tracker.services.reference_data import reference_data
 from apps.schedule.models import Match
 
 from .constants import MATCH_TRACKER_DATA_NOT_FOUND
@@ -89,8 +92,9 @@ class MatchEventsActionsMixin:
                 status=status.HTTP_200_OK,
             )
 
-        with transaction.atomic():
-            match_data = MatchData.objects.select_for_update().get(pk=match_data.pk)
+        # Spectator reads must not queue behind (or block) tracker writes.
+        with revision_snapshot():
+            match_data = MatchData.objects.get(pk=match_data.pk)
             match_parts_payload = [
                 {
                     "id_uuid": str(part.id_uuid),
@@ -106,48 +110,36 @@ class MatchEventsActionsMixin:
                 .order_by("part_number", "start_time")
                 .all()
             ]
-            events_payload = build_match_events(match_data)
             base = {
                 "home_team_id": str(match.home_team.id_uuid),
                 "match_parts": match_parts_payload,
                 "status": match_data.status,
                 "live_revision": match_data.live_revision,
             }
-            if since_revision is None:
-                return Response(
-                    {**base, "mode": "full", "events": events_payload},
-                    status=status.HTTP_200_OK,
-                )
-
-            summary = summarize_match_changes(
-                match_data,
-                since_revision=since_revision,
-            )
-            can_send_delta = summary.history_complete and (
-                LiveResource.EVENTS not in summary.resources
-                or LiveResource.EVENTS in summary.complete_id_resources
-            )
-            if not can_send_delta:
-                return Response(
-                    {**base, "mode": "full", "events": events_payload},
-                    status=status.HTTP_200_OK,
+            if since_revision is not None:
+                delta = read_timeline_delta(
+                    match_data,
+                    LiveResource.EVENTS,
+                    since_revision=since_revision,
                 )
-
-            changed_ids = summary.changed_ids.get(LiveResource.EVENTS, frozenset())
-            current_ids = {event["event_id"] for event in events_payload}
+                if delta is not None:
+                    return Response(
+                        {
+                            **base,
+                            "mode": "delta",
+                            "base_revision": since_revision,
+                            "upsert": delta.upsert,
+                            "deleted_ids": delta.deleted_ids,
+                            "order": delta.order,
+                        },
+                        status=status.HTTP_200_OK,
+                    )
+
+            events_payload = read_timeline(match_data, LiveResource.EVENTS)
+            if events_payload is None:
+                events_payload = build_match_events(match_data)
             return Response(
-                {
-                    **base,
-                    "mode": "delta",
-                    "base_revision": since_revision,
-                    "upsert": [
-                        event
-                        for event in events_payload
-                        if event["event_id"] in changed_ids
-                    ],
-                    "deleted_ids": sorted(changed_ids - current_ids),
-                    "order": [event["event_id"] for event in events_payload],
-                },
+                {**base, "mode": "full", "events": events_payload},
                 status=status.HTTP_200_OK,
             )
 
@@ -186,50 +178,38 @@ class MatchEventsActionsMixin:
                 status=status.HTTP_200_OK,
             )
 
-        with transaction.atomic():
-            match_data = MatchData.objects.select_for_update().get(pk=match_data.pk)
-            shots_payload = build_match_shots(match_data)
+        with revision_snapshot():
+            match_data = MatchData.objects.get(pk=match_data.pk)
             base = {
                 "home_team_id": str(match.home_team.id_uuid),
                 "away_team_id": str(match.away_team.id_uuid),
                 "status": match_data.status,
                 "live_revision": match_data.live_revision,
             }
-            if since_revision is None:
-                return Response(
-                    {**base, "mode": "full", "shots": shots_payload},
-                    status=status.HTTP_200_OK,
+            if since_revision is not None:
+                delta = read_timeline_delta(
+                    match_data,
+                    LiveResource.SHOTS,
+                    since_revision=since_revision,
                 )
-
-            summary = summarize_match_changes(
-                match_data,
-                since_revision=since_revision,
-            )
-            can_send_delta = summary.history_complete and (
-                LiveResource.SHOTS not in summary.resources
-                or LiveResource.SHOTS in summary.complete_id_resources
-            )
-            if not can_send_delta:
-                return Response(
-                    {**base, "mode": "full", "shots": shots_payload},
-                    status=status.HTTP_200_OK,
-                )
-
-            changed_ids = summary.changed_ids.get(LiveResource.SHOTS, frozenset())
-            current_ids = {shot["event_id"] for shot in shots_payload}
+                if delta is not None:
+                    return Response(
+                        {
+                            **base,
+                            "mode": "delta",
+                            "base_revision": since_revision,
+                            "upsert": delta.upsert,
+                            "deleted_ids": delta.deleted_ids,
+                            "order": delta.order,
+                        },
+                        status=status.HTTP_200_OK,
+                    )
+
+            shots_payload = read_timeline(match_data, LiveResource.SHOTS)
+            if shots_payload is None:
+                shots_payload = build_match_shots(match_data)
             return Response(
-                {
-                    **base,
-                    "mode": "delta",
-                    "base_revision": since_revision,
-                    "upsert": [
-                        shot
-                        for shot in shots_payload
-                        if shot["event_id"] in changed_ids
-                    ],
-                    "deleted_ids": sorted(changed_ids - current_ids),
-                    "order": [shot["event_id"] for shot in shots_payload],
-                },
+                {**base, "mode": "full", "shots": shots_payload},
                 status=status.HTTP_200_OK,
             )
 
@@ -556,7 +536,7 @@ class MatchEventsActionsMixin:
                 "players__user",
             )
         )
-        goal_types = list(GoalType.objects.order_by("name"))
+        goal_types = reference_data().goal_types
 
         players_by_id: dict[str, dict[str, str]] = {}
         for group in player_groups:
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import timedelta
 import json
 import logging
-from typing import Any
+from typing import Any, ClassVar
 from uuid import uuid4
 
 from django.conf import settings
@@ -37,8 +38,14 @@ from apps.game_tracker.services.tracker_http import (
     poll_tracker_state,
 )
 from apps.kwt_common.api.permissions import IsStaffOrReadOnly
-from apps.kwt_common.utils.match_summary import build_match_summaries
+from apps.kwt_common.public_cache import (
+    SCHEDULE_TAG,
+    cached_public_payload,
+    public_cache_key,
+)
+from apps.kwt_common.utils.match_summary import MatchSummary, load_match_summaries
 from apps.player.models.player import Player
+from apps.player.services.viewer_identity import viewer_player_for
 from apps.schedule.models import Match
 from apps.team.models.team import Team
 
@@ -54,6 +61,9 @@ from .serializers import MatchSerializer, MatchWriteSerializer
 
 logger = logging.getLogger(__name__)
 
+# Query params that change public schedule payloads (see `_public_cache_key`).
+_PUBLIC_SCHEDULE_PARAMS = ("club", "limit", "season", "team")
+
 
 def _parse_since_revision(raw: str | None) -> int | None:
     """Parse a non-negative live revision, allowing -1 for an initial snapshot."""
@@ -146,10 +156,8 @@ def _write_mvp_vote_tokens(
 
 
 def _authenticated_player(request: Request) -> Player | None:
-    if request.user.is_authenticated and hasattr(request.user, "player"):
-        player = getattr(request.user, "player", None)
-        if isinstance(player, Player):
-            return player
+    if request.user.is_authenticated:
+        return viewer_player_for(request)
     return None
 
 
@@ -198,6 +206,43 @@ class MatchViewSet(
     serializer_class = MatchSerializer
     permission_classes = (IsStaffOrReadOnly,)
 
+    # Max SQL queries per action (incl. session/auth lookups); see
+    # `apps.kwt_common.query_budget`.
+    query_budgets: ClassVar[dict[str, int]] = {
+        "list": 8,
+        "retrieve": 6,
+        "create": 20,
+        "update": 8,
+        "partial_update": 8,
+        "destroy": 24,
+        "next_match": 8,
+        "upcoming": 6,
+        "recent": 6,
+        "finished": 6,
+        "tracker_state": 10,
+        "tracker_command": 12,
+        "tracker_poll": 12,
+        "live_state": 20,
+        "live_poll": 25,
+        "summary": 15,
+        "stats": 26,
+        "impacts": 30,
+        "mvp_status": 20,
+        "mvp_vote": 30,
+        "events": 14,
+        "shots": 11,
+        "can_edit_events": 6,
+        "event_options": 10,
+        "create_goal": 30,
+        "goal_detail": 32,
+        "create_substitute": 30,
+        "substitute_detail": 32,
+        "create_pause": 30,
+        "pause_detail": 32,
+        "create_timeout": 30,
+        "timeout_detail": 32,
+    }
+
     def get_serializer_class(self) -> type[MatchSerializer | MatchWriteSerializer]:
         """Use an explicit flat serializer for staff schedule writes."""
         if self.action in {"create", "update", "partial_update"}:
@@ -251,12 +296,7 @@ class MatchViewSet(
 
         """
         if self.request.user.is_authenticated:
-            try:
-                return Player.objects.prefetch_related("team_follow").get(
-                    user=self.request.user
-                )
-            except Player.DoesNotExist:
-                return None
+            return viewer_player_for(self.request)
 
         if settings.DEBUG:
             player_id = self.request.query_params.get("player_id")
@@ -292,8 +332,22 @@ class MatchViewSet(
         return not self.request.query_params.get("followed")
 
     def _public_cache_key(self) -> str:
-        """Cache key that varies by full path (including query string)."""
-        return f"korfbal:schedule:{self.request.get_full_path()}"
+        """Cache key that varies by action and the filtering query params."""
+        return public_cache_key(
+            f"schedule-{self.action}",
+            self.request.query_params,
+            fields=_PUBLIC_SCHEDULE_PARAMS,
+        )
+
+    def _public_payload(self, compute: Callable[[], Any]) -> Any:
+        """Return `compute()`, shared through the public cache when allowed."""
+        if not self._is_cacheable_public_request():
+            return compute()
+        return cached_public_payload(
+            self._public_cache_key(),
+            tags=(SCHEDULE_TAG,),
+            compute=compute,
+        )
 
     @action(detail=False, methods=("GET",), url_path="next")
     def next_match(
@@ -308,24 +362,13 @@ class MatchViewSet(
             Response: Serialized next match.
 
         """
-        if self._is_cacheable_public_request():
-            cache_key = self._public_cache_key()
-            cache_miss = object()
-            cached_payload = cache.get(cache_key, cache_miss)
-            if cached_payload is not cache_miss:
-                return Response(cached_payload)
+        return Response(self._public_payload(self._next_match_payload))
 
+    def _next_match_payload(self) -> Any:
         match = self._upcoming_queryset().first()
         if not match:
-            payload: Any = None
-            if self._is_cacheable_public_request():
-                cache.set(self._public_cache_key(), payload, timeout=30)
-            return Response(payload, status=status.HTTP_200_OK)
-        serializer = self.get_serializer(match)
-        payload = serializer.data
-        if self._is_cacheable_public_request():
-            cache.set(self._public_cache_key(), payload, timeout=30)
-        return Response(payload)
+            return None
+        return self.get_serializer(match).data
 
     @action(detail=False, methods=("GET",), url_path="upcoming")
     def upcoming(
@@ -400,13 +443,11 @@ class MatchViewSet(
 
         limit = max(limit, 1)
 
-        if self._is_cacheable_public_request():
-            cache_key = self._public_cache_key()
-            cache_miss = object()
-            cached_payload = cache.get(cache_key, cache_miss)
-            if cached_payload is not cache_miss:
-                return Response(cached_payload)
+        return Response(
+            self._public_payload(lambda: self._finished_summaries(request, limit)),
+        )
 
+    def _finished_summaries(self, request: Request, limit: int) -> list[MatchSummary]:
         # Respect the same filtering as other match list endpoints.
         # Instead of building an IN(subquery) over matches, apply the filter
         # directly to the MatchData join to keep the query planner happy.
@@ -435,23 +476,12 @@ class MatchViewSet(
         if season_id:
             match_filter &= Q(match_link__season__id_uuid=season_id)
 
-        match_data_queryset = (
+        return load_match_summaries(
             MatchData.objects
-            .select_related(
-                "match_link",
-                "match_link__home_team__club",
-                "match_link__away_team__club",
-                "match_link__season",
-            )
             .filter(match_filter, status="finished")
             .order_by("-match_link__start_time")[:limit]
         )
 
-        summaries = build_match_summaries(list(match_data_queryset))
-        if self._is_cacheable_public_request():
-            cache.set(self._public_cache_key(), summaries, timeout=30)
-        return Response(summaries)
-
     @action(
         detail=True,
         methods=("GET",),
@@ -757,12 +787,13 @@ class MatchViewSet(
 
         """
         match: Match = self.get_object()
-        match_data = MatchData.objects.filter(match_link=match).first()
-        if not match_data:
+        summaries = load_match_summaries(
+            MatchData.objects.filter(match_link=match).order_by("pk")[:1],
+        )
+        if not summaries:
             return Response(None, status=status.HTTP_200_OK)
 
-        summary = build_match_summaries([match_data])[0]
-        return Response(summary)
+        return Response(summaries[0])
 
     @action(detail=True, methods=("GET",), url_path="stats")
     def stats(
@@ -225,6 +225,12 @@ def test_match_event_and_shot_deltas_upsert_and_delete(client: Client) -> None:
     match_data.status = "active"
     match_data.save(update_fields=["status"])
     shooter = get_user_model().objects.create_user(username="delta-shooter")
+    part = MatchPart.objects.create(
+        match_data=match_data,
+        part_number=1,
+        start_time=timezone.now() - timedelta(minutes=5),
+        active=True,
+    )
     for _index in range(10):
         Shot.objects.create(
             player=shooter.player,
@@ -239,6 +245,7 @@ def test_match_event_and_shot_deltas_upsert_and_delete(client: Client) -> None:
         team=home_team,
         scored=True,
         shot_type=GoalType.objects.create(name="Delta goal"),
+        match_part=part,
         time=timezone.now(),
     )
 
@@ -246,6 +253,9 @@ def test_match_event_and_shot_deltas_upsert_and_delete(client: Client) -> None:
     full_shots = client.get(f"/api/matches/{match.id_uuid}/shots/").json()
     revision = full_events["live_revision"]
     assert full_shots["live_revision"] == revision
+    assert [event["event_id"] for event in full_events["events"]] == [
+        str(goal.id_uuid),
+    ]
 
     goal.scored = False
     goal.save(update_fields=["scored"])
@@ -185,7 +185,8 @@ def test_mvp_vote_rejects_candidate_not_in_match(client: Client) -> None:
     assert response.json() == {"detail": "Invalid MVP candidate."}
 
 
-@pytest.mark.django_db
+# Vote caches are written after commit, so these flows need real commits.
+@pytest.mark.django_db(transaction=True)
 @override_settings(SECURE_SSL_REDIRECT=False)
 def test_mvp_vote_flow_and_publish_after_close(client: Client) -> None:
     """Authenticated vote should be persisted and publish after the window closes."""
@@ -279,7 +280,7 @@ def test_mvp_vote_flow_and_publish_after_close(client: Client) -> None:
     assert payload["mvp"]["id_uuid"] == str(candidate_a.id_uuid)
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True)
 @override_settings(SECURE_SSL_REDIRECT=False)
 def test_mvp_anonymous_vote_persists_via_cookie(client: Client) -> None:
     """Anonymous votes should persist via signed cookie token."""
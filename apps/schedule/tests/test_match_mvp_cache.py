@@ -0,0 +1,197 @@
+"""Tests for the cached MVP candidates and vote tallies."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+from uuid import uuid4
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+import pytest
+
+from apps.awards.models.mvp import MatchMvpVote
+from apps.awards.services import mvp_cache
+from apps.awards.services.mvp import (
+    build_match_mvp_status_payload,
+    cast_vote_anon,
+    mvp_candidate_snapshots,
+)
+from apps.club.models import Club
+from apps.game_tracker.models import (
+    GroupType,
+    MatchData,
+    MatchPart,
+    MatchPlayer,
+    PlayerGroup,
+)
+from apps.game_tracker.services.player_designation import (
+    sync_match_players_for_team,
+)
+from apps.player.models.player import Player
+from apps.schedule.models import Match, Season
+from apps.team.models import Team
+
+
+def _finished_match() -> tuple[Match, MatchData, Player, Player]:
+    today = timezone.now().date()
+    season = Season.objects.create(name="2025", start_date=today, end_date=today)
+    home_team = Team.objects.create(name="Home", club=Club.objects.create(name="HC"))
+    away_team = Team.objects.create(name="Away", club=Club.objects.create(name="AC"))
+    match = Match.objects.create(
+        home_team=home_team,
+        away_team=away_team,
+        season=season,
+        start_time=timezone.now(),
+    )
+    match_data = MatchData.objects.get(match_link=match)
+    match_data.status = "finished"
+    match_data.save(update_fields=["status"])
+
+    finished_at = timezone.now() - timezone.timedelta(minutes=2)
+    MatchPart.objects.create(
+        match_data=match_data,
+        part_number=1,
+        start_time=finished_at - timezone.timedelta(minutes=30),
+        end_time=finished_at,
+        active=False,
+    )
+
+    players = []
+    for username, team in (("alice", home_team), ("bob", away_team)):
+        user = get_user_model().objects.create_user(
+            username=username,
+            password="pass1234",  # nosec
+        )
+        MatchPlayer.objects.create(match_data=match_data, team=team, player=user.player)
+        players.append(user.player)
+    return match, match_data, players[0], players[1]
+
+
+@pytest.mark.django_db
+def test_mvp_status_is_served_from_cache_after_votes(
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
+    """Votes update the cached tallies; status reads need no queries."""
+    match, match_data, alice, bob = _finished_match()
+    build_match_mvp_status_payload(match=match, match_data=match_data)
+
+    token = str(uuid4())
+    with django_capture_on_commit_callbacks(execute=True):
+        cast_vote_anon(
+            match=match,
+            match_data=match_data,
+            voter_token=str(uuid4()),
+            candidate=alice,
+        )
+    with django_capture_on_commit_callbacks(execute=True):
+        cast_vote_anon(
+            match=match,
+            match_data=match_data,
+            voter_token=token,
+            candidate=bob,
+        )
+    with django_capture_on_commit_callbacks(execute=True):
+        cast_vote_anon(
+            match=match,
+            match_data=match_data,
+            voter_token=token,
+            candidate=alice,
+        )
+
+    with CaptureQueriesContext(connection) as queries:
+        payload = build_match_mvp_status_payload(
+            match=match,
+            match_data=match_data,
+            anon_voter_token=token,
+        )
+
+    assert len(queries) == 0
+    assert payload["user_vote"] == {"candidate_id_uuid": str(alice.id_uuid)}
+    assert [
+        (row["candidate"]["username"], row["votes"])
+        for row in payload["vote_breakdown"]
+    ] == [("alice", 2)]
+
+
+@pytest.mark.django_db
+def test_mvp_tallies_are_reconciled_from_the_database() -> None:
+    """Writes that bypass the vote service show up once the tallies expire."""
+    match, match_data, alice, bob = _finished_match()
+    cast_vote_anon(
+        match=match,
+        match_data=match_data,
+        voter_token=str(uuid4()),
+        candidate=alice,
+    )
+    build_match_mvp_status_payload(match=match, match_data=match_data)
+
+    # Queryset updates do not send signals, so the cached tallies are stale.
+    MatchMvpVote.objects.filter(match=match).update(candidate=bob)
+    payload = build_match_mvp_status_payload(match=match, match_data=match_data)
+    assert payload["vote_breakdown"][0]["candidate"]["username"] == "alice"
+
+    # Expiring the tally marker (the reconcile interval) forces a recount.
+    mvp_cache.invalidate_tallies(match.id_uuid)
+    payload = build_match_mvp_status_payload(match=match, match_data=match_data)
+    assert payload["vote_breakdown"][0]["candidate"]["username"] == "bob"
+
+
+@pytest.mark.django_db
+def test_roster_change_invalidates_cached_candidates(
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
+    """Adding a match player drops the cached candidate list after commit."""
+    match, match_data, _alice, _bob = _finished_match()
+    assert len(mvp_candidate_snapshots(match, match_data)) == 2  # noqa: PLR2004
+
+    carol = get_user_model().objects.create_user(
+        username="carol",
+        password="pass1234",  # nosec
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        MatchPlayer.objects.create(
+            match_data=match_data,
+            team=match.home_team,
+            player=carol.player,
+        )
+        # Other workers keep the old list until the roster change commits.
+        assert len(mvp_candidate_snapshots(match, match_data)) == 2  # noqa: PLR2004
+
+    usernames = [c.username for c in mvp_candidate_snapshots(match, match_data)]
+    assert usernames == ["alice", "carol", "bob"]
+
+
+@pytest.mark.django_db
+def test_player_changes_invalidate_cached_candidates(
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
+    """Renamed users and synced rosters are not served from stale snapshots."""
+    match, match_data, alice, _bob = _finished_match()
+    mvp_candidate_snapshots(match, match_data)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        alice.user.first_name = "Alice"
+        alice.user.last_name = "Smith"
+        alice.user.save()
+    names = [c.display_name for c in mvp_candidate_snapshots(match, match_data)]
+    assert names == ["Alice Smith", "bob"]
+
+    carol = get_user_model().objects.create_user(
+        username="carol",
+        password="pass1234",  # nosec
+    )
+    PlayerGroup.objects.create(
+        match_data=match_data,
+        team=match.home_team,
+        starting_type=GroupType.objects.create(name="Reserve", order=3),
+        current_type=GroupType.objects.get(name="Reserve"),
+    ).players.add(alice, carol.player)
+    # Only adds rows, through `bulk_create`.
+    with django_capture_on_commit_callbacks(execute=True):
+        sync_match_players_for_team(match_data=match_data, team=match.home_team)
+
+    usernames = [c.username for c in mvp_candidate_snapshots(match, match_data)]
+    assert usernames == ["alice", "carol", "bob"]
@@ -17,6 +17,7 @@ from apps.game_tracker.models import (
     PlayerGroup,
     Shot,
 )
+from apps.kwt_common.query_budget import assert_within_query_budget
 from apps.schedule.models import Match, Season
 from apps.team.models import Team, TeamData
 
@@ -117,7 +118,9 @@ def test_match_stats_returns_home_vs_away_counts(client: Client) -> None:
         shot_type=vrije_bal,
     )
 
-    response = client.get(f"/api/matches/{match.id_uuid}/stats/")
+    response = assert_within_query_budget(
+        lambda: client.get(f"/api/matches/{match.id_uuid}/stats/"),
+    )
     assert response.status_code == HTTPStatus.OK
 
     payload = response.json()
@@ -0,0 +1,53 @@
+"""Tests for the cached public schedule endpoints."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Any
+
+from django.test import override_settings
+from django.test.client import Client
+from django.utils import timezone
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from apps.club.models import Club
+from apps.game_tracker.models import MatchData
+from apps.schedule.models import Match, Season
+from apps.team.models import Team
+
+
+@pytest.mark.django_db
+@override_settings(SECURE_SSL_REDIRECT=False)
+def test_finished_endpoint_is_invalidated_when_a_match_finishes(
+    client: Client,
+    settings: SettingsWrapper,
+    django_capture_on_commit_callbacks: Callable[..., Any],
+) -> None:
+    """A cached anonymous response picks up a match finished after commit."""
+    settings.KORFBAL_PUBLIC_CACHE_TTL_S = 60
+    today = timezone.now().date()
+    season = Season.objects.create(name="2025", start_date=today, end_date=today)
+    team = Team.objects.create(name="Cached", club=Club.objects.create(name="CC"))
+    opponent = Team.objects.create(name="Other", club=Club.objects.create(name="OC"))
+    match = Match.objects.create(
+        home_team=team,
+        away_team=opponent,
+        season=season,
+        start_time=timezone.now() - timedelta(hours=2),
+    )
+    url = "/api/matches/finished/"
+
+    assert client.get(url, {"team": str(team.id_uuid)}).json() == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        match_data = MatchData.objects.get(match_link=match)
+        match_data.status = "finished"
+        match_data.save(update_fields=["status"])
+
+    # Same filters, different parameter order and an unrelated cache buster.
+    response = client.get(f"{url}?_=1&team={team.id_uuid}")
+    assert response.status_code == HTTPStatus.OK
+    assert [item["id_uuid"] for item in response.json()] == [str(match.id_uuid)]
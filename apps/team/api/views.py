@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
 
 from django.db.models import Q, QuerySet
 from django.utils import timezone
@@ -26,9 +26,16 @@ from apps.game_tracker.services.match_impact import (
 )
 from apps.kwt_common.api.pagination import StandardResultsSetPagination
 from apps.kwt_common.api.permissions import IsStaffOrReadOnly
+from apps.kwt_common.overview_sections import is_complete_overview
+from apps.kwt_common.public_cache import (
+    cached_public_payload,
+    public_cache_key,
+    team_tag,
+)
 from apps.player.api.serializers import PlayerSongSerializer, PlayerSongUpdateSerializer
 from apps.player.models import Player
 from apps.player.models.player_song import PlayerSong, PlayerSongStatus
+from apps.player.services.viewer_identity import viewer_player_for
 from apps.schedule.models import Season
 from apps.team.models.team import Team
 from apps.team.models.team_data import TeamData
@@ -51,6 +58,24 @@ class TeamViewSet(viewsets.ModelViewSet):
     filter_backends = (filters.SearchFilter,)
     search_fields = ("name", "club__name")
 
+    # Max SQL queries per action (incl. session/auth lookups); see
+    # `apps.kwt_common.query_budget`.
+    query_budgets: ClassVar[dict[str, int]] = {
+        "list": 6,
+        "retrieve": 4,
+        "create": 6,
+        "update": 6,
+        "partial_update": 6,
+        "destroy": 18,
+        "overview": 34,
+        "impact_breakdown": 8,
+        "goal_song_admin": 14,
+        "update_goal_song_fallback": 15,
+        "update_player_goal_song_selection": 16,
+        "remove_player_song": 19,
+        "update_player_song_settings": 14,
+    }
+
     @action(detail=True, methods=("GET",), url_path="overview")
     def overview(
         self,
@@ -65,6 +90,22 @@ class TeamViewSet(viewsets.ModelViewSet):
 
         """
         team = self.get_object()
+        if request.user.is_authenticated:
+            return Response(self._overview_payload(request, team))
+        payload = cached_public_payload(
+            public_cache_key(
+                "team-overview",
+                request.query_params,
+                fields=("include_roster", "include_stats", "season"),
+                subject=team.id_uuid,
+            ),
+            tags=(team_tag(team.id_uuid),),
+            compute=lambda: self._overview_payload(request, team),
+            cacheable=is_complete_overview,
+        )
+        return Response(payload)
+
+    def _overview_payload(self, request: Request, team: Team) -> dict[str, Any]:
         seasons_qs = list(self._team_seasons_queryset(team))
         season = self._resolve_season(request, seasons_qs)
 
@@ -79,13 +120,9 @@ class TeamViewSet(viewsets.ModelViewSet):
             default=True,
         )
 
-        viewer_player = (
-            Player.objects.filter(user=request.user).first()
-            if request.user.is_authenticated
-            else None
-        )
+        viewer_player = self._viewer_player(request)
 
-        payload = build_team_overview_payload(
+        return build_team_overview_payload(
             team=team,
             season=season,
             seasons=seasons_qs,
@@ -105,7 +142,6 @@ class TeamViewSet(viewsets.ModelViewSet):
                 team_payload=self.get_serializer(team).data,
             ),
         )
-        return Response(payload)
 
     @action(
         detail=True,
@@ -755,9 +791,7 @@ class TeamViewSet(viewsets.ModelViewSet):
 
     @staticmethod
     def _viewer_player(request: Request) -> Player | None:
-        if not request.user.is_authenticated:
-            return None
-        return Player.objects.filter(user=request.user).first()
+        return viewer_player_for(request)
 
     def _viewer_can_manage_goal_songs(
         self,
@@ -6,13 +6,15 @@ from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
-from asgiref.sync import async_to_sync
 from django.db.models import Q, QuerySet
 from django.utils import timezone
 
 from apps.game_tracker.models import MatchData, MatchPlayer, Shot
+from apps.kwt_common.image_derivatives import LIST_THUMBNAIL_SIZE
+from apps.kwt_common.overview_sections import OverviewSection, compose_sections
+from apps.kwt_common.public_cache import public_cache_key, team_tag
 from apps.kwt_common.utils.general_stats import build_general_stats
-from apps.kwt_common.utils.match_summary import build_match_summaries
+from apps.kwt_common.utils.match_summary import load_match_summaries
 from apps.kwt_common.utils.players_stats import build_player_stats
 from apps.player.models import Player
 from apps.player.privacy import can_view_by_visibility
@@ -42,61 +44,144 @@ def build_team_overview_payload(
 ) -> dict[str, Any]:
     """Build the stable API payload for the team overview endpoint."""
     match_data_qs = _team_match_queryset(team, season)
-    upcoming_matches = build_match_summaries(
-        match_data_qs.filter(status__in=["upcoming", "active"]).order_by(
-            "match_link__start_time",
-        )[:10],
-    )
-    recent_matches = build_match_summaries(
-        match_data_qs.filter(status="finished").order_by("-match_link__start_time")[
-            :10
-        ],
-    )
+    include_stats = options.include_stats and match_data_qs.exists()
+
+    sections = [
+        OverviewSection(
+            name="upcoming",
+            compute=lambda: load_match_summaries(
+                match_data_qs.filter(status__in=["upcoming", "active"]).order_by(
+                    "match_link__start_time",
+                )[:10],
+            ),
+            fallback=[],
+        ),
+        OverviewSection(
+            name="recent",
+            compute=lambda: load_match_summaries(
+                match_data_qs.filter(status="finished").order_by(
+                    "-match_link__start_time",
+                )[:10],
+            ),
+            fallback=[],
+        ),
+        OverviewSection(
+            name="seasons",
+            compute=lambda: _seasons_payload(seasons),
+            fallback=[],
+        ),
+    ]
+    if include_stats:
+        sections.extend(
+            _team_stats_sections(team=team, season=season, match_data_qs=match_data_qs),
+        )
+    if options.include_roster:
+        sections.append(
+            OverviewSection(
+                name="roster",
+                compute=lambda: _roster_payload(
+                    team=team,
+                    season=season,
+                    match_data_qs=match_data_qs,
+                    viewer_player=options.viewer_player,
+                ),
+                fallback=[],
+            ),
+        )
+    results = compose_sections("team", sections)
+    roster = results.get("roster", [])
+
+    return {
+        "team": options.team_payload,
+        "matches": {
+            "upcoming": results.get("upcoming"),
+            "recent": results.get("recent"),
+        },
+        "stats": {
+            "general": results.get("stats_general"),
+            "players": results.get("stats_players", []),
+        },
+        "roster": roster,
+        "seasons": results.get("seasons"),
+        "meta": {
+            "season_id": str(season.id_uuid) if season else None,
+            "season_name": season.name if season else None,
+            "roster_count": len(roster),
+            "viewer_can_manage_goal_songs": options.viewer_can_manage_goal_songs,
+            "fallback_goal_song_audio_urls": options.fallback_goal_song_audio_urls,
+            "partial_sections": list(results.partial),
+        },
+    }
 
-    stats_general = None
-    if options.include_stats and match_data_qs.exists():
-        stats_general = async_to_sync(build_general_stats)(match_data_qs)
 
-    roster_players: list[Player] = []
-    if options.include_roster or options.include_stats:
-        roster_players = list(_team_players_queryset(team, season, match_data_qs))
+def _team_stats_sections(
+    *,
+    team: Team,
+    season: Season | None,
+    match_data_qs: QuerySet[MatchData],
+) -> list[OverviewSection]:
+    # Stats do not depend on the viewer, so they are shared (and invalidated
+    # with the team's public payloads) across viewers.
+    subject = f"{team.id_uuid}:{season.id_uuid if season else 'all'}"
+    tags = (team_tag(team.id_uuid),)
+    return [
+        OverviewSection(
+            name="stats_general",
+            compute=lambda: build_general_stats(match_data_qs),
+            cache_key=public_cache_key("team-stats-general", None, subject=subject),
+            cache_tags=tags,
+        ),
+        OverviewSection(
+            name="stats_players",
+            compute=lambda: build_player_stats(
+                list(_team_players_queryset(team, season, match_data_qs)),
+                match_data_qs,
+            ),
+            fallback=[],
+            cache_key=public_cache_key("team-stats-players", None, subject=subject),
+            cache_tags=tags,
+        ),
+    ]
+
 
+def _roster_payload(
+    *,
+    team: Team,
+    season: Season | None,
+    match_data_qs: QuerySet[MatchData],
+    viewer_player: Player | None,
+) -> list[dict[str, str]]:
     main_roster_ids = _main_roster_ids(team=team, season=season)
     ordered_roster_players = _order_roster_players(
-        roster_players=roster_players,
+        roster_players=list(_team_players_queryset(team, season, match_data_qs)),
         main_roster_ids=main_roster_ids,
     )
+    return [
+        {
+            "id_uuid": str(player.id_uuid),
+            "display_name": player.user.username,
+            "username": player.user.username,
+            "roster_role": (
+                "main" if str(player.id_uuid) in main_roster_ids else "reserve"
+            ),
+            "profile_picture_url": (
+                player.get_profile_picture(size=LIST_THUMBNAIL_SIZE)
+                if can_view_by_visibility(
+                    visibility=player.profile_picture_visibility,
+                    viewer=viewer_player,
+                    target=player,
+                )
+                else player.get_placeholder_profile_picture_url()
+            ),
+            "profile_url": player.get_absolute_url(),
+        }
+        for player in ordered_roster_players
+    ]
 
-    roster: list[dict[str, str]] = []
-    if options.include_roster:
-        roster = [
-            {
-                "id_uuid": str(player.id_uuid),
-                "display_name": player.user.username,
-                "username": player.user.username,
-                "roster_role": (
-                    "main" if str(player.id_uuid) in main_roster_ids else "reserve"
-                ),
-                "profile_picture_url": (
-                    player.get_profile_picture()
-                    if can_view_by_visibility(
-                        visibility=player.profile_picture_visibility,
-                        viewer=options.viewer_player,
-                        target=player,
-                    )
-                    else player.get_placeholder_profile_picture_url()
-                ),
-                "profile_url": player.get_absolute_url(),
-            }
-            for player in ordered_roster_players
-        ]
-
-    stats_players = []
-    if options.include_stats and roster_players and match_data_qs.exists():
-        stats_players = async_to_sync(build_player_stats)(roster_players, match_data_qs)
 
+def _seasons_payload(seasons: list[Season]) -> list[dict[str, Any]]:
     current_season = _current_season()
-    seasons_payload = [
+    return [
         {
             "id_uuid": str(option.id_uuid),
             "name": option.name,
@@ -108,27 +193,6 @@ def build_team_overview_payload(
         for option in seasons
     ]
 
-    return {
-        "team": options.team_payload,
-        "matches": {
-            "upcoming": upcoming_matches,
-            "recent": recent_matches,
-        },
-        "stats": {
-            "general": stats_general,
-            "players": stats_players,
-        },
-        "roster": roster,
-        "seasons": seasons_payload,
-        "meta": {
-            "season_id": str(season.id_uuid) if season else None,
-            "season_name": season.name if season else None,
-            "roster_count": len(roster),
-            "viewer_can_manage_goal_songs": options.viewer_can_manage_goal_songs,
-            "fallback_goal_song_audio_urls": options.fallback_goal_song_audio_urls,
-        },
-    }
-
 
 def _current_season() -> Season | None:
     today = timezone.now().date()
@@ -142,14 +206,7 @@ def _team_match_queryset(
     team: Team,
     season: Season | None,
 ) -> QuerySet[MatchData]:
-    queryset = MatchData.objects.select_related(
-        "match_link",
-        "match_link__home_team",
-        "match_link__home_team__club",
-        "match_link__away_team",
-        "match_link__away_team__club",
-        "match_link__season",
-    ).filter(
+    queryset = MatchData.objects.filter(
         Q(match_link__home_team=team) | Q(match_link__away_team=team),
     )
     if season:
@@ -17,6 +17,7 @@ from apps.game_tracker.services.match_impact import (
     LATEST_MATCH_IMPACT_ALGORITHM_VERSION,
     persist_match_impact_rows_with_breakdowns,
 )
+from apps.kwt_common.query_budget import assert_within_query_budget
 from apps.player.models.player_song import PlayerSong, PlayerSongStatus
 from apps.schedule.models import Match, Season
 from apps.team.models import Team
@@ -92,7 +93,9 @@ def test_team_overview_includes_matches_stats_and_roster(
     legacy_match_data.away_score = 16
     legacy_match_data.save(update_fields=["status", "home_score", "away_score"])
 
-    response = client.get(f"/api/team/teams/{team.id_uuid}/overview/")
+    response = assert_within_query_budget(
+        lambda: client.get(f"/api/team/teams/{team.id_uuid}/overview/"),
+    )
 
     assert response.status_code == HTTPStatus.OK
     payload = response.json()
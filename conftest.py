@@ -17,3 +17,14 @@ from pytest_django.fixtures import SettingsWrapper
 @pytest.fixture(autouse=True)
 def _disable_secure_ssl_redirect(settings: SettingsWrapper) -> None:
     settings.SECURE_SSL_REDIRECT = False
+
+
+@pytest.fixture(autouse=True)
+def _clear_reference_data() -> None:
+    # Test transactions roll back without delete signals, so a goal/group type
+    # snapshot loaded by an earlier test would otherwise outlive its rows.
+    from apps.game_tracker.services.reference_data import (  # noqa: PLC0415
+        clear_local_reference_data,
+    )
+
+    clear_local_reference_data()
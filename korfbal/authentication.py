@@ -8,11 +8,15 @@ from bg_auth.jwt import (
     JwtError,
     decode as decode_jwt,
 )
-from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractBaseUser
 from rest_framework.authentication import BaseAuthentication, get_authorization_header
 from rest_framework.exceptions import AuthenticationFailed
 
+from apps.player.services.viewer_identity import (
+    remember_viewer_player,
+    resolve_identity,
+)
+
 
 class JwtBearerAuthentication(BaseAuthentication):
     """Authenticate requests using BG Auth JWT bearer tokens."""
@@ -46,7 +50,9 @@ class JwtBearerAuthentication(BaseAuthentication):
         """Authenticate the request using a JWT bearer token.
 
         This method delegates header parsing to `_extract_bearer_token` to keep
-        complexity low.
+        complexity low. The user and their player are resolved through the
+        short-lived identity cache (keyed by user id and token `iat`), and the
+        player is attached to the request so views don't look it up again.
 
         Raises:
             AuthenticationFailed: If the provided token is invalid, the user is
@@ -67,11 +73,10 @@ class JwtBearerAuthentication(BaseAuthentication):
         if not user_id:
             raise AuthenticationFailed("Invalid access token")
 
-        user_model = get_user_model()
-        try:
-            user = user_model.objects.get(pk=user_id)
-        except user_model.DoesNotExist as exc:
-            raise AuthenticationFailed("User not found") from exc
+        identity = resolve_identity(user_id, issued_at=payload.get("iat"))
+        if identity is None:
+            raise AuthenticationFailed("User not found")
+        user = identity.user
 
         if not getattr(user, "is_active", False):
             raise AuthenticationFailed("User is inactive")
@@ -79,4 +84,5 @@ class JwtBearerAuthentication(BaseAuthentication):
         if not isinstance(user, AbstractBaseUser):
             raise AuthenticationFailed("Invalid user")
 
+        remember_viewer_player(request, identity.player)
         return user, token
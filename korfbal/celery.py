@@ -3,6 +3,7 @@
 import os
 
 from celery import Celery
+from celery.schedules import crontab
 
 
 # Set the default Django settings module for the 'celery' program.
@@ -19,4 +20,19 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
 # Celery Beat schedule for periodic tasks.
-app.conf.beat_schedule = {}
+app.conf.beat_schedule = {
+    # Repairs rollup buckets whose queued increments were lost.
+    "recount-audit-rollup": {
+        "task": "apps.audit.tasks.recount_audit_rollup",
+        "schedule": crontab(minute=5),
+    },
+    # New events must never land in the default partition.
+    "ensure-audit-partitions": {
+        "task": "apps.audit.tasks.ensure_audit_partitions",
+        "schedule": crontab(hour=2, minute=15),
+    },
+    "purge-audit-events": {
+        "task": "apps.audit.tasks.purge_audit_events",
+        "schedule": crontab(hour=2, minute=45),
+    },
+}
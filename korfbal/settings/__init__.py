@@ -38,15 +38,37 @@ from .integrations import *
 
 # App performance switches
 from .performance import (
+    KORFBAL_AUDIT_BUFFERED_INGEST,
+    KORFBAL_AUDIT_INGEST_BATCH_SIZE,
+    KORFBAL_AUDIT_INGEST_FLUSH_DELAY_S,
+    KORFBAL_AUDIT_INGEST_MAX_PENDING,
+    KORFBAL_ELIGIBILITY_REFRESH_DELAY_S,
+    KORFBAL_ELIGIBILITY_STATE_TTL_S,
     KORFBAL_ENABLE_IMPACT_AUTO_RECOMPUTE,
+    KORFBAL_IDENTITY_CACHE_TTL_S,
     KORFBAL_IMPACT_AUTO_RECOMPUTE_LIMIT,
     KORFBAL_LOG_SLOW_DB_QUERIES,
     KORFBAL_LOG_SLOW_REQUESTS,
+    KORFBAL_MEDIA_URL_CACHE_ENABLED,
+    KORFBAL_MEDIA_URL_MIN_VALIDITY_S,
+    KORFBAL_MVP_CACHE_TTL_S,
+    KORFBAL_MVP_TALLY_RECONCILE_S,
+    KORFBAL_OVERVIEW_SECTION_TIMEOUT_MS,
+    KORFBAL_OVERVIEW_SECTION_WORKERS,
+    KORFBAL_PAGE_VISIT_BATCH_SIZE,
+    KORFBAL_PAGE_VISIT_FLUSH_INTERVAL_S,
+    KORFBAL_PAGE_VISIT_MAX_PATHS,
+    KORFBAL_PAGE_VISIT_SAMPLE_PERCENT,
+    KORFBAL_PLAYER_SEARCH_INDEX_TTL_S,
+    KORFBAL_PUBLIC_CACHE_STALE_S,
+    KORFBAL_PUBLIC_CACHE_TTL_S,
+    KORFBAL_QUERY_BUDGETS_ENABLED,
     KORFBAL_SLOW_DB_INCLUDE_SQL,
     KORFBAL_SLOW_DB_QUERY_MS,
     KORFBAL_SLOW_REQUEST_BUFFER_SIZE,
     KORFBAL_SLOW_REQUEST_BUFFER_TTL_S,
     KORFBAL_SLOW_REQUEST_MS,
+    KORFBAL_TRACKER_FACTS_TTL_S,
     SPOTDL_DOWNLOAD_TIMEOUT_SECONDS,
     SPOTDL_STALE_IN_PROGRESS_SECONDS,
 )
@@ -91,6 +113,7 @@ from .services import (
     CELERY_TIMEZONE,
     CHANNEL_LAYERS,
     DATABASES,
+    KORFBAL_AUDIT_INGEST_STREAM_URL,
     KORFBAL_SSE_ENABLED,
     KORFBAL_SSE_HEARTBEAT_SECONDS,
     KORFBAL_SSE_MAX_MATCHES,
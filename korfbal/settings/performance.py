@@ -29,6 +29,9 @@ KORFBAL_IMPACT_AUTO_RECOMPUTE_LIMIT = env_int(
 KORFBAL_LOG_SLOW_DB_QUERIES = env_bool("KORFBAL_LOG_SLOW_DB_QUERIES", False)
 KORFBAL_SLOW_DB_QUERY_MS = env_int("KORFBAL_SLOW_DB_QUERY_MS", 200)
 KORFBAL_SLOW_DB_INCLUDE_SQL = env_bool("KORFBAL_SLOW_DB_INCLUDE_SQL", False)
+# Per-view query budgets (opt-in outside tests). Logs requests that run more
+# SQL queries than their viewset action declares in `query_budgets`.
+KORFBAL_QUERY_BUDGETS_ENABLED = env_bool("KORFBAL_QUERY_BUDGETS_ENABLED", False)
 
 # Slow request surfacing (opt-in). Adds timing headers and keeps a rolling
 # buffer (in cache) of the slowest requests so you don't have to tail logs.
@@ -40,6 +43,73 @@ KORFBAL_SLOW_REQUEST_BUFFER_TTL_S = env_int(
     60 * 60 * 24,
 )
 
+# Presigned media URLs (S3 querystring auth). Signatures are reused across
+# requests/workers until at most this many seconds of validity remain.
+KORFBAL_MEDIA_URL_CACHE_ENABLED = env_bool("KORFBAL_MEDIA_URL_CACHE_ENABLED", True)
+KORFBAL_MEDIA_URL_MIN_VALIDITY_S = env_int("KORFBAL_MEDIA_URL_MIN_VALIDITY_S", 300)
+
+# Bearer-auth identity cache: user + player rows per (user, token iat). Saves
+# are invalidated via signals; 0 disables the cache.
+KORFBAL_IDENTITY_CACHE_TTL_S = env_int("KORFBAL_IDENTITY_CACHE_TTL_S", 60)
+
+# Match-player picker name index per (club, season). Rebuilt on roster,
+# membership and user-name changes; the TTL bounds staleness otherwise.
+KORFBAL_PLAYER_SEARCH_INDEX_TTL_S = env_int("KORFBAL_PLAYER_SEARCH_INDEX_TTL_S", 600)
+
+# MVP voting: candidate lists and vote windows of finished matches are cached
+# for CACHE_TTL_S. Vote tallies are cache counters bumped per vote and
+# recounted from the database every TALLY_RECONCILE_S and when publishing.
+KORFBAL_MVP_CACHE_TTL_S = env_int("KORFBAL_MVP_CACHE_TTL_S", 60 * 60 * 6)
+KORFBAL_MVP_TALLY_RECONCILE_S = env_int("KORFBAL_MVP_TALLY_RECONCILE_S", 60)
+
+# Club eligibility dashboard: played-match state per (club, season) is cached
+# for STATE_TTL_S and updated per match by a Celery task, scheduled
+# REFRESH_DELAY_S after a match finishes or its minutes/roster change.
+KORFBAL_ELIGIBILITY_REFRESH_DELAY_S = env_int("KORFBAL_ELIGIBILITY_REFRESH_DELAY_S", 5)
+KORFBAL_ELIGIBILITY_STATE_TTL_S = env_int(
+    "KORFBAL_ELIGIBILITY_STATE_TTL_S",
+    60 * 60 * 6,
+)
+
+# Public response cache (anonymous schedule lists and club/team overviews):
+# payloads are fresh for TTL_S and may be served STALE_S longer while one
+# worker recomputes them. Match changes invalidate affected payloads.
+KORFBAL_PUBLIC_CACHE_STALE_S = env_int("KORFBAL_PUBLIC_CACHE_STALE_S", 30)
+KORFBAL_PUBLIC_CACHE_TTL_S = env_int("KORFBAL_PUBLIC_CACHE_TTL_S", 60)
+
+# Match-wide tracker data (score, counters, pauses, groups, last event) is
+# cached per live revision and shared by every team perspective. Writes that
+# bypass tracker commands show up after TTL_S; 0 disables the cache.
+KORFBAL_TRACKER_FACTS_TTL_S = env_int("KORFBAL_TRACKER_FACTS_TTL_S", 60)
+
+# Club/team/player overview sections: the request thread is helped by up to
+# WORKERS threads from a process-wide pool (0 runs them in the request thread;
+# helpers also need persistent DB connections). Sections still running after
+# TIMEOUT_MS are left out and the response is marked partial.
+KORFBAL_OVERVIEW_SECTION_TIMEOUT_MS = env_int(
+    "KORFBAL_OVERVIEW_SECTION_TIMEOUT_MS",
+    3000,
+)
+KORFBAL_OVERVIEW_SECTION_WORKERS = env_int("KORFBAL_OVERVIEW_SECTION_WORKERS", 4)
+
+# Page-visit tracking: visits are buffered per process (one row per user and
+# page per window) and bulk-upserted by a Celery task every FLUSH_INTERVAL_S or
+# BATCH_SIZE pairs. UUID/numeric path segments are collapsed and a window
+# tracks at most MAX_PATHS distinct pages; SAMPLE_PERCENT=0 disables tracking.
+KORFBAL_PAGE_VISIT_BATCH_SIZE = env_int("KORFBAL_PAGE_VISIT_BATCH_SIZE", 500)
+KORFBAL_PAGE_VISIT_FLUSH_INTERVAL_S = env_int("KORFBAL_PAGE_VISIT_FLUSH_INTERVAL_S", 30)
+KORFBAL_PAGE_VISIT_MAX_PATHS = env_int("KORFBAL_PAGE_VISIT_MAX_PATHS", 1000)
+KORFBAL_PAGE_VISIT_SAMPLE_PERCENT = env_int("KORFBAL_PAGE_VISIT_SAMPLE_PERCENT", 100)
+
+# Buffered audit ingest: validated events go to a Valkey stream and are written
+# in batches by a Celery flush (scheduled FLUSH_DELAY_S after the first event)
+# or `manage.py drain_audit_ingest --follow`. Ingest answers 503 once
+# MAX_PENDING events are waiting.
+KORFBAL_AUDIT_BUFFERED_INGEST = env_bool("KORFBAL_AUDIT_BUFFERED_INGEST", False)
+KORFBAL_AUDIT_INGEST_BATCH_SIZE = env_int("KORFBAL_AUDIT_INGEST_BATCH_SIZE", 1000)
+KORFBAL_AUDIT_INGEST_FLUSH_DELAY_S = env_int("KORFBAL_AUDIT_INGEST_FLUSH_DELAY_S", 2)
+KORFBAL_AUDIT_INGEST_MAX_PENDING = env_int("KORFBAL_AUDIT_INGEST_MAX_PENDING", 50_000)
+
 # --- spotDL (goal song downloads) ---
 # Some downloads can take longer due to upstream rate limiting / search issues.
 # Keep this configurable per environment.
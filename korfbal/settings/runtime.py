@@ -16,6 +16,11 @@ RUNNER = env("RUNNER", "")
 KORFBAL_ENABLE_PROMETHEUS = env_bool("KORFBAL_ENABLE_PROMETHEUS", RUNNER == "uwsgi")
 KORFBAL_AUDIT_INGEST_TOKEN = env("KORFBAL_AUDIT_INGEST_TOKEN", "")
 KORFBAL_AUDIT_RETENTION_DAYS = env_int("KORFBAL_AUDIT_RETENTION_DAYS", 90)
+KORFBAL_AUDIT_PARTITION_MONTHS_AHEAD = env_int(
+    "KORFBAL_AUDIT_PARTITION_MONTHS_AHEAD",
+    3,
+)
+KORFBAL_AUDIT_ROLLUP_RECOUNT_HOURS = env_int("KORFBAL_AUDIT_ROLLUP_RECOUNT_HOURS", 24)
 
 RUNNING_TESTS = bool(os.getenv("PYTEST_CURRENT_TEST")) or any(
     "pytest" in arg for arg in sys.argv
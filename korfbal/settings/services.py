@@ -40,6 +40,10 @@ DATABASES = {
         "PASSWORD": env("POSTGRES_PASSWORD", "postgres"),
         "HOST": env("POSTGRES_HOST", "127.0.0.1"),
         "PORT": env("POSTGRES_PORT", "5432"),
+        # Persistent connections also let overview sections run on helper
+        # threads (see `apps.kwt_common.overview_sections`).
+        "CONN_MAX_AGE": env_int("POSTGRES_CONN_MAX_AGE", 0),
+        "CONN_HEALTH_CHECKS": True,
     },
 }
 
@@ -56,6 +60,11 @@ CACHES = {
     },
 }
 
+KORFBAL_AUDIT_INGEST_STREAM_URL = env(
+    "KORFBAL_AUDIT_INGEST_STREAM_URL",
+    f"redis://{VALKEY_HOST}:{VALKEY_PORT}/2",
+)
+
 CELERY_BROKER_URL = (
     f"redis://{env('CELERY_BROKER_HOST', VALKEY_HOST)}:"
     f"{env('CELERY_BROKER_PORT', str(VALKEY_PORT))}/0"
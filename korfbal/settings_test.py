@@ -49,6 +49,15 @@ PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 KORFBAL_ENABLE_IMPACT_AUTO_RECOMPUTE = True
 KORFBAL_IMPACT_AUTO_RECOMPUTE_LIMIT = 25
 KORFBAL_TEST_FAST_POLL = True
+# Tests write and re-read within one transaction, so after-commit invalidation
+# never runs; public response cache tests enable it explicitly.
+KORFBAL_PUBLIC_CACHE_TTL_S = 0
+# Tests edit rows directly between tracker reads without advancing the live
+# revision; tracker facts cache tests enable it explicitly.
+KORFBAL_TRACKER_FACTS_TTL_S = 0
+# Helper threads use their own connections, which cannot see rows written by
+# transactional tests; section tests enable them explicitly.
+KORFBAL_OVERVIEW_SECTION_WORKERS = 0
 
 
 # ---------------------------------------------------------------------------